@@ -2,4 +2,12 @@
 # SPDX-License-Identifier: MIT
 """Module for MFD Host."""
 
-from .base import Host
+import typing
+
+from .lazy_import import lazy_getattr
+
+if typing.TYPE_CHECKING:
+    from .base import Host
+    from .fleet import HostFleet
+
+__getattr__ = lazy_getattr(__name__, attributes={"Host": ".base", "HostFleet": ".fleet"})
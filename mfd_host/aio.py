@@ -0,0 +1,106 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for asyncio support of Host and its features."""
+
+import asyncio
+import threading
+import typing
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Optional
+
+if typing.TYPE_CHECKING:
+    from .base import Host
+
+# Blocking calls are executed by dedicated pool, default pool of event loop is too small to drive hundreds of hosts
+ASYNC_MAX_THREADS = 256
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_async_executor() -> ThreadPoolExecutor:
+    """Get pool of threads executing blocking calls of awaitable variants, created on first use."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=ASYNC_MAX_THREADS, thread_name_prefix="mfd-host-async")
+        return _executor
+
+
+def set_async_executor(executor: ThreadPoolExecutor) -> None:
+    """
+    Replace pool of threads executing blocking calls of awaitable variants.
+
+    :param executor: Pool to be used, e.g. bigger one for thousands of hosts
+    """
+    global _executor
+    with _executor_lock:
+        _executor = executor
+
+
+def get_host_semaphore(host: "Host") -> asyncio.Semaphore:
+    """
+    Get semaphore limiting concurrent awaitable calls on the host, one per event loop.
+
+    :param host: Host object, its `async_concurrency` is the limit
+    :return: Semaphore of running event loop
+    """
+    loop = asyncio.get_running_loop()
+    with host._lock:
+        if loop not in host._async_semaphores:
+            host._async_semaphores[loop] = asyncio.Semaphore(host.async_concurrency)
+        return host._async_semaphores[loop]
+
+
+async def call_async(host: Optional["Host"], function: Callable, *args, **kwargs) -> Any:
+    """
+    Execute blocking function in worker thread, without blocking event loop.
+
+    Number of calls executed at the same time on the host is limited by its semaphore.
+    Cancellation of awaiting task does not interrupt the call, the semaphore is released when it returns,
+    so the limit holds also for abandoned calls.
+
+    :param host: Host object which semaphore is used, None - no limit
+    :param function: Blocking function
+    :param args: Positional arguments of function
+    :param kwargs: Keyword arguments of function
+    :return: Value returned by function
+    """
+    loop = asyncio.get_running_loop()
+    call = partial(function, *args, **kwargs)
+    if host is None:
+        return await loop.run_in_executor(get_async_executor(), call)
+
+    semaphore = get_host_semaphore(host)
+    await semaphore.acquire()
+    try:
+        future = loop.run_in_executor(get_async_executor(), call)
+    except BaseException:
+        semaphore.release()
+        raise
+    future.add_done_callback(lambda _: semaphore.release())
+    return await asyncio.shield(future)
+
+
+def get_async_variant(obj: Any, host: Optional["Host"], name: str) -> Optional[Callable]:
+    """
+    Get awaitable variant of public method of object, named as the method with "a" prefix.
+
+    :param obj: Object, e.g. feature of host
+    :param host: Host object which semaphore limits the calls
+    :param name: Name of awaitable variant, e.g. "aget_meminfo" for "get_meminfo" method
+    :return: Coroutine function or None if there is no method for the name
+    """
+    method_name = name[1:]
+    if not name.startswith("a") or method_name.startswith("_") or not callable(getattr(type(obj), method_name, None)):
+        return None
+    method = getattr(obj, method_name)
+
+    async def _async_variant(*args, **kwargs) -> Any:
+        return await call_async(host, method, *args, **kwargs)
+
+    _async_variant.__name__ = name
+    _async_variant.__qualname__ = f"{type(obj).__qualname__}.{name}"
+    _async_variant.__doc__ = f"Awaitable variant of `{method_name}()`, executed in worker thread.\n\n{method.__doc__}"
+    return _async_variant
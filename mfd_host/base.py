@@ -3,18 +3,30 @@
 """Module for Host."""
 
 import logging
+import os
+import threading
 import typing
+import weakref
 from abc import ABC
-from typing import Optional, Union, List
+from contextlib import contextmanager
+from functools import partial
+from importlib import import_module
+from typing import Callable, Iterator, Optional, Union, List
 
 from mfd_common_libs import add_logging_level, log_levels
 from mfd_typing import OSName, PCIAddress, PCIDevice
 from mfd_typing.network_interface import InterfaceType, InterfaceInfo
 
+from .cache import InterfaceInfoCache
+from .data_structures import InterfaceChangeSet, InterfaceEvent, InterfaceEventType, get_interface_events
 from .exceptions import HostConnectedOSNotSupported, NetworkInterfaceRefreshException, HostConnectionTypeNotSupported
-from .feature.stats import BaseFeatureStats, StatsFeatureType
+from .facts_cache import FACTS_CACHE_DIR_VARIABLE, HostFactsCache
+from .fingerprint import HostFingerprint, get_host_fingerprint
+from .interface_index import InterfaceInfoIndex, get_pci_address_key
 
 if typing.TYPE_CHECKING:
+    import asyncio
+
     from mfd_connect import (
         Connection,
     )
@@ -47,6 +59,8 @@ if typing.TYPE_CHECKING:
     from mfd_dmesg import Dmesg
     from mfd_event_log import EventLog
 
+    from .batch import CommandBatch
+    from .feature.stats import StatsFeatureType
     from .feature.utils import UtilsFeatureType
     from .feature.memory import MemoryFeatureType
     from .feature.cpu import CPUFeatureType
@@ -56,6 +70,13 @@ if typing.TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 add_logging_level(level_name="MODULE_DEBUG", level_value=log_levels.MODULE_DEBUG)
 
+HOST_CLASSES = {
+    OSName.LINUX: ".linux:LinuxHost",
+    OSName.WINDOWS: ".windows:WindowsHost",
+    OSName.ESXI: ".esxi:ESXiHost",
+    OSName.FREEBSD: ".freebsd:FreeBSDHost",
+}
+
 
 class Host(ABC):
     """Abstract class for host."""
@@ -70,23 +91,13 @@ class Host(ABC):
         if cls != Host:
             return super().__new__(cls)
 
-        from .linux import LinuxHost
-        from .windows import WindowsHost
-        from .esxi import ESXiHost
-        from .freebsd import FreeBSDHost
-
-        os_name = connection.get_os_name()
-        os_name_to_class = {
-            OSName.LINUX: LinuxHost,
-            OSName.WINDOWS: WindowsHost,
-            OSName.ESXI: ESXiHost,
-            OSName.FREEBSD: FreeBSDHost,
-        }
-
-        if os_name not in os_name_to_class.keys():
+        os_name = get_host_fingerprint(connection).os_name
+        if os_name not in HOST_CLASSES:
             raise HostConnectedOSNotSupported(f"Unsupported OS for Host: {os_name}")
 
-        owner_class = os_name_to_class.get(os_name)
+        # only module of host for the connected OS is imported
+        module_name, _, class_name = HOST_CLASSES[os_name].partition(":")
+        owner_class = getattr(import_module(module_name, __package__), class_name)
         return super().__new__(owner_class)
 
     def __init__(self, *, connection: "Connection", **kwargs):
@@ -94,6 +105,13 @@ class Host(ABC):
         Initialize Host.
 
         :param connection: Instance of mfd-connect connection.
+        :param interface_info_cache_ttl: Time in seconds for which info about all interfaces is cached, 0 - disabled
+        :param async_concurrency: Maximum number of awaitable calls executed at the same time on the host, 1 by default
+        :param coalesce_commands: Whether identical commands issued concurrently by features share single execution
+        :param facts_cache_dir: Local directory persisting static facts of the host between sessions,
+                                `MFD_HOST_FACTS_CACHE_DIR` environment variable by default, disabled if not set
+        :param fingerprint_validation_interval: Time in seconds after which access to details of host fingerprint
+                                                checks boot ID of the host, 60 by default, 0 - disabled
         """
         self.connection = connection
         self.name: str = kwargs.get("name")
@@ -141,6 +159,87 @@ class Host(ABC):
         self._service: ServiceFeatureType | None = None
         self._device: DeviceFeatureType | None = None
 
+        self._interface_subscribers: list[tuple[Callable[[InterfaceEvent], None], set[InterfaceEventType]]] = []
+
+        # Guards lazy initialization of features and subscribers list, reentrant as features may use other features
+        self._lock = threading.RLock()
+        # Serializes refreshes of `network_interfaces`, separate lock so features are not blocked by long refresh
+        self._refresh_lock = threading.RLock()
+
+        # Batch of commands collected by `batch()` context, separate for each thread
+        self._batch_context = threading.local()
+
+        # Awaitable calls (`a<method>` of features, `arefresh_network_interfaces`) are limited by semaphore per loop
+        self.async_concurrency: int = kwargs.get("async_concurrency", 1)
+        self._async_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+        # Identical concurrent commands of features share single execution, when enabled
+        self.single_flight: Optional["SingleFlight"] = None
+        if kwargs.get("coalesce_commands"):
+            from .single_flight import SingleFlight
+
+            self.single_flight = SingleFlight()
+
+        if "fingerprint_validation_interval" in kwargs:
+            self.fingerprint.validation_interval = kwargs["fingerprint_validation_interval"]
+
+        # Static facts of the host (e.g. CPU topology) are persisted between sessions, when enabled
+        self.facts_cache: Optional[HostFactsCache] = None
+        facts_cache_dir = kwargs.get("facts_cache_dir", os.environ.get(FACTS_CACHE_DIR_VARIABLE))
+        if facts_cache_dir:
+            self.facts_cache = HostFactsCache(facts_cache_dir, connection)
+
+        host = weakref.ref(self)
+        self.interface_info_cache = InterfaceInfoCache(
+            fetch=lambda: host().network._get_all_interfaces_info(), ttl=kwargs.get("interface_info_cache_ttl", 0)
+        )
+
+    @property
+    def fingerprint(self) -> HostFingerprint:
+        """Details identifying the host, shared by all users of the connection."""
+        return get_host_fingerprint(self.connection)
+
+    @property
+    def _feature_connection(self) -> "Connection":
+        """Connection used by features, coalescing identical concurrent commands if enabled."""
+        if self.single_flight is None:
+            return self.connection
+        return self.single_flight.wrap(self.connection)
+
+    @property
+    def active_batch(self) -> Optional["CommandBatch"]:
+        """Batch collecting commands of feature calls in current thread, see `batch()`."""
+        return getattr(self._batch_context, "batch", None)
+
+    @contextmanager
+    def batch(self) -> Iterator["CommandBatch"]:
+        """
+        Collect commands of feature calls and execute them in single round trip on exit.
+
+        Feature methods not returning command output (e.g. `utils.set_icmp_echo()`, `memory.set_huge_pages()`)
+        queue their commands, other commands can be queued by `add()` of yielded batch,
+        their results are available after exit. Nested contexts share the outer batch.
+        Commands are not executed if exception is raised inside the context.
+
+        :return: Batch of commands
+        :raises custom_exception or ConnectionCalledProcessError: on exit, if any of commands failed
+        """
+        if self.active_batch is not None:
+            yield self.active_batch
+            return
+
+        from .batch import CommandBatch
+
+        batch = CommandBatch(self.connection, self.fingerprint.os_name)
+        self._batch_context.batch = batch
+        try:
+            yield batch
+        finally:
+            self._batch_context.batch = None
+        batch.execute()
+
     @property
     def network(
         self,
@@ -154,9 +253,15 @@ class Host(ABC):
     ]:
         """Network feature."""
         if self._network is None:
-            from mfd_network_adapter import NetworkAdapterOwner
+            with self._lock:
+                if self._network is None:
+                    from mfd_network_adapter import NetworkAdapterOwner
 
-            self._network = NetworkAdapterOwner(connection=self.connection, cli_client=self.cli_client)
+                    network = NetworkAdapterOwner(connection=self.connection, cli_client=self.cli_client)
+                    if self.interface_info_cache.enabled:
+                        self.interface_info_cache.bind_invalidation(network)
+                    # published only when ready, other threads must not see owner without invalidation bound
+                    self._network = network
 
         return self._network
 
@@ -168,9 +273,14 @@ class Host(ABC):
     ]:
         """Driver feature."""
         if self._driver is None:
-            from mfd_package_manager import PackageManager
+            with self._lock:
+                if self._driver is None:
+                    from mfd_package_manager import PackageManager
 
-            self._driver = PackageManager(connection=self.connection)
+                    driver = PackageManager(connection=self.connection)
+                    if self.interface_info_cache.enabled:
+                        self.interface_info_cache.bind_driver_invalidation(driver)
+                    self._driver = driver
 
         return self._driver
 
@@ -178,22 +288,9 @@ class Host(ABC):
     def event(self) -> "EventLog | Dmesg":
         """Event feature."""
         if self._event is None:
-            from mfd_dmesg import Dmesg
-            from mfd_event_log import EventLog
-            from mfd_connect import RPyCConnection
-            from .esxi import ESXiHost
-            from .linux import LinuxHost
-            from .freebsd import FreeBSDHost
-            from .windows import WindowsHost
-
-            if self.__class__ in [ESXiHost, FreeBSDHost, LinuxHost]:
-                self._event = Dmesg(connection=self.connection)
-            elif self.__class__ in [WindowsHost] and type(self.connection) in [RPyCConnection]:
-                self._event = EventLog(connection=self.connection)
-            else:
-                raise HostConnectionTypeNotSupported(
-                    f"Unsupported connection type: {type(self.connection)} for event feature."
-                )
+            with self._lock:
+                if self._event is None:
+                    self._create_event_object()
 
         return self._event
 
@@ -201,7 +298,9 @@ class Host(ABC):
     def virtualization(self) -> Union["HypervHypervisor", "KVMHypervisor", "ESXiHypervisor"]:
         """Virtualization feature."""
         if self._virtualization is None:
-            self._create_virtualization_object()
+            with self._lock:
+                if self._virtualization is None:
+                    self._create_virtualization_object()
 
         return self._virtualization
 
@@ -209,9 +308,11 @@ class Host(ABC):
     def utils(self) -> "UtilsFeatureType":
         """Utils feature."""
         if self._utils is None:
-            from .feature.utils import BaseFeatureUtils
+            with self._lock:
+                if self._utils is None:
+                    from .feature.utils import BaseFeatureUtils
 
-            self._utils = BaseFeatureUtils(connection=self.connection, host=self)
+                    self._utils = BaseFeatureUtils(connection=self._feature_connection, host=self)
 
         return self._utils
 
@@ -219,51 +320,82 @@ class Host(ABC):
     def memory(self) -> "MemoryFeatureType":
         """Memory feature."""
         if self._memory is None:
-            from .feature.memory import BaseFeatureMemory
+            with self._lock:
+                if self._memory is None:
+                    from .feature.memory import BaseFeatureMemory
 
-            self._memory = BaseFeatureMemory(connection=self.connection, host=self)
+                    self._memory = BaseFeatureMemory(connection=self._feature_connection, host=self)
         return self._memory
 
     @property
-    def stats(self) -> StatsFeatureType:
+    def stats(self) -> "StatsFeatureType":
         """Stats feature."""
         if self._stats is None:
-            self._stats = BaseFeatureStats(connection=self.connection, host=self)
+            with self._lock:
+                if self._stats is None:
+                    from .feature.stats import BaseFeatureStats
+
+                    self._stats = BaseFeatureStats(connection=self._feature_connection, host=self)
         return self._stats
 
     @property
     def cpu(self) -> "CPUFeatureType":
         """CPU feature."""
         if self._cpu is None:
-            from .feature.cpu import BaseFeatureCPU
+            with self._lock:
+                if self._cpu is None:
+                    from .feature.cpu import BaseFeatureCPU
 
-            self._cpu = BaseFeatureCPU(connection=self.connection, host=self)
+                    self._cpu = BaseFeatureCPU(connection=self._feature_connection, host=self)
         return self._cpu
 
     @property
     def service(self) -> "ServiceFeatureType":
         """Service feature."""
         if self._service is None:
-            from .feature.service import BaseFeatureService
+            with self._lock:
+                if self._service is None:
+                    from .feature.service import BaseFeatureService
 
-            self._service = BaseFeatureService(connection=self.connection, host=self)
+                    self._service = BaseFeatureService(connection=self._feature_connection, host=self)
         return self._service
 
     @property
     def device(self) -> "DeviceFeatureType":
         """Device feature."""
         if self._device is None:
-            from .feature.device import BaseFeatureDevice
+            with self._lock:
+                if self._device is None:
+                    from .feature.device import BaseFeatureDevice
 
-            self._device = BaseFeatureDevice(connection=self.connection, host=self)
+                    self._device = BaseFeatureDevice(connection=self._feature_connection, host=self)
         return self._device
 
+    def _create_event_object(self) -> None:
+        """Decide which object should be created and initialize it."""
+        from mfd_dmesg import Dmesg
+        from mfd_event_log import EventLog
+        from mfd_connect import RPyCConnection
+        from .esxi import ESXiHost
+        from .linux import LinuxHost
+        from .freebsd import FreeBSDHost
+        from .windows import WindowsHost
+
+        if self.__class__ in [ESXiHost, FreeBSDHost, LinuxHost]:
+            self._event = Dmesg(connection=self.connection)
+        elif self.__class__ in [WindowsHost] and type(self.connection) in [RPyCConnection]:
+            self._event = EventLog(connection=self.connection)
+        else:
+            raise HostConnectionTypeNotSupported(
+                f"Unsupported connection type: {type(self.connection)} for event feature."
+            )
+
     def _create_virtualization_object(self) -> None:
         """Decide which object should be created and initialize it."""
         from mfd_hyperv.hypervisor import HypervHypervisor
         from mfd_kvm.hypervisor import KVMHypervisor
 
-        os_name = self.connection.get_os_name()
+        os_name = self.fingerprint.os_name
         os_name_to_class = {
             OSName.LINUX: KVMHypervisor,
             OSName.FREEBSD: KVMHypervisor,
@@ -289,28 +421,6 @@ class Host(ABC):
             return False
         return interface.name == compared_to.name and interface.pci_address == compared_to.pci_address
 
-    @staticmethod
-    def _add_visited_flag_to_objects(objects: List[object]) -> None:
-        """Upodate in-place objects from the list."""
-        for item in objects:
-            setattr(item, "visited", False)
-
-    @staticmethod
-    def _remove_unvisited_interfaces_and_cleanup(interfaces: List["NetworkInterface"]) -> None:
-        """Remove unvisited interfaces from the list and remove 'visited' attribute from all interfaces."""
-        to_be_removed = []
-        for interface in interfaces:
-            if not interface.visited:
-                to_be_removed.append(interface)
-
-        for interface in to_be_removed:
-            interfaces.remove(interface)
-
-        # remove 'visited' tag
-        for iface in interfaces:
-            if getattr(iface, "visited", False):
-                delattr(iface, "visited")
-
     def _add_interfaces(
         self,
         interfaces: list["NetworkInterface"],
@@ -322,29 +432,148 @@ class Host(ABC):
         for info, model in interfaces_info:
             interfaces.append(NetworkInterface(connection=self.connection, interface_info=info, topology=model))
 
+    def _get_all_network_interfaces(self) -> list["NetworkInterface"]:
+        """Get NetworkInterface objects for all interfaces of the host, based on cached interfaces info."""
+        interfaces = []
+        self._add_interfaces(interfaces, [(info, None) for info in self.interface_info_cache.get()])
+        return interfaces
+
     @staticmethod
-    def _update_interfaces(
+    def _get_interface_key(interface_info: "InterfaceInfo") -> tuple:
+        """Get key identifying interface, consistent with `_are_interfaces_same()` comparison."""
+        return interface_info.interface_type, interface_info.name, get_pci_address_key(interface_info.pci_address)
+
+    @staticmethod
+    def _get_refresh_scope(
+        interface_types: Optional[List["InterfaceType"]] = None,
+        pci_addresses: Optional[List[PCIAddress]] = None,
+        interface_names: Optional[List[str]] = None,
+    ) -> Optional[Callable[["InterfaceInfo"], bool]]:
+        """
+        Get predicate checking whether interface is in scope of partial refresh.
+
+        Interface is in scope when it matches any of passed criteria.
+        Criteria use only fields of the key from `_get_interface_key()`, so scope is consistent for matched interfaces.
+
+        :param interface_types: Types of interfaces to be refreshed
+        :param pci_addresses: PCI addresses of interfaces to be refreshed
+        :param interface_names: Names of interfaces to be refreshed
+        :return: Predicate or None if no criteria passed (full refresh)
+        """
+        if not (interface_types or pci_addresses or interface_names):
+            return None
+
+        types = set(interface_types or [])
+        pci_address_keys = {get_pci_address_key(pci_address) for pci_address in pci_addresses or []}
+        names = set(interface_names or [])
+
+        def _is_in_scope(interface_info: "InterfaceInfo") -> bool:
+            return (
+                interface_info.interface_type in types
+                or interface_info.name in names
+                or (
+                    interface_info.pci_address is not None
+                    and get_pci_address_key(interface_info.pci_address) in pci_address_keys
+                )
+            )
+
+        return _is_in_scope
+
+    def _has_topology_interfaces(self) -> bool:
+        """Check whether topology of the host contains network interfaces models."""
+        return bool(self.topology and self.topology.network_interfaces)
+
+    def _get_scoped_interfaces_info(
+        self,
+        interface_types: Optional[List["InterfaceType"]] = None,
+        pci_addresses: Optional[List[PCIAddress]] = None,
+        interface_names: Optional[List[str]] = None,
+    ) -> Optional[list["InterfaceInfoType"]]:
+        """
+        Gather info only about interfaces in scope of partial refresh, without enumeration of all interfaces.
+
+        Gathered info must be the same as the one of matching interfaces from full enumeration of network owner,
+        it may contain interfaces out of scope, they are skipped by the scope.
+
+        :param interface_types: Types of interfaces to be refreshed
+        :param pci_addresses: PCI addresses of interfaces to be refreshed
+        :param interface_names: Names of interfaces to be refreshed
+        :return: List of InterfaceInfo objects, None if scoped query is not supported for the host or passed scope
+        """
+        return None
+
+    def _reconcile_interfaces(
+        self,
         interfaces: list["NetworkInterface"],
         interfaces_info: list[tuple["InterfaceInfoType", "NetworkInterfaceModel | None"]],
-    ) -> None:
-        """Update interfaces with interface info data."""
+        scope: Optional[Callable[["InterfaceInfo"], bool]] = None,
+    ) -> InterfaceChangeSet:
+        """
+        Reconcile in-place list of NetworkInterface objects with fresh interface info data.
+
+        Objects matching fresh data keep their identity and get only interface info updated,
+        objects not matching any of fresh data are removed and new objects are created for the remaining data.
+
+        :param interfaces: List of NetworkInterface objects to be reconciled
+        :param interfaces_info: List of tuples of fresh InterfaceInfo and NetworkInterfaceModel objects
+        :param scope: Predicate selecting interfaces to be reconciled,
+                      objects and data out of scope are left as they are
+        :return: Change-set with added, removed and updated NetworkInterface objects
+        """
+        fresh_info = {}
+        for info, model in interfaces_info:
+            if scope is None or scope(info):
+                fresh_info.setdefault(self._get_interface_key(info), (info, model))
+
+        change_set = InterfaceChangeSet()
+        kept_interfaces = []
+        kept_keys = set()
         for interface in interfaces:
-            for compared_to, _ in interfaces_info:
-                if Host._are_interfaces_same(interface._interface_info, compared_to):
-                    interface.visited = True
-                    compared_to.visited = True
-                    interface._interface_info = compared_to  # updating only interface info
+            key = self._get_interface_key(interface._interface_info)
+            if scope is not None and not scope(interface._interface_info):
+                kept_interfaces.append(interface)
+                continue
+            matching = fresh_info.get(key)
+            if matching is None:
+                change_set.removed.append(interface)
+                continue
+            info, _ = matching
+            if interface._interface_info != info:
+                change_set.updated.append(interface)
+            interface._interface_info = info  # updating only interface info
+            kept_interfaces.append(interface)
+            kept_keys.add(key)
+
+        reconciled_interfaces = list(kept_interfaces)
+        self._add_interfaces(
+            interfaces=reconciled_interfaces,
+            interfaces_info=[matching for key, matching in fresh_info.items() if key not in kept_keys],
+        )
+        change_set.added = reconciled_interfaces[len(kept_interfaces) :]
+        # single slice assignment, so `list(host.network_interfaces)` in other thread gets either old or new content
+        interfaces[:] = reconciled_interfaces
+        return change_set
 
     def _get_filtered_interface_info_by_topology(
         self, interfaces_info: list["InterfaceInfoType"], ignore_instantiate: bool
     ) -> list[tuple["InterfaceInfoType", "NetworkInterfaceModel"]]:
-        """Get InterfaceInfo objects from topology models."""
+        """
+        Get InterfaceInfo objects from topology models.
+
+        Index of interfaces reproduces filtering of base NetworkAdapterOwner, owners with own filtering
+        (e.g. ESXi, which matches all criteria at once) filter the list by themselves.
+        """
+        from mfd_network_adapter.network_adapter_owner.base import NetworkAdapterOwner
         from mfd_network_adapter.network_adapter_owner.exceptions import NetworkAdapterIncorrectData
 
         models_to_instantiate = [
             interface for interface in self.topology.network_interfaces if interface.instantiate or ignore_instantiate
         ]
         filtered_info = []
+        if type(self.network)._filter_interfaces_info is NetworkAdapterOwner._filter_interfaces_info:
+            filter_interfaces_info = InterfaceInfoIndex(interfaces_info).filter
+        else:
+            filter_interfaces_info = partial(self.network._filter_interfaces_info, all_interfaces_info=interfaces_info)
 
         for interface_model in models_to_instantiate:
             try:
@@ -352,8 +581,7 @@ class Host(ABC):
                     interface_indexes = [int(interface_model.interface_index)]
                 else:
                     interface_indexes = getattr(interface_model, "interface_indexes", None)
-                info = self.network._filter_interfaces_info(
-                    all_interfaces_info=interfaces_info,
+                info = filter_interfaces_info(
                     pci_address=None
                     if interface_model.pci_address is None
                     else PCIAddress(data=interface_model.pci_address),
@@ -383,8 +611,14 @@ class Host(ABC):
         return filtered_info
 
     def refresh_network_interfaces(
-        self, ignore_instantiate: bool = False, extended: Optional[List["InterfaceType"]] = None
-    ) -> None:
+        self,
+        ignore_instantiate: bool = False,
+        extended: Optional[List["InterfaceType"]] = None,
+        *,
+        interface_types: Optional[List["InterfaceType"]] = None,
+        pci_addresses: Optional[List[PCIAddress]] = None,
+        interface_names: Optional[List[str]] = None,
+    ) -> InterfaceChangeSet:
         """Refresh NetworkInteface objects.
 
         - Addition:
@@ -393,7 +627,7 @@ class Host(ABC):
 
         - Update:
         In case objects are already added to the list they are updated with the fresh `interface_info` data.
-        Check logic of `self._are_interfaces_same()` method used for comparing interfaces.
+        Interfaces are matched by (interface_type, name, pci_address) key, see `self._get_interface_key()`.
 
         - Deletion:
         In case objects from current list do not much any of fresh `interface_info` data they will be deleted
@@ -414,49 +648,143 @@ class Host(ABC):
             `host.refresh_network_interfaces(extended=[InterfaceType.VF])`
             so that will return list of topology interfaces + all VFs captured on the system
 
+        - Partial refresh:
+        In case any of `interface_types`, `pci_addresses`, `interface_names` is passed only interfaces matching
+        any of them are added, updated or deleted, other objects from `network_interfaces` list are left as they are,
+        e.g. after VFs creation:
+            `host.refresh_network_interfaces(extended=[InterfaceType.VF], interface_types=[InterfaceType.VF])`
+        Without topology interfaces and valid cached info, hosts supporting it (Linux: physical and virtual functions
+        from sysfs) gather info only about interfaces in scope, otherwise all interfaces are gathered.
+
+        - Thread safety:
+        Concurrent calls are serialized, `network_interfaces` list is replaced in single step,
+        so copy of it taken in other thread (`list(host.network_interfaces)`) never contains partial result.
+
         :param ignore_instantiate: flag to determine whether 'instantiate' from interface model is checked or ignored
         :param extended: List of interface types to be included in result, e.g. [InterfaceType.VF]
+        :param interface_types: Partial refresh - types of interfaces to be refreshed
+        :param pci_addresses: Partial refresh - PCI addresses of interfaces to be refreshed
+        :param interface_names: Partial refresh - names of interfaces to be refreshed
+        :return: Change-set with added, removed and updated NetworkInterface objects
         :raises NetworkAdapterIncorrectData: in case topology data doesn't much any of the interfaces from the system
         :raises ValueError: if there is problem while creating network interfaces
         """
-        logger.log(level=log_levels.MODULE_DEBUG, msg="Preparing NetworkInterfaces.")
+        with self._refresh_lock:
+            logger.log(level=log_levels.MODULE_DEBUG, msg="Preparing NetworkInterfaces.")
+
+            if (self.topology and extended and not self.topology.network_interfaces) or (
+                not self.topology and extended
+            ):
+                raise NetworkInterfaceRefreshException(
+                    "Wrong usage of extended parameter - "
+                    "if there is no topology interfaces then all interfaces "
+                    "are always collected."
+                )
+            scope = self._get_refresh_scope(
+                interface_types=interface_types, pci_addresses=pci_addresses, interface_names=interface_names
+            )
+            all_interfaces_info = None
+            if scope is not None and not self.interface_info_cache.valid and not self._has_topology_interfaces():
+                # only interfaces in scope are gathered, topology models are matched against all interfaces
+                all_interfaces_info = self._get_scoped_interfaces_info(
+                    interface_types=interface_types, pci_addresses=pci_addresses, interface_names=interface_names
+                )
+            if all_interfaces_info is None:
+                # gather fresh info about interfaces, cached one is used if interface info cache is enabled
+                all_interfaces_info = self.interface_info_cache.get()
 
-        if (self.topology and extended and not self.topology.network_interfaces) or (not self.topology and extended):
-            raise NetworkInterfaceRefreshException(
-                "Wrong usage of extended parameter - "
-                "if there is no topology interfaces then all interfaces "
-                "are always collected."
+            if not self._has_topology_interfaces():
+                # case 2)
+                filtered_info = [(x, None) for x in all_interfaces_info]
+            else:
+                # case 1a) & 1b) & 1c)
+                filtered_info = self._get_filtered_interface_info_by_topology(
+                    interfaces_info=all_interfaces_info, ignore_instantiate=ignore_instantiate
+                )  # it's a list of tuples of InterfaceInfo and NetworkInterfaceModel objects
+                if extended:
+                    # case 1c)
+                    extended_info = [(x, None) for x in all_interfaces_info if x.interface_type in extended]
+                    filtered_info.extend(extended_info)
+
+            change_set = self._reconcile_interfaces(
+                interfaces=self.network_interfaces, interfaces_info=filtered_info, scope=scope
             )
-        # gather fresh info about interfaces
-        all_interfaces_info = self.network._get_all_interfaces_info()
+            self._notify_interface_subscribers(change_set)
+            return change_set
 
-        # visited flag is used temporarily, it should be deleted from obejcts by the end of method call
-        self._add_visited_flag_to_objects(objects=self.network_interfaces + all_interfaces_info)
+    async def arefresh_network_interfaces(self, *args, **kwargs) -> InterfaceChangeSet:
+        """
+        Awaitable variant of `refresh_network_interfaces()`, executed in worker thread.
 
-        # case 2)
-        if not self.topology or not self.topology.network_interfaces:
-            self._update_interfaces(
-                interfaces=self.network_interfaces, interfaces_info=[(x, None) for x in all_interfaces_info]
-            )
-            self._remove_unvisited_interfaces_and_cleanup(self.network_interfaces)
-            self._add_interfaces(
-                interfaces=self.network_interfaces,
-                interfaces_info=[(info, None) for info in all_interfaces_info if not info.visited],
-            )
+        Subscribers of interface events are called in the worker thread.
+
+        :param args: Positional arguments of `refresh_network_interfaces()`
+        :param kwargs: Keyword arguments of `refresh_network_interfaces()`
+        :return: Change-set with added, removed and updated NetworkInterface objects
+        """
+        return await self.arun(self.refresh_network_interfaces, *args, **kwargs)
+
+    async def arun(self, function: Callable, *args, **kwargs) -> typing.Any:
+        """
+        Execute blocking function in worker thread, limited by semaphore of the host.
+
+        E.g. `await host.arun(host.network.get_interfaces)` for objects without awaitable variants of methods.
+
+        :param function: Blocking function
+        :param args: Positional arguments of function
+        :param kwargs: Keyword arguments of function
+        :return: Value returned by function
+        """
+        from .aio import call_async
+
+        return await call_async(self, function, *args, **kwargs)
+
+    def subscribe_interface_events(
+        self,
+        callback: Callable[[InterfaceEvent], None],
+        event_types: Optional[List[InterfaceEventType]] = None,
+    ) -> None:
+        """
+        Subscribe to events emitted by `refresh_network_interfaces()`.
+
+        Callback is called with InterfaceEvent object for each added, removed or updated (info changed) interface.
+
+        :param callback: Function called with InterfaceEvent object
+        :param event_types: Types of events to be delivered, all types by default
+        """
+        with self._lock:
+            self.unsubscribe_interface_events(callback)
+            self._interface_subscribers.append((callback, set(event_types or InterfaceEventType)))
+
+    def unsubscribe_interface_events(self, callback: Callable[[InterfaceEvent], None]) -> None:
+        """
+        Unsubscribe from events emitted by `refresh_network_interfaces()`.
+
+        :param callback: Function passed to `subscribe_interface_events()`
+        """
+        with self._lock:
+            self._interface_subscribers = [
+                (subscriber, event_types)
+                for subscriber, event_types in self._interface_subscribers
+                if subscriber != callback
+            ]
+
+    def _notify_interface_subscribers(self, change_set: InterfaceChangeSet) -> None:
+        """
+        Deliver events from change-set to subscribers.
+
+        Exception raised by subscriber is logged and does not prevent delivery to other subscribers.
+
+        :param change_set: Change-set of reconciled NetworkInterface objects
+        """
+        if not self._interface_subscribers or not change_set:
             return
 
-        # case 1a) & 1b) & 1c)
-        filtered_info = self._get_filtered_interface_info_by_topology(
-            interfaces_info=all_interfaces_info, ignore_instantiate=ignore_instantiate
-        )  # it's a list of tuples of InterfaceInfo and NetworkInterfaceModel objects
-        if extended:
-            # case 1c)
-            extended_info = [(x, None) for x in all_interfaces_info if x.interface_type in extended]
-            filtered_info.extend(extended_info)
-
-        self._update_interfaces(interfaces=self.network_interfaces, interfaces_info=filtered_info)
-        self._remove_unvisited_interfaces_and_cleanup(self.network_interfaces)
-        self._add_interfaces(
-            interfaces=self.network_interfaces,
-            interfaces_info=[(info, model) for (info, model) in filtered_info if not info.visited],
-        )
+        for event in get_interface_events(change_set):
+            for callback, event_types in list(self._interface_subscribers):
+                if event.event_type not in event_types:
+                    continue
+                try:
+                    callback(event)
+                except Exception as e:
+                    logger.warning(f"Interface event subscriber {callback} failed on {event}: {e}")
@@ -0,0 +1,202 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for batches of commands executed in single round trip."""
+
+import logging
+import re
+import typing
+from dataclasses import dataclass
+from subprocess import CalledProcessError
+from typing import Iterable, Optional, Type
+from uuid import uuid4
+
+from mfd_common_libs import add_logging_level, log_levels
+from mfd_typing import OSName
+
+from .exceptions import CommandBatchException
+
+if typing.TYPE_CHECKING:
+    from mfd_connect import Connection
+    from mfd_connect.base import ConnectionCompletedProcess
+
+logger = logging.getLogger(__name__)
+add_logging_level(level_name="MODULE_DEBUG", level_value=log_levels.MODULE_DEBUG)
+
+# Each command is wrapped, so its stdout, return code and stderr are delimited by markers with unique token
+SHELL_BATCH_HEADER = "__mfd_err=$(mktemp 2>/dev/null || mktemp -t mfd_host)"
+SHELL_BATCH_COMMAND = (
+    "printf '%s\\n' '{marker}:{index}:out'\n"
+    "{{ {command}\n"
+    '}} 2>"$__mfd_err"\n'
+    "printf '\\n{marker}:{index}:rc:%s\\n' \"$?\"\n"
+    'cat "$__mfd_err"\n'
+    "printf '\\n{marker}:{index}:end\\n'"
+)
+SHELL_BATCH_FOOTER = 'rm -f "$__mfd_err"'
+POWERSHELL_BATCH_COMMAND = (
+    "Write-Output '{marker}:{index}:out'; $__mfd_err = ''; $global:LASTEXITCODE = 0; "
+    "try {{ & {{ {command} }} | Out-String -Stream -Width 4096; "
+    "$__mfd_rc = if (-not $?) {{ 1 }} else {{ [int]$LASTEXITCODE }} }} "
+    "catch {{ $__mfd_err = $_ | Out-String; $__mfd_rc = 1 }}; "
+    'Write-Output "`n{marker}:{index}:rc:$__mfd_rc"; if ($__mfd_err) {{ Write-Output $__mfd_err.TrimEnd() }}; '
+    'Write-Output "`n{marker}:{index}:end"'
+)
+
+
+@dataclass
+class BatchedCommand:
+    """Dataclass for command queued in batch, `result` is set when batch is executed."""
+
+    command: str
+    expected_return_codes: Optional[Iterable[int]] = frozenset({0})
+    custom_exception: Optional[Type[CalledProcessError]] = None
+    result: Optional["ConnectionCompletedProcess"] = None
+
+    @property
+    def done(self) -> bool:
+        """Check whether command was executed."""
+        return self.result is not None
+
+    @property
+    def stdout(self) -> str:
+        """Standard output of executed command."""
+        return self.check().stdout
+
+    def check(self) -> "ConnectionCompletedProcess":
+        """
+        Get result of executed command, checking its return code.
+
+        :return: Result of command
+        :raises CommandBatchException: if batch with command was not executed yet
+        :raises custom_exception or ConnectionCalledProcessError: if return code is not expected
+        """
+        if self.result is None:
+            raise CommandBatchException(f"Command was not executed yet, batch is pending: {self.command}")
+        if not self.expected_return_codes or self.result.return_code in self.expected_return_codes:
+            return self.result
+
+        from mfd_connect.exceptions import ConnectionCalledProcessError
+
+        raise (self.custom_exception or ConnectionCalledProcessError)(
+            returncode=self.result.return_code, cmd=self.command, output=self.result.stdout, stderr=self.result.stderr
+        )
+
+
+class CommandBatch:
+    """
+    Commands executed as single shell (PowerShell on Windows) script, in one round trip to the host.
+
+    Outputs and return codes of commands are delimited in script output and delivered to each command separately.
+    Commands are executed one by one regardless of failures of previous ones, they must not exit the shell.
+    """
+
+    def __init__(self, connection: "Connection", os_name: OSName):
+        """
+        Initialize batch.
+
+        :param connection: Object of mfd-connect
+        :param os_name: OS of the host, decides whether shell or PowerShell script is used
+        """
+        self._connection = connection
+        self._os_name = os_name
+        self._commands: list[BatchedCommand] = []
+
+    def __len__(self) -> int:
+        return len([command for command in self._commands if not command.done])
+
+    def add(
+        self,
+        command: str,
+        *,
+        expected_return_codes: Optional[Iterable[int]] = frozenset({0}),
+        custom_exception: Optional[Type[CalledProcessError]] = None,
+    ) -> BatchedCommand:
+        """
+        Queue command.
+
+        :param command: Shell command (PowerShell command on Windows)
+        :param expected_return_codes: Return codes considered acceptable, None - any return code
+        :param custom_exception: Exception raised on not expected return code, must inherit from CalledProcessError
+        :return: Queued command, its result is available after execution of batch
+        """
+        batched_command = BatchedCommand(
+            command=command, expected_return_codes=expected_return_codes, custom_exception=custom_exception
+        )
+        self._commands.append(batched_command)
+        return batched_command
+
+    def execute(self) -> list[BatchedCommand]:
+        """
+        Execute queued commands in single round trip.
+
+        Results are set for all commands, before exception of the first failed command is raised.
+
+        :return: Executed commands
+        :raises CommandBatchException: if output of script can't be split into outputs of commands
+        :raises custom_exception or ConnectionCalledProcessError: if return code of any command is not expected
+        """
+        pending = [command for command in self._commands if not command.done]
+        self._commands = []
+        if not pending:
+            return pending
+
+        if len(pending) == 1:
+            pending[0].result = self._execute(pending[0].command)
+        else:
+            marker = f"__mfd_host_batch_{uuid4().hex}"
+            logger.log(level=log_levels.MODULE_DEBUG, msg=f"Executing batch of {len(pending)} commands.")
+            output = self._execute(self._get_script(pending, marker)).stdout
+            self._set_results(pending, output, marker)
+
+        for command in pending:
+            command.check()
+        return pending
+
+    def _execute(self, command: str) -> "ConnectionCompletedProcess":
+        """Execute command in shell of the host, return codes are checked by batched commands."""
+        if self._os_name == OSName.WINDOWS:
+            return self._connection.execute_powershell(command, expected_return_codes=None)
+        return self._connection.execute_command(command, shell=True, expected_return_codes=None)
+
+    def _get_script(self, commands: list[BatchedCommand], marker: str) -> str:
+        """Get script executing all commands with delimited outputs."""
+        if self._os_name == OSName.WINDOWS:
+            return "; ".join(
+                POWERSHELL_BATCH_COMMAND.format(marker=marker, index=index, command=command.command)
+                for index, command in enumerate(commands)
+            )
+        return "\n".join(
+            [SHELL_BATCH_HEADER]
+            + [
+                SHELL_BATCH_COMMAND.format(marker=marker, index=index, command=command.command)
+                for index, command in enumerate(commands)
+            ]
+            + [SHELL_BATCH_FOOTER]
+        )
+
+    @staticmethod
+    def _set_results(commands: list[BatchedCommand], output: str, marker: str) -> None:
+        """
+        Split output of script into results of commands.
+
+        :raises CommandBatchException: if output of any command is missing
+        """
+        from mfd_connect.base import ConnectionCompletedProcess
+
+        pattern = re.compile(
+            rf"^{marker}:(?P<index>\d+):out\n(?P<stdout>.*?)\n{marker}:(?P=index):rc:(?P<rc>-?\d+)\n"
+            rf"(?P<stderr>.*?)\n{marker}:(?P=index):end$",
+            re.MULTILINE | re.DOTALL,
+        )
+        for match in pattern.finditer(output):
+            command = commands[int(match["index"])]
+            command.result = ConnectionCompletedProcess(
+                args=command.command,
+                stdout=match["stdout"],
+                stderr=match["stderr"],
+                return_code=int(match["rc"]),
+            )
+
+        missing = [command.command for command in commands if not command.done]
+        if missing:
+            raise CommandBatchException(f"Output of batched commands is missing: {missing}, batch output: {output}")
@@ -0,0 +1,164 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for host-scoped interface info cache."""
+
+import logging
+import threading
+import typing
+from functools import wraps
+from time import monotonic
+from typing import Any, Callable, Iterable, Optional
+
+from mfd_common_libs import add_logging_level, log_levels
+
+if typing.TYPE_CHECKING:
+    from mfd_network_adapter import NetworkAdapterOwner
+    from mfd_package_manager import PackageManager
+    from mfd_network_adapter.network_adapter_owner.base import InterfaceInfoType
+
+logger = logging.getLogger(__name__)
+add_logging_level(level_name="MODULE_DEBUG", level_value=log_levels.MODULE_DEBUG)
+
+# Operations of NetworkAdapterOwner (and its features) which change set of interfaces or their details
+INTERFACE_INFO_MUTATING_OPERATIONS = {
+    None: (
+        "create_vfs",
+        "delete_vfs",
+        "load_driver_module",
+        "load_driver_file",
+        "unload_driver_module",
+        "reload_driver_module",
+    ),
+    "vlan": ("create_vlan", "create_macvlan", "modify_vlan", "remove_vlan", "remove_all_vlans"),
+    "vxlan": ("create_setup_vxlan", "delete_vxlan"),
+    "gre": ("create_setup_gre", "delete_gre"),
+}
+# Operations of PackageManager (host.driver) of any OS which load, unload, bind or install drivers of interfaces
+DRIVER_MUTATING_OPERATIONS = (
+    "load_module",
+    "unload_module",
+    "insert_module",
+    "bind_driver",
+    "unbind_driver",
+    "recompile_and_load_driver",
+    "install_build",
+    "install_build_for_device_id",
+    "install_vib",
+    "uninstall_vib",
+    "install_inf_driver_for_matching_devices",
+    "unload_driver",
+    "delete_driver_via_pnputil",
+)
+
+
+class InterfaceInfoCache:
+    """
+    Cache of all interfaces info gathered from the host.
+
+    Info is served from cache until TTL expires or cache is invalidated, TTL equal to 0 disables caching.
+    Cache is thread-safe, concurrent misses of enabled cache result in single fetch.
+    """
+
+    def __init__(self, fetch: Callable[[], list["InterfaceInfoType"]], ttl: float = 0):
+        """
+        Initialize cache.
+
+        :param fetch: Function gathering all interfaces info from the host
+        :param ttl: Time in seconds for which gathered info is valid
+        """
+        self._fetch = fetch
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._interfaces_info: Optional[list["InterfaceInfoType"]] = None
+        self._fetched_at = 0.0
+        self._lock = threading.RLock()
+
+    @property
+    def enabled(self) -> bool:
+        """Check whether caching is enabled."""
+        return self.ttl > 0
+
+    @property
+    def valid(self) -> bool:
+        """Check whether cached info is still valid, so `get()` serves it without gathering."""
+        with self._lock:
+            return self.enabled and self._interfaces_info is not None and monotonic() - self._fetched_at < self.ttl
+
+    def get(self) -> list["InterfaceInfoType"]:
+        """
+        Get all interfaces info, from cache if still valid.
+
+        :return: List of InterfaceInfo objects
+        """
+        if not self.enabled:
+            with self._lock:
+                self.misses += 1
+            return self._fetch()
+
+        with self._lock:
+            if self._interfaces_info is not None and monotonic() - self._fetched_at < self.ttl:
+                self.hits += 1
+                return list(self._interfaces_info)
+
+            self.misses += 1
+            interfaces_info = self._fetch()
+            self._interfaces_info = list(interfaces_info)
+            self._fetched_at = monotonic()
+            return interfaces_info
+
+    def invalidate(self) -> None:
+        """Drop cached info, next `get()` gathers it from the host, fetch in progress is waited for."""
+        with self._lock:
+            if self._interfaces_info is not None:
+                logger.log(level=log_levels.MODULE_DEBUG, msg="Interface info cache invalidated.")
+            self._interfaces_info = None
+
+    def reset_counters(self) -> None:
+        """Reset hit and miss counters."""
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+
+    def bind_invalidation(self, owner: "NetworkAdapterOwner") -> None:
+        """
+        Invalidate cache after each mutating operation called on network adapter owner or its features.
+
+        :param owner: Network adapter owner object
+        """
+        for feature_name, operations in INTERFACE_INFO_MUTATING_OPERATIONS.items():
+            try:
+                target = owner if feature_name is None else getattr(owner, feature_name)
+            except Exception as e:
+                logger.log(
+                    level=log_levels.MODULE_DEBUG,
+                    msg=f"Cache is not invalidated by {feature_name} feature operations, feature not available: {e}",
+                )
+                continue
+            self._bind_operations(target, operations)
+
+    def bind_driver_invalidation(self, package_manager: "PackageManager") -> None:
+        """
+        Invalidate cache after each operation on drivers called on package manager.
+
+        :param package_manager: Package manager object
+        """
+        self._bind_operations(package_manager, DRIVER_MUTATING_OPERATIONS)
+
+    def _bind_operations(self, target: Any, operations: Iterable[str]) -> None:
+        """Replace operations available on the object with wrappers invalidating cache."""
+        for operation in operations:
+            if callable(getattr(type(target), operation, None)):
+                setattr(target, operation, self._invalidating(target, operation))
+
+    def _invalidating(self, target: Any, operation: str) -> Callable:
+        """Get wrapper of method, looked up on the class at call time, invalidating cache after the call."""
+
+        @wraps(getattr(type(target), operation))
+        def wrapper(*args, **kwargs) -> Any:
+            try:
+                return getattr(type(target), operation)(target, *args, **kwargs)
+            finally:
+                self.invalidate()
+
+        return wrapper
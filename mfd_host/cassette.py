@@ -0,0 +1,546 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for recording outputs of remote commands and replaying them without the host."""
+
+import gzip
+import json
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from subprocess import CalledProcessError
+from io import StringIO
+from typing import IO, Any, Callable, Iterable, Iterator, Optional, Type, Union
+
+from mfd_common_libs import add_logging_level, log_levels
+from mfd_connect import Connection
+from mfd_connect.base import ConnectionCompletedProcess
+from mfd_connect.exceptions import ConnectionCalledProcessError, RemoteProcessInvalidState
+from mfd_connect.process import RemoteProcess
+from mfd_typing import OSBitness, OSName, OSType
+from mfd_typing.cpu_values import CPUArchitecture
+
+from .exceptions import CassetteException
+from .fingerprint import get_host_fingerprint
+
+logger = logging.getLogger(__name__)
+add_logging_level(level_name="MODULE_DEBUG", level_value=log_levels.MODULE_DEBUG)
+
+CASSETTE_VERSION = 1
+# Methods of connection which are recorded, stored as their index in cassette
+RECORDED_METHODS = ("execute_command", "execute_powershell", "start_process")
+# Methods of connection returning system details, recorded with type of returned value
+SYSTEM_METHODS = {
+    "get_os_name": OSName,
+    "get_os_type": OSType,
+    "get_os_bitness": OSBitness,
+    "get_cpu_architecture": CPUArchitecture,
+}
+
+
+@dataclass(frozen=True)
+class CassetteInteraction:
+    """
+    Dataclass for recorded execution of command, `duration` is wall time of execution in seconds.
+
+    Started process has no return code if it was running when recording ended, `log_path` is its log file.
+    """
+
+    method: str
+    command: str
+    stdout: str
+    stderr: str
+    return_code: Optional[int]
+    duration: float
+    log_path: Optional[str] = None
+
+
+class Cassette:
+    """
+    Recorded executions of commands, with system details (OS name, OS type, ...) and IP of the host.
+
+    Saved as gzip compressed JSON, each distinct output is stored once, as the same outputs repeat often.
+    """
+
+    def __init__(
+        self,
+        interactions: Optional[list[CassetteInteraction]] = None,
+        *,
+        system: Optional[dict[str, Any]] = None,
+        ip: Optional[str] = None,
+    ):
+        """
+        Initialize cassette.
+
+        :param interactions: Recorded executions, in order of execution
+        :param system: Values returned by system methods of connection, e.g. {"get_os_name": OSName.LINUX}
+        :param ip: IP of the host
+        """
+        self.interactions: list[CassetteInteraction] = list(interactions or [])
+        self.system: dict[str, Any] = dict(system or {})
+        self.ip = ip
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.interactions)
+
+    def add(self, interaction: CassetteInteraction) -> None:
+        """
+        Add recorded execution.
+
+        :param interaction: Recorded execution
+        """
+        with self._lock:
+            self.interactions.append(interaction)
+
+    def save(self, path: Union[str, Path]) -> None:
+        """
+        Save cassette to file.
+
+        :param path: Path of file, e.g. "meminfo.cassette.json.gz"
+        """
+        outputs: dict[str, int] = {}
+        interactions = []
+        with self._lock:
+            for interaction in self.interactions:
+                stdout = outputs.setdefault(interaction.stdout, len(outputs))
+                stderr = outputs.setdefault(interaction.stderr, len(outputs))
+                interactions.append(
+                    [
+                        RECORDED_METHODS.index(interaction.method),
+                        interaction.command,
+                        stdout,
+                        stderr,
+                        interaction.return_code,
+                        round(interaction.duration, 6),
+                    ]
+                )
+                if interaction.log_path is not None:
+                    interactions[-1].append(interaction.log_path)
+        data = {
+            "version": CASSETTE_VERSION,
+            "system": {name: value.value for name, value in self.system.items()},
+            "ip": self.ip,
+            "outputs": list(outputs),
+            "interactions": interactions,
+        }
+        with gzip.open(path, "wt", encoding="utf-8") as file:
+            json.dump(data, file, separators=(",", ":"))
+        logger.log(
+            level=log_levels.MODULE_DEBUG,
+            msg=f"Saved {len(interactions)} commands with {len(outputs)} distinct outputs to cassette {path}",
+        )
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "Cassette":
+        """
+        Load cassette from file.
+
+        :param path: Path of file saved by `save()`
+        :return: Cassette
+        :raises CassetteException: if file is not a cassette of supported version
+        """
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as file:
+                data = json.load(file)
+        except (OSError, ValueError) as e:
+            raise CassetteException(f"Unable to read cassette {path}: {e}") from e
+        if not isinstance(data, dict) or data.get("version") != CASSETTE_VERSION:
+            raise CassetteException(f"Not supported cassette version in {path}, expected {CASSETTE_VERSION}")
+
+        outputs = data["outputs"]
+        interactions = [
+            CassetteInteraction(
+                method=RECORDED_METHODS[method],
+                command=command,
+                stdout=outputs[stdout],
+                stderr=outputs[stderr],
+                return_code=return_code,
+                duration=duration,
+                log_path=log_path[0] if log_path else None,
+            )
+            for method, command, stdout, stderr, return_code, duration, *log_path in data["interactions"]
+        ]
+        system = {name: SYSTEM_METHODS[name](value) for name, value in data["system"].items()}
+        return cls(interactions, system=system, ip=data["ip"])
+
+
+@contextmanager
+def recording(connection: Connection, cassette: Optional[Cassette] = None) -> Iterator[Cassette]:
+    """
+    Record commands executed by connection inside the context.
+
+    Methods of connection object are replaced for the time of recording, so all its users (Host, features,
+    network adapter owner) are recorded and connection keeps its type. Commands failing with not expected
+    return code are recorded too. Output of started process is recorded when it is read to the end
+    (`stdout_text` or `get_stdout_iter()`), or as much as was read when recording ends.
+
+    :param connection: Object of mfd-connect
+    :param cassette: Cassette to record to, new one if not given
+    :return: Cassette with recorded commands
+    """
+    cassette = cassette if cassette is not None else Cassette()
+    if cassette.ip is None:
+        ip = getattr(connection, "ip", None)
+        cassette.ip = str(ip) if ip is not None else None
+    # OS name is usually read by Host before recording started, fingerprint has it already
+    cassette.system.setdefault("get_os_name", get_host_fingerprint(connection).os_name)
+
+    originals = {name: getattr(connection, name) for name in (*RECORDED_METHODS, *SYSTEM_METHODS)}
+    processes: list[_RecordingProcess] = []
+    for name in RECORDED_METHODS:
+        if name == "start_process":
+            setattr(connection, name, _get_recording_process_method(originals[name], cassette, processes))
+        else:
+            setattr(connection, name, _get_recording_method(originals[name], name, cassette))
+    for name in SYSTEM_METHODS:
+        setattr(connection, name, _get_recording_system_method(originals[name], name, cassette))
+    try:
+        yield cassette
+    finally:
+        for process in processes:
+            process.record()
+        for name, original in originals.items():
+            function = getattr(original, "__func__", None)
+            if function is not None and function is getattr(type(connection), name, None):
+                # method of class, instance attribute is dropped
+                delattr(connection, name)
+            else:
+                setattr(connection, name, original)
+
+
+def _get_recording_method(method: Callable, method_name: str, cassette: Cassette) -> Callable:
+    """Get replacement of method executing command, recording executions to cassette."""
+
+    def record(command: str, *args, **kwargs) -> ConnectionCompletedProcess:
+        stdout = stderr = return_code = None
+        start = time.perf_counter()
+        try:
+            result = method(command, *args, **kwargs)
+        except CalledProcessError as e:
+            stdout, stderr, return_code = e.stdout, e.stderr, e.returncode
+            raise
+        else:
+            stdout, stderr = _get_output(result, "stdout"), _get_output(result, "stderr")
+            return_code = result.return_code
+            return result
+        finally:
+            if return_code is not None:
+                cassette.add(
+                    CassetteInteraction(
+                        method=method_name,
+                        command=command,
+                        stdout=stdout or "",
+                        stderr=stderr or "",
+                        return_code=return_code,
+                        duration=time.perf_counter() - start,
+                    )
+                )
+
+    return record
+
+
+def _get_recording_process_method(
+    method: Callable, cassette: Cassette, processes: list["_RecordingProcess"]
+) -> Callable:
+    """Get replacement of method starting process, recording output of started processes to cassette."""
+
+    def record(command: str, *args, **kwargs) -> RemoteProcess:
+        process = _RecordingProcess(method(command, *args, **kwargs), command, cassette)
+        processes.append(process)
+        return process
+
+    return record
+
+
+class _RecordingProcess:
+    """Process started by recorded connection, recording its output to cassette once it was read."""
+
+    def __init__(self, process: RemoteProcess, command: str, cassette: Cassette):
+        """
+        Initialize wrapper.
+
+        :param process: Started process
+        :param command: Command of process
+        :param cassette: Cassette to record to
+        """
+        self.__wrapped__ = process
+        self._command = command
+        self._cassette = cassette
+        self._stdout: list[str] = []
+        self._start = time.perf_counter()
+        self._recorded = False
+        self._lock = threading.Lock()
+
+    @property
+    def __class__(self) -> type:
+        return self.__wrapped__.__class__
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.__wrapped__, name)
+
+    @property
+    def stdout_text(self) -> str:
+        """Get whole output of process, recording it."""
+        stdout = self.__wrapped__.stdout_text
+        self._stdout = [stdout]
+        self.record()
+        return stdout
+
+    def get_stdout_iter(self) -> Iterator[str]:
+        """Iterate over lines of output of process, recording them when iteration ends."""
+        for line in self.__wrapped__.get_stdout_iter():
+            self._stdout.append(line)
+            yield line
+        self.record()
+
+    def record(self) -> None:
+        """Add process to cassette with output read so far, once."""
+        with self._lock:
+            if self._recorded:
+                return
+            self._recorded = True
+        try:
+            return_code = None if self.__wrapped__.running else self.__wrapped__.return_code
+        except RemoteProcessInvalidState:
+            return_code = None
+        log_path = getattr(self.__wrapped__, "log_path", None)
+        self._cassette.add(
+            CassetteInteraction(
+                method="start_process",
+                command=self._command,
+                stdout="".join(self._stdout),
+                stderr="",
+                return_code=return_code,
+                duration=time.perf_counter() - self._start,
+                log_path=str(log_path) if log_path is not None else None,
+            )
+        )
+
+
+def _get_output(result: ConnectionCompletedProcess, name: str) -> Optional[str]:
+    """Get stdout or stderr of completed process, None if it was not captured."""
+    try:
+        return getattr(result, name)
+    except NotImplementedError:
+        return None
+
+
+def _get_recording_system_method(method: Callable, method_name: str, cassette: Cassette) -> Callable:
+    """Get replacement of method returning system detail, recording the detail to cassette."""
+
+    def record(*args, **kwargs) -> Any:
+        value = method(*args, **kwargs)
+        cassette.system[method_name] = value
+        return value
+
+    return record
+
+
+class ReplayConnection(Connection):
+    """
+    Connection serving outputs of commands recorded in cassette, without the host.
+
+    Executions of the same command are served in recorded order, starting over when all were served,
+    so replay is deterministic. Commands are matched by method and command only, other arguments are ignored.
+    Not expected return code raises the same exception as connection would.
+    Started processes are served as finished ones, with recorded output and return code, see `ReplayProcess`.
+    """
+
+    def __init__(self, cassette: Union[Cassette, str, Path], *, latency: float = 0.0, recorded_latency: float = 0.0):
+        """
+        Initialize connection.
+
+        :param cassette: Cassette or path of saved one
+        :param latency: Time in seconds added to each execution, simulating round trip to the host
+        :param recorded_latency: Fraction of recorded duration of command added to each execution, 1 - as recorded
+        :raises CassetteException: if OS name of the host is not recorded in cassette
+        """
+        super().__init__(cache_system_data=False)
+        self.cassette = cassette if isinstance(cassette, Cassette) else Cassette.load(cassette)
+        if "get_os_name" not in self.cassette.system:
+            raise CassetteException("OS name of the host is not recorded in cassette.")
+        self._ip = self.cassette.ip
+        self.latency = latency
+        self.recorded_latency = recorded_latency
+        self.executions = 0
+        self._interactions: dict[tuple[str, str], list[CassetteInteraction]] = {}
+        for interaction in self.cassette.interactions:
+            self._interactions.setdefault((interaction.method, interaction.command), []).append(interaction)
+        self._positions: dict[tuple[str, str], int] = {}
+        self._lock = threading.Lock()
+
+    def __str__(self) -> str:
+        return f"replay({self._ip})"
+
+    def execute_command(self, command: str, **kwargs) -> ConnectionCompletedProcess:
+        """Serve recorded output of command."""
+        return self._execute("execute_command", command, **kwargs)
+
+    def execute_powershell(self, command: str, **kwargs) -> ConnectionCompletedProcess:
+        """Serve recorded output of PowerShell command."""
+        return self._execute("execute_powershell", command, **kwargs)
+
+    def start_process(self, command: str, **kwargs) -> "ReplayProcess":
+        """Serve recorded output of started process."""
+        return ReplayProcess(self._get_next_interaction("start_process", command))
+
+    def get_os_name(self) -> OSName:
+        """Get recorded OS name of the host."""
+        return self._get_system_detail("get_os_name")
+
+    def get_os_type(self) -> OSType:
+        """Get recorded OS type of the host, derived from OS name if not recorded."""
+        if "get_os_type" not in self.cassette.system:
+            return OSType.WINDOWS if self.get_os_name() is OSName.WINDOWS else OSType.POSIX
+        return self._get_system_detail("get_os_type")
+
+    def get_os_bitness(self) -> OSBitness:
+        """Get recorded OS bitness of the host."""
+        return self._get_system_detail("get_os_bitness")
+
+    def get_cpu_architecture(self) -> CPUArchitecture:
+        """Get recorded CPU architecture of the host."""
+        return self._get_system_detail("get_cpu_architecture")
+
+    @property
+    def path(self) -> Any:
+        """Not available, file system of the host is not recorded."""
+        raise CassetteException("File system of the host is not available in replay.")
+
+    def disconnect(self) -> None:
+        """Nothing to disconnect."""
+
+    def wait_for_host(self, timeout: int = 60) -> None:
+        """Replayed host is always available."""
+
+    def restart_platform(self) -> None:
+        """Not available, replayed host can't be restarted."""
+        raise CassetteException("Platform restart is not available in replay.")
+
+    def shutdown_platform(self) -> None:
+        """Not available, replayed host can't be shut down."""
+        raise CassetteException("Platform shutdown is not available in replay.")
+
+    def _get_system_detail(self, method_name: str) -> Any:
+        """
+        Get recorded value returned by system method.
+
+        :raises CassetteException: if value was not recorded
+        """
+        if method_name not in self.cassette.system:
+            raise CassetteException(f"Value of {method_name} is not recorded in cassette.")
+        return self.cassette.system[method_name]
+
+    def _get_next_interaction(self, method_name: str, command: str) -> CassetteInteraction:
+        """
+        Get next recorded execution of command, after simulated latency.
+
+        :raises CassetteException: if command was not recorded
+        """
+        key = (method_name, command)
+        with self._lock:
+            interactions = self._interactions.get(key)
+            if not interactions:
+                raise CassetteException(f"Command not recorded in cassette, {method_name}: {command}")
+            position = self._positions.get(key, 0)
+            self._positions[key] = (position + 1) % len(interactions)
+            self.executions += 1
+        interaction = interactions[position]
+
+        delay = self.latency + self.recorded_latency * interaction.duration
+        if delay > 0:
+            time.sleep(delay)
+        return interaction
+
+    def _execute(
+        self,
+        method_name: str,
+        command: str,
+        *,
+        expected_return_codes: Optional[Iterable[int]] = frozenset({0}),
+        custom_exception: Optional[Type[CalledProcessError]] = None,
+        **kwargs,
+    ) -> ConnectionCompletedProcess:
+        """
+        Serve next recorded execution of command.
+
+        :raises CassetteException: if command was not recorded
+        :raises custom_exception or ConnectionCalledProcessError: if recorded return code is not expected
+        """
+        interaction = self._get_next_interaction(method_name, command)
+        if expected_return_codes and interaction.return_code not in expected_return_codes:
+            raise (custom_exception or ConnectionCalledProcessError)(
+                returncode=interaction.return_code, cmd=command, output=interaction.stdout, stderr=interaction.stderr
+            )
+        return ConnectionCompletedProcess(
+            args=command, stdout=interaction.stdout, stderr=interaction.stderr, return_code=interaction.return_code
+        )
+
+
+class ReplayProcess(RemoteProcess):
+    """Finished process serving recorded output, stopping and killing it does nothing."""
+
+    def __init__(self, interaction: CassetteInteraction):
+        """
+        Initialize process.
+
+        :param interaction: Recorded start of process
+        """
+        self._interaction = interaction
+        self.log_path = interaction.log_path
+
+    @property
+    def running(self) -> bool:
+        """Replayed process is always finished."""
+        return False
+
+    @property
+    def stdin_stream(self) -> IO:
+        """Not available, replayed process has no input."""
+        raise CassetteException("Input of process is not available in replay.")
+
+    @property
+    def stdout_stream(self) -> IO:
+        """Stream of recorded output."""
+        return StringIO(self._interaction.stdout)
+
+    @property
+    def stderr_stream(self) -> IO:
+        """Stream of recorded error output."""
+        return StringIO(self._interaction.stderr)
+
+    @property
+    def stdout_text(self) -> str:
+        """Recorded output."""
+        return self._interaction.stdout
+
+    @property
+    def stderr_text(self) -> str:
+        """Recorded error output."""
+        return self._interaction.stderr
+
+    def get_stdout_iter(self) -> Iterator[str]:
+        """Iterate over lines of recorded output."""
+        return iter(self._interaction.stdout.splitlines(keepends=True))
+
+    def get_stderr_iter(self) -> Iterator[str]:
+        """Iterate over lines of recorded error output."""
+        return iter(self._interaction.stderr.splitlines(keepends=True))
+
+    @property
+    def return_code(self) -> Optional[int]:
+        """Recorded return code, None if process was running when recording ended."""
+        return self._interaction.return_code
+
+    def wait(self, timeout: int = 60) -> Optional[int]:
+        """Replayed process is already finished."""
+        return self.return_code
+
+    def stop(self, wait: Optional[int] = 60) -> None:
+        """Replayed process is already finished."""
+
+    def kill(self, wait: Optional[int] = 60, with_signal: Any = None) -> None:
+        """Replayed process is already finished."""
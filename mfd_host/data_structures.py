@@ -0,0 +1,117 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for host data structures."""
+
+import typing
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Optional
+
+from .exceptions import HostFleetException
+
+if typing.TYPE_CHECKING:
+    from mfd_network_adapter import NetworkInterface
+
+    from .base import Host
+
+
+@dataclass
+class InterfaceChangeSet:
+    """Dataclass for the result of NetworkInterface objects reconciliation.
+
+    `added` - objects created for interfaces which were not tracked yet
+    `removed` - objects dropped, because their interfaces are missing from the system under test
+    `updated` - objects which received interface info different from the previous one
+    """
+
+    added: list["NetworkInterface"] = field(default_factory=list)
+    removed: list["NetworkInterface"] = field(default_factory=list)
+    updated: list["NetworkInterface"] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        """Check whether any change was detected."""
+        return bool(self.added or self.removed or self.updated)
+
+
+class InterfaceEventType(Enum):
+    """Types of events emitted on NetworkInterface objects reconciliation."""
+
+    ADDED = "added"
+    REMOVED = "removed"
+    UPDATED = "updated"
+
+
+@dataclass(frozen=True)
+class InterfaceEvent:
+    """Dataclass for the event about NetworkInterface object change."""
+
+    event_type: InterfaceEventType
+    interface: "NetworkInterface"
+
+
+def get_interface_events(change_set: InterfaceChangeSet) -> list[InterfaceEvent]:
+    """
+    Convert change-set into list of events.
+
+    Events are ordered: removed, added, updated.
+
+    :param change_set: Change-set of reconciled NetworkInterface objects
+    :return: List of events
+    """
+    return (
+        [InterfaceEvent(InterfaceEventType.REMOVED, interface) for interface in change_set.removed]
+        + [InterfaceEvent(InterfaceEventType.ADDED, interface) for interface in change_set.added]
+        + [InterfaceEvent(InterfaceEventType.UPDATED, interface) for interface in change_set.updated]
+    )
+
+
+@dataclass
+class HostCallResult:
+    """Dataclass for the result of call executed on single host of fleet.
+
+    `value` - value returned by the call, None if call failed
+    `exception` - exception raised by the call, TimeoutError if call exceeded timeout
+    `duration` - wall time of the call in seconds
+    """
+
+    host: "Host"
+    value: Any = None
+    exception: Optional[BaseException] = None
+    duration: float = 0.0
+
+    @property
+    def succeeded(self) -> bool:
+        """Check whether call returned without exception."""
+        return self.exception is None
+
+
+class FleetResult(dict):
+    """Results of call executed on fleet of hosts, HostCallResult objects keyed by Host objects in fleet order."""
+
+    @property
+    def returned(self) -> dict["Host", Any]:
+        """Values returned by succeeded calls."""
+        return {host: result.value for host, result in self.items() if result.succeeded}
+
+    @property
+    def failed(self) -> dict["Host", BaseException]:
+        """Exceptions raised by failed calls."""
+        return {host: result.exception for host, result in self.items() if not result.succeeded}
+
+    @property
+    def succeeded(self) -> bool:
+        """Check whether calls on all hosts succeeded."""
+        return all(result.succeeded for result in self.values())
+
+    def raise_on_failure(self) -> None:
+        """
+        Raise exception if call failed on any host.
+
+        :raises HostFleetException: with failures of all hosts, first exception is chained
+        """
+        failed = self.failed
+        if not failed:
+            return
+        details = ", ".join(f"{host.name or host.connection.ip}: {exception!r}" for host, exception in failed.items())
+        first_exception = next(iter(failed.values()))
+        raise HostFleetException(f"Call failed on {len(failed)} of {len(self)} hosts - {details}") from first_exception
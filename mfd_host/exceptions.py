@@ -41,6 +41,10 @@ class CPUFeatureException(HostModuleException):
     """Handle CPU Feature exceptions."""
 
 
+class StatsSamplerException(HostModuleException):
+    """Handle stats sampler errors."""
+
+
 class ServiceFeatureException(HostModuleException):
     """Handle service feature exceptions."""
 
@@ -55,3 +59,23 @@ class UtilsFeatureException(HostModuleException):
 
 class UtilsFeatureExecutionError(HostModuleException, subprocess.CalledProcessError):
     """Handle Utils feature Execution errors."""
+
+
+class InterfaceWatcherException(HostModuleException):
+    """Handle interface watcher errors."""
+
+
+class HostFleetException(HostModuleException):
+    """Handle errors of calls executed on fleet of hosts."""
+
+
+class CommandBatchException(HostModuleException):
+    """Handle errors of batch of commands."""
+
+
+class CassetteException(HostModuleException):
+    """Handle errors of recorded commands cassette."""
+
+
+class FingerprintExecutionError(HostModuleException, subprocess.CalledProcessError):
+    """Handle errors of commands gathering host fingerprint."""
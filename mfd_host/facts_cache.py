@@ -0,0 +1,175 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for persistent cache of static host facts."""
+
+import json
+import logging
+import os
+import re
+import threading
+import typing
+from copy import deepcopy
+from functools import wraps
+from pathlib import Path
+from typing import Any, Callable, Optional, TypeVar, Union
+
+from mfd_common_libs import add_logging_level, log_levels
+
+from .exceptions import FingerprintExecutionError
+from .fingerprint import get_host_fingerprint
+
+if typing.TYPE_CHECKING:
+    from mfd_connect import Connection
+
+logger = logging.getLogger(__name__)
+add_logging_level(level_name="MODULE_DEBUG", level_value=log_levels.MODULE_DEBUG)
+
+# Directory of facts cache used by hosts created without `facts_cache_dir` argument
+FACTS_CACHE_DIR_VARIABLE = "MFD_HOST_FACTS_CACHE_DIR"
+FACTS_CACHE_VERSION = 1
+UNSAFE_FILE_NAME_CHARACTERS_REGEX = re.compile(r"[^\w.-]")
+
+T = TypeVar("T")
+
+
+class HostFactsCache:
+    """
+    Static facts of the host (e.g. CPU topology, memory channels) persisted in local directory between sessions.
+
+    Facts of each host are stored in JSON file named by IP of connection, together with host fingerprint
+    (OS name, kernel, boot ID, CPU count and OS name with build). Facts are dropped when fingerprint differs,
+    so reboot of the host (build change on ESXi, which has no boot ID) or OS change invalidates them.
+    Reboot during the session is noticed by validation of fingerprint on access to facts, once validation interval
+    of fingerprint passed (see `HostFingerprint.validation_interval`), or by explicit `HostFingerprint.validate()`.
+    Facts must be JSON serializable. Errors of reading or writing the file and of gathering fingerprint are logged
+    and facts are gathered from host.
+    Cache is thread-safe, concurrent misses of the same fact result in single fetch.
+    """
+
+    def __init__(self, directory: Union[str, Path], connection: "Connection"):
+        """
+        Initialize cache.
+
+        :param directory: Local directory of cache files, created if missing, `~` is expanded
+        :param connection: Object of mfd-connect
+        """
+        self.directory = Path(directory).expanduser()
+        self._connection = connection
+        self.hits = 0
+        self.misses = 0
+        self._facts: Optional[dict[str, Any]] = None
+        self._fingerprint: Optional[dict[str, str]] = None
+        self._lock = threading.RLock()
+
+    @property
+    def path(self) -> Path:
+        """Path of the file with facts of the host."""
+        identity = str(getattr(self._connection, "ip", None) or "localhost")
+        return self.directory / f"{UNSAFE_FILE_NAME_CHARACTERS_REGEX.sub('_', identity)}.json"
+
+    def get(self, name: str, fetch: Callable[[], T]) -> T:
+        """
+        Get fact, from cache if gathered for the same boot of the host.
+
+        :param name: Name of fact, e.g. "LinuxMemory.get_memory_channels"
+        :param fetch: Function gathering the fact from the host
+        :return: Value of fact
+        """
+        with self._lock:
+            try:
+                facts = self._load()
+            except FingerprintExecutionError as e:
+                logger.log(level=log_levels.MODULE_DEBUG, msg=f"Host fingerprint not gathered, fact not cached: {e}")
+                self.misses += 1
+                return fetch()
+            if name in facts:
+                self.hits += 1
+                return deepcopy(facts[name])
+
+            self.misses += 1
+            value = fetch()
+            facts[name] = deepcopy(value)
+            self._store()
+            return value
+
+    def invalidate(self) -> None:
+        """Drop facts of the host, also from the file, they are gathered from the host on next access."""
+        with self._lock:
+            self._facts = None
+            self._fingerprint = None
+            try:
+                self.path.unlink(missing_ok=True)
+            except OSError as e:
+                logger.log(level=log_levels.MODULE_DEBUG, msg=f"Facts cache file not removed: {e}")
+            logger.log(level=log_levels.MODULE_DEBUG, msg="Host facts cache invalidated.")
+
+    def reset_counters(self) -> None:
+        """Reset hit and miss counters."""
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+
+    def _get_fingerprint(self) -> dict[str, str]:
+        """Get current fingerprint of the host, facts are valid only for the same one."""
+        fingerprint = get_host_fingerprint(self._connection)
+        return {"os_name": fingerprint.os_name.value, **fingerprint.details}
+
+    def _read(self, fingerprint: dict[str, str]) -> dict[str, Any]:
+        """Read facts stored in the file for given fingerprint, empty if file is missing or outdated."""
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.log(level=log_levels.MODULE_DEBUG, msg=f"Facts cache file not read: {e}")
+            return {}
+        if not isinstance(data, dict) or data.get("version") != FACTS_CACHE_VERSION:
+            return {}
+        if data.get("fingerprint") != fingerprint:
+            logger.log(level=log_levels.MODULE_DEBUG, msg="Host rebooted or its OS changed, cached host facts dropped.")
+            return {}
+        return data.get("facts", {})
+
+    def _load(self) -> dict[str, Any]:
+        """Get facts valid for current fingerprint of the host, read from the file once per fingerprint."""
+        fingerprint = self._get_fingerprint()
+        if self._facts is None or fingerprint != self._fingerprint:
+            self._facts = self._read(fingerprint)
+            self._fingerprint = fingerprint
+        return self._facts
+
+    def _store(self) -> None:
+        """Write facts to the file, merged with facts stored meanwhile by other sessions."""
+        self._facts = {**self._read(self._fingerprint), **self._facts}
+        data = {"version": FACTS_CACHE_VERSION, "fingerprint": self._fingerprint, "facts": self._facts}
+        # written to temporary file and renamed, so other sessions never read partially written file
+        temporary_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            temporary_path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+            os.replace(temporary_path, self.path)
+        except (OSError, TypeError, ValueError) as e:
+            logger.log(level=log_levels.MODULE_DEBUG, msg=f"Facts cache file not written: {e}")
+            if temporary_path.exists():
+                temporary_path.unlink()
+
+
+def host_fact(method: Callable[..., T]) -> Callable[..., T]:
+    """
+    Serve result of feature method without arguments from facts cache of the host, if enabled.
+
+    Fact is named by class of feature and method, e.g. "LinuxMemory.get_memory_channels".
+
+    :param method: Feature method gathering static fact of the host
+    :return: Wrapped method
+    """
+
+    @wraps(method)
+    def wrapper(self, *args, **kwargs) -> T:
+        host = self._host()
+        facts_cache = getattr(host, "facts_cache", None)
+        if not isinstance(facts_cache, HostFactsCache) or args or kwargs:
+            return method(self, *args, **kwargs)
+        return facts_cache.get(f"{type(self).__name__}.{method.__name__}", lambda: method(self))
+
+    return wrapper
@@ -5,15 +5,23 @@
 import typing
 import logging
 import weakref
-from functools import lru_cache
-from typing import Any, Dict, Set
+from types import FunctionType
+from typing import Any, Optional
 
 from mfd_common_libs import add_logging_level, log_levels
-from mfd_typing import OSName
+
+from mfd_host.feature.registry import get_feature_class
+from mfd_host.instrumentation import (
+    InstrumentedConnection,
+    get_feature_host_name,
+    instrument_method,
+    is_instrumentation_enabled,
+)
 
 if typing.TYPE_CHECKING:
     from mfd_connect import Connection
     from mfd_host import Host
+    from mfd_host.batch import BatchedCommand
 
 logger = logging.getLogger(__name__)
 add_logging_level(level_name="MODULE_DEBUG", level_value=log_levels.MODULE_DEBUG)
@@ -22,18 +30,27 @@ add_logging_level(level_name="MODULE_DEBUG", level_value=log_levels.MODULE_DEBUG
 class BaseFeature:
     """Class for BaseFeature."""
 
+    # Name of feature in registry of OS implementations, see `mfd_host.feature.registry`
+    _feature_name: Optional[str] = None
+
     def __new__(cls, *args, **kwargs):
         """Create new feature object."""
-        os_name = kwargs["connection"].get_os_name()
-        os_name = "esxi" if os_name == OSName.ESXI else os_name.value.lower()
+        from mfd_host.fingerprint import get_host_fingerprint
 
-        all_subclasses = _get_all_subclasses(cls)
-        requested_class = all_subclasses.get(os_name)
+        os_name = get_host_fingerprint(kwargs["connection"]).os_name
+        requested_class = get_feature_class(cls._feature_name, os_name) if cls._feature_name else None
 
-        if requested_class is None:
+        if requested_class is None or not issubclass(requested_class, cls):
             return super().__new__(cls)
         return super().__new__(requested_class)
 
+    def __init_subclass__(cls, **kwargs):
+        """Wrap public methods of feature, so their calls are recorded when instrumentation is enabled."""
+        super().__init_subclass__(**kwargs)
+        for name, value in list(vars(cls).items()):
+            if not name.startswith("_") and isinstance(value, FunctionType):
+                setattr(cls, name, instrument_method(value))
+
     def __init__(self, connection: "Connection", host: "Host"):
         """
         Initialize BaseFeature.
@@ -44,18 +61,54 @@ class BaseFeature:
         self._connection = connection
         self._host = weakref.ref(host)
 
+    @property
+    def _connection(self) -> "Connection":
+        """Connection of feature, its commands are recorded when instrumentation is enabled."""
+        if not is_instrumentation_enabled():
+            return self.__connection
+        return InstrumentedConnection(self.__connection, get_feature_host_name(self))
+
+    @_connection.setter
+    def _connection(self, connection: "Connection") -> None:
+        self.__connection = connection
+
+    def _execute_commands(self, commands: list[str], *, defer: bool = True, **kwargs) -> list["BatchedCommand"]:
+        """
+        Execute commands in single round trip.
+
+        If `defer` is set and host has active batch (see `Host.batch()`), commands are queued to it
+        and their results are available on exit of batch context.
+
+        :param commands: Shell commands (PowerShell commands on Windows)
+        :param defer: Whether commands can be queued to active batch of host
+        :param kwargs: Arguments of `CommandBatch.add()`, e.g. custom_exception
+        :return: Commands with results, if already executed
+        """
+        from mfd_host.batch import CommandBatch
+        from mfd_host.fingerprint import get_host_fingerprint
+
+        host = self._host()
+        active_batch = host.active_batch if defer and host is not None else None
+        if active_batch is None:
+            batch = CommandBatch(self._connection, get_host_fingerprint(self._connection).os_name)
+        else:
+            batch = active_batch
+        batched_commands = [batch.add(command, **kwargs) for command in commands]
+        if active_batch is None:
+            batch.execute()
+        return batched_commands
 
-@lru_cache()
-def _get_all_subclasses(cls: Any) -> Dict[str, Any]:
-    os_class_dict = {}
-    cls_subclasses = _subclasses(cls)
-    for subcls in cls_subclasses:
-        module_details = subcls.__module__.split(".")
-        if module_details[-1] != "base":
-            os_class_dict[module_details[-1]] = subcls
-    return os_class_dict
+    def __getattr__(self, name: str) -> Any:
+        """
+        Get awaitable variant of public method, named as the method with "a" prefix, e.g. `aget_meminfo`.
 
+        Variant executes the method in worker thread, calls on the host are limited by its semaphore.
+        """
+        async_variant = None
+        if name.startswith("a") and hasattr(type(self), name[1:]):
+            from mfd_host.aio import get_async_variant
 
-@lru_cache()
-def _subclasses(cls: Any) -> Set[Any]:
-    return set(c for subcls in cls.__subclasses__() for c in _subclasses(subcls)).union(cls.__subclasses__())
+            async_variant = get_async_variant(self, self.__dict__.get("_host", lambda: None)(), name)
+        if async_variant is None:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+        return async_variant
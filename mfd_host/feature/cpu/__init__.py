@@ -1,13 +1,31 @@
 # Copyright (C) 2025 Intel Corporation
 # SPDX-License-Identifier: MIT
-"""Module for CPU feature."""
+"""Module for CPU feature.
 
-from typing import Union
+OS implementations are imported on first access, so only modules needed by the connected OS are loaded.
+"""
 
-from .base import BaseFeatureCPU
-from .esxi import ESXiCPU
-from .freebsd import FreeBSDCPU
-from .linux import LinuxCPU
-from .windows import WindowsCPU
+import typing
 
-CPUFeatureType = Union[BaseFeatureCPU, ESXiCPU, FreeBSDCPU, LinuxCPU, WindowsCPU]
+from mfd_host.lazy_import import lazy_getattr
+
+if typing.TYPE_CHECKING:
+    from .base import BaseFeatureCPU
+    from .esxi import ESXiCPU
+    from .freebsd import FreeBSDCPU
+    from .linux import LinuxCPU
+    from .windows import WindowsCPU
+
+    CPUFeatureType = BaseFeatureCPU | ESXiCPU | FreeBSDCPU | LinuxCPU | WindowsCPU
+
+__getattr__ = lazy_getattr(
+    __name__,
+    attributes={
+        "BaseFeatureCPU": ".base",
+        "ESXiCPU": ".esxi",
+        "FreeBSDCPU": ".freebsd",
+        "LinuxCPU": ".linux",
+        "WindowsCPU": ".windows",
+    },
+    unions={"CPUFeatureType": ("BaseFeatureCPU", "ESXiCPU", "FreeBSDCPU", "LinuxCPU", "WindowsCPU")},
+)
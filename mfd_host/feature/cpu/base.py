@@ -15,3 +15,5 @@ add_logging_level("MODULE_DEBUG", log_levels.MODULE_DEBUG)
 
 class BaseFeatureCPU(BaseFeature, ABC):
     """Base class for CPU feature."""
+
+    _feature_name = "cpu"
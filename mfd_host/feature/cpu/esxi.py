@@ -10,6 +10,7 @@ from mfd_common_libs import add_logging_level, log_levels, TimeoutCounter
 from mfd_connect.process import RemoteProcess
 
 from mfd_host.exceptions import CPUFeatureExecutionError, CPUFeatureException
+from mfd_host.facts_cache import host_fact
 from mfd_host.feature.cpu.base import BaseFeatureCPU
 from mfd_network_adapter.data_structures import State
 
@@ -20,6 +21,7 @@ add_logging_level("MODULE_DEBUG", log_levels.MODULE_DEBUG)
 class ESXiCPU(BaseFeatureCPU):
     """ESXi class for CPU feature."""
 
+    @host_fact
     def packages(self) -> int:
         """To fetch the number of numa nodes.
 
@@ -27,6 +29,7 @@ class ESXiCPU(BaseFeatureCPU):
         """
         return self._cpu_attributes(search_pattern="CPU Packages")
 
+    @host_fact
     def cores(self) -> int:
         """To fetch the number of cores.
 
@@ -34,6 +37,7 @@ class ESXiCPU(BaseFeatureCPU):
         """
         return self._cpu_attributes(search_pattern="CPU Cores")
 
+    @host_fact
     def threads(self) -> int:
         """To fetch the numbers of threads.
 
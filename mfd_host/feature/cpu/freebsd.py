@@ -3,11 +3,18 @@
 """Module for FreeBSD CPU."""
 
 import logging
+from typing import TYPE_CHECKING, Optional
 
 from mfd_common_libs import add_logging_level, log_levels
+from mfd_host.exceptions import FingerprintExecutionError
 from mfd_host.feature.cpu.base import BaseFeatureCPU
+from mfd_host.fingerprint import get_host_fingerprint
 from mfd_sysctl.freebsd import FreebsdSysctl
 
+if TYPE_CHECKING:
+    from mfd_connect import Connection
+    from mfd_host import Host
+
 logger = logging.getLogger(__name__)
 add_logging_level("MODULE_DEBUG", log_levels.MODULE_DEBUG)
 
@@ -15,10 +22,28 @@ add_logging_level("MODULE_DEBUG", log_levels.MODULE_DEBUG)
 class FreeBSDCPU(BaseFeatureCPU):
     """FreeBSD class for CPU feature."""
 
+    def __init__(self, *, connection: "Connection", host: "Host") -> None:
+        """Initialize the FreeBSD CPU feature.
+
+        :param connection: Object of mfd-connect
+        :param host: Object of mfd-host
+        """
+        super().__init__(connection=connection, host=host)
+        # created on first use, so availability of sysctl is checked once and only when it is needed
+        self._sysctl_freebsd: Optional[FreebsdSysctl] = None
+
     def get_log_cpu_no(self) -> int:
-        """Get the number of logical CPUs.
+        """Get the number of logical CPUs, from fingerprint of the host if it holds it.
 
         :return: Number of logical cpus
         """
-        self._sysctl_freebsd = FreebsdSysctl(connection=self._connection)
+        try:
+            cpu_count = get_host_fingerprint(self._connection).cpu_count
+        except FingerprintExecutionError as e:
+            logger.log(level=log_levels.MODULE_DEBUG, msg=f"Host fingerprint not gathered: {e}")
+            cpu_count = None
+        if cpu_count is not None:
+            return cpu_count
+        if self._sysctl_freebsd is None:
+            self._sysctl_freebsd = FreebsdSysctl(connection=self._connection)
         return self._sysctl_freebsd.get_log_cpu_no()
@@ -7,8 +7,9 @@ import re
 from typing import Dict
 
 from mfd_common_libs import add_logging_level, log_levels
-from mfd_host.exceptions import CPUFeatureExecutionError, CPUFeatureException
+from mfd_host.exceptions import CPUFeatureExecutionError, CPUFeatureException, FingerprintExecutionError
 from mfd_host.feature.cpu.base import BaseFeatureCPU
+from mfd_host.fingerprint import get_host_fingerprint
 
 logger = logging.getLogger(__name__)
 add_logging_level("MODULE_DEBUG", log_levels.MODULE_DEBUG)
@@ -64,11 +65,18 @@ class LinuxCPU(BaseFeatureCPU):
         return self._parse_cpu_stats(output)
 
     def get_log_cpu_no(self) -> int:
-        """Get the number of logical CPUs.
+        """Get the number of logical CPUs, from fingerprint of the host if it holds it.
 
         :return: Number of logical cpus
         :raises CPUFeatureException: if failed to get logical cpus
         """
+        try:
+            cpu_count = get_host_fingerprint(self._connection).cpu_count
+        except FingerprintExecutionError as e:
+            logger.log(level=log_levels.MODULE_DEBUG, msg=f"Host fingerprint not gathered: {e}")
+            cpu_count = None
+        if cpu_count is not None:
+            return cpu_count
         command = "nproc"
         output = self._connection.execute_command(command, custom_exception=CPUFeatureExecutionError).stdout
         try:
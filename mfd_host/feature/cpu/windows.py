@@ -9,6 +9,7 @@ from typing import Dict, List
 from mfd_common_libs import add_logging_level, log_levels
 from mfd_connect.util.powershell_utils import parse_powershell_list
 from mfd_host.exceptions import CPUFeatureExecutionError, CPUFeatureException
+from mfd_host.facts_cache import host_fact
 from mfd_host.feature.cpu.base import BaseFeatureCPU
 from mfd_host.feature.cpu.const import COREINFO_REGISTRY_PATH, COREINFO_EXE_PATH
 from mfd_network_adapter.data_structures import State
@@ -20,6 +21,7 @@ add_logging_level("MODULE_DEBUG", log_levels.MODULE_DEBUG)
 class WindowsCPU(BaseFeatureCPU):
     """Windows class for CPU feature."""
 
+    @host_fact
     def get_core_info(self) -> List[Dict[str, str]]:
         """Get device id, number of cores and number of logical processors.
 
@@ -44,6 +46,7 @@ class WindowsCPU(BaseFeatureCPU):
                 return State.ENABLED
         return State.DISABLED
 
+    @host_fact
     def get_phy_cpu_no(self) -> int:
         """Get the number of physical cpus.
 
@@ -71,6 +74,7 @@ class WindowsCPU(BaseFeatureCPU):
         cmd = f"set-itemproperty -path '{registry_path}' -Name {'EulaAccepted'} -Value {1}"
         self._connection.execute_powershell(cmd, custom_exception=CPUFeatureExecutionError)
 
+    @host_fact
     def get_numa_node_count(self) -> int:
         """Get NUMA node count.
 
@@ -84,6 +88,7 @@ class WindowsCPU(BaseFeatureCPU):
 
         return len(re.findall(r".*NUMA Node\s*(\d+).*", output))
 
+    @host_fact
     def get_log_cpu_no(self) -> int:
         """Get the number of logical CPUs.
 
@@ -1,8 +1,25 @@
 # Copyright (C) 2025 Intel Corporation
 # SPDX-License-Identifier: MIT
-"""Module for device feature."""
+"""Module for device feature.
 
-from .base import BaseFeatureDevice
-from .windows import WindowsDevice
+OS implementations are imported on first access, so only modules needed by the connected OS are loaded.
+"""
 
-DeviceFeatureType = BaseFeatureDevice | WindowsDevice
+import typing
+
+from mfd_host.lazy_import import lazy_getattr
+
+if typing.TYPE_CHECKING:
+    from .base import BaseFeatureDevice
+    from .windows import WindowsDevice
+
+    DeviceFeatureType = BaseFeatureDevice | WindowsDevice
+
+__getattr__ = lazy_getattr(
+    __name__,
+    attributes={
+        "BaseFeatureDevice": ".base",
+        "WindowsDevice": ".windows",
+    },
+    unions={"DeviceFeatureType": ("BaseFeatureDevice", "WindowsDevice")},
+)
@@ -13,3 +13,5 @@ add_logging_level("MODULE_DEBUG", log_levels.MODULE_DEBUG)
 
 class BaseFeatureDevice(BaseFeature, ABC):
     """Base class for Device feature."""
+
+    _feature_name = "device"
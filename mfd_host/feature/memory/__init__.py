@@ -1,12 +1,31 @@
 # Copyright (C) 2025 Intel Corporation
 # SPDX-License-Identifier: MIT
-"""Module for memory feature."""
+"""Module for memory feature.
 
-from typing import Union
-from .base import BaseFeatureMemory
-from .linux import LinuxMemory
-from .windows import WindowsMemory
-from .esxi import ESXiMemory
-from .freebsd import FreeBSDMemory
+OS implementations are imported on first access, so only modules needed by the connected OS are loaded.
+"""
 
-MemoryFeatureType = Union[BaseFeatureMemory, LinuxMemory, WindowsMemory, FreeBSDMemory, ESXiMemory]
+import typing
+
+from mfd_host.lazy_import import lazy_getattr
+
+if typing.TYPE_CHECKING:
+    from .base import BaseFeatureMemory
+    from .esxi import ESXiMemory
+    from .freebsd import FreeBSDMemory
+    from .linux import LinuxMemory
+    from .windows import WindowsMemory
+
+    MemoryFeatureType = BaseFeatureMemory | ESXiMemory | FreeBSDMemory | LinuxMemory | WindowsMemory
+
+__getattr__ = lazy_getattr(
+    __name__,
+    attributes={
+        "BaseFeatureMemory": ".base",
+        "ESXiMemory": ".esxi",
+        "FreeBSDMemory": ".freebsd",
+        "LinuxMemory": ".linux",
+        "WindowsMemory": ".windows",
+    },
+    unions={"MemoryFeatureType": ("BaseFeatureMemory", "ESXiMemory", "FreeBSDMemory", "LinuxMemory", "WindowsMemory")},
+)
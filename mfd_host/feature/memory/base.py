@@ -20,7 +20,9 @@ add_logging_level("MODULE_DEBUG", log_levels.MODULE_DEBUG)
 class BaseFeatureMemory(BaseFeature, ABC):
     """Base class for Memory feature."""
 
+    _feature_name = "memory"
+
     def __init__(self, connection: "Connection", host: "Host"):
         """Initialize Base Memory Feature."""
-        self._connection = connection
+        super().__init__(connection=connection, host=host)
         self._mount = Mount(connection=connection)
@@ -2,6 +2,8 @@
 # SPDX-License-Identifier: MIT
 """Module for ESXI Memory."""
 
+from mfd_host.facts_cache import host_fact
+
 from .base import BaseFeatureMemory
 from .exceptions import ServerMemoryNotFoundError
 import re
@@ -11,6 +13,7 @@ class ESXiMemory(BaseFeatureMemory):
     """ESXi class for Memory feature."""
 
     @property
+    @host_fact
     def ram(self) -> int:
         """
         Return bytes of RAM.
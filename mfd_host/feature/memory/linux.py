@@ -2,6 +2,8 @@
 # SPDX-License-Identifier: MIT
 """Module for Linux Memory."""
 
+from mfd_host.facts_cache import host_fact
+
 from .base import BaseFeatureMemory
 from .exceptions import MountDiskDirectoryError, InsufficientMemoryError, MatchNotFound
 import logging
@@ -81,19 +83,20 @@ class LinuxMemory(BaseFeatureMemory):
         """
         mount_point = "/dev/hugepages"
         self._mount_hugetlbs(mount_point=mount_point)
-        command = (
+        commands = [
             f"echo {page_size_in_memory} > " f"/sys/kernel/mm/hugepages/hugepages-{page_size_in_kernel}kB/nr_hugepages"
-        )
-        self._connection.execute_command(command=command, shell=True)
+        ]
         if page_size_per_numa_node:
             for node in range(page_size_per_numa_node[1]):
-                command1 = (
+                commands.append(
                     f"echo {page_size_per_numa_node[0]} >"
                     f" /sys/devices/system/node/node{node}"
                     f"/hugepages/hugepages-{page_size_in_kernel}kB/nr_hugepages"
                 )
-                self._connection.execute_command(command=command1, shell=True)
+        # all nodes are set in single round trip
+        self._execute_commands(commands)
 
+    @host_fact
     def get_memory_channels(self) -> int:
         """
         Get memory channels from system.
@@ -0,0 +1,105 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for registry of OS implementations of features."""
+
+import logging
+import threading
+from importlib import import_module
+from importlib.metadata import entry_points
+from typing import Optional
+
+from mfd_common_libs import add_logging_level, log_levels
+from mfd_typing import OSName
+
+logger = logging.getLogger(__name__)
+add_logging_level(level_name="MODULE_DEBUG", level_value=log_levels.MODULE_DEBUG)
+
+# Entry point name is "<feature>.<os>", e.g. "utils.linux", value is "module:Class"
+FEATURE_ENTRY_POINT_GROUP = "mfd_host.features"
+
+FEATURE_REGISTRY: dict[tuple[str, OSName], str] = {
+    ("cpu", OSName.LINUX): "mfd_host.feature.cpu.linux:LinuxCPU",
+    ("cpu", OSName.WINDOWS): "mfd_host.feature.cpu.windows:WindowsCPU",
+    ("cpu", OSName.FREEBSD): "mfd_host.feature.cpu.freebsd:FreeBSDCPU",
+    ("cpu", OSName.ESXI): "mfd_host.feature.cpu.esxi:ESXiCPU",
+    ("device", OSName.WINDOWS): "mfd_host.feature.device.windows:WindowsDevice",
+    ("memory", OSName.LINUX): "mfd_host.feature.memory.linux:LinuxMemory",
+    ("memory", OSName.WINDOWS): "mfd_host.feature.memory.windows:WindowsMemory",
+    ("memory", OSName.FREEBSD): "mfd_host.feature.memory.freebsd:FreeBSDMemory",
+    ("memory", OSName.ESXI): "mfd_host.feature.memory.esxi:ESXiMemory",
+    ("service", OSName.LINUX): "mfd_host.feature.service.linux:LinuxService",
+    ("service", OSName.WINDOWS): "mfd_host.feature.service.windows:WindowsService",
+    ("service", OSName.FREEBSD): "mfd_host.feature.service.freebsd:FreeBSDService",
+    ("service", OSName.ESXI): "mfd_host.feature.service.esxi:ESXiService",
+    ("stats", OSName.LINUX): "mfd_host.feature.stats.linux:LinuxStats",
+    ("stats", OSName.WINDOWS): "mfd_host.feature.stats.windows:WindowsStats",
+    ("stats", OSName.FREEBSD): "mfd_host.feature.stats.freebsd:FreeBSDStats",
+    ("stats", OSName.ESXI): "mfd_host.feature.stats.esxi:ESXiStats",
+    ("utils", OSName.LINUX): "mfd_host.feature.utils.linux:LinuxUtils",
+    ("utils", OSName.WINDOWS): "mfd_host.feature.utils.windows:WindowsUtils",
+    ("utils", OSName.FREEBSD): "mfd_host.feature.utils.freebsd:FreeBSDUtils",
+    ("utils", OSName.ESXI): "mfd_host.feature.utils.esxi:ESXiUtils",
+}
+
+_registry: Optional[dict[tuple[str, OSName], str]] = None
+_feature_classes: dict[tuple[str, OSName], Optional[type]] = {}
+_lock = threading.RLock()
+
+
+def _get_entry_point_features() -> dict[tuple[str, OSName], str]:
+    """Get features registered by installed packages in `mfd_host.features` entry point group."""
+    features = {}
+    for entry_point in entry_points(group=FEATURE_ENTRY_POINT_GROUP):
+        feature, _, os_part = entry_point.name.rpartition(".")
+        try:
+            features[(feature, OSName[os_part.upper()])] = entry_point.value
+        except KeyError:
+            logger.warning(f"Skipping feature entry point {entry_point.name}, unknown OS: {os_part}")
+    return features
+
+
+def _get_registry() -> dict[tuple[str, OSName], str]:
+    """Get registry, features from entry points are merged on the first call."""
+    global _registry
+    with _lock:
+        if _registry is None:
+            _registry = {**FEATURE_REGISTRY, **_get_entry_point_features()}
+        return _registry
+
+
+def register_feature(feature: str, os_name: OSName, target: str) -> None:
+    """
+    Register OS implementation of feature, replacing already registered one.
+
+    :param feature: Name of feature, e.g. "utils"
+    :param os_name: OS of implementation
+    :param target: Path to implementation class in "module:Class" format
+    """
+    with _lock:
+        _get_registry()[(feature, os_name)] = target
+        _feature_classes.pop((feature, os_name), None)
+
+
+def get_feature_class(feature: str, os_name: OSName) -> Optional[type]:
+    """
+    Get OS implementation of feature, only module of the implementation is imported.
+
+    :param feature: Name of feature, e.g. "utils"
+    :param os_name: OS of implementation
+    :return: Implementation class or None if not registered
+    """
+    key = (feature, os_name)
+    if key in _feature_classes:
+        return _feature_classes[key]
+    with _lock:
+        if key not in _feature_classes:
+            target = _get_registry().get(key)
+            if target is None:
+                _feature_classes[key] = None
+            else:
+                module_name, _, class_name = target.partition(":")
+                logger.log(
+                    level=log_levels.MODULE_DEBUG, msg=f"Loading {feature} feature for {os_name.value}: {target}"
+                )
+                _feature_classes[key] = getattr(import_module(module_name), class_name)
+        return _feature_classes[key]
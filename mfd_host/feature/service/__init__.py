@@ -1,11 +1,33 @@
 # Copyright (C) 2025 Intel Corporation
 # SPDX-License-Identifier: MIT
-"""Module for service feature."""
+"""Module for service feature.
 
-from .base import BaseFeatureService
-from .esxi import ESXiService
-from .freebsd import FreeBSDService
-from .linux import LinuxService
-from .windows import WindowsService
+OS implementations are imported on first access, so only modules needed by the connected OS are loaded.
+"""
 
-ServiceFeatureType = BaseFeatureService | ESXiService | FreeBSDService | LinuxService | WindowsService
+import typing
+
+from mfd_host.lazy_import import lazy_getattr
+
+if typing.TYPE_CHECKING:
+    from .base import BaseFeatureService
+    from .esxi import ESXiService
+    from .freebsd import FreeBSDService
+    from .linux import LinuxService
+    from .windows import WindowsService
+
+    ServiceFeatureType = BaseFeatureService | ESXiService | FreeBSDService | LinuxService | WindowsService
+
+__getattr__ = lazy_getattr(
+    __name__,
+    attributes={
+        "BaseFeatureService": ".base",
+        "ESXiService": ".esxi",
+        "FreeBSDService": ".freebsd",
+        "LinuxService": ".linux",
+        "WindowsService": ".windows",
+    },
+    unions={
+        "ServiceFeatureType": ("BaseFeatureService", "ESXiService", "FreeBSDService", "LinuxService", "WindowsService")
+    },
+)
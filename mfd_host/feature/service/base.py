@@ -15,3 +15,5 @@ add_logging_level("MODULE_DEBUG", log_levels.MODULE_DEBUG)
 
 class BaseFeatureService(BaseFeature, ABC):
     """Base class for Service feature."""
+
+    _feature_name = "service"
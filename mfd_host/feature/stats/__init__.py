@@ -1,13 +1,31 @@
 # Copyright (C) 2025 Intel Corporation
 # SPDX-License-Identifier: MIT
-"""Module for stats feature."""
+"""Module for stats feature.
 
-from typing import Union
+OS implementations are imported on first access, so only modules needed by the connected OS are loaded.
+"""
 
-from .base import BaseFeatureStats
-from .esxi import ESXiStats
-from .linux import LinuxStats
-from .windows import WindowsStats
-from .freebsd import FreeBSDStats
+import typing
 
-StatsFeatureType = Union[BaseFeatureStats, ESXiStats, LinuxStats, WindowsStats, FreeBSDStats]
+from mfd_host.lazy_import import lazy_getattr
+
+if typing.TYPE_CHECKING:
+    from .base import BaseFeatureStats
+    from .esxi import ESXiStats
+    from .freebsd import FreeBSDStats
+    from .linux import LinuxStats
+    from .windows import WindowsStats
+
+    StatsFeatureType = BaseFeatureStats | ESXiStats | FreeBSDStats | LinuxStats | WindowsStats
+
+__getattr__ = lazy_getattr(
+    __name__,
+    attributes={
+        "BaseFeatureStats": ".base",
+        "ESXiStats": ".esxi",
+        "FreeBSDStats": ".freebsd",
+        "LinuxStats": ".linux",
+        "WindowsStats": ".windows",
+    },
+    unions={"StatsFeatureType": ("BaseFeatureStats", "ESXiStats", "FreeBSDStats", "LinuxStats", "WindowsStats")},
+)
@@ -0,0 +1,204 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for sampling of Linux stats by collector agent running on the host."""
+
+import base64
+import logging
+import typing
+import uuid
+from pathlib import Path, PurePosixPath
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from mfd_common_libs import add_logging_level, log_levels
+
+from mfd_host.exceptions import StatsSamplerException
+
+from .agent_script import HEX_PREFIX, LAYOUT_RECORD, MAGIC, OVERHEAD_RECORD, SAMPLE_RECORD
+from .data_structures import CollectorOverhead
+from .sampling import StatsSampler
+
+if typing.TYPE_CHECKING:
+    from mfd_connect import Connection
+
+logger = logging.getLogger(__name__)
+add_logging_level("MODULE_DEBUG", log_levels.MODULE_DEBUG)
+
+AGENT_SCRIPT_PATH = Path(__file__).with_name("agent_script.py")
+# tmpfs is preferred, so samples are kept in memory of the host and its disks are not touched
+AGENT_DIRECTORIES = ("/dev/shm", "/tmp")
+# files with counters in hex, numbers of other files are decimal, whatever their width
+HEX_FILES = ("/proc/net/softnet_stat",)
+
+
+def _decode_varint(data: bytes, position: int) -> Tuple[int, int]:
+    """Decode varint written by `agent_script.encode_varint`, return value and position after it."""
+    value = shift = 0
+    while True:
+        byte = data[position]
+        position += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, position
+        shift += 7
+
+
+def _decode_signed_varint(data: bytes, position: int) -> Tuple[int, int]:
+    """Decode zigzag varint written by `agent_script.encode_signed_varint`, return value and position after it."""
+    value, position = _decode_varint(data, position)
+    return (value >> 1) ^ -(value & 1), position
+
+
+def decode_agent_samples(data: bytes, paths: List[str]) -> Tuple[List[Dict[str, str]], Optional[CollectorOverhead]]:
+    """
+    Decode output file of collector agent.
+
+    Record truncated by killed collector ends decoding, samples before it are returned.
+
+    :param data: Content of output file
+    :param paths: Paths of files sampled by collector, in order of its arguments
+    :return: Contents of files in each sample, overhead of collector if it was stopped gracefully
+    :raises StatsSamplerException: when data is not output of collector
+    """
+    if not data.startswith(MAGIC):
+        raise StatsSamplerException("Output of collector agent has unexpected format.")
+    layouts: List[Optional[str]] = [None] * len(paths)
+    numbers: List[List[int]] = [[] for _ in paths]
+    samples = []
+    overhead = None
+    position = len(MAGIC)
+    try:
+        while position < len(data):
+            record_type, position = data[position : position + 1], position + 1
+            if record_type == LAYOUT_RECORD:
+                index, position = _decode_varint(data, position)
+                length, position = _decode_varint(data, position)
+                if position + length > len(data):
+                    break
+                layouts[index] = data[position : position + length].decode()
+                numbers[index] = []
+                position += length
+            elif record_type == SAMPLE_RECORD:
+                sample_numbers = []
+                for index in range(len(paths)):
+                    count, position = _decode_varint(data, position)
+                    previous_numbers = numbers[index] or [0] * count
+                    file_numbers = []
+                    for previous_number in previous_numbers[:count]:
+                        difference, position = _decode_signed_varint(data, position)
+                        file_numbers.append(previous_number + difference)
+                    sample_numbers.append(file_numbers)
+                numbers = sample_numbers
+                samples.append({path: layouts[index].format(*numbers[index]) for index, path in enumerate(paths)})
+            elif record_type == OVERHEAD_RECORD:
+                values = []
+                for _ in range(4):
+                    value, position = _decode_varint(data, position)
+                    values.append(value)
+                cpu_time, wall_time, max_rss, sample_count = values
+                overhead = CollectorOverhead(
+                    cpu_time=cpu_time / 1e6,
+                    wall_time=wall_time / 1e6,
+                    max_rss=max_rss,
+                    samples=sample_count,
+                    file_size=len(data),
+                )
+            else:
+                raise StatsSamplerException(f"Unknown record {record_type!r} in output of collector agent.")
+    except IndexError:
+        logger.log(level=log_levels.MODULE_DEBUG, msg="Output of collector agent truncated, the last record dropped.")
+    return samples, overhead
+
+
+class AgentStatsSampler(StatsSampler):
+    """
+    Sampler of Linux stats by collector agent running on the host.
+
+    Python collector (`agent_script.py`) is copied to tmpfs of the host and samples procfs files into
+    compact binary file there, layouts of files and delta-encoded numbers, see `agent_script`.
+    Nothing is transferred while sampling, the file is fetched in bulk and parsed when sampling stops,
+    so time series are available only after `stop()`. Resources used by collector are in `overhead`.
+    Requires python3 and base64 on the host.
+    """
+
+    def __init__(self, connection: "Connection", metrics: Iterable[str], interval: float, capacity: int):
+        """
+        Initialize sampler.
+
+        :param connection: Object of mfd-connect
+        :param metrics: Names of metrics, keys of `SAMPLING_METRICS`
+        :param interval: Time between samples in seconds
+        :param capacity: Maximum number of samples kept, the oldest ones are dropped
+        :raises StatsSamplerException: on unknown metric or invalid interval or capacity
+        """
+        super().__init__(connection, metrics=metrics, interval=interval, capacity=capacity)
+        self.overhead: Optional[CollectorOverhead] = None
+        self._name = f"mfd_host_agent_{uuid.uuid4().hex[:12]}"
+        self._directory: Optional[PurePosixPath] = None
+
+    @property
+    def script_path(self) -> Optional[PurePosixPath]:
+        """Path of collector on the host, known when it is deployed."""
+        return self._directory / f"{self._name}.py" if self._directory else None
+
+    @property
+    def output_path(self) -> Optional[PurePosixPath]:
+        """Path of output file of collector on the host, known when it is deployed."""
+        return self._directory / f"{self._name}.bin" if self._directory else None
+
+    @property
+    def command(self) -> str:
+        """Shell command of collector."""
+        files = [f"{HEX_PREFIX}{file}" if file in HEX_FILES else file for file in self.files]
+        return f"exec python3 {self.script_path} {self.output_path} {self.interval} {' '.join(files)}"
+
+    @property
+    def running(self) -> bool:
+        """Check whether samples are collected."""
+        return self._process is not None and self._process.running
+
+    def start(self) -> None:
+        """
+        Deploy collector on the host and start it.
+
+        :raises StatsSamplerException: when collector can't be deployed
+        """
+        logger.log(level=log_levels.MODULE_DEBUG, msg=f"Start agent sampling of {self.metrics} every {self.interval}s")
+        self._deploy()
+        self._process = self._connection.start_process(self.command, shell=True)
+
+    def stop(self) -> None:
+        """
+        Stop collector, fetch its output file, parse samples and remove its files from the host.
+
+        :raises StatsSamplerException: when output file can't be fetched
+        """
+        if self._process is None:
+            return
+        logger.log(level=log_levels.MODULE_DEBUG, msg="Stop agent sampling")
+        self._stop_process()
+        result = self._connection.execute_command(
+            f"base64 {self.output_path}; rm -f {self.output_path} {self.script_path}",
+            shell=True,
+            expected_return_codes=None,
+        )
+        if result.return_code:
+            raise StatsSamplerException(f"Output of collector agent not fetched: {result.stderr}")
+        samples, self.overhead = decode_agent_samples(base64.b64decode(result.stdout), self.files)
+        for contents in samples:
+            self._add_contents(contents)
+        logger.log(level=log_levels.MODULE_DEBUG, msg=f"Collector agent overhead: {self.overhead}")
+
+    def _deploy(self) -> None:
+        """Write collector to the first writable directory of `AGENT_DIRECTORIES` in a single command."""
+        script = base64.b64encode(AGENT_SCRIPT_PATH.read_bytes()).decode()
+        command = (
+            "command -v python3 >/dev/null || exit 127; "
+            f"for directory in {' '.join(AGENT_DIRECTORIES)}; do [ -w $directory ] && break; done; "
+            f"echo {script} | base64 -d > $directory/{self._name}.py && echo $directory"
+        )
+        result = self._connection.execute_command(command, shell=True, expected_return_codes=None)
+        if result.return_code or not result.stdout.strip():
+            raise StatsSamplerException(
+                f"Collector agent not deployed, python3 and base64 are required on the host: {result.stderr}"
+            )
+        self._directory = PurePosixPath(result.stdout.strip().splitlines()[-1])
@@ -0,0 +1,166 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""
+Collector sampling procfs files on the host into compact binary file, deployed by `AgentStatsSampler`.
+
+Usage: python3 agent_script.py <output file> <interval> <file> [<file> ...]
+
+Path prefixed by `HEX_PREFIX` (e.g. hex:/proc/net/softnet_stat) is file of 8 hex digit counters,
+numbers in other files are decimal.
+
+Only standard library of Python 3.6 is used, the script is executed by Python interpreter of the host.
+Each file is stored as layout (text with numbers replaced by placeholders), written only when it changes,
+and numbers of each sample as differences from the previous sample, encoded as zigzag varints,
+so counters which didn't change take single byte. Output file format:
+- header `MAGIC`,
+- `LAYOUT_RECORD`, varint index of file, varint length, layout as UTF-8 - layout of file changed,
+  numbers of the next sample of the file are differences from zeros,
+- `SAMPLE_RECORD`, for each file varint count of numbers and differences of numbers,
+- `OVERHEAD_RECORD`, varints of CPU time and wall time of collector in microseconds, its maximum resident
+  memory in kB and number of samples - written when collector is stopped by SIGTERM or SIGINT.
+"""
+
+import os
+import re
+import signal
+import sys
+import time
+
+MAGIC = b"MFDS\x01"
+LAYOUT_RECORD = b"L"
+SAMPLE_RECORD = b"S"
+OVERHEAD_RECORD = b"O"
+HEX_PREFIX = "hex:"
+NUMBER_REGEX = re.compile(r"\d+")
+HEX_NUMBER_REGEX = re.compile(r"\b(?P<hex>[0-9a-f]{8})\b|\d+")
+
+
+def encode_varint(value: int, output: bytearray) -> None:
+    """Append unsigned integer encoded as varint, 7 bits per byte, the lowest first."""
+    while value > 0x7F:
+        output.append((value & 0x7F) | 0x80)
+        value >>= 7
+    output.append(value)
+
+
+def encode_signed_varint(value: int, output: bytearray) -> None:
+    """Append signed integer encoded as zigzag varint, small absolute values take few bytes."""
+    encode_varint(value * 2 if value >= 0 else -value * 2 - 1, output)
+
+
+def split_numbers(text: str, hexadecimal: bool = False) -> tuple:
+    """
+    Split text into layout and numbers.
+
+    Numbers are replaced by `str.format` placeholders, hex counters, fractional parts (e.g. "0.05") and numbers
+    with leading zeros keep their width, so layout filled with numbers gives the same text.
+
+    :param text: Content of file
+    :param hexadecimal: Whether 8 digit numbers are hex counters, otherwise all numbers are decimal
+    :return: Layout and list of numbers
+    """
+    parts = []
+    numbers = []
+    end = 0
+    for match in (HEX_NUMBER_REGEX if hexadecimal else NUMBER_REGEX).finditer(text):
+        start = match.start()
+        parts.append(text[end:start].replace("{", "{{").replace("}", "}}"))
+        digits = match.group()
+        if hexadecimal and match.group("hex"):
+            parts.append("{:08x}")
+            numbers.append(int(digits, 16))
+        elif start and text[start - 1] == "." or digits.startswith("0") and len(digits) > 1:
+            parts.append("{:0%dd}" % len(digits))
+            numbers.append(int(digits))
+        else:
+            parts.append("{}")
+            numbers.append(int(digits))
+        end = match.end()
+    parts.append(text[end:].replace("{", "{{").replace("}", "}}"))
+    return "".join(parts), numbers
+
+
+def read_file(path: str) -> str:
+    """Read file, empty content if it can't be read."""
+    try:
+        with open(path) as file:
+            return file.read()
+    except OSError:
+        return ""
+
+
+def collect(output_path: str, interval: float, paths: list, hex_paths: tuple = ()) -> None:
+    """
+    Sample files into output file until stopped by SIGTERM or SIGINT.
+
+    :param output_path: Path of output file, preferably on tmpfs
+    :param interval: Time between samples in seconds
+    :param paths: Paths of sampled files
+    :param hex_paths: Paths of sampled files with hex counters
+    """
+
+    state = {"sleeping": False, "stopping": False}
+
+    def _stop(signum: int, frame: object) -> None:
+        # record being written is finished first, so output file is never truncated in the middle of record
+        state["stopping"] = True
+        if state["sleeping"]:
+            raise SystemExit(0)
+
+    signal.signal(signal.SIGTERM, _stop)
+    signal.signal(signal.SIGINT, _stop)
+    start = time.monotonic()
+    layouts = [None] * len(paths)
+    previous_numbers = [[] for _ in paths]
+    samples = 0
+    with open(output_path, "wb") as output_file:
+        output_file.write(MAGIC)
+        try:
+            while not state["stopping"]:
+                record = bytearray()
+                sample = bytearray(SAMPLE_RECORD)
+                for index, path in enumerate(paths):
+                    layout, numbers = split_numbers(read_file(path), hexadecimal=path in hex_paths)
+                    if layout != layouts[index]:
+                        layout_bytes = layout.encode()
+                        record += LAYOUT_RECORD
+                        encode_varint(index, record)
+                        encode_varint(len(layout_bytes), record)
+                        record += layout_bytes
+                        layouts[index] = layout
+                        previous_numbers[index] = [0] * len(numbers)
+                    encode_varint(len(numbers), sample)
+                    for number, previous_number in zip(numbers, previous_numbers[index]):
+                        encode_signed_varint(number - previous_number, sample)
+                    previous_numbers[index] = numbers
+                output_file.write(record + sample)
+                # flushed each sample, so samples are available even if collector is killed
+                output_file.flush()
+                samples += 1
+                state["sleeping"] = True
+                if not state["stopping"]:
+                    time.sleep(max(start + samples * interval - time.monotonic(), 0))
+                state["sleeping"] = False
+        except SystemExit:
+            pass
+        finally:
+            # available only on Unix, as the collector itself
+            import resource
+
+            times = os.times()
+            overhead = bytearray(OVERHEAD_RECORD)
+            encode_varint(int((times.user + times.system) * 1e6), overhead)
+            encode_varint(int((time.monotonic() - start) * 1e6), overhead)
+            encode_varint(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss, overhead)
+            encode_varint(samples, overhead)
+            output_file.write(overhead)
+
+
+if __name__ == "__main__":
+    arguments = sys.argv[3:]
+    collect(
+        sys.argv[1],
+        float(sys.argv[2]),
+        [argument[len(HEX_PREFIX) :] if argument.startswith(HEX_PREFIX) else argument for argument in arguments],
+        tuple(argument[len(HEX_PREFIX) :] for argument in arguments if argument.startswith(HEX_PREFIX)),
+    )
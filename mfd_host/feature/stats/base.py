@@ -15,3 +15,5 @@ add_logging_level("MODULE_DEBUG", log_levels.MODULE_DEBUG)
 
 class BaseFeatureStats(BaseFeature, ABC):
     """Base class for Stats feature."""
+
+    _feature_name = "stats"
@@ -2,8 +2,9 @@
 # SPDX-License-Identifier: MIT
 """Module for host stats data structures."""
 
-from dataclasses import dataclass
-from typing import Optional
+from array import array
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
 
 
 @dataclass
@@ -18,10 +19,46 @@ class StatsOutput:
     process_raw_output: Optional[str] = None
 
 
+@dataclass
+class TimeSeries:
+    """Dataclass for samples of single stat, NaN value marks sample without the stat."""
+
+    name: str
+    timestamps: List[float] = field(default_factory=list)
+    values: List[float] = field(default_factory=list)
+
+
+@dataclass
+class CollectorOverhead:
+    """Dataclass for resources used on the host by collector agent."""
+
+    cpu_time: float
+    wall_time: float
+    max_rss: int
+    samples: int
+    file_size: int
+
+    @property
+    def cpu_utilization(self) -> float:
+        """Utilization of single CPU by collector in percentages."""
+        return round(self.cpu_time / self.wall_time * 100.0, 2) if self.wall_time else 0.0
+
+
 cpu_actual_labels = ["us", "sy", "ni", "id", "wa", "hi", "si", "st"]
 cpu_friendly_labels = ["user", "sys", "nice", "idle", "IO-wait", "HW-int", "SOFT-int", "stolen"]
 mem_labels = ["total", "free", "used"]
 swap_labels = ["total", "free", "used"]
+# columns of cpu lines of /proc/stat, guest time is already included in user and nice, so it is not counted separately
+proc_stat_cpu_labels = ["user", "nice", "system", "idle", "iowait", "irq", "softirq", "steal"]
+# counters of /proc/net/softnet_stat by column, the next columns are backlog length (gauge) and CPU number
+softnet_stat_labels = {
+    0: "processed",
+    1: "dropped",
+    2: "time_squeeze",
+    8: "cpu_collision",
+    9: "received_rps",
+    10: "flow_limit_count",
+}
 
 """Windows Counter Path"""
 
@@ -30,3 +67,38 @@ PagedMemory = '"\\Memory\\Pool Paged Bytes"'
 NonPagedMemory = '"\\Memory\\Pool Nonpaged Bytes"'
 CPUTimeUtilization = '"\\Processor(_Total)\\% Processor Time"'
 DPCRate = r"\Processor(*)\DPC Rate"
+
+
+@dataclass
+class InterruptCounters:
+    """
+    Dataclass for per-CPU counters of /proc/interrupts or /proc/softirqs.
+
+    Counters of all rows are stored in single array, counter of row `i` on CPU in column `j`
+    is `counts[i * len(cpus) + j]`.
+    """
+
+    timestamp: float
+    cpus: List[int]
+    names: List[str] = field(default_factory=list)
+    descriptions: List[str] = field(default_factory=list)
+    counts: array = field(default_factory=lambda: array("Q"))
+
+    def get(self, name: str) -> Dict[int, int]:
+        """
+        Get counters of row on each CPU.
+
+        :param name: Name of row, e.g. "134", "LOC" or "NET_RX"
+        :return: Counters by CPU number
+        :raises ValueError: when there is no such row
+        """
+        start = self.names.index(name) * len(self.cpus)
+        return dict(zip(self.cpus, self.counts[start : start + len(self.cpus)]))
+
+
+@dataclass
+class SoftnetStat:
+    """Dataclass for per-CPU counters of /proc/net/softnet_stat, by CPU number and name of counter."""
+
+    timestamp: float
+    counters: Dict[int, Dict[str, int]] = field(default_factory=dict)
@@ -3,6 +3,7 @@
 """Module for FreeBSD stats."""
 
 import logging
+import threading
 from typing import TYPE_CHECKING
 
 from mfd_common_libs import add_logging_level, log_levels
@@ -30,38 +31,43 @@ class FreeBSDStats(BaseFeatureStats):
         self._connection = connection
         self._sysctl = FreebsdSysctl(connection=connection)
         self._cp_times_last = None
+        # read of counters and update of last ones must be atomic, otherwise concurrent calls get negative deltas
+        self._cp_times_lock = threading.Lock()
+        self._pagesize = None
 
     def get_cpu_utilization(self) -> dict[str, dict[str, str]]:
         """Get CPU utilization.
 
         CPU utilization based on the time spent by the cores in different states since the last function call.
+        Concurrent calls are serialized, each of them gets utilization since the preceding one.
 
         :return: dictionary in format:
                  {'core_number': {'stat1': value,
                                   'stat2': value ...}}
         """
-        # Obtain data on the time spent by each core in different states
-        sysctl_out = self._sysctl.get_sysctl_value("kern.cp_times")
-        cp_times_raw = list(map(int, sysctl_out.split()))
-        cp_times = {
-            str(int(i // 5)): {
-                "user": cp_times_raw[i],
-                "nice": cp_times_raw[i + 1],
-                "system": cp_times_raw[i + 2],
-                "interrupt": cp_times_raw[i + 3],
-                "idle": cp_times_raw[i + 4],
+        with self._cp_times_lock:
+            # Obtain data on the time spent by each core in different states
+            sysctl_out = self._sysctl.get_sysctl_value("kern.cp_times")
+            cp_times_raw = list(map(int, sysctl_out.split()))
+            cp_times = {
+                str(int(i // 5)): {
+                    "user": cp_times_raw[i],
+                    "nice": cp_times_raw[i + 1],
+                    "system": cp_times_raw[i + 2],
+                    "interrupt": cp_times_raw[i + 3],
+                    "idle": cp_times_raw[i + 4],
+                }
+                for i in range(0, len(cp_times_raw), 5)
             }
-            for i in range(0, len(cp_times_raw), 5)
-        }
-        # For the first call will return average CPU usage since the system booted
-        if not self._cp_times_last:
-            self._cp_times_last = {c: {metric: 0 for metric in metrics.keys()} for c, metrics in cp_times.items()}
-        # Calculate the difference for each core since the last call
-        cp_times_diff = {
-            c: {k: cp_times[c][k] - self._cp_times_last[c][k] for k in cp_times[c].keys()} for c in cp_times.keys()
-        }
-        # Save current cp_times ​​to calculate the difference on subsequent calls
-        self._cp_times_last = cp_times
+            # For the first call will return average CPU usage since the system booted
+            if not self._cp_times_last:
+                self._cp_times_last = {c: {metric: 0 for metric in metrics.keys()} for c, metrics in cp_times.items()}
+            # Calculate the difference for each core since the last call
+            cp_times_diff = {
+                c: {k: cp_times[c][k] - self._cp_times_last[c][k] for k in cp_times[c].keys()} for c in cp_times.keys()
+            }
+            # Save current cp_times ​​to calculate the difference on subsequent calls
+            self._cp_times_last = cp_times
         # Sum up the differences for each core
         sum_cp_times_diff = {c: sum(cp_times_diff[c].values()) for c in cp_times_diff.keys()}
         # Calculate CPU load by the ratio of the metric difference to the sum of the differences for a specific core
@@ -93,14 +99,19 @@ class FreeBSDStats(BaseFeatureStats):
         logger.log(log_levels.MODULE_DEBUG, f"CPU usage: {cpu_usage}")
         return cpu_usage
 
+    def _get_pagesize(self) -> int:
+        """Get size of memory page in bytes, read once as it doesn't change while system is running."""
+        if self._pagesize is None:
+            self._pagesize = int(self._sysctl.get_sysctl_value("hw.pagesize"))
+        return self._pagesize
+
     def get_free_memory(self) -> int:
         """Get free memory.
 
         :return: Memory free in MB
         """
         v_free_count = int(self._sysctl.get_sysctl_value("vm.stats.vm.v_free_count"))
-        pagesize = int(self._sysctl.get_sysctl_value("hw.pagesize"))
-        freemem = (v_free_count * pagesize) >> 20
+        freemem = (v_free_count * self._get_pagesize()) >> 20
         return freemem
 
     def get_wired_memory(self) -> int:
@@ -109,6 +120,5 @@ class FreeBSDStats(BaseFeatureStats):
         :return: Wired memory in MB
         """
         v_wire_count = int(self._sysctl.get_sysctl_value("vm.stats.vm.v_wire_count"))
-        pagesize = int(self._sysctl.get_sysctl_value("hw.pagesize"))
-        wiredmem = (v_wire_count * pagesize) >> 20
+        wiredmem = (v_wire_count * self._get_pagesize()) >> 20
         return wiredmem
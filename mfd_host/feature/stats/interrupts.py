@@ -0,0 +1,136 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for per-CPU interrupt counters of Linux, /proc/interrupts and /proc/softirqs."""
+
+import re
+from array import array
+from typing import Dict
+
+from mfd_host.exceptions import StatisticNotFoundException
+
+from .data_structures import InterruptCounters
+
+# grouping of interrupt rates: by row (IRQ number, e.g. "134", or type, e.g. "NET_RX"), by name of handler
+# (e.g. "ens801f0-TxRx-12", rows without handler keep their name, e.g. "LOC") or by interface of queue ("ens801f0")
+INTERRUPT_GROUPS = ("irq", "name", "interface")
+# names of handlers end description of IRQ, e.g. "IR-PCI-MSI 524288-edge ens801f0-TxRx-12" or "... i8042, serio"
+HANDLER_NAME_REGEX = re.compile(r"\S+(?:, \S+)*$")
+# queues of drivers, e.g. "ens801f0-TxRx-12" (ice, i40e, ixgbe), "eth0-rx-0" (igb), "eth0-fp-3" (qede)
+QUEUE_NAME_REGEX = re.compile(r"^(?P<interface>.+?)-(?:txrx|rx|tx|fp)-\d+$", re.IGNORECASE)
+
+
+def parse_interrupt_counters(output: str, timestamp: float) -> InterruptCounters:
+    """
+    Parse content of /proc/interrupts or /proc/softirqs, header with CPU columns followed by row per IRQ.
+
+    Counters of row are converted in bulk into single array, rows with fewer columns (e.g. `ERR`) are padded
+    with zeros, text after counters is kept as description.
+
+    :param output: Content of file
+    :param timestamp: Time of reading in seconds since boot
+    :return: Counters of all rows
+    :raises StatisticNotFoundException: when output has no CPU columns
+    """
+    lines = output.splitlines()
+    header = next((index for index, line in enumerate(lines) if line.strip()), None)
+    if header is None or not lines[header].lstrip().startswith("CPU"):
+        raise StatisticNotFoundException(f"Unable to find CPU columns of interrupt counters: {output[:200]}")
+    cpus = [int(column[3:]) for column in lines[header].split()]
+    columns = len(cpus)
+    counters = InterruptCounters(timestamp=timestamp, cpus=cpus)
+    counts, names, descriptions = counters.counts, counters.names, counters.descriptions
+    zeros = [0] * columns
+    for line in lines[header + 1 :]:
+        name, _, text = line.partition(":")
+        fields = text.split(None, columns)
+        if not fields and not name.strip():
+            continue
+        if len(fields) >= columns and fields[columns - 1].isdigit():
+            counts.extend(map(int, fields[:columns]))
+            descriptions.append(fields[columns] if len(fields) > columns else "")
+        else:
+            filled = 0
+            while filled < len(fields) and fields[filled].isdigit():
+                filled += 1
+            counts.extend(map(int, fields[:filled]))
+            counts.extend(zeros[filled:])
+            descriptions.append(text.split(None, filled)[filled] if filled < len(fields) else "")
+        names.append(name.strip())
+    return counters
+
+
+def get_group_name(name: str, description: str, group_by: str) -> str:
+    """
+    Get name of group of interrupt row.
+
+    :param name: Name of row, e.g. "134" or "LOC"
+    :param description: Description of row, e.g. "IR-PCI-MSI 524288-edge ens801f0-TxRx-12"
+    :param group_by: Grouping, one of `INTERRUPT_GROUPS`
+    :return: Name of group
+    """
+    if group_by == "irq" or not name.isdigit():
+        return name
+    match = HANDLER_NAME_REGEX.search(description)
+    if match is None:
+        return name
+    handler = match.group()
+    if group_by == "interface":
+        queue_match = QUEUE_NAME_REGEX.match(handler)
+        if queue_match:
+            return queue_match["interface"]
+    return handler
+
+
+def get_interrupt_rates(
+    previous: InterruptCounters, current: InterruptCounters, group_by: str = "name"
+) -> Dict[str, Dict[int, float]]:
+    """
+    Calculate rates per second of interrupts on each CPU between two readings, summed by group.
+
+    Rows are matched by name, rows without change are skipped by comparing their counters in bulk,
+    so cost depends mostly on number of active rows. Counters of new rows count from 0, counters which went
+    backwards and CPUs missing in either reading are skipped.
+
+    :param previous: Earlier reading
+    :param current: Later reading
+    :param group_by: Grouping, one of `INTERRUPT_GROUPS`
+    :return: dictionary in format {'ens801f0-TxRx-12': {12: 15234.5}, 'LOC': {0: 250.0, 1: 249.0}},
+             only CPUs with interrupts in the interval
+    :raises ValueError: on unknown grouping or when readings are not in order
+    """
+    if group_by not in INTERRUPT_GROUPS:
+        raise ValueError(f"Unknown grouping of interrupts: {group_by}, available: {INTERRUPT_GROUPS}")
+    elapsed = current.timestamp - previous.timestamp
+    if elapsed <= 0:
+        raise ValueError(f"Readings of interrupts are not in order: {previous.timestamp}, {current.timestamp}")
+    columns, previous_columns = len(current.cpus), len(previous.cpus)
+    if current.cpus == previous.cpus:
+        matched_columns = [(column, column) for column in range(columns)]
+    else:
+        previous_column_by_cpu = {cpu: column for column, cpu in enumerate(previous.cpus)}
+        matched_columns = [
+            (column, previous_column_by_cpu[cpu])
+            for column, cpu in enumerate(current.cpus)
+            if cpu in previous_column_by_cpu
+        ]
+    previous_row_by_name = {name: row for row, name in enumerate(previous.names)}
+    zeros = array(current.counts.typecode, bytes(current.counts.itemsize * previous_columns))
+    rates: Dict[str, Dict[int, float]] = {}
+    for row, name in enumerate(current.names):
+        counts = current.counts[row * columns : (row + 1) * columns]
+        previous_row = previous_row_by_name.get(name)
+        if previous_row is None:
+            previous_counts = zeros
+        else:
+            previous_counts = previous.counts[previous_row * previous_columns : (previous_row + 1) * previous_columns]
+            if counts == previous_counts:
+                continue
+        group_rates = None
+        for column, previous_column in matched_columns:
+            difference = counts[column] - previous_counts[previous_column]
+            if difference > 0:
+                if group_rates is None:
+                    group_rates = rates.setdefault(get_group_name(name, current.descriptions[row], group_by), {})
+                cpu = current.cpus[column]
+                group_rates[cpu] = group_rates.get(cpu, 0.0) + difference / elapsed
+    return rates
@@ -4,24 +4,61 @@
 
 import logging
 import re
-from typing import Dict, List, Optional, Union
-
+import threading
+import typing
+from typing import Dict, Iterable, List, Optional, Tuple, Union
 
 from mfd_common_libs import add_logging_level, log_levels
 
-from mfd_connect.base import ConnectionCompletedProcess
-from mfd_host.exceptions import StatisticNotFoundException
+from mfd_host.exceptions import StatisticNotFoundException, StatsSamplerException
 from mfd_host.feature.stats.base import BaseFeatureStats
 
-from .data_structures import cpu_actual_labels, cpu_friendly_labels, mem_labels, swap_labels, StatsOutput
+from .data_structures import (
+    InterruptCounters,
+    SoftnetStat,
+    cpu_actual_labels,
+    cpu_friendly_labels,
+    mem_labels,
+    proc_stat_cpu_labels,
+    swap_labels,
+    StatsOutput,
+)
+from .interrupts import get_interrupt_rates, parse_interrupt_counters
+from .softnet import find_softnet_stat_bottlenecks, parse_softnet_stat
+
+if typing.TYPE_CHECKING:
+    from mfd_connect import Connection
+    from mfd_connect.base import ConnectionCompletedProcess
+    from mfd_host import Host
+    from mfd_host.feature.stats.sampling import StatsSampler
 
 logger = logging.getLogger(__name__)
 add_logging_level("MODULE_DEBUG", log_levels.MODULE_DEBUG)
 
+# printed between two reads of /proc/stat by `measure_cpu_utilization()`
+PROC_STAT_SEPARATOR = "__mfd_host_proc_stat__"
+# printed between two reads of interrupt counters by `measure_interrupt_rates()` and `measure_softirq_rates()`
+INTERRUPTS_SEPARATOR = "__mfd_host_interrupts__"
+
 
 class LinuxStats(BaseFeatureStats):
     """Linux class for Stats feature."""
 
+    def __init__(self, *, connection: "Connection", host: "Host") -> None:
+        """Initialize the Linux Stats feature.
+
+        :param connection: Object of mfd-connect
+        :param host: Object of mfd-host
+        """
+        super().__init__(connection=connection, host=host)
+        # CPU times read by the last call of each named session of `get_cpu_utilization_delta()`
+        self._cpu_times_sessions: Dict[str, Dict[str, List[int]]] = {}
+        # read of counters and update of session must be atomic, otherwise concurrent calls get negative deltas
+        self._cpu_times_lock = threading.Lock()
+        # sampler started by `start_sampling()`, guarded by lock so only one runs at a time
+        self._sampler: Optional["StatsSampler"] = None
+        self._sampler_lock = threading.Lock()
+
     def get_meminfo(self) -> Dict[str, str]:
         """Get information about memory in system.
 
@@ -33,6 +70,8 @@ class LinuxStats(BaseFeatureStats):
     def get_cpu_utilization(self) -> Dict[str, Dict[str, str]]:
         """Get sar CPU utilization values for all cores. Output data is in percentages which sums up to 1 for each core.
 
+        Values are averages of sysstat logs, for utilization during given time see `get_cpu_utilization_delta()`.
+
         :return: dictionary in format:
                  {'core_number': {'stat1': value,
                                   'stat2': value ...}}
@@ -58,6 +97,253 @@ class LinuxStats(BaseFeatureStats):
             return_dictionary[str(match["cpu_number"])] = match
         return return_dictionary
 
+    def start_cpu_utilization_session(self, session: str = "default") -> None:
+        """Start measurement of CPU utilization in named session, see `get_cpu_utilization_delta()`.
+
+        :param session: Name of session, started session is restarted
+        """
+        with self._cpu_times_lock:
+            self._cpu_times_sessions[session] = self._read_cpu_times()
+
+    def get_cpu_utilization_delta(self, session: str = "default", *, stop: bool = False) -> Dict[str, Dict[str, float]]:
+        """Get CPU utilization since the start of session or since the previous call in the session.
+
+        Utilization is computed from differences of time spent by the cores in each state, read from /proc/stat,
+        so it covers exactly the time between calls. Each call starts the next interval of session, so calls in fixed
+        intervals give time series of utilization. Session not started before gives utilization since boot.
+        Sessions have independent baselines, concurrent calls are serialized.
+
+        :param session: Name of session
+        :param stop: Whether to end session, next call in the session gives utilization since boot
+        :return: dictionary of percentages in format:
+                 {'all': {'user': 3.25, 'nice': 0.0, 'system': 1.0, 'idle': 95.74, 'iowait': 0.01,
+                          'irq': 0.0, 'softirq': 0.0, 'steal': 0.0},
+                  'core_number': {...}}
+        :raises StatisticNotFoundException: when /proc/stat has no CPU times
+        """
+        with self._cpu_times_lock:
+            cpu_times = self._read_cpu_times()
+            previous_cpu_times = self._cpu_times_sessions.pop(session, {})
+            if not stop:
+                self._cpu_times_sessions[session] = cpu_times
+        return self._get_cpu_utilization_between(previous_cpu_times, cpu_times)
+
+    def measure_cpu_utilization(self, interval: float) -> Dict[str, Dict[str, float]]:
+        """Measure CPU utilization during given time from now, /proc/stat is read at both ends by single command.
+
+        :param interval: Time of measurement in seconds
+        :return: dictionary of percentages, see `get_cpu_utilization_delta()`
+        :raises StatisticNotFoundException: when /proc/stat has no CPU times
+        """
+        command = f"cat /proc/stat; sleep {interval}; echo {PROC_STAT_SEPARATOR}; cat /proc/stat"
+        output = self._connection.execute_command(command, shell=True).stdout
+        start_output, _, end_output = output.partition(PROC_STAT_SEPARATOR)
+        return self._get_cpu_utilization_between(self._parse_cpu_times(start_output), self._parse_cpu_times(end_output))
+
+    def get_interrupts(self) -> InterruptCounters:
+        """Get per-CPU counters of hardware interrupts from /proc/interrupts.
+
+        :return: Counters of each IRQ on each CPU since boot, rows are IRQ numbers (e.g. "134") or types (e.g. "LOC"),
+                 descriptions contain names of handlers (e.g. "IR-PCI-MSI 524288-edge ens801f0-TxRx-12")
+        :raises StatisticNotFoundException: when /proc/interrupts has no CPU columns
+        """
+        return self._read_interrupt_counters("/proc/interrupts")
+
+    def get_softirqs(self) -> InterruptCounters:
+        """Get per-CPU counters of software interrupts from /proc/softirqs.
+
+        :return: Counters of each softirq type (e.g. "NET_RX") on each CPU since boot
+        :raises StatisticNotFoundException: when /proc/softirqs has no CPU columns
+        """
+        return self._read_interrupt_counters("/proc/softirqs")
+
+    def measure_interrupt_rates(self, interval: float, group_by: str = "name") -> Dict[str, Dict[int, float]]:
+        """Measure rates of hardware interrupts on each CPU during given time from now.
+
+        /proc/interrupts is read at both ends by single command. For rates between any two readings
+        of `get_interrupts()` see `mfd_host.feature.stats.interrupts.get_interrupt_rates`.
+
+        :param interval: Time of measurement in seconds
+        :param group_by: Grouping of rates: "irq" - by IRQ number, "name" - by name of handler, e.g. "ens801f0-TxRx-12",
+                         "interface" - queues of interface summed, e.g. "ens801f0"; rows without handler, e.g. "LOC",
+                         keep their name
+        :return: dictionary of interrupts per second in format {'ens801f0-TxRx-12': {12: 15234.5}, 'LOC': {0: 250.0}},
+                 only CPUs with interrupts in the interval
+        :raises StatisticNotFoundException: when /proc/interrupts has no CPU columns
+        :raises ValueError: on unknown grouping
+        """
+        return get_interrupt_rates(*self._measure_interrupt_counters("/proc/interrupts", interval), group_by=group_by)
+
+    def measure_softirq_rates(self, interval: float) -> Dict[str, Dict[int, float]]:
+        """Measure rates of software interrupts on each CPU during given time from now.
+
+        /proc/softirqs is read at both ends by single command, e.g. cores servicing NET_RX of the traffic.
+
+        :param interval: Time of measurement in seconds
+        :return: dictionary of softirqs per second in format {'NET_RX': {12: 20431.0, 13: 20112.5}, 'TIMER': {...}},
+                 only CPUs with softirqs in the interval
+        :raises StatisticNotFoundException: when /proc/softirqs has no CPU columns
+        """
+        return get_interrupt_rates(*self._measure_interrupt_counters("/proc/softirqs", interval), group_by="irq")
+
+    def get_softnet_stat(self) -> SoftnetStat:
+        """Get per-CPU packet backlog counters from /proc/net/softnet_stat.
+
+        :return: Counters of each CPU since boot (processed, dropped, time_squeeze, cpu_collision, received_rps,
+                 flow_limit_count), with uptime of the host as timestamp
+        :raises StatisticNotFoundException: when /proc/net/softnet_stat has no counters
+        """
+        return parse_softnet_stat(*self._split_uptime(self._read_with_uptime("/proc/net/softnet_stat")))
+
+    def get_softnet_stat_bottlenecks(
+        self, since: SoftnetStat, dropped_rate: float = 0.0, time_squeeze_rate: float = 0.0
+    ) -> Dict[int, Dict[str, float]]:
+        """Find CPUs whose packet backlog drops or time squeezes per second since reading are above thresholds.
+
+        Reading at the start of run is given by `get_softnet_stat()`, deltas between any two readings are given by
+        `mfd_host.feature.stats.softnet.get_softnet_stat_deltas`.
+
+        :param since: Reading of `get_softnet_stat()` at the start of run
+        :param dropped_rate: Threshold of drops per second, drops mean full backlog of the CPU
+        :param time_squeeze_rate: Threshold of time squeezes per second, squeezes mean NAPI budget was exhausted
+        :return: dictionary of counters per second of flagged CPUs in format
+                 {12: {'processed': 750000.0, 'dropped': 120.5, 'time_squeeze': 21.0, ...}}
+        :raises StatisticNotFoundException: when /proc/net/softnet_stat has no counters
+        :raises ValueError: when reading is not from the past
+        """
+        bottlenecks = find_softnet_stat_bottlenecks(
+            since, self.get_softnet_stat(), dropped_rate=dropped_rate, time_squeeze_rate=time_squeeze_rate
+        )
+        if bottlenecks:
+            logger.log(log_levels.MODULE_DEBUG, f"CPUs with packet backlog drops or time squeezes: {list(bottlenecks)}")
+        return bottlenecks
+
+    def start_sampling(
+        self,
+        metrics: Iterable[str] = ("cpu", "memory"),
+        interval: float = 1.0,
+        capacity: int = 3600,
+        *,
+        agent: bool = False,
+    ) -> "StatsSampler":
+        """Start sampling stats in background, by single collector running on the host until `stop_sampling()`.
+
+        Samples are read as they arrive and kept in ring buffer of `capacity` samples, the oldest ones are dropped.
+        Time series are available from returned sampler also while sampling, e.g. `sampler.series("cpu.idle")`.
+        With `agent`, collector agent deployed to the host samples into binary file on its tmpfs, which is fetched
+        and parsed on `stop_sampling()`, so nothing is transferred while sampling and time series are available
+        only after stop, see `mfd_host.feature.stats.agent.AgentStatsSampler`.
+
+        :param metrics: Names of metrics, see `mfd_host.feature.stats.sampling.SAMPLING_METRICS`
+        :param interval: Time between samples in seconds
+        :param capacity: Maximum number of samples kept
+        :param agent: Whether to sample by collector agent, requires python3 on the host
+        :return: Sampler collecting samples
+        :raises StatsSamplerException: when sampling is already started, on invalid arguments or failed agent deploy
+        """
+        from mfd_host.feature.stats.agent import AgentStatsSampler
+        from mfd_host.feature.stats.sampling import StatsSampler
+
+        with self._sampler_lock:
+            if self._sampler is not None:
+                raise StatsSamplerException("Sampling is already started, stop it first.")
+            sampler_class = AgentStatsSampler if agent else StatsSampler
+            sampler = sampler_class(self._connection, metrics=metrics, interval=interval, capacity=capacity)
+            sampler.start()
+            self._sampler = sampler
+        return sampler
+
+    def stop_sampling(self) -> "StatsSampler":
+        """Stop sampling started by `start_sampling()`.
+
+        :return: Sampler with collected samples
+        :raises StatsSamplerException: when sampling is not started
+        """
+        with self._sampler_lock:
+            sampler, self._sampler = self._sampler, None
+        if sampler is None:
+            raise StatsSamplerException("Sampling is not started.")
+        sampler.stop()
+        return sampler
+
+    def _read_interrupt_counters(self, path: str) -> InterruptCounters:
+        """Read interrupt counters from /proc/interrupts or /proc/softirqs."""
+        return parse_interrupt_counters(*self._split_uptime(self._read_with_uptime(path)))
+
+    def _measure_interrupt_counters(self, path: str, interval: float) -> Tuple[InterruptCounters, InterruptCounters]:
+        """Read interrupt counters at the start and at the end of interval, by single command."""
+        command = f"cat /proc/uptime {path}; sleep {interval}; echo {INTERRUPTS_SEPARATOR}; cat /proc/uptime {path}"
+        output = self._connection.execute_command(command, shell=True).stdout
+        start_output, _, end_output = output.partition(f"{INTERRUPTS_SEPARATOR}\n")
+        return (
+            parse_interrupt_counters(*self._split_uptime(start_output)),
+            parse_interrupt_counters(*self._split_uptime(end_output)),
+        )
+
+    def _read_with_uptime(self, path: str) -> str:
+        """Read file together with /proc/uptime, by single command."""
+        return self._connection.execute_command(f"cat /proc/uptime {path}", shell=True).stdout
+
+    @staticmethod
+    def _split_uptime(output: str) -> Tuple[str, float]:
+        """Split output of `cat /proc/uptime <file>` into content of file and uptime of the host.
+
+        :param output: Content of /proc/uptime followed by content of file
+        :return: Content of file and uptime in seconds, used as timestamp of counters in file
+        :raises StatisticNotFoundException: when output has no uptime
+        """
+        uptime, _, content = output.partition("\n")
+        try:
+            return content, float(uptime.split()[0])
+        except (IndexError, ValueError) as e:
+            raise StatisticNotFoundException(f"Unable to find uptime in output: {uptime}") from e
+
+    def _read_cpu_times(self) -> Dict[str, List[int]]:
+        """Read time spent by the cores in each state since boot."""
+        return self._parse_cpu_times(self._connection.execute_command("cat /proc/stat", shell=True).stdout)
+
+    def _parse_cpu_times(self, output: str) -> Dict[str, List[int]]:
+        """Parse cpu lines of /proc/stat, e.g. `cpu0 4705 356 584 3699 23 23 0 0 0 0`.
+
+        :param output: Content of /proc/stat
+        :return: dictionary in format {'all': [user, nice, system, ...], 'core_number': [...]}, in USER_HZ
+        :raises StatisticNotFoundException: when output has no CPU times
+        """
+        cpu_times = {}
+        for line in output.splitlines():
+            if not line.startswith("cpu"):
+                continue
+            name, *values = line.split()
+            # older kernels report fewer columns, missing ones are 0
+            times = [int(value) for value in values[: len(proc_stat_cpu_labels)]]
+            cpu_times[name[3:] or "all"] = times + [0] * (len(proc_stat_cpu_labels) - len(times))
+        if not cpu_times:
+            raise StatisticNotFoundException(f"Unable to find CPU times in /proc/stat: {output}")
+        return cpu_times
+
+    @staticmethod
+    def _get_cpu_utilization_between(
+        previous_cpu_times: Dict[str, List[int]], cpu_times: Dict[str, List[int]]
+    ) -> Dict[str, Dict[str, float]]:
+        """Calculate CPU utilization in percentages from difference of CPU times.
+
+        :param previous_cpu_times: CPU times at the start, CPUs missing in them (e.g. brought online) count from 0
+        :param cpu_times: CPU times at the end
+        :return: dictionary of percentages, see `get_cpu_utilization_delta()`
+        """
+        cpu_usage = {}
+        for cpu, times in cpu_times.items():
+            previous_times = previous_cpu_times.get(cpu, [0] * len(times))
+            # counters (e.g. iowait) may go backwards, negative differences are not counted
+            times_diff = [max(value - previous_value, 0) for value, previous_value in zip(times, previous_times)]
+            sum_times_diff = sum(times_diff)
+            cpu_usage[cpu] = {
+                label: round(diff / sum_times_diff * 100.0, 2) if sum_times_diff else 0.0
+                for label, diff in zip(proc_stat_cpu_labels, times_diff)
+            }
+        logger.log(log_levels.MODULE_DEBUG, f"CPU usage of all cores: {cpu_usage.get('all')}")
+        return cpu_usage
+
     def get_slabinfo(self) -> Dict[str, str]:
         """Capture slabinfo results.
 
@@ -235,7 +521,9 @@ class LinuxStats(BaseFeatureStats):
             process_stat=proc_stats,
         )
 
-    def _execute_top_command(self, separate_cpu: bool, memory_scaling: str, options: str) -> ConnectionCompletedProcess:
+    def _execute_top_command(
+        self, separate_cpu: bool, memory_scaling: str, options: str
+    ) -> "ConnectionCompletedProcess":
         """
         Execute the top command with specified parameters.
 
@@ -254,7 +542,7 @@ class LinuxStats(BaseFeatureStats):
             cmd += f" {str(options)}"
         return self._connection.execute_command(cmd, shell=True)
 
-    def _handle_separate_cpu_warning(self, memory_scaling: str, options: str) -> ConnectionCompletedProcess:
+    def _handle_separate_cpu_warning(self, memory_scaling: str, options: str) -> "ConnectionCompletedProcess":
         """
         Handle the warning about inappropriate '1' flag in the top command.
 
@@ -321,9 +609,8 @@ class LinuxStats(BaseFeatureStats):
             line = line.replace(":", " ").replace(",", " ")
             stats = {}
             buffer_pattern = "buff/cache" if "buff/cache" in line else "buffers"
-            mem_labels.append(buffer_pattern)
             if buffer_pattern in line:
-                for label in mem_labels:
+                for label in [*mem_labels, buffer_pattern]:
                     label_pattern = re.search(rf"(?P<value>\d+.\d+)(\s+|\+)({label})", line)
                     if label_pattern:
                         stats[label] = float(label_pattern.group("value"))
@@ -332,8 +619,7 @@ class LinuxStats(BaseFeatureStats):
                 mem_stats["Scale"] = line.split("Mem")[0]
             if "Swap" in line:
                 swap_pattern = "avail" if "avail" in line else "cached Mem"
-                swap_labels.append(swap_pattern)
-                for label in swap_labels:
+                for label in [*swap_labels, swap_pattern]:
                     label_pattern = re.search(rf"(?P<value>\d+.\d+)(\s+|\+)({label})", line)
                     if label_pattern:
                         stats[label] = float(label_pattern.group("value"))
@@ -0,0 +1,380 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for background sampling of Linux stats."""
+
+import logging
+import math
+import re
+import threading
+import typing
+from array import array
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from mfd_common_libs import add_logging_level, log_levels
+
+from mfd_host.exceptions import StatisticNotFoundException, StatsSamplerException
+
+from .data_structures import TimeSeries, proc_stat_cpu_labels
+from .softnet import parse_softnet_stat
+
+if typing.TYPE_CHECKING:
+    from mfd_connect import Connection
+    from mfd_connect.process import RemoteProcess
+
+logger = logging.getLogger(__name__)
+add_logging_level("MODULE_DEBUG", log_levels.MODULE_DEBUG)
+
+# printed by collector before each sample
+SAMPLE_MARKER = "__mfd_host_sample__"
+FILE_HEADER_REGEX = re.compile(r"^==> (?P<path>\S+) <==$")
+UPTIME_FILE = "/proc/uptime"
+# time in seconds to wait for collector to stop and for the rest of its output
+STOP_TIMEOUT = 10
+NET_DEV_COLUMNS = {0: "rx_bytes", 1: "rx_packets", 3: "rx_drop", 8: "tx_bytes", 9: "tx_packets", 11: "tx_drop"}
+
+
+@dataclass(frozen=True)
+class SamplingMetric:
+    """
+    Metric sampled by `StatsSampler`.
+
+    `read` gets values of metric from contents of its files. Values of gauges are stored as they are, values of
+    counters are passed to `derive` together with values of previous sample and time between samples,
+    so series of counters start with the second sample.
+    """
+
+    files: Tuple[str, ...]
+    read: Callable[[Dict[str, str]], Dict[str, float]]
+    derive: Optional[Callable[[Dict[str, float], Dict[str, float], float], Dict[str, float]]] = None
+
+
+def _read_cpu_times(contents: Dict[str, str], per_core: bool) -> Dict[str, float]:
+    """Read CPU times of all cores (`cpu.user`, ...) or of each core (`cpu0.user`, ...) from /proc/stat."""
+    values = {}
+    for line in contents["/proc/stat"].splitlines():
+        if not line.startswith("cpu"):
+            continue
+        name, *times = line.split()
+        if (name != "cpu") is not per_core:
+            continue
+        for label, time in zip(proc_stat_cpu_labels, times):
+            values[f"{name}.{label}"] = float(time)
+    return values
+
+
+def _derive_cpu_utilization(previous: Dict[str, float], current: Dict[str, float], elapsed: float) -> Dict[str, float]:
+    """Calculate percentages of time spent by cores in each state, from differences of CPU times."""
+    diffs_by_cpu: Dict[str, Dict[str, float]] = {}
+    for name, value in current.items():
+        if name in previous:
+            cpu, _, label = name.partition(".")
+            # counters (e.g. iowait) may go backwards, negative differences are not counted
+            diffs_by_cpu.setdefault(cpu, {})[label] = max(value - previous[name], 0.0)
+    utilization = {}
+    for cpu, diffs in diffs_by_cpu.items():
+        sum_diffs = sum(diffs.values())
+        for label, diff in diffs.items():
+            utilization[f"{cpu}.{label}"] = round(diff / sum_diffs * 100.0, 2) if sum_diffs else 0.0
+    return utilization
+
+
+def _derive_rates(previous: Dict[str, float], current: Dict[str, float], elapsed: float) -> Dict[str, float]:
+    """Calculate rates per second of counters, counters which were reset or wrapped are skipped."""
+    if elapsed <= 0:
+        return {}
+    return {
+        name: (value - previous[name]) / elapsed
+        for name, value in current.items()
+        if name in previous and value >= previous[name]
+    }
+
+
+def _read_meminfo(contents: Dict[str, str]) -> Dict[str, float]:
+    """Read fields of /proc/meminfo, in kB (or pages for HugePages_* counts)."""
+    values = {}
+    for line in contents["/proc/meminfo"].splitlines():
+        name, _, value = line.partition(":")
+        fields = value.split()
+        if fields:
+            values[f"memory.{name}"] = float(fields[0])
+    return values
+
+
+def _read_softirqs(contents: Dict[str, str]) -> Dict[str, float]:
+    """Read number of softirqs of each type summed over all CPUs, from /proc/softirqs."""
+    values = {}
+    for line in contents["/proc/softirqs"].splitlines()[1:]:
+        name, _, counts = line.partition(":")
+        if counts:
+            values[f"softirqs.{name.strip()}"] = float(sum(map(int, counts.split())))
+    return values
+
+
+def _read_loadavg(contents: Dict[str, str]) -> Dict[str, float]:
+    """Read load averages from /proc/loadavg."""
+    load = contents["/proc/loadavg"].split()
+    return {"loadavg.1min": float(load[0]), "loadavg.5min": float(load[1]), "loadavg.15min": float(load[2])}
+
+
+def _read_net_dev(contents: Dict[str, str]) -> Dict[str, float]:
+    """Read bytes, packets and drops received and transmitted by each interface, from /proc/net/dev."""
+    values = {}
+    for line in contents["/proc/net/dev"].splitlines()[2:]:
+        interface, _, counters = line.partition(":")
+        counters = counters.split()
+        for column, label in NET_DEV_COLUMNS.items():
+            if column < len(counters):
+                values[f"net.{interface.strip()}.{label}"] = float(counters[column])
+    return values
+
+
+def _read_softnet_stat(contents: Dict[str, str]) -> Dict[str, float]:
+    """Read packet backlog counters of each CPU, from /proc/net/softnet_stat."""
+    softnet_stat = parse_softnet_stat(contents["/proc/net/softnet_stat"], timestamp=0.0)
+    return {
+        f"softnet.cpu{cpu}.{label}": float(value)
+        for cpu, counters in softnet_stat.counters.items()
+        for label, value in counters.items()
+    }
+
+
+# Metrics available for sampling, series are named by metric prefix, e.g. "cpu.idle", "memory.MemFree"
+SAMPLING_METRICS: Dict[str, SamplingMetric] = {
+    "cpu": SamplingMetric(
+        files=("/proc/stat",),
+        read=lambda contents: _read_cpu_times(contents, per_core=False),
+        derive=_derive_cpu_utilization,
+    ),
+    "cpu_per_core": SamplingMetric(
+        files=("/proc/stat",),
+        read=lambda contents: _read_cpu_times(contents, per_core=True),
+        derive=_derive_cpu_utilization,
+    ),
+    "memory": SamplingMetric(files=("/proc/meminfo",), read=_read_meminfo),
+    "softirqs": SamplingMetric(files=("/proc/softirqs",), read=_read_softirqs, derive=_derive_rates),
+    "loadavg": SamplingMetric(files=("/proc/loadavg",), read=_read_loadavg),
+    "net": SamplingMetric(files=("/proc/net/dev",), read=_read_net_dev, derive=_derive_rates),
+    "softnet": SamplingMetric(files=("/proc/net/softnet_stat",), read=_read_softnet_stat, derive=_derive_rates),
+}
+
+
+class SampleRingBuffer:
+    """
+    Fixed-size buffer of numeric samples, the oldest samples are overwritten when it is full.
+
+    Each series is stored in preallocated array of floats, NaN marks samples without value of series.
+    """
+
+    def __init__(self, capacity: int):
+        """
+        Initialize buffer.
+
+        :param capacity: Maximum number of samples kept
+        """
+        self.capacity = capacity
+        self.count = 0
+        self._timestamps = array("d", [math.nan]) * capacity
+        self._series: Dict[str, array] = {}
+
+    def __len__(self) -> int:
+        """Number of samples kept."""
+        return min(self.count, self.capacity)
+
+    @property
+    def names(self) -> List[str]:
+        """Names of series in buffer."""
+        return list(self._series)
+
+    def append(self, timestamp: float, values: Dict[str, float]) -> None:
+        """
+        Add sample, overwriting the oldest one if buffer is full.
+
+        :param timestamp: Time of sample
+        :param values: Values of series in sample
+        """
+        position = self.count % self.capacity
+        self._timestamps[position] = timestamp
+        for name, series in self._series.items():
+            series[position] = values.get(name, math.nan)
+        for name, value in values.items():
+            if name not in self._series:
+                series = self._series[name] = array("d", [math.nan]) * self.capacity
+                series[position] = value
+        self.count += 1
+
+    def get(self, name: str) -> TimeSeries:
+        """
+        Get samples of series, the oldest first.
+
+        :param name: Name of series
+        :return: Time series, empty if there is no such series
+        """
+        timestamps = self._ordered(self._timestamps)
+        series = self._series.get(name)
+        values = self._ordered(series) if series is not None else []
+        return TimeSeries(name=name, timestamps=timestamps if values else [], values=values)
+
+    def _ordered(self, samples: array) -> List[float]:
+        """Get stored samples, the oldest first."""
+        if self.count <= self.capacity:
+            return samples[: self.count].tolist()
+        position = self.count % self.capacity
+        return samples[position:].tolist() + samples[:position].tolist()
+
+
+class StatsSampler:
+    """
+    Sampler of Linux stats running in background.
+
+    Single long-running collector started on the host prints selected procfs files each interval,
+    samples are parsed in background thread as they arrive and kept in fixed-size ring buffer.
+    Timestamps are seconds since boot of the host (/proc/uptime), values of counters are derived
+    (e.g. CPU utilization in percentages, rates per second), see `SAMPLING_METRICS`.
+    """
+
+    def __init__(self, connection: "Connection", metrics: Iterable[str], interval: float, capacity: int):
+        """
+        Initialize sampler.
+
+        :param connection: Object of mfd-connect
+        :param metrics: Names of metrics, keys of `SAMPLING_METRICS`
+        :param interval: Time between samples in seconds
+        :param capacity: Maximum number of samples kept, the oldest ones are dropped
+        :raises StatsSamplerException: on unknown metric or invalid interval or capacity
+        """
+        metrics = list(dict.fromkeys(metrics))
+        unknown_metrics = [metric for metric in metrics if metric not in SAMPLING_METRICS]
+        if not metrics or unknown_metrics:
+            raise StatsSamplerException(f"Unknown metrics: {unknown_metrics}, available: {list(SAMPLING_METRICS)}")
+        if interval <= 0 or capacity <= 0:
+            raise StatsSamplerException(f"Interval and capacity must be positive, got {interval} and {capacity}")
+        self._connection = connection
+        self.metrics = metrics
+        self.interval = interval
+        self.buffer = SampleRingBuffer(capacity)
+        self.errors = 0
+        self._process: Optional["RemoteProcess"] = None
+        self._reader: Optional[threading.Thread] = None
+        self._previous: Dict[str, Tuple[float, Dict[str, float]]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def files(self) -> List[str]:
+        """Files read by collector in each sample, the first one is /proc/uptime giving timestamp of sample."""
+        return list(
+            dict.fromkeys([UPTIME_FILE, *(file for metric in self.metrics for file in SAMPLING_METRICS[metric].files)])
+        )
+
+    @property
+    def command(self) -> str:
+        """Shell command of collector."""
+        # single process per sample, `tail -v` prints header before each file
+        return f"while :; do echo {SAMPLE_MARKER}; tail -v -n +1 {' '.join(self.files)}; sleep {self.interval}; done"
+
+    @property
+    def running(self) -> bool:
+        """Check whether samples are collected."""
+        return self._reader is not None and self._reader.is_alive()
+
+    @property
+    def names(self) -> List[str]:
+        """Names of sampled series."""
+        with self._lock:
+            return self.buffer.names
+
+    def series(self, name: str) -> TimeSeries:
+        """
+        Get samples of series, e.g. "cpu.idle", the oldest first.
+
+        :param name: Name of series
+        :return: Time series, empty if there is no such series
+        """
+        with self._lock:
+            return self.buffer.get(name)
+
+    def start(self) -> None:
+        """Start collector on the host and reading its samples."""
+        logger.log(level=log_levels.MODULE_DEBUG, msg=f"Start sampling of {self.metrics} every {self.interval}s")
+        self._process = self._connection.start_process(self.command, shell=True)
+        self._reader = threading.Thread(
+            target=self._read_samples, args=(self._process.get_stdout_iter(),), name="mfd-host-sampler", daemon=True
+        )
+        self._reader.start()
+
+    def stop(self) -> None:
+        """Stop collector, samples already printed by it are read."""
+        if self._process is None:
+            return
+        logger.log(level=log_levels.MODULE_DEBUG, msg="Stop sampling")
+        self._stop_process()
+        self._reader.join(timeout=STOP_TIMEOUT)
+
+    def _stop_process(self) -> None:
+        """Stop collector process gracefully, kill it if it is still running."""
+        if self._process.running:
+            self._process.stop(wait=STOP_TIMEOUT)
+            if self._process.running:
+                self._process.kill(wait=STOP_TIMEOUT)
+
+    def _read_samples(self, lines: Iterator[str]) -> None:
+        """Split output of collector into samples and add them to buffer."""
+        sample_lines = None
+        for line in lines:
+            line = line.rstrip("\n")
+            if line == SAMPLE_MARKER:
+                if sample_lines:
+                    self._add_sample(sample_lines)
+                sample_lines = []
+            elif sample_lines is not None:
+                sample_lines.append(line)
+        if sample_lines:
+            self._add_sample(sample_lines)
+
+    def _add_sample(self, lines: List[str]) -> None:
+        """Split sample into files and add it to buffer."""
+        self._add_contents(self._split_files(lines))
+
+    def _add_contents(self, contents: Dict[str, str]) -> None:
+        """Parse contents of files read in sample and add it to buffer, errors are logged and counted."""
+        try:
+            timestamp = float(contents[UPTIME_FILE].split()[0])
+            values = {}
+            for metric in self.metrics:
+                values.update(self._get_metric_values(metric, contents, timestamp))
+        except (KeyError, IndexError, ValueError, StatisticNotFoundException) as e:
+            self.errors += 1
+            logger.log(level=log_levels.MODULE_DEBUG, msg=f"Sample not parsed: {e!r}")
+            return
+        with self._lock:
+            self.buffer.append(timestamp, values)
+
+    def _get_metric_values(self, metric: str, contents: Dict[str, str], timestamp: float) -> Dict[str, float]:
+        """Get values of metric in sample, derived from previous sample for counters."""
+        sampling_metric = SAMPLING_METRICS[metric]
+        values = sampling_metric.read(contents)
+        if sampling_metric.derive is None:
+            return values
+        previous = self._previous.get(metric)
+        self._previous[metric] = timestamp, values
+        if previous is None:
+            return {}
+        previous_timestamp, previous_values = previous
+        return sampling_metric.derive(previous_values, values, timestamp - previous_timestamp)
+
+    @staticmethod
+    def _split_files(lines: List[str]) -> Dict[str, str]:
+        """Split output of `tail -v` into contents of files."""
+        contents = {}
+        path, file_lines = None, []
+        for line in lines:
+            match = FILE_HEADER_REGEX.match(line)
+            if match:
+                if path is not None:
+                    contents[path] = "\n".join(file_lines)
+                path, file_lines = match["path"], []
+            elif line:
+                file_lines.append(line)
+        if path is not None:
+            contents[path] = "\n".join(file_lines)
+        return contents
@@ -0,0 +1,88 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for per-CPU packet backlog counters of Linux, /proc/net/softnet_stat."""
+
+from typing import Dict
+
+from mfd_host.exceptions import StatisticNotFoundException
+
+from .data_structures import SoftnetStat, softnet_stat_labels
+
+# column with CPU number, printed since kernel 5.10, older kernels print row per online CPU
+SOFTNET_STAT_CPU_COLUMN = 12
+# counters are 32-bit and wrap around
+SOFTNET_STAT_COUNTER_RANGE = 2**32
+
+
+def parse_softnet_stat(output: str, timestamp: float) -> SoftnetStat:
+    """
+    Parse content of /proc/net/softnet_stat, row of hex columns per CPU.
+
+    :param output: Content of file
+    :param timestamp: Time of reading in seconds since boot
+    :return: Counters of each CPU, see `softnet_stat_labels`
+    :raises StatisticNotFoundException: when output has no counters
+    """
+    softnet_stat = SoftnetStat(timestamp=timestamp)
+    for row, line in enumerate(output.split("\n")):
+        columns = line.split()
+        if not columns:
+            continue
+        try:
+            values = [int(column, 16) for column in columns]
+        except ValueError as e:
+            raise StatisticNotFoundException(f"Unable to parse softnet_stat line: {line}") from e
+        cpu = values[SOFTNET_STAT_CPU_COLUMN] if len(values) > SOFTNET_STAT_CPU_COLUMN else row
+        softnet_stat.counters[cpu] = {
+            label: values[column] for column, label in softnet_stat_labels.items() if column < len(values)
+        }
+    if not softnet_stat.counters:
+        raise StatisticNotFoundException(f"Unable to find counters in softnet_stat: {output}")
+    return softnet_stat
+
+
+def get_softnet_stat_deltas(previous: SoftnetStat, current: SoftnetStat) -> Dict[int, Dict[str, int]]:
+    """
+    Calculate increments of counters of each CPU between two readings, wrapped counters are counted correctly.
+
+    :param previous: Earlier reading
+    :param current: Later reading
+    :return: dictionary in format {12: {'processed': 1500000, 'dropped': 0, 'time_squeeze': 42, ...}},
+             CPUs missing in either reading are skipped
+    """
+    return {
+        cpu: {
+            label: (value - previous.counters[cpu].get(label, value)) % SOFTNET_STAT_COUNTER_RANGE
+            for label, value in counters.items()
+        }
+        for cpu, counters in current.counters.items()
+        if cpu in previous.counters
+    }
+
+
+def find_softnet_stat_bottlenecks(
+    previous: SoftnetStat, current: SoftnetStat, dropped_rate: float = 0.0, time_squeeze_rate: float = 0.0
+) -> Dict[int, Dict[str, float]]:
+    """
+    Find CPUs whose backlog drops or time squeezes per second between two readings are above thresholds.
+
+    Drops mean full backlog of the CPU (net.core.netdev_max_backlog), time squeezes mean NAPI poll ran out
+    of budget or time (net.core.netdev_budget, net.core.netdev_budget_usecs) with packets still pending.
+
+    :param previous: Earlier reading
+    :param current: Later reading
+    :param dropped_rate: Threshold of drops per second
+    :param time_squeeze_rate: Threshold of time squeezes per second
+    :return: dictionary of counters per second of flagged CPUs in format
+             {12: {'processed': 750000.0, 'dropped': 120.5, 'time_squeeze': 21.0, ...}}
+    :raises ValueError: when readings are not in order
+    """
+    elapsed = current.timestamp - previous.timestamp
+    if elapsed <= 0:
+        raise ValueError(f"Readings of softnet_stat are not in order: {previous.timestamp}, {current.timestamp}")
+    bottlenecks = {}
+    for cpu, deltas in get_softnet_stat_deltas(previous, current).items():
+        rates = {label: delta / elapsed for label, delta in deltas.items()}
+        if rates["dropped"] > dropped_rate or rates["time_squeeze"] > time_squeeze_rate:
+            bottlenecks[cpu] = rates
+    return bottlenecks
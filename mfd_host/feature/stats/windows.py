@@ -28,11 +28,18 @@ class WindowsStats(BaseFeatureStats):
                                         \\Memory\\Pool Paged Bytes\
                                         \\Memory\\Pool Nonpaged Bytes\
         """
-        return {
-            "Available": int(self.get_performance_counter(data_structures.AvailableMemory)),
-            "Paged": int(self.get_performance_counter(data_structures.PagedMemory)),
-            "Nonpaged": int(self.get_performance_counter(data_structures.NonPagedMemory)),
+        counters = {
+            "Available": data_structures.AvailableMemory,
+            "Paged": data_structures.PagedMemory,
+            "Nonpaged": data_structures.NonPagedMemory,
         }
+        # all counters are queried by single PowerShell call
+        commands = self._execute_commands(
+            [self._get_performance_counter_command(counter) for counter in counters.values()],
+            defer=False,
+            expected_return_codes={0},
+        )
+        return {name: int(self._parse_performance_counter(command.stdout)) for name, command in zip(counters, commands)}
 
     def get_cpu_utilization(self) -> float:
         """Get the CPU utilization value.
@@ -48,10 +55,23 @@ class WindowsStats(BaseFeatureStats):
         :return: stats value.
         :raises StatisticNotFoundException when unable to parse the powershell output.
         """
-        cmd = f"Get-counter -Counter {counter_name} | Format-List"
-
+        cmd = self._get_performance_counter_command(counter_name)
         cmd_output = self._connection.execute_powershell(cmd, expected_return_codes={0}).stdout
+        return self._parse_performance_counter(cmd_output)
+
+    @staticmethod
+    def _get_performance_counter_command(counter_name: str) -> str:
+        """Get command querying performance counter."""
+        return f"Get-counter -Counter {counter_name} | Format-List"
+
+    @staticmethod
+    def _parse_performance_counter(cmd_output: str) -> float:
+        """Parse value of performance counter.
 
+        :param cmd_output: Output of command from `_get_performance_counter_command()`
+        :return: stats value.
+        :raises StatisticNotFoundException when unable to parse the powershell output.
+        """
         if "Readings  : " in cmd_output:
             line = cmd_output.split("Readings  : ")[1].split(":")
             if len(line) == 2:
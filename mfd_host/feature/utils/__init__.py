@@ -1,13 +1,31 @@
 # Copyright (C) 2025 Intel Corporation
 # SPDX-License-Identifier: MIT
-"""Module for utils feature."""
+"""Module for utils feature.
 
-from typing import Union
+OS implementations are imported on first access, so only modules needed by the connected OS are loaded.
+"""
 
-from .base import BaseFeatureUtils
-from .linux import LinuxUtils
-from .windows import WindowsUtils
-from .freebsd import FreeBSDUtils
-from .esxi import ESXiUtils
+import typing
 
-UtilsFeatureType = Union[BaseFeatureUtils, LinuxUtils, WindowsUtils, FreeBSDUtils, ESXiUtils]
+from mfd_host.lazy_import import lazy_getattr
+
+if typing.TYPE_CHECKING:
+    from .base import BaseFeatureUtils
+    from .esxi import ESXiUtils
+    from .freebsd import FreeBSDUtils
+    from .linux import LinuxUtils
+    from .windows import WindowsUtils
+
+    UtilsFeatureType = BaseFeatureUtils | ESXiUtils | FreeBSDUtils | LinuxUtils | WindowsUtils
+
+__getattr__ = lazy_getattr(
+    __name__,
+    attributes={
+        "BaseFeatureUtils": ".base",
+        "ESXiUtils": ".esxi",
+        "FreeBSDUtils": ".freebsd",
+        "LinuxUtils": ".linux",
+        "WindowsUtils": ".windows",
+    },
+    unions={"UtilsFeatureType": ("BaseFeatureUtils", "ESXiUtils", "FreeBSDUtils", "LinuxUtils", "WindowsUtils")},
+)
@@ -5,10 +5,10 @@
 import logging
 from abc import ABC, abstractmethod
 from ipaddress import IPv4Address, IPv6Address
-from typing import overload, TYPE_CHECKING
+from itertools import chain
+from typing import Iterable, overload, TYPE_CHECKING
 
 from mfd_common_libs import add_logging_level, log_levels
-from mfd_connect.util.rpc_copy_utils import _get_hostname
 
 from mfd_host.exceptions import UtilsFeatureException
 from mfd_host.feature.base import BaseFeature
@@ -26,6 +26,8 @@ add_logging_level("MODULE_DEBUG", log_levels.MODULE_DEBUG)
 class BaseFeatureUtils(BaseFeature, ABC):
     """Base class for Utils feature."""
 
+    _feature_name = "utils"
+
     def get_interface_by_ip(
         self, ip: IPv4Address | IPv6Address, check_all_interfaces: bool = False
     ) -> "ESXiNetworkInterface | FreeBSDNetworkInterface | LinuxNetworkInterface | WindowsNetworkInterface":
@@ -37,19 +39,92 @@ class BaseFeatureUtils(BaseFeature, ABC):
                                      False - check interfaces saved in network_interfaces attribute
         :return: Matching interface
         """
-        interfaces_to_check = (
-            self._host().network.get_interfaces() if check_all_interfaces else self._host().network_interfaces
-        )
-        ip_version = "v4" if isinstance(ip, IPv4Address) else "v6"
+        interface = self.get_interfaces_by_ips([ip], check_all_interfaces=check_all_interfaces).get(ip)
+        if interface is None:
+            raise UtilsFeatureException(f"Interface with ip {ip} not found.")
+        return interface
+
+    def get_interfaces_by_ips(
+        self, ips: Iterable[IPv4Address | IPv6Address], check_all_interfaces: bool = False
+    ) -> dict[
+        IPv4Address | IPv6Address,
+        "ESXiNetworkInterface | FreeBSDNetworkInterface | LinuxNetworkInterface | WindowsNetworkInterface",
+    ]:
+        """
+        Get interfaces with matching IP addresses.
+
+        Addresses of all interfaces are gathered by single bulk query, see `get_ip_address_index()`.
+        Address assigned to interface without NetworkInterface object (e.g. VMkernel interface on ESXi)
+        is matched to its uplink, see `_get_interface_uplinks()`.
+        Interfaces not covered by the query (e.g. placed in network namespace) are checked one by one.
+
+        :param ips: IP addresses
+        :param check_all_interfaces: True - gather all interfaces and check,
+                                     False - check interfaces saved in network_interfaces attribute
+        :return: Dictionary of IP address and matching interface, IP addresses without matching interface are skipped
+        """
+        host = self._host()
+        interfaces_to_check = host._get_all_network_interfaces() if check_all_interfaces else host.network_interfaces
+        missing = set(ips)
+        try:
+            interface_names_by_ip = self.get_ip_address_index()
+        except NotImplementedError:
+            interface_names_by_ip = None
+
+        interfaces_by_name = {}
+        not_indexed = []
         for interface in interfaces_to_check:
-            for addr in getattr(interface.ip.get_ips(), ip_version):
-                if ip == addr.ip:
-                    return interface
+            if interface_names_by_ip is None or getattr(interface, "namespace", None):
+                not_indexed.append(interface)
+            else:
+                interfaces_by_name.setdefault(interface.name, interface)
+
+        found = {}
+        uplinks = None
+        for ip in missing:
+            name = (interface_names_by_ip or {}).get(ip)
+            interface = interfaces_by_name.get(name)
+            if interface is None and name is not None:
+                if uplinks is None:
+                    uplinks = self._get_interface_uplinks()
+                interface = next(
+                    (interfaces_by_name[uplink] for uplink in uplinks.get(name, []) if uplink in interfaces_by_name),
+                    None,
+                )
+            if interface is not None:
+                found[ip] = interface
+        missing.difference_update(found)
 
-        raise UtilsFeatureException(f"Interface with ip {ip} not found.")
+        for interface in not_indexed:
+            if not missing:
+                break
+            interface_ips = interface.ip.get_ips()
+            for addr in chain(interface_ips.v4, interface_ips.v6):
+                if addr.ip in missing:
+                    found[addr.ip] = interface
+                    missing.discard(addr.ip)
+        return found
+
+    def get_ip_address_index(self) -> dict[IPv4Address | IPv6Address, str]:
+        """
+        Get IP addresses of all interfaces by single bulk query.
+
+        :return: Dictionary of IP address and name of interface with the address assigned
+        """
+        raise NotImplementedError
+
+    def _get_interface_uplinks(self) -> dict[str, list[str]]:
+        """
+        Get uplinks of interfaces not backed by network adapter, queried only when address index refers to them.
+
+        :return: Dictionary of name of interface and names of its uplinks
+        """
+        return {}
 
     def get_hostname(self) -> str:
         """Get hostname."""
+        from mfd_connect.util.rpc_copy_utils import _get_hostname
+
         return _get_hostname(self._connection)
 
     @overload
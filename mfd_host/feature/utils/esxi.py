@@ -2,6 +2,10 @@
 # SPDX-License-Identifier: MIT
 """Module for esxi utils."""
 
+import re
+from ipaddress import IPv4Address, IPv6Address, ip_address
+
+from mfd_host.exceptions import UtilsFeatureExecutionError
 from mfd_host.feature.utils import BaseFeatureUtils
 
 
@@ -15,3 +19,50 @@ class ESXiUtils(BaseFeatureUtils):
         :param ignore_broadcasts: ICMP echo ignore broadcasts.
         """
         raise NotImplementedError
+
+    def get_ip_address_index(self) -> dict[IPv4Address | IPv6Address, str]:
+        """
+        Get IP addresses of all VMkernel interfaces by `esxcli network ip interface ipv4/ipv6 address list` calls.
+
+        :return: Dictionary of IP address and name of interface with the address assigned
+        """
+        index = {}
+        for version in ("ipv4", "ipv6"):
+            output = self._connection.execute_command(
+                f"esxcli network ip interface {version} address list", custom_exception=UtilsFeatureExecutionError
+            ).stdout
+            for line in output.splitlines()[2:]:
+                columns = line.split()
+                try:
+                    index.setdefault(ip_address(columns[1]), columns[0])
+                except (IndexError, ValueError):
+                    # interface without address configured
+                    continue
+        return index
+
+    def _get_interface_uplinks(self) -> dict[str, list[str]]:
+        """
+        Get uplinks (vmnics) of VMkernel interfaces, uplinks of standard or distributed switch of each of them.
+
+        Switches and VMkernel interfaces are listed by single command.
+
+        :return: Dictionary of name of VMkernel interface and names of its uplinks
+        """
+        output = self._connection.execute_command(
+            "esxcli network ip interface list; esxcli network vswitch standard list; "
+            "esxcli network vswitch dvs vmware list",
+            shell=True,
+            expected_return_codes=None,
+        ).stdout
+        switches_of_interfaces = {}
+        uplinks_of_switches = {}
+        for block in re.split(r"^(?=\S)", output, flags=re.MULTILINE):
+            fields = dict(re.findall(r"^\s+(?P<key>[^:\n]+):[ \t]*(?P<value>.*?)\s*$", block, flags=re.MULTILINE))
+            if "Name" not in fields:
+                continue
+            if "Portset" in fields:
+                vds_name = fields.get("VDS Name", "N/A")
+                switches_of_interfaces[fields["Name"]] = fields["Portset"] if vds_name == "N/A" else vds_name
+            elif "Uplinks" in fields:
+                uplinks_of_switches[fields["Name"]] = [uplink for uplink in fields["Uplinks"].split(", ") if uplink]
+        return {interface: uplinks_of_switches.get(switch, []) for interface, switch in switches_of_interfaces.items()}
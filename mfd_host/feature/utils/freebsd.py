@@ -2,6 +2,10 @@
 # SPDX-License-Identifier: MIT
 """Module for freebsd utils."""
 
+import re
+from ipaddress import IPv4Address, IPv6Address, ip_address
+
+from mfd_host.exceptions import UtilsFeatureExecutionError
 from mfd_host.feature.utils import BaseFeatureUtils
 
 
@@ -18,3 +22,25 @@ class FreeBSDUtils(BaseFeatureUtils):
         """
         cmd = f"sysctl net.inet.icmp.bmcastecho={int(ignore_broadcasts is False)}"
         self._connection.execute_command(cmd)
+
+    def get_ip_address_index(self) -> dict[IPv4Address | IPv6Address, str]:
+        """
+        Get IP addresses of all interfaces by single `ifconfig -a` call.
+
+        :return: Dictionary of IP address and name of interface with the address assigned
+        """
+        output = self._connection.execute_command("ifconfig -a", custom_exception=UtilsFeatureExecutionError).stdout
+        interface_regex = re.compile(r"^(?P<name>\S+): flags=")
+        inet_regex = re.compile(r"^\s+inet6?\s+(?P<ip>\S+)")
+        index = {}
+        name = None
+        for line in output.splitlines():
+            interface_match = interface_regex.match(line)
+            if interface_match:
+                name = interface_match["name"]
+                continue
+            inet_match = inet_regex.match(line)
+            if inet_match and name is not None:
+                # Link local address is printed with %<if_name> suffix
+                index.setdefault(ip_address(inet_match["ip"].split("%")[0]), name)
+        return index
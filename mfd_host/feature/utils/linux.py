@@ -2,13 +2,17 @@
 # SPDX-License-Identifier: MIT
 """Module for linux utils."""
 
+import json
 import logging
+import re
+from ipaddress import ip_address
 from typing import Union, TYPE_CHECKING
 
 from mfd_common_libs import add_logging_level, log_levels
 from mfd_base_tool.exceptions import ToolNotAvailable
 
-from mfd_host.exceptions import HostModuleException, UtilsFeatureExecutionError
+from mfd_host.exceptions import FingerprintExecutionError, HostModuleException, UtilsFeatureExecutionError
+from mfd_host.fingerprint import get_host_fingerprint
 from mfd_host.feature.utils.base import BaseFeatureUtils
 
 logger = logging.getLogger(__name__)
@@ -112,20 +116,66 @@ class LinuxUtils(BaseFeatureUtils):
         :param ignore_all: ICMP echo ignore all.
         :param ignore_broadcasts: ICMP echo ignore broadcasts.
         """
-        cmd = f"echo '{int(ignore_all)}' > /proc/sys/net/ipv4/icmp_echo_ignore_all"
-        self._connection.execute_command(cmd, shell=True)
-
-        cmd = f"echo '{int(ignore_broadcasts)}' > /proc/sys/net/ipv4/icmp_echo_ignore_broadcasts"
-        self._connection.execute_command(cmd, shell=True)
+        self._execute_commands(
+            [
+                f"echo '{int(ignore_all)}' > /proc/sys/net/ipv4/icmp_echo_ignore_all",
+                f"echo '{int(ignore_broadcasts)}' > /proc/sys/net/ipv4/icmp_echo_ignore_broadcasts",
+            ]
+        )
 
     def get_pretty_name(self) -> str:
         """
-        Get distro name from /etc/os-release.
+        Get distro name from /etc/os-release, from fingerprint of the host if it holds it.
 
         :raises: UtilsFeatureExecutionError raised if file is empty or does not exist
         :return: distro name.
         """
+        try:
+            pretty_name = get_host_fingerprint(self._connection).pretty_name
+        except FingerprintExecutionError as e:
+            logger.log(level=log_levels.MODULE_DEBUG, msg=f"Host fingerprint not gathered: {e}")
+            pretty_name = None
+        if pretty_name is not None:
+            return pretty_name.replace('"', "")
         cmd = "cat /etc/os-release | grep -i 'pretty_name'"
         res = self._connection.execute_command(cmd, custom_exception=UtilsFeatureExecutionError, shell=True)
 
         return res.stdout.split("=", 1)[1].rstrip().replace('"', "")
+
+    def get_ip_address_index(self) -> dict[Union["IPv4Address", "IPv6Address"], str]:
+        """
+        Get IP addresses of all interfaces by single `ip -j addr` call.
+
+        iproute2 older than 4.13 has no JSON output, `ip -o addr` is parsed then.
+        Tentative addresses are skipped.
+
+        :return: Dictionary of IP address and name of interface with the address assigned
+        """
+        result = self._connection.execute_command("ip -j addr", expected_return_codes=None)
+        try:
+            links = json.loads(result.stdout) if not result.return_code else None
+        except json.JSONDecodeError:
+            links = None
+        if links is None:
+            logger.log(level=log_levels.MODULE_DEBUG, msg="JSON output of ip not supported, parsing ip -o addr.")
+            return self._get_ip_address_index_from_oneline_output()
+
+        index = {}
+        for link in links:
+            for addr in link.get("addr_info", []):
+                if addr.get("family") not in ("inet", "inet6") or addr.get("tentative"):
+                    continue
+                index.setdefault(ip_address(addr["local"]), link["ifname"])
+        return index
+
+    def _get_ip_address_index_from_oneline_output(self) -> dict[Union["IPv4Address", "IPv6Address"], str]:
+        """Get IP addresses of all interfaces from `ip -o addr` output, see `get_ip_address_index()`."""
+        output = self._connection.execute_command("ip -o addr", custom_exception=UtilsFeatureExecutionError).stdout
+        address_regex = re.compile(r"^\d+:\s+(?P<name>[^\s@]+)\S*\s+inet6?\s+(?P<ip>[^\s/]+)(?P<flags>.*)$")
+        index = {}
+        for line in output.splitlines():
+            match = address_regex.match(line)
+            if not match or "tentative" in match["flags"].split("\\")[0].split():
+                continue
+            index.setdefault(ip_address(match["ip"]), match["name"])
+        return index
@@ -2,6 +2,10 @@
 # SPDX-License-Identifier: MIT
 """Module for windows utils."""
 
+import re
+from ipaddress import IPv4Address, IPv6Address, ip_address
+
+from mfd_host.exceptions import UtilsFeatureExecutionError
 from mfd_host.feature.utils import BaseFeatureUtils
 
 
@@ -15,3 +19,30 @@ class WindowsUtils(BaseFeatureUtils):
         :param ignore_broadcasts: ICMP echo ignore broadcasts.
         """
         raise NotImplementedError
+
+    def get_ip_address_index(self) -> dict[IPv4Address | IPv6Address, str]:
+        """
+        Get IP addresses of all interfaces by single `Get-NetIPAddress` call.
+
+        Tentative addresses are skipped.
+
+        :return: Dictionary of IP address and name of interface with the address assigned
+        """
+        output = self._connection.execute_powershell(
+            "Get-NetIPAddress", custom_exception=UtilsFeatureExecutionError
+        ).stdout
+        address_regex = re.compile(r"IPAddress +: +(?P<ip>\S+)")
+        alias_regex = re.compile(r"InterfaceAlias +: +(?P<alias>.+?)\s*$", re.MULTILINE)
+        state_regex = re.compile(r"AddressState +: +(?P<state>\S+)")
+        index = {}
+        for block in re.split(r"^\s*$", output, flags=re.MULTILINE):
+            address_match = address_regex.search(block)
+            alias_match = alias_regex.search(block)
+            if not address_match or not alias_match:
+                continue
+            state_match = state_regex.search(block)
+            if state_match and state_match["state"].casefold() == "tentative":
+                continue
+            # interface index in ipv6 address
+            index.setdefault(ip_address(address_match["ip"].split("%")[0]), alias_match["alias"])
+        return index
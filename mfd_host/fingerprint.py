@@ -0,0 +1,196 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for host fingerprint."""
+
+import logging
+import re
+import threading
+import typing
+from time import monotonic
+from typing import Optional
+from weakref import WeakKeyDictionary, ref
+
+from mfd_common_libs import add_logging_level, log_levels
+from mfd_typing import OSName
+
+from .exceptions import FingerprintExecutionError
+
+if typing.TYPE_CHECKING:
+    from mfd_connect import Connection
+
+logger = logging.getLogger(__name__)
+add_logging_level(level_name="MODULE_DEBUG", level_value=log_levels.MODULE_DEBUG)
+
+# Each command prints `key=value` lines, all details are gathered by single call, missing detail is skipped
+FINGERPRINT_COMMANDS = {
+    OSName.LINUX: (
+        "echo kernel=$(uname -r); echo boot_id=$(cat /proc/sys/kernel/random/boot_id); "
+        "echo cpu_count=$(nproc); grep -i '^pretty_name=' /etc/os-release || true"
+    ),
+    OSName.FREEBSD: (
+        "echo kernel=$(uname -r); echo boot_id=$(sysctl -n kern.boottime); "
+        "echo cpu_count=$(sysctl -n hw.ncpu); echo pretty_name=$(uname -sr)"
+    ),
+    OSName.ESXI: (
+        "echo kernel=$(uname -r); echo cpu_count=$(esxcli hardware cpu global get | sed -n 's/.*CPU Threads: *//p'); "
+        "echo pretty_name=$(vmware -v)"
+    ),
+    OSName.WINDOWS: (
+        "$os = Get-CimInstance Win32_OperatingSystem; "
+        '"kernel=" + [Environment]::OSVersion.Version.ToString(); '
+        "\"boot_id=\" + $os.LastBootUpTime.ToString('o'); "
+        '"cpu_count=" + [Environment]::ProcessorCount; '
+        '"pretty_name=" + $os.Caption'
+    ),
+}
+BOOT_ID_COMMANDS = {
+    OSName.LINUX: "cat /proc/sys/kernel/random/boot_id",
+    OSName.FREEBSD: "sysctl -n kern.boottime",
+    OSName.WINDOWS: "(Get-CimInstance Win32_OperatingSystem).LastBootUpTime.ToString('o')",
+}
+FINGERPRINT_LINE_REGEX = re.compile(r"^(?P<key>\w+)=(?P<value>.*)$")
+# Time in seconds after which details are validated on access by reading boot ID of the host
+FINGERPRINT_VALIDATION_INTERVAL = 60.0
+
+_fingerprints: "WeakKeyDictionary[Connection, HostFingerprint]" = WeakKeyDictionary()
+_fingerprints_lock = threading.Lock()
+
+
+class HostFingerprint:
+    """
+    Details identifying the host, gathered once per connection.
+
+    OS name and other details are gathered on first access, details by single command.
+    Details are dropped when boot ID of the host changed, see `validate()`. Access to details validates them
+    when `validation_interval` passed since they were gathered or validated, 0 disables it.
+    Details are gathered once even if accessed concurrently from many threads.
+    """
+
+    def __init__(self, connection: "Connection"):
+        """
+        Initialize fingerprint.
+
+        :param connection: Object of mfd-connect
+        """
+        self._connection = ref(connection)
+        self._os_name: Optional[OSName] = None
+        self._details: Optional[dict[str, str]] = None
+        self._validated_at = 0.0
+        self.validation_interval = FINGERPRINT_VALIDATION_INTERVAL
+        self._lock = threading.RLock()
+
+    @property
+    def os_name(self) -> OSName:
+        """OS name of the host."""
+        if self._os_name is None:
+            with self._lock:
+                if self._os_name is None:
+                    self._os_name = self._connection().get_os_name()
+        return self._os_name
+
+    @property
+    def kernel_version(self) -> Optional[str]:
+        """Kernel release on Linux, FreeBSD and ESXi, OS build version on Windows."""
+        return self._get_details().get("kernel")
+
+    @property
+    def pretty_name(self) -> Optional[str]:
+        """Human readable name of OS, e.g. distro name from /etc/os-release on Linux."""
+        return self._get_details().get("pretty_name")
+
+    @property
+    def cpu_count(self) -> Optional[int]:
+        """Number of logical CPUs."""
+        cpu_count = self._get_details().get("cpu_count")
+        return int(cpu_count) if cpu_count and cpu_count.isdigit() else None
+
+    @property
+    def boot_id(self) -> Optional[str]:
+        """ID changing on each boot of the host, not available on ESXi."""
+        return self._get_details().get("boot_id")
+
+    @property
+    def details(self) -> dict[str, str]:
+        """All details gathered by fingerprint command, without OS name."""
+        return dict(self._get_details())
+
+    def invalidate(self) -> None:
+        """Drop gathered details, they are gathered again on next access."""
+        with self._lock:
+            self._os_name = None
+            self._details = None
+
+    def validate(self) -> bool:
+        """
+        Check whether the host was not rebooted since details were gathered, drop them otherwise.
+
+        :return: True if details are still valid, False if they were dropped
+        """
+        with self._lock:
+            if self._details is None or self.os_name not in BOOT_ID_COMMANDS:
+                return True
+            if self._read_boot_id() == self._details.get("boot_id"):
+                self._validated_at = monotonic()
+                return True
+            logger.log(level=log_levels.MODULE_DEBUG, msg="Boot ID changed, host fingerprint invalidated.")
+            self.invalidate()
+            return False
+
+    def _execute(self, command: str) -> str:
+        """
+        Execute command in shell of the host.
+
+        :raises FingerprintExecutionError: if command failed
+        """
+        connection = self._connection()
+        if self.os_name == OSName.WINDOWS:
+            return connection.execute_powershell(command, custom_exception=FingerprintExecutionError).stdout
+        return connection.execute_command(command, shell=True, custom_exception=FingerprintExecutionError).stdout
+
+    def _read_boot_id(self) -> str:
+        """Read current boot ID of the host."""
+        return self._execute(BOOT_ID_COMMANDS[self.os_name]).strip()
+
+    def _get_details(self) -> dict[str, str]:
+        """Gather details of the host on the first call, validate them if validation interval passed."""
+        with self._lock:
+            if self._details is not None and 0 < self.validation_interval <= monotonic() - self._validated_at:
+                self.validate()
+            if self._details is None:
+                self._details = self._parse_details(self._execute(FINGERPRINT_COMMANDS[self.os_name]))
+                self._validated_at = monotonic()
+            return self._details
+
+    @staticmethod
+    def _parse_details(output: str) -> dict[str, str]:
+        """
+        Parse `key=value` lines of output, empty values are skipped.
+
+        :param output: Output of fingerprint command
+        :return: Dictionary of details
+        """
+        details = {}
+        for line in output.splitlines():
+            match = FINGERPRINT_LINE_REGEX.match(line.strip())
+            if match and match["value"].strip():
+                details[match["key"].lower()] = match["value"].strip().strip('"')
+        return details
+
+
+def get_host_fingerprint(connection: "Connection") -> HostFingerprint:
+    """
+    Get fingerprint of the host shared by all users of the connection.
+
+    :param connection: Object of mfd-connect, wrapped connection (e.g. `CoalescingConnection`, also wrapped
+                       by `InstrumentedConnection`) shares it with wrapped one
+    :return: HostFingerprint object
+    """
+    while hasattr(connection, "__wrapped__"):
+        connection = connection.__wrapped__
+    fingerprint = _fingerprints.get(connection)
+    if fingerprint is None:
+        with _fingerprints_lock:
+            fingerprint = _fingerprints.get(connection)
+            if fingerprint is None:
+                fingerprint = _fingerprints[connection] = HostFingerprint(connection)
+    return fingerprint
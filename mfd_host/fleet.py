@@ -0,0 +1,214 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for fleet of hosts executing calls concurrently."""
+
+import logging
+import typing
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from operator import attrgetter
+from time import monotonic
+from typing import Any, Callable, Iterable, Iterator, Optional, Union
+
+from mfd_common_libs import add_logging_level, log_levels
+
+from .data_structures import FleetResult, HostCallResult
+from .exceptions import HostFleetException
+
+if typing.TYPE_CHECKING:
+    from mfd_connect import Connection
+    from mfd_model.config import HostModel, TopologyModelBase
+
+    from .base import Host
+
+logger = logging.getLogger(__name__)
+add_logging_level(level_name="MODULE_DEBUG", level_value=log_levels.MODULE_DEBUG)
+
+DEFAULT_MAX_WORKERS = 16
+# Calls waiting for free worker have no deadline yet, their start is checked with this interval
+START_POLL_INTERVAL = 0.05
+
+
+class HostFleet:
+    """
+    Collection of hosts executing calls on all of them concurrently.
+
+    Calls are executed by bounded pool of worker threads, one call per host, so total wall time approaches
+    the time of the slowest host instead of the sum. Failure on one host does not stop calls on other hosts,
+    exceptions are returned in results.
+
+    Timeout is counted from the start of call on the host, not from queueing it.
+    Call exceeding timeout is abandoned with TimeoutError in results, but keeps running in its worker thread
+    until it returns (threads can't be interrupted), so the worker is not available for other hosts meanwhile.
+    """
+
+    def __init__(
+        self, hosts: Iterable["Host"], *, max_workers: int = DEFAULT_MAX_WORKERS, timeout: Optional[float] = None
+    ):
+        """
+        Initialize fleet.
+
+        :param hosts: Host objects
+        :param max_workers: Maximum number of calls executed at the same time
+        :param timeout: Default time in seconds for call on single host, None - no timeout
+        :raises HostFleetException: if max_workers is not positive
+        """
+        if max_workers < 1:
+            raise HostFleetException(f"Number of workers must be positive, got: {max_workers}")
+        self._hosts = list(hosts)
+        self.max_workers = max_workers
+        self.timeout = timeout
+
+    @classmethod
+    def from_topology(
+        cls,
+        topology: Union["TopologyModelBase", Iterable["HostModel"]],
+        connection_factory: Callable[["HostModel"], "Connection"],
+        **kwargs,
+    ) -> "HostFleet":
+        """
+        Create fleet from topology model, hosts are created concurrently.
+
+        :param topology: Topology model (its `hosts` are used) or host models
+        :param connection_factory: Function creating connection to host described by host model
+        :param kwargs: Arguments of `HostFleet` constructor
+        :return: Fleet of Host objects, named after models, with topology set to their models
+        :raises HostFleetException: if creation of any host failed
+        """
+        from .base import Host
+
+        models = list(getattr(topology, "hosts", topology) or [])
+        fleet = cls([], **kwargs)
+        results = fleet._execute(
+            models, lambda model: Host(connection=connection_factory(model), name=model.name, topology=model)
+        )
+        failed = [(model, result.exception) for model, result in zip(models, results) if not result.succeeded]
+        if failed:
+            details = ", ".join(f"{model.name}: {exception!r}" for model, exception in failed)
+            _, first_exception = failed[0]
+            message = f"Failed to create {len(failed)} of {len(models)} hosts - {details}"
+            raise HostFleetException(message) from first_exception
+        fleet._hosts = [result.value for result in results]
+        return fleet
+
+    @property
+    def hosts(self) -> list["Host"]:
+        """Host objects of the fleet."""
+        return list(self._hosts)
+
+    def __iter__(self) -> Iterator["Host"]:
+        return iter(self._hosts)
+
+    def __len__(self) -> int:
+        return len(self._hosts)
+
+    def run(self, function: Callable[["Host"], Any], *, timeout: Optional[float] = None) -> FleetResult:
+        """
+        Call function with each host of the fleet concurrently.
+
+        :param function: Function called with Host object, e.g. `lambda host: host.cpu.get_log_cpu_no()`
+        :param timeout: Time in seconds for call on single host, default timeout of fleet if not passed
+        :return: Results of calls keyed by Host objects, in order of hosts in fleet
+        """
+        start = monotonic()
+        fleet_result = FleetResult(zip(self._hosts, self._execute(self._hosts, function, timeout)))
+        logger.log(
+            level=log_levels.MODULE_DEBUG,
+            msg=f"Call succeeded on {len(fleet_result.returned)} of {len(self._hosts)} hosts "
+            f"in {monotonic() - start:.2f}s",
+        )
+        return fleet_result
+
+    def _execute(
+        self, items: list[Any], function: Callable[[Any], Any], timeout: Optional[float] = None
+    ) -> list[HostCallResult]:
+        """
+        Call function with each item concurrently.
+
+        :param items: Arguments of calls, e.g. Host objects
+        :param function: Function called with each item
+        :param timeout: Time in seconds for single call, default timeout of fleet if not passed
+        :return: Results of calls in order of items
+        """
+        timeout = self.timeout if timeout is None else timeout
+        started_at: dict[int, float] = {}
+        results: dict[int, HostCallResult] = {}
+
+        def _call(index: int) -> Any:
+            started_at[index] = monotonic()
+            return function(items[index])
+
+        executor = ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(items)) or 1, thread_name_prefix="host-fleet"
+        )
+        try:
+            futures = {executor.submit(_call, index): index for index in range(len(items))}
+            pending = set(futures)
+            while pending:
+                wait_time = None
+                if timeout is not None:
+                    pending, wait_time = self._expire_calls(pending, futures, started_at, timeout, items, results)
+                    if not pending:
+                        break
+                done, pending = wait(pending, timeout=wait_time, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index = futures[future]
+                    duration = monotonic() - started_at.get(index, monotonic())
+                    exception = future.exception()
+                    if exception is None:
+                        results[index] = HostCallResult(host=items[index], value=future.result(), duration=duration)
+                    else:
+                        results[index] = HostCallResult(host=items[index], exception=exception, duration=duration)
+        finally:
+            # abandoned calls are not waited for, calls not started yet are cancelled
+            executor.shutdown(wait=False, cancel_futures=True)
+        return [results[index] for index in range(len(items))]
+
+    @staticmethod
+    def _expire_calls(
+        pending: set[Future],
+        futures: dict[Future, int],
+        started_at: dict[int, float],
+        timeout: float,
+        items: list[Any],
+        results: dict[int, HostCallResult],
+    ) -> tuple[set[Future], float]:
+        """
+        Abandon pending calls exceeding timeout, their results are set to TimeoutError.
+
+        :return: Calls still pending and time to wait for the nearest deadline
+        """
+        now = monotonic()
+        still_pending = set()
+        wait_time = timeout
+        for future in pending:
+            index = futures[future]
+            if index not in started_at:
+                wait_time = min(wait_time, START_POLL_INTERVAL)
+                still_pending.add(future)
+                continue
+            elapsed = now - started_at[index]
+            if elapsed < timeout or future.done():
+                wait_time = min(wait_time, timeout - elapsed)
+                still_pending.add(future)
+                continue
+            logger.log(
+                level=log_levels.MODULE_DEBUG,
+                msg=f"Call with {items[index]} exceeded timeout of {timeout}s, abandoned.",
+            )
+            results[index] = HostCallResult(
+                host=items[index], exception=TimeoutError(f"Call exceeded timeout of {timeout}s"), duration=elapsed
+            )
+        return still_pending, max(wait_time, 0)
+
+    def call(self, method: str, *args, timeout: Optional[float] = None, **kwargs) -> FleetResult:
+        """
+        Call method of host or of its feature on each host of the fleet concurrently.
+
+        :param method: Dotted path of method relative to host, e.g. "cpu.get_log_cpu_no" or "refresh_network_interfaces"
+        :param args: Positional arguments of method
+        :param timeout: Time in seconds for call on single host, default timeout of fleet if not passed
+        :param kwargs: Keyword arguments of method
+        :return: Results of calls keyed by Host objects, in order of hosts in fleet
+        """
+        get_method = attrgetter(method)
+        return self.run(lambda host: get_method(host)(*args, **kwargs), timeout=timeout)
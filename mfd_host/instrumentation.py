@@ -0,0 +1,432 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for instrumentation of feature methods and remote commands they execute."""
+
+import logging
+import threading
+import time
+import typing
+from bisect import bisect_left
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from functools import wraps
+from pathlib import Path
+from typing import Any, Callable, Iterator, Optional, Union
+
+from mfd_common_libs import add_logging_level, log_levels
+
+if typing.TYPE_CHECKING:
+    from mfd_connect import Connection
+    from mfd_connect.base import ConnectionCompletedProcess
+
+logger = logging.getLogger(__name__)
+add_logging_level(level_name="MODULE_DEBUG", level_value=log_levels.MODULE_DEBUG)
+
+# Upper bounds in seconds of latency histogram buckets, from 100 us doubling up to ~105 s, last bucket is unbounded
+HISTOGRAM_BUCKETS = tuple(1e-4 * 2**index for index in range(21))
+
+# Sinks receiving records, empty tuple - instrumentation disabled, checked on each call so it must stay cheap
+_sinks: tuple["InstrumentationSink", ...] = ()
+_sinks_lock = threading.Lock()
+# Stack of feature method calls in progress, separate for each thread
+_context = threading.local()
+
+
+@dataclass(frozen=True)
+class InstrumentationRecord:
+    """
+    Dataclass for measurement of single feature method call or remote command.
+
+    `kind` - "method" or "command"
+    `name` - qualified name of feature method (e.g. "LinuxStats.get_meminfo") or command
+    `method` - for command, qualified name of feature method which executed it
+    `duration` - wall time in seconds
+    `stdout_bytes` - bytes of stdout returned by command, for method sum of its commands
+    `parse_time` - for method, wall time in seconds spent outside of remote commands (parsing output)
+    `commands` - for method, number of remote commands executed by it
+    """
+
+    kind: str
+    name: str
+    host: Optional[str]
+    started: float
+    duration: float
+    stdout_bytes: int = 0
+    parse_time: float = 0.0
+    commands: int = 0
+    method: Optional[str] = None
+    failed: bool = False
+
+
+class InstrumentationSink:
+    """Base class for receivers of instrumentation records, `record()` may be called from many threads."""
+
+    def record(self, record: InstrumentationRecord) -> None:
+        """
+        Receive record.
+
+        :param record: Measurement of method call or command
+        """
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Finish receiving records, called by `disable_instrumentation()`."""
+
+
+class Histogram:
+    """Statistics of measurements, latencies are counted in buckets of `HISTOGRAM_BUCKETS`."""
+
+    def __init__(self):
+        """Initialize empty histogram."""
+        self.count = 0
+        self.failed = 0
+        self.total_time = 0.0
+        self.min_time = float("inf")
+        self.max_time = 0.0
+        self.stdout_bytes = 0
+        self.parse_time = 0.0
+        self.commands = 0
+        self.buckets = [0] * (len(HISTOGRAM_BUCKETS) + 1)
+
+    def add(self, record: InstrumentationRecord) -> None:
+        """
+        Add measurement.
+
+        :param record: Measurement of method call or command
+        """
+        self.count += 1
+        self.failed += record.failed
+        self.total_time += record.duration
+        self.min_time = min(self.min_time, record.duration)
+        self.max_time = max(self.max_time, record.duration)
+        self.stdout_bytes += record.stdout_bytes
+        self.parse_time += record.parse_time
+        self.commands += record.commands
+        self.buckets[bisect_left(HISTOGRAM_BUCKETS, record.duration)] += 1
+
+    @property
+    def mean_time(self) -> float:
+        """Mean wall time in seconds."""
+        return self.total_time / self.count if self.count else 0.0
+
+    def percentile(self, percent: float) -> float:
+        """
+        Get approximate percentile of wall time.
+
+        :param percent: Percent of measurements, e.g. 95
+        :return: Upper bound of bucket containing the percentile, max time for last bucket
+        """
+        if not self.count:
+            return 0.0
+        rank = percent / 100 * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.buckets):
+            seen += bucket_count
+            if seen >= rank and bucket_count:
+                return min(HISTOGRAM_BUCKETS[index], self.max_time) if index < len(HISTOGRAM_BUCKETS) else self.max_time
+        return self.max_time
+
+
+class HistogramSink(InstrumentationSink):
+    """Sink aggregating records in memory, into histogram per method and per command."""
+
+    def __init__(self):
+        """Initialize sink."""
+        self.histograms: dict[tuple[str, str], Histogram] = {}
+        self._lock = threading.Lock()
+
+    def record(self, record: InstrumentationRecord) -> None:
+        """
+        Add record to histogram of its method or command.
+
+        :param record: Measurement of method call or command
+        """
+        with self._lock:
+            histogram = self.histograms.get((record.kind, record.name))
+            if histogram is None:
+                histogram = self.histograms[(record.kind, record.name)] = Histogram()
+            histogram.add(record)
+
+    def get_histogram(self, kind: str, name: str) -> Optional[Histogram]:
+        """
+        Get histogram of method or command.
+
+        :param kind: "method" or "command"
+        :param name: Qualified name of method or command
+        :return: Histogram, None if nothing was recorded
+        """
+        return self.histograms.get((kind, name))
+
+    def summary(self, limit: Optional[int] = 20) -> str:
+        """
+        Get table of methods and commands, the most time consuming first.
+
+        :param limit: Maximum number of rows per kind, None - all
+        :return: Summary as text
+        """
+        with self._lock:
+            histograms = dict(self.histograms)
+
+        lines = []
+        for kind in ("method", "command"):
+            rows = sorted(
+                ((name, histogram) for (row_kind, name), histogram in histograms.items() if row_kind == kind),
+                key=lambda row: row[1].total_time,
+                reverse=True,
+            )
+            if not rows:
+                continue
+            lines.append(
+                f"{kind:<60} {'count':>7} {'total[s]':>9} {'mean[ms]':>9} {'p95[ms]':>9} {'max[ms]':>9} "
+                f"{'stdout[B]':>11} {'parse[s]':>9}"
+            )
+            for name, histogram in rows[:limit]:
+                lines.append(
+                    f"{name[:60]:<60} {histogram.count:>7} {histogram.total_time:>9.3f} "
+                    f"{histogram.mean_time * 1e3:>9.2f} {histogram.percentile(95) * 1e3:>9.2f} "
+                    f"{histogram.max_time * 1e3:>9.2f} {histogram.stdout_bytes:>11} {histogram.parse_time:>9.3f}"
+                )
+        return "\n".join(lines)
+
+
+class LoggingSummarySink(HistogramSink):
+    """Sink aggregating records in memory and logging summary when closed, e.g. at teardown of tests."""
+
+    def __init__(self, level: int = logging.INFO, limit: Optional[int] = 20):
+        """
+        Initialize sink.
+
+        :param level: Logging level of summary
+        :param limit: Maximum number of rows per kind in summary, None - all
+        """
+        super().__init__()
+        self.level = level
+        self.limit = limit
+
+    def close(self) -> None:
+        """Log summary of recorded methods and commands."""
+        if self.histograms:
+            logger.log(level=self.level, msg=f"Instrumentation summary:\n{self.summary(self.limit)}")
+
+
+class JsonLinesSink(InstrumentationSink):
+    """Sink writing each record as JSON object in separate line of file."""
+
+    def __init__(self, path: Union[str, Path]):
+        """
+        Initialize sink, file is opened for appending.
+
+        :param path: Path of file
+        """
+        self.path = Path(path)
+        self._file = self.path.open("a", encoding="utf-8")
+        self._lock = threading.Lock()
+
+    def record(self, record: InstrumentationRecord) -> None:
+        """
+        Write record to file.
+
+        :param record: Measurement of method call or command
+        """
+        import json
+
+        line = json.dumps(asdict(record))
+        with self._lock:
+            if not self._file.closed:
+                self._file.write(line + "\n")
+
+    def close(self) -> None:
+        """Close file."""
+        with self._lock:
+            self._file.close()
+
+
+def enable_instrumentation(*sinks: InstrumentationSink) -> None:
+    """
+    Start recording feature method calls and remote commands to sinks.
+
+    :param sinks: Receivers of records, added to already enabled ones
+    """
+    global _sinks
+    with _sinks_lock:
+        _sinks = _sinks + tuple(sink for sink in sinks if sink not in _sinks)
+
+
+def disable_instrumentation() -> None:
+    """Stop recording and close all sinks, e.g. logging summary of `LoggingSummarySink`."""
+    global _sinks
+    with _sinks_lock:
+        sinks, _sinks = _sinks, ()
+    for sink in sinks:
+        sink.close()
+
+
+def is_instrumentation_enabled() -> bool:
+    """Check whether any sink is receiving records."""
+    return bool(_sinks)
+
+
+@contextmanager
+def instrumented(*sinks: InstrumentationSink) -> Iterator[tuple[InstrumentationSink, ...]]:
+    """
+    Record feature method calls and remote commands to sinks inside the context.
+
+    :param sinks: Receivers of records, `HistogramSink` if not given
+    :return: Sinks
+    """
+    sinks = sinks or (HistogramSink(),)
+    enable_instrumentation(*sinks)
+    try:
+        yield sinks
+    finally:
+        disable_instrumentation()
+
+
+def _emit(record: InstrumentationRecord) -> None:
+    """Deliver record to sinks, failure of sink doesn't affect measured call."""
+    for sink in _sinks:
+        try:
+            sink.record(record)
+        except Exception as e:
+            logger.log(level=log_levels.MODULE_DEBUG, msg=f"Instrumentation sink {sink} failed: {e}")
+
+
+class _MethodCall:
+    """Measurements of feature method call in progress."""
+
+    __slots__ = ("name", "command_time", "stdout_bytes", "commands")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.command_time = 0.0
+        self.stdout_bytes = 0
+        self.commands = 0
+
+
+def _get_calls() -> list[_MethodCall]:
+    """Get stack of feature method calls in progress in current thread."""
+    calls = getattr(_context, "calls", None)
+    if calls is None:
+        calls = _context.calls = []
+    return calls
+
+
+def instrument_method(function: Callable) -> Callable:
+    """
+    Wrap feature method, so its calls are recorded when instrumentation is enabled.
+
+    Wrapper of disabled instrumentation only calls the method.
+
+    :param function: Method of feature class
+    :return: Wrapped method
+    """
+    name = function.__qualname__
+
+    @wraps(function)
+    def wrapper(self, *args, **kwargs) -> Any:
+        if not _sinks:
+            return function(self, *args, **kwargs)
+
+        calls = _get_calls()
+        call = _MethodCall(name)
+        calls.append(call)
+        failed = True
+        started = time.time()
+        start = time.perf_counter()
+        try:
+            value = function(self, *args, **kwargs)
+            failed = False
+            return value
+        finally:
+            duration = time.perf_counter() - start
+            calls.pop()
+            if calls:
+                # nested method call, its commands are commands of the caller too
+                calls[-1].command_time += call.command_time
+                calls[-1].stdout_bytes += call.stdout_bytes
+                calls[-1].commands += call.commands
+            _emit(
+                InstrumentationRecord(
+                    kind="method",
+                    name=name,
+                    host=get_feature_host_name(self),
+                    started=started,
+                    duration=duration,
+                    stdout_bytes=call.stdout_bytes,
+                    parse_time=max(duration - call.command_time, 0.0),
+                    commands=call.commands,
+                    failed=failed,
+                )
+            )
+
+    return wrapper
+
+
+def get_feature_host_name(feature: Any) -> Optional[str]:
+    """Get name of host of feature, None if not available."""
+    host = feature.__dict__.get("_host", lambda: None)()
+    return getattr(host, "name", None)
+
+
+class InstrumentedConnection:
+    """
+    Connection wrapper recording `execute_command()` and `execute_powershell()` calls.
+
+    Other attributes are taken from wrapped connection. Wrapper reports class of wrapped connection,
+    so features behave the same with instrumentation enabled (e.g. `isinstance()` checks of mfd modules).
+    """
+
+    def __init__(self, connection: "Connection", host_name: Optional[str] = None):
+        """
+        Initialize wrapper.
+
+        :param connection: Object of mfd-connect
+        :param host_name: Name of host put in records
+        """
+        self.__wrapped__ = connection
+        self._host_name = host_name
+
+    @property
+    def __class__(self) -> type:
+        return self.__wrapped__.__class__
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.__wrapped__, name)
+
+    def execute_command(self, command: str, *args, **kwargs) -> "ConnectionCompletedProcess":
+        """Execute command, recording its wall time and size of output."""
+        return self._execute("execute_command", command, *args, **kwargs)
+
+    def execute_powershell(self, command: str, *args, **kwargs) -> "ConnectionCompletedProcess":
+        """Execute PowerShell command, recording its wall time and size of output."""
+        return self._execute("execute_powershell", command, *args, **kwargs)
+
+    def _execute(self, method_name: str, command: str, *args, **kwargs) -> "ConnectionCompletedProcess":
+        """Execute command by method of wrapped connection and record it."""
+        calls = _get_calls()
+        result = None
+        started = time.time()
+        start = time.perf_counter()
+        try:
+            result = getattr(self.__wrapped__, method_name)(command, *args, **kwargs)
+            return result
+        finally:
+            duration = time.perf_counter() - start
+            stdout = getattr(result, "stdout", None)
+            stdout_bytes = len(stdout.encode(errors="replace")) if isinstance(stdout, str) else 0
+            if calls:
+                calls[-1].command_time += duration
+                calls[-1].stdout_bytes += stdout_bytes
+                calls[-1].commands += 1
+            _emit(
+                InstrumentationRecord(
+                    kind="command",
+                    name=command,
+                    host=self._host_name,
+                    started=started,
+                    duration=duration,
+                    stdout_bytes=stdout_bytes,
+                    method=calls[-1].name if calls else None,
+                    failed=result is None,
+                )
+            )
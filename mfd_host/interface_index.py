@@ -0,0 +1,171 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for InterfaceInfo index."""
+
+import random
+import typing
+from collections import defaultdict
+from heapq import merge
+from typing import Iterable, Optional, Union
+
+from mfd_const import Family, Speed
+from mfd_typing import PCIAddress, PCIDevice, VendorID
+
+try:
+    from mfd_const_internal import SPEED_IDS, DEVICE_IDS
+except ImportError:
+    from mfd_const import SPEED_IDS, DEVICE_IDS
+
+if typing.TYPE_CHECKING:
+    from mfd_network_adapter.network_adapter_owner.base import InterfaceInfoType
+
+INTEL_VENDOR_ID = VendorID("8086")
+
+
+def get_pci_address_key(pci_address: Optional[PCIAddress]) -> Optional[tuple[int, int, int, int]]:
+    """
+    Get hashable key of PCI address.
+
+    Plain tuple is hashed and compared much faster than PCIAddress object.
+
+    :param pci_address: PCI address
+    :return: Tuple of domain, bus, slot and function or None if PCI address is not available
+    """
+    if pci_address is None:
+        return None
+    return pci_address.domain, pci_address.bus, pci_address.slot, pci_address.func
+
+
+class InterfaceInfoIndex:
+    """
+    Index of InterfaceInfo objects built in one pass over the list.
+
+    Filtering follows semantics of `NetworkAdapterOwner._filter_interfaces_info()`,
+    but each lookup touches only positions of matching interfaces instead of scanning whole list.
+    """
+
+    def __init__(self, interfaces_info: Iterable["InterfaceInfoType"]):
+        """
+        Initialize index.
+
+        :param interfaces_info: List of InterfaceInfo objects to be indexed
+        """
+        self._interfaces_info = list(interfaces_info)
+        self._by_pci_address: dict[tuple, list[int]] = defaultdict(list)
+        self._by_pci_device: dict[tuple, list[int]] = defaultdict(list)
+        self._by_name: dict[str, list[int]] = defaultdict(list)
+        self._by_device_id: dict[str, list[int]] = defaultdict(list)
+
+        for position, info in enumerate(self._interfaces_info):
+            if info.pci_address is not None:
+                self._by_pci_address[get_pci_address_key(info.pci_address)].append(position)
+            if info.pci_device:
+                self._by_pci_device[(info.pci_device.vendor_id, info.pci_device.device_id)].append(position)
+                if info.pci_device.vendor_id == INTEL_VENDOR_ID:
+                    self._by_device_id[f"0x{info.pci_device.device_id}"].append(position)
+            if info.name is not None:
+                self._by_name[info.name].append(position)
+
+    def __len__(self) -> int:
+        """Get number of indexed interfaces."""
+        return len(self._interfaces_info)
+
+    def _get_by_positions(self, *positions_lists: list[int]) -> list["InterfaceInfoType"]:
+        """Get InterfaceInfo objects placed on given positions, in order of the indexed list, without duplicates."""
+        positions = merge(*positions_lists) if len(positions_lists) > 1 else positions_lists[0]
+        selected = []
+        last_position = None
+        for position in positions:
+            if position != last_position:
+                selected.append(self._interfaces_info[position])
+                last_position = position
+        return selected
+
+    def _get_by_pci_device(self, pci_device: PCIDevice) -> list["InterfaceInfoType"]:
+        """Get InterfaceInfo objects with PCI device equal to given one, subsystem IDs are compared as wildcards."""
+        positions = self._by_pci_device.get((pci_device.vendor_id, pci_device.device_id), [])
+        return [info for info in self._get_by_positions(positions) if info.pci_device == pci_device]
+
+    def _get_by_speed_and_family(
+        self, family: Optional[Union[str, Family]], speed: Optional[Union[str, Speed]]
+    ) -> list["InterfaceInfoType"]:
+        """Get InterfaceInfo objects with device ID matching given family or speed."""
+        from mfd_network_adapter.network_adapter_owner.base import NetworkAdapterOwner
+
+        searched_dev_ids = (
+            list(DEVICE_IDS[family.upper() if isinstance(family, str) else family.name]) if family is not None else []
+        )
+        if speed is not None:
+            searched_dev_ids.extend(
+                SPEED_IDS[NetworkAdapterOwner._unify_speed_str(speed) if isinstance(speed, str) else speed.value]
+            )
+        positions_lists = [
+            self._by_device_id[dev_id] for dev_id in set(searched_dev_ids) if dev_id in self._by_device_id
+        ]
+        if not positions_lists:
+            return []
+        return self._get_by_positions(*positions_lists)
+
+    def filter(
+        self,
+        *,
+        pci_address: Optional[PCIAddress] = None,
+        pci_device: Optional[PCIDevice] = None,
+        family: Optional[Union[str, Family]] = None,
+        speed: Optional[Union[str, Speed]] = None,
+        interface_indexes: Optional[list[int]] = None,
+        interface_names: Optional[list[str]] = None,
+        random_interface: Optional[bool] = None,
+        all_interfaces: Optional[bool] = None,
+    ) -> list["InterfaceInfoType"]:
+        """
+        Filter indexed InterfaceInfo objects based on passed criteria.
+
+        :param pci_address: PCI address
+        :param pci_device: PCI device
+        :param family: Family str matching keys of DEVICE_IDS from mfd-const or Family Enum member from mfd-const
+        :param speed: Speed str matching keys of SPEED_IDS from mfd-const or Speed Enum member from mfd-const
+        :param interface_indexes: Indexes of interfaces, like [0, 1] - first and second interface of adapter
+        :param interface_names: Names of the interfaces
+        :param random_interface: Flag - random interface
+        :param all_interfaces: Flag - all interfaces
+        :return: Filtered list of InterfaceInfo objects
+        :raises NetworkAdapterIncorrectData: in case of incorrect combination of criteria
+        """
+        from mfd_network_adapter.network_adapter_owner.base import NetworkAdapterOwner
+        from mfd_network_adapter.network_adapter_owner.exceptions import NetworkAdapterIncorrectData
+
+        NetworkAdapterOwner._validate_filtering_args(
+            pci_address=pci_address, pci_device=pci_device, family=family, speed=speed, interface_names=interface_names
+        )
+
+        if pci_address is not None:
+            selected = self._get_by_positions(self._by_pci_address.get(get_pci_address_key(pci_address), []))
+        elif pci_device is not None:
+            selected = self._get_by_pci_device(pci_device)
+        elif interface_names:
+            positions_lists = [self._by_name[name] for name in set(interface_names) if name in self._by_name]
+            selected = self._get_by_positions(*positions_lists) if positions_lists else []
+        elif family is not None or speed is not None:
+            selected = self._get_by_speed_and_family(family=family, speed=speed)
+        else:
+            selected = self._interfaces_info
+
+        if not selected:
+            return []
+
+        if interface_indexes:
+            return [selected[idx] for idx in interface_indexes]
+
+        # by default ALL flag will be set
+        if random_interface is None and all_interfaces is None:
+            all_interfaces = True
+
+        if not (bool(random_interface) ^ bool(all_interfaces)):
+            raise NetworkAdapterIncorrectData(
+                "One and only one of random_interface / all_interfaces flags should be True."
+            )
+
+        if random_interface:
+            return [random.choice(selected)]
+        return list(selected)
@@ -0,0 +1,186 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for watcher driving incremental refresh of network interfaces."""
+
+import logging
+import re
+import typing
+from queue import Empty, Queue
+from threading import Event, Thread
+from time import monotonic
+from typing import Callable, Iterable, Optional
+
+from mfd_common_libs import add_logging_level, log_levels
+
+from .exceptions import InterfaceWatcherException
+
+if typing.TYPE_CHECKING:
+    from mfd_connect.process import RemoteProcess
+
+    from .base import Host
+
+logger = logging.getLogger(__name__)
+add_logging_level(level_name="MODULE_DEBUG", level_value=log_levels.MODULE_DEBUG)
+
+IP_MONITOR_LINK_COMMAND = "ip -o monitor link"
+UDEVADM_MONITOR_NET_COMMAND = "udevadm monitor --kernel --subsystem-match=net"
+
+# e.g. "3: eth0: <BROADCAST,...> mtu 1500 ...", "Deleted 7: eth0.100@eth0: <BROADCAST,...> ..."
+IP_MONITOR_LINK_REGEX = re.compile(r"^(?:Deleted\s+)?\d+:\s+(?P<name>[^:@\s]+)(?:@\S+)?:")
+# e.g. "KERNEL[1234.567890] add      /devices/pci0000:00/0000:00:03.0/net/eth1 (net)"
+UDEVADM_MONITOR_REGEX = re.compile(r"^KERNEL\[[\d.]+\]\s+\w+\s+\S+/net/(?P<name>[^/\s]+)\s+\(net\)")
+
+_END_OF_STREAM = object()
+
+
+def parse_ip_monitor_line(line: str) -> Optional[str]:
+    """
+    Get interface name from line of `ip -o monitor link` output.
+
+    :param line: Line of output
+    :return: Interface name or None if line doesn't describe link event
+    """
+    match = IP_MONITOR_LINK_REGEX.match(line.strip())
+    return match.group("name") if match else None
+
+
+def parse_udevadm_monitor_line(line: str) -> Optional[str]:
+    """
+    Get interface name from line of `udevadm monitor --kernel --subsystem-match=net` output.
+
+    :param line: Line of output
+    :return: Interface name or None if line doesn't describe net device event
+    """
+    match = UDEVADM_MONITOR_REGEX.match(line.strip())
+    return match.group("name") if match else None
+
+
+WATCHER_SOURCES = {
+    "ip": (IP_MONITOR_LINK_COMMAND, parse_ip_monitor_line),
+    "udev": (UDEVADM_MONITOR_NET_COMMAND, parse_udevadm_monitor_line),
+}
+
+
+class InterfaceWatcher:
+    """
+    Watcher of interface events refreshing only affected interfaces.
+
+    Lines from event source are parsed into interface names.
+    Names gathered within debounce period are refreshed at once by partial `Host.refresh_network_interfaces()` call.
+    """
+
+    def __init__(
+        self,
+        host: "Host",
+        event_source: Iterable[str],
+        *,
+        parser: Callable[[str], Optional[str]] = parse_ip_monitor_line,
+        debounce: float = 0.5,
+        refresh_kwargs: Optional[dict] = None,
+        process: Optional["RemoteProcess"] = None,
+    ):
+        """
+        Initialize watcher.
+
+        :param host: Host object which interfaces are refreshed
+        :param event_source: Iterable of event lines, e.g. stdout iterator of long-running monitor process
+        :param parser: Function returning interface name from event line or None for not relevant lines
+        :param debounce: Time in seconds to gather events before refresh
+        :param refresh_kwargs: Additional arguments for `Host.refresh_network_interfaces()`, e.g. extended
+        :param process: Remote process producing events, stopped together with watcher
+        """
+        self._host = host
+        self._event_source = event_source
+        self._parser = parser
+        self._debounce = debounce
+        self._refresh_kwargs = refresh_kwargs or {}
+        self._process = process
+        self._names = Queue()
+        self._stop_event = Event()
+        self._reader_thread = Thread(target=self._read_events, name="interface-watcher-reader", daemon=True)
+        self._refresh_thread = Thread(target=self._refresh_interfaces, name="interface-watcher-refresh", daemon=True)
+        self.refresh_count = 0
+        self.last_error: Optional[Exception] = None
+
+    @property
+    def running(self) -> bool:
+        """Check whether watcher is still processing events."""
+        return self._refresh_thread.is_alive()
+
+    def start(self) -> None:
+        """Start processing events in background threads."""
+        if self._refresh_thread.ident is not None:
+            raise InterfaceWatcherException("Interface watcher can be started only once.")
+        self._reader_thread.start()
+        self._refresh_thread.start()
+
+    def stop(self, timeout: Optional[float] = 10) -> None:
+        """
+        Stop watcher, pending events are refreshed before stop.
+
+        :param timeout: Time in seconds to wait for background threads
+        """
+        self._stop_event.set()
+        if self._process is not None and self._process.running:
+            self._process.stop()
+        self.join(timeout=timeout)
+
+    def join(self, timeout: Optional[float] = None) -> None:
+        """
+        Wait until event source is exhausted and all events are refreshed.
+
+        :param timeout: Time in seconds to wait
+        """
+        if self._refresh_thread.ident is not None:
+            self._refresh_thread.join(timeout=timeout)
+
+    def _read_events(self) -> None:
+        """Parse lines from event source into queue of interface names."""
+        try:
+            for line in self._event_source:
+                if self._stop_event.is_set():
+                    break
+                name = self._parser(line)
+                if name is not None:
+                    self._names.put(name)
+        except Exception as e:
+            logger.warning(f"Interface watcher stopped reading events: {e}")
+            self.last_error = e
+        finally:
+            self._names.put(_END_OF_STREAM)
+
+    def _refresh_interfaces(self) -> None:
+        """Gather names of changed interfaces and refresh them after debounce period."""
+        end_of_stream = False
+        while not end_of_stream:
+            try:
+                name = self._names.get(timeout=0.1)
+            except Empty:
+                if self._stop_event.is_set():
+                    break
+                continue
+            if name is _END_OF_STREAM:
+                break
+
+            pending = {name}
+            deadline = monotonic() + self._debounce
+            while not end_of_stream:
+                try:
+                    name = self._names.get(timeout=max(deadline - monotonic(), 0))
+                except Empty:
+                    break
+                if name is _END_OF_STREAM:
+                    end_of_stream = True
+                else:
+                    pending.add(name)
+            self._refresh(sorted(pending))
+
+    def _refresh(self, interface_names: list[str]) -> None:
+        """Refresh interfaces with given names."""
+        logger.log(level=log_levels.MODULE_DEBUG, msg=f"Refreshing interfaces after events: {interface_names}")
+        try:
+            self._host.refresh_network_interfaces(interface_names=interface_names, **self._refresh_kwargs)
+            self.refresh_count += 1
+        except Exception as e:
+            logger.warning(f"Interface watcher failed to refresh interfaces {interface_names}: {e}")
+            self.last_error = e
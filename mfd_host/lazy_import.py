@@ -0,0 +1,32 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for lazy import of package attributes."""
+
+from functools import reduce
+from importlib import import_module
+from operator import or_
+from typing import Any, Callable, Optional
+
+
+def lazy_getattr(
+    package: str, attributes: dict[str, str], unions: Optional[dict[str, tuple[str, ...]]] = None
+) -> Callable[[str], Any]:
+    """
+    Create module `__getattr__` importing submodule only when its attribute is accessed.
+
+    :param package: Name of package, `__name__` of module defining `__getattr__`
+    :param attributes: Attribute names mapped to relative names of submodules defining them, e.g. {"Host": ".base"}
+    :param unions: Names of type aliases mapped to names of attributes joined into union,
+                   e.g. {"StatsFeatureType": ("BaseFeatureStats", "LinuxStats")}, all members are imported
+    :return: Function to be assigned as `__getattr__` of the package
+    """
+    unions = unions or {}
+
+    def __getattr__(name: str) -> Any:
+        if name in attributes:
+            return getattr(import_module(attributes[name], package), name)
+        if name in unions:
+            return reduce(or_, (__getattr__(member) for member in unions[name]))
+        raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+    return __getattr__
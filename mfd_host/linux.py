@@ -3,11 +3,20 @@
 """Module for Host for Linux OS."""
 
 import logging
+import typing
+from typing import Iterable, List, Optional
 
 from mfd_common_libs import add_logging_level, log_levels, os_supported
-from mfd_typing import OSName
+from mfd_typing import OSName, PCIAddress
+from mfd_typing.network_interface import InterfaceType
 
 from .base import Host
+from .exceptions import InterfaceWatcherException
+from .interface_watcher import InterfaceWatcher, WATCHER_SOURCES
+from .sysfs_interfaces import get_sysfs_interfaces_command, parse_sysfs_interfaces
+
+if typing.TYPE_CHECKING:
+    from mfd_typing.network_interface import LinuxInterfaceInfo
 
 logger = logging.getLogger(__name__)
 add_logging_level(level_name="MODULE_DEBUG", level_value=log_levels.MODULE_DEBUG)
@@ -17,3 +26,94 @@ class LinuxHost(Host):
     """Class for Linux host."""
 
     __init__ = os_supported(OSName.LINUX)(Host.__init__)
+
+    _interface_watcher: Optional[InterfaceWatcher] = None
+
+    def _get_scoped_interfaces_info(
+        self,
+        interface_types: Optional[List[InterfaceType]] = None,
+        pci_addresses: Optional[List[PCIAddress]] = None,
+        interface_names: Optional[List[str]] = None,
+    ) -> Optional[List["LinuxInterfaceInfo"]]:
+        """
+        Gather info only about interfaces in scope of partial refresh from sysfs, in single command.
+
+        Named interfaces, interfaces of PCI addresses and all virtual functions are supported,
+        for other interface types or interfaces which can't be reproduced from sysfs None is returned.
+
+        :param interface_types: Types of interfaces to be refreshed
+        :param pci_addresses: PCI addresses of interfaces to be refreshed
+        :param interface_names: Names of interfaces to be refreshed
+        :return: List of LinuxInterfaceInfo objects, None if full enumeration is required
+        """
+        if not set(interface_types or []) <= {InterfaceType.VF}:
+            return None
+        command = get_sysfs_interfaces_command(
+            interface_names=interface_names or [],
+            pci_addresses=pci_addresses or [],
+            virtual_functions=bool(interface_types),
+        )
+        result = self.connection.execute_command(command, shell=True, expected_return_codes=None)
+        interfaces_info = parse_sysfs_interfaces(result.stdout, self.network.is_management_interface)
+        if interfaces_info is None:
+            logger.log(level=log_levels.MODULE_DEBUG, msg="Interfaces in scope not covered by sysfs query.")
+        return interfaces_info
+
+    @property
+    def interface_watcher(self) -> Optional[InterfaceWatcher]:
+        """Running interface watcher, if started."""
+        return self._interface_watcher
+
+    def start_interface_watcher(
+        self,
+        *,
+        source: str = "ip",
+        debounce: float = 0.5,
+        event_source: Optional[Iterable[str]] = None,
+        **refresh_kwargs,
+    ) -> InterfaceWatcher:
+        """
+        Start background watcher refreshing interfaces affected by kernel link events.
+
+        Long-running remote process (`ip -o monitor link` or `udevadm monitor`) is started on the host
+        and names of interfaces from its events are passed to partial `refresh_network_interfaces()` call.
+
+        :param source: Source of events, "ip" (netlink via `ip monitor`) or "udev"
+        :param debounce: Time in seconds to gather events before refresh
+        :param event_source: Iterable of event lines used instead of remote process, e.g. in tests
+        :param refresh_kwargs: Additional arguments for `refresh_network_interfaces()`,
+                               e.g. extended=[InterfaceType.VF] when new VFs are expected on host with topology
+        :return: Started watcher
+        :raises InterfaceWatcherException: if watcher is already running or source is not supported
+        """
+        with self._lock:
+            if self._interface_watcher is not None and self._interface_watcher.running:
+                raise InterfaceWatcherException("Interface watcher is already running.")
+            if source not in WATCHER_SOURCES:
+                raise InterfaceWatcherException(f"Unsupported interface watcher source: {source}")
+
+            command, parser = WATCHER_SOURCES[source]
+            process = None
+            if event_source is None:
+                logger.log(level=log_levels.MODULE_DEBUG, msg=f"Starting interface watcher: {command}")
+                process = self.connection.start_process(command, shell=True)
+                event_source = process.get_stdout_iter()
+
+            self._interface_watcher = InterfaceWatcher(
+                self,
+                event_source,
+                parser=parser,
+                debounce=debounce,
+                refresh_kwargs=refresh_kwargs,
+                process=process,
+            )
+            self._interface_watcher.start()
+            return self._interface_watcher
+
+    def stop_interface_watcher(self) -> None:
+        """Stop background interface watcher, if started."""
+        # stopped outside of the lock, its pending refresh may need to initialize network feature
+        with self._lock:
+            watcher, self._interface_watcher = self._interface_watcher, None
+        if watcher is not None:
+            watcher.stop()
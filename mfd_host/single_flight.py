@@ -0,0 +1,154 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for single-flight coalescing of identical concurrent commands."""
+
+import logging
+import threading
+import typing
+from concurrent.futures import Future
+from typing import Any, Callable, Hashable, Optional
+
+from mfd_common_libs import add_logging_level, log_levels
+
+if typing.TYPE_CHECKING:
+    from mfd_connect import Connection
+    from mfd_connect.base import ConnectionCompletedProcess
+
+logger = logging.getLogger(__name__)
+add_logging_level(level_name="MODULE_DEBUG", level_value=log_levels.MODULE_DEBUG)
+
+
+class SingleFlight:
+    """
+    Coalescing of identical concurrent calls.
+
+    Call started while identical one (same key) is in flight doesn't execute, it waits for the in-flight one
+    and gets its result or exception. Results are not kept after the call, so it's not a cache.
+    """
+
+    def __init__(self):
+        """Initialize single flight."""
+        self.executions = 0
+        self.saved = 0
+        self._calls: dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, function: Callable, *args, **kwargs) -> Any:
+        """
+        Execute function or wait for in-flight execution with the same key.
+
+        :param key: Key identifying the call
+        :param function: Function executing the call
+        :param args: Positional arguments of function
+        :param kwargs: Keyword arguments of function
+        :return: Value returned by function
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = self._calls[key] = Future()
+                self.executions += 1
+                in_flight = False
+            else:
+                self.saved += 1
+                in_flight = True
+
+        if in_flight:
+            logger.log(level=log_levels.MODULE_DEBUG, msg=f"Waiting for result of in-flight call: {key}")
+            return call.result()
+
+        try:
+            value = function(*args, **kwargs)
+        except BaseException as e:
+            call.set_exception(e)
+            raise
+        else:
+            call.set_result(value)
+            return value
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+    def reset_counters(self) -> None:
+        """Reset execution and saved execution counters."""
+        with self._lock:
+            self.executions = 0
+            self.saved = 0
+
+    def wrap(self, connection: "Connection") -> "CoalescingConnection":
+        """
+        Get connection coalescing identical concurrent commands by this single flight.
+
+        :param connection: Object of mfd-connect
+        :return: Wrapped connection
+        """
+        return CoalescingConnection(connection, self)
+
+
+class CoalescingConnection:
+    """
+    Connection wrapper sharing execution of identical concurrent commands.
+
+    `execute_command()` and `execute_powershell()` calls with the same command and arguments are coalesced,
+    other attributes are taken from wrapped connection. Wrapper reports class of wrapped connection,
+    so `isinstance()` checks of mfd modules (e.g. hostname of RPyC connection) treat it as wrapped one.
+    """
+
+    def __init__(self, connection: "Connection", single_flight: SingleFlight):
+        """
+        Initialize wrapper.
+
+        :param connection: Object of mfd-connect
+        :param single_flight: Single flight coalescing commands, may be shared by many wrappers
+        """
+        self.__wrapped__ = connection
+        self._single_flight = single_flight
+
+    @property
+    def __class__(self) -> type:
+        return self.__wrapped__.__class__
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.__wrapped__, name)
+
+    def execute_command(self, command: str, *args, **kwargs) -> "ConnectionCompletedProcess":
+        """Execute command, sharing result with identical concurrent commands."""
+        return self._execute("execute_command", command, *args, **kwargs)
+
+    def execute_powershell(self, command: str, *args, **kwargs) -> "ConnectionCompletedProcess":
+        """Execute PowerShell command, sharing result with identical concurrent commands."""
+        return self._execute("execute_powershell", command, *args, **kwargs)
+
+    def _execute(self, method_name: str, command: str, *args, **kwargs) -> "ConnectionCompletedProcess":
+        """Execute command by method of wrapped connection, coalesced if arguments can be compared."""
+        method = getattr(self.__wrapped__, method_name)
+        key = self._get_key(method_name, command, args, kwargs)
+        if key is None:
+            return method(command, *args, **kwargs)
+        return self._single_flight.do(key, method, command, *args, **kwargs)
+
+    @staticmethod
+    def _get_key(method_name: str, command: str, args: tuple, kwargs: dict) -> Optional[tuple]:
+        """Get key of command execution, None if any argument is not hashable."""
+        try:
+            key = (
+                method_name,
+                command,
+                tuple(_freeze(arg) for arg in args),
+                frozenset((name, _freeze(value)) for name, value in kwargs.items()),
+            )
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+
+def _freeze(value: Any) -> Any:
+    """Convert collections used as command arguments (env, expected return codes) to hashable equivalents."""
+    if isinstance(value, dict):
+        return frozenset((key, _freeze(item)) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, set):
+        return frozenset(value)
+    return value
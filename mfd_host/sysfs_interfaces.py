@@ -0,0 +1,140 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for scoped query of Linux interfaces info from sysfs, used by partial refresh of interfaces."""
+
+import re
+from ipaddress import IPv4Interface
+from typing import Callable, Iterable, List, Optional
+
+from mfd_typing import MACAddress, PCIAddress, PCIDevice
+from mfd_typing.network_interface import InterfaceType, LinuxInterfaceInfo
+
+# class of PCI functions listed by `lspci` in full enumeration of interfaces
+ETHERNET_CONTROLLER_CLASS = "0x0200"
+# sysfs net device type of Ethernet (ARPHRD_ETHER), only such devices have MAC address in `ip a` output
+ETHERNET_NET_DEVICE_TYPE = "1"
+# subsystem IDs which `lspci` doesn't report
+MISSING_SUBSYSTEM_IDS = {"0x0000", "0xffff"}
+
+# emits lines:
+#   netns - host has network namespaces
+#   pci <address> <class> <vendor> <device> <subsystem vendor> <subsystem device> <is VF>
+#   net <name> <address of PCI function or -> <is bonding slave> <type> <MAC address>
+#   inet lines of `ip -o -4 addr show`
+SYSFS_INTERFACES_SCRIPT = r"""
+net() {
+  [ -e "$1/ifindex" ] || return 0
+  if [ -e "$1/device" ]; then address=$(readlink -f "$1/device"); address=${address##*/}; else address=-; fi
+  slave=0; [ -e "$1/bonding_slave" ] && slave=1
+  echo "net ${1##*/} $address $slave $(cat "$1/type") $(cat "$1/address")"
+}
+pci() {
+  [ -e "$1/vendor" ] || return 0
+  vf=0; [ -e "$1/physfn" ] && vf=1
+  ids=$(cat "$1/class" "$1/vendor" "$1/device" "$1/subsystem_vendor" "$1/subsystem_device" | tr '\n' ' ')
+  echo "pci ${1##*/} $ids$vf"
+  for path in "$1"/net/*; do net "$path"; done
+}
+ip netns list 2>/dev/null | grep -q . && echo netns
+"""
+
+
+def get_sysfs_interfaces_command(
+    interface_names: Iterable[str], pci_addresses: Iterable[PCIAddress], virtual_functions: bool
+) -> str:
+    """
+    Get shell command gathering sysfs data of interfaces in scope in single round trip.
+
+    Named interfaces backed by PCI function are queried together with other interfaces of the function.
+
+    :param interface_names: Names of interfaces
+    :param pci_addresses: PCI addresses of interfaces
+    :param virtual_functions: Whether all virtual functions are queried
+    :return: Command
+    """
+    lines = [SYSFS_INTERFACES_SCRIPT.strip()]
+    for name in interface_names:
+        path = f"/sys/class/net/{name}"
+        lines.append(f'if [ -e {path}/device ]; then pci "$(readlink -f {path}/device)"; else net {path}; fi')
+    for pci_address in pci_addresses:
+        lines.append(f"pci /sys/bus/pci/devices/{pci_address}")
+    if virtual_functions:
+        lines.append('for path in /sys/bus/pci/devices/*/physfn; do [ -e "$path" ] && pci "${path%/physfn}"; done')
+    lines.append("ip -o -4 addr show")
+    return "\n".join(lines)
+
+
+def parse_sysfs_interfaces(
+    output: str, is_management_interface: Callable[[IPv4Interface], bool]
+) -> Optional[List[LinuxInterfaceInfo]]:
+    """
+    Parse output of `get_sysfs_interfaces_command()` into info consistent with full enumeration of owner.
+
+    Only physical and virtual functions (and management interface among them) are reproduced,
+    for network namespaces, virtual devices, bonding slaves, BTS and VPORT interfaces or PCI functions
+    other than Ethernet controllers info can't be gathered this way and full enumeration is required.
+
+    :param output: Output of command
+    :param is_management_interface: Function of network adapter owner checking IP of management interface
+    :return: List of LinuxInterfaceInfo objects, None if full enumeration is required
+    """
+    functions = {}
+    nets = []
+    management_names = set()
+    for line in output.splitlines():
+        columns = line.split()
+        if not columns:
+            continue
+        if columns[0] == "netns":
+            return None
+        if columns[0] == "pci" and len(columns) == 8:
+            functions[columns[1]] = columns[2:]
+        elif columns[0] == "net" and len(columns) == 6:
+            nets.append(columns[1:])
+        else:
+            match = re.match(r"\d+:\s+(?P<name>\S+)\s+inet\s+(?P<ip>\S+)\s.*\bglobal\b", line)
+            if match and is_management_interface(IPv4Interface(match.group("ip"))):
+                management_names.add(match.group("name"))
+
+    interfaces_info = []
+    nets_of_functions = {}
+    for name, address, slave, net_type, mac_address in nets:
+        if address not in functions or slave == "1" or name.startswith("nac_"):
+            return None
+        nets_of_functions.setdefault(address, []).append(name)
+        _, vendor, device, sub_vendor, sub_device, vf = functions[address]
+        if name in management_names:
+            interface_type = InterfaceType.MANAGEMENT
+        else:
+            interface_type = InterfaceType.VF if vf == "1" else InterfaceType.PF
+        interfaces_info.append(
+            LinuxInterfaceInfo(
+                name=name,
+                pci_address=PCIAddress(data=address),
+                pci_device=_get_pci_device(vendor, device, sub_vendor, sub_device),
+                interface_type=interface_type,
+                mac_address=MACAddress(addr=mac_address) if net_type == ETHERNET_NET_DEVICE_TYPE else None,
+                installed=True,
+            )
+        )
+
+    for address, (pci_class, vendor, device, sub_vendor, sub_device, vf) in functions.items():
+        if not pci_class.startswith(ETHERNET_CONTROLLER_CLASS) or len(nets_of_functions.get(address, [])) > 1:
+            return None
+        if address not in nets_of_functions:
+            interfaces_info.append(
+                LinuxInterfaceInfo(
+                    pci_address=PCIAddress(data=address),
+                    pci_device=_get_pci_device(vendor, device, sub_vendor, sub_device),
+                    interface_type=InterfaceType.VF if vf == "1" else InterfaceType.ETH_CONTROLLER,
+                    installed=False,
+                )
+            )
+    return interfaces_info
+
+
+def _get_pci_device(vendor: str, device: str, sub_vendor: str, sub_device: str) -> PCIDevice:
+    """Get PCIDevice from sysfs IDs, subsystem IDs are skipped like in `lspci` output."""
+    if sub_vendor in MISSING_SUBSYSTEM_IDS:
+        sub_vendor = sub_device = None
+    return PCIDevice(*(None if value is None else value[2:] for value in (vendor, device, sub_vendor, sub_device)))
@@ -0,0 +1,46 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Benchmarks with wall-clock budgets, run only on request, as their results depend on the machine."""
+
+import os
+from typing import Callable
+
+import pytest
+
+# set to any non-empty value to run tests marked as benchmark
+BENCHMARKS_VARIABLE = "MFD_HOST_BENCHMARKS"
+
+_report_lines: list[str] = []
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Register benchmark marker."""
+    config.addinivalue_line(
+        "markers", f"benchmark: wall-clock benchmark, run only when {BENCHMARKS_VARIABLE} environment variable is set"
+    )
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    """Deselect benchmarks, unless requested by environment variable."""
+    if os.environ.get(BENCHMARKS_VARIABLE):
+        return
+    deselected = [item for item in items if item.get_closest_marker("benchmark")]
+    if not deselected:
+        return
+    config.hook.pytest_deselected(items=deselected)
+    items[:] = [item for item in items if not item.get_closest_marker("benchmark")]
+
+
+def pytest_terminal_summary(terminalreporter: pytest.TerminalReporter) -> None:
+    """Show results reported by benchmarks."""
+    if not _report_lines:
+        return
+    terminalreporter.write_sep("-", "benchmark results")
+    for line in _report_lines:
+        terminalreporter.write_line(line)
+
+
+@pytest.fixture
+def benchmark_report() -> Callable[[str], None]:
+    """Get function reporting line of benchmark result in terminal summary."""
+    return _report_lines.append
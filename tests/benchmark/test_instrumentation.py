@@ -0,0 +1,54 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Benchmark of overhead added to feature methods by disabled instrumentation."""
+
+from time import perf_counter
+
+import pytest
+from mfd_connect import RPyCConnection
+from mfd_typing import OSName
+
+from mfd_host import Host
+from mfd_host.feature.base import BaseFeature
+from mfd_host.instrumentation import is_instrumentation_enabled
+
+CALLS = 100_000
+# upper limit for overhead of disabled instrumentation per method call using connection, remote command takes ms
+DISABLED_OVERHEAD_BUDGET_PER_CALL = 3e-6
+
+pytestmark = pytest.mark.benchmark
+
+
+class _Feature(BaseFeature):
+    def get_connection(self):
+        return self._connection
+
+
+class TestInstrumentationBenchmark:
+    @pytest.fixture
+    def feature(self, mocker):
+        connection = mocker.create_autospec(RPyCConnection)
+        connection.get_os_name.return_value = OSName.LINUX
+        host = Host(connection=connection)
+        yield _Feature(connection=connection, host=host)
+        mocker.stopall()
+
+    def test_disabled_overhead(self, feature):
+        assert not is_instrumentation_enabled()
+        connection = feature._connection
+
+        def _baseline(self):
+            return connection
+
+        start = perf_counter()
+        for _ in range(CALLS):
+            _baseline(feature)
+        baseline_time = perf_counter() - start
+
+        start = perf_counter()
+        for _ in range(CALLS):
+            feature.get_connection()
+        instrumented_time = perf_counter() - start
+
+        overhead_per_call = (instrumented_time - baseline_time) / CALLS
+        assert overhead_per_call < DISABLED_OVERHEAD_BUDGET_PER_CALL, f"{overhead_per_call * 1e9:.0f} ns per call"
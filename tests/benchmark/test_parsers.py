@@ -0,0 +1,290 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Benchmark of feature parsers of command outputs at sizes seen on production hosts."""
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+from time import perf_counter
+from typing import Callable
+
+import pytest
+from mfd_connect import RPyCConnection
+from mfd_connect.base import ConnectionCompletedProcess
+from mfd_typing import OSName
+
+from mfd_host import Host
+from mfd_host.feature.stats.linux import INTERRUPTS_SEPARATOR
+
+LOGICAL_CPUS = 448
+TOP_PROCESSES = 20_000
+COUNTER_INSTANCES = 1_792  # \Processor(*)\DPC Rate of 448 CPUs in 4 processor groups, 3 lines per reading
+COUNTER_SAMPLES = 20
+ESXTOP_COLUMNS = 50_000
+ESXTOP_SAMPLES = 60
+IRQ_ROWS = 3_000  # queue IRQs of 7 ports with 448 queues each, plus other devices
+ACTIVE_IRQ_ROWS = 448
+# upper limits for parsing, per unit of the output; parsing linear in size of output stays orders of magnitude below
+TOP_CPU_BUDGET_PER_CPU = 100e-6
+TOP_MEM_BUDGET_PER_LINE = 5e-6
+TOP_PROC_BUDGET_PER_PROCESS = 50e-6
+MPSTAT_BUDGET_PER_CPU = 100e-6
+GET_COUNTER_BUDGET_PER_LINE = 10e-6
+# two readings of /proc/interrupts parsed and compared
+INTERRUPTS_BUDGET_PER_COUNTER = 1e-6
+# column of esxtop CSV is selected on the host by cut and awk, budget for the whole pipeline
+ESXTOP_BUDGET_PER_CELL = 1e-6
+# set to path of JSON lines file to track results of benchmarks over time
+RESULTS_FILE_VARIABLE = "MFD_HOST_BENCHMARK_RESULTS"
+
+pytestmark = pytest.mark.benchmark
+
+
+def _track(report: Callable[[str], None], name: str, size: int, elapsed: float, budget: float) -> None:
+    """Report result of benchmark in terminal summary and append it to results file, when requested."""
+    report(f"{name} [{size}]: {elapsed:.4f}s (budget {budget:.4f}s)")
+    results_file = os.environ.get(RESULTS_FILE_VARIABLE)
+    if not results_file:
+        return
+    record = {
+        "benchmark": name,
+        "size": size,
+        "time": elapsed,
+        "budget": budget,
+        "python": sys.version.split()[0],
+        "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+    }
+    with open(results_file, "a", encoding="utf-8") as file:
+        file.write(json.dumps(record) + "\n")
+
+
+def _measure(function, *args, **kwargs) -> tuple[float, object]:
+    """Measure the best time of 3 calls, to not depend on single hiccups of the machine."""
+    elapsed = []
+    for _ in range(3):
+        start = perf_counter()
+        result = function(*args, **kwargs)
+        elapsed.append(perf_counter() - start)
+    return min(elapsed), result
+
+
+def _generate_top_output(cpus: int, processes: int) -> str:
+    """Generate `top -b -n1 -1` output."""
+    lines = [
+        "top - 19:43:02 up 111 days, 22:16,  0 users,  load average: 0.46, 0.31, 0.22",
+        f"Tasks: {processes} total,   1 running, {processes - 1} sleeping,   0 stopped,   0 zombie",
+    ]
+    lines.extend(
+        f"%Cpu{cpu:<3}:  {cpu % 7:.1f} us,  {cpu % 3:.1f} sy,  0.0 ni, {93 - cpu % 10:.1f} id,  0.0 wa,  0.0 hi,"
+        f"  0.0 si,  0.0 st"
+        for cpu in range(cpus)
+    )
+    lines.append("MiB Mem :  78924.9 total,  60415.4 free,   3092.8 used,  15416.8 buff/cache")
+    lines.append("MiB Swap:   8192.0 total,   8129.9 free,     62.1 used.  74997.8 avail Mem")
+    lines.append("    PID USER      PR  NI    VIRT    RES    SHR S  %CPU  %MEM     TIME+ COMMAND")
+    lines.extend(
+        f"{pid + 1:>7} root      20   0 {pid * 13 % 2000000:>7} {pid % 65536:>6} {pid % 8192:>6} S"
+        f" {pid % 100 / 10:>5.1f} {pid % 10 / 10:>5.1f} {pid % 60:>5}:{pid % 100:02}.00 worker/{pid}:kworker"
+        for pid in range(processes)
+    )
+    return "\n".join(lines) + "\n"
+
+
+def _generate_mpstat_output(cpus: int) -> str:
+    """Generate `mpstat -A` output with CPU utilization and interrupts sections."""
+    header = "Linux 5.15.0-88-generic (host) \t11/22/2023 \t_x86_64_\t(448 CPU)"
+    entries = ["all", *map(str, range(cpus))]
+    utilization = ["12:17:07 PM  CPU    %usr   %nice    %sys %iowait    %irq   %soft  %steal  %guest  %gnice   %idle"]
+    utilization.extend(
+        f"12:17:07 PM  {entry:>4}    0.26    0.00    0.09    0.00    0.00    0.00    0.00    0.00    0.00   99.65"
+        for entry in entries
+    )
+    interrupts = ["12:17:07 PM  CPU    intr/s"]
+    interrupts.extend(f"12:17:07 PM  {entry:>4}    9.86" for entry in entries)
+    nodes = ["12:17:07 PM  NODE    %usr   %nice    %sys %iowait    %irq   %soft  %steal  %guest  %gnice   %idle"]
+    nodes.append("12:17:07 PM   all    0.06    0.00    0.03    0.00    0.00    0.00    0.00    0.00    0.00   99.91")
+    return "\n\n".join([header, "\n".join(utilization), "\n".join(interrupts), "\n".join(nodes)]) + "\n"
+
+
+def _generate_interrupts_output(cpus: int, rows: int, active_rows: int, uptime: float) -> str:
+    """Generate `cat /proc/uptime /proc/interrupts` output, each queue IRQ counted on its own CPU."""
+    lines = [f"{uptime:.2f} 1000.00", " " * 11 + "".join(f"CPU{cpu:<8}" for cpu in range(cpus))]
+    for row in range(rows):
+        counts = [0] * cpus
+        counts[row % cpus] = row * 1000 + (int(uptime) if row < active_rows else 0)
+        lines.append(
+            f"{row + 100:>4}: "
+            + " ".join(f"{count:>10}" for count in counts)
+            + f"  IR-PCI-MSI {524288 + row}-edge      ens801f{row // cpus}-TxRx-{row % cpus}"
+        )
+    lines.append(
+        "LOC: " + " ".join(f"{cpu * 12345678 + int(uptime):>10}" for cpu in range(cpus)) + "  Local timer interrupts"
+    )
+    return "\n".join(lines) + "\n"
+
+
+def _generate_get_counter_output(instances: int, samples: int) -> str:
+    """Generate `Get-Counter | Format-List` output of counters with wildcard instance, 3 lines per reading."""
+    blocks = []
+    for sample in range(samples):
+        readings = "            ".join(
+            f"\\\\b17-27878\\processor({instance // 4},{instance % 4})\\dpc rate :\n"
+            f"            {(instance + sample) % 97}\n            \n"
+            for instance in range(instances)
+        )
+        blocks.append(f"Timestamp : 11/22/2023 12:17:{sample % 60:02} PM\nReadings  : {readings}\n")
+    return "\n" + "".join(blocks)
+
+
+def _generate_esxtop_csv(columns: int, samples: int) -> str:
+    """Generate `esxtop -b` CSV output with one column of CPU usage of monitored process."""
+    groups = [f"Group Cpu({idx}:vm-{idx})" for idx in range(columns // 10)]
+    header = [
+        f'"\\\\host\\{group}\\{counter}"'
+        for group in groups
+        for counter in (
+            "Members",
+            "% Used",
+            "% Run",
+            "% System",
+            "% Wait",
+            "% Ready",
+            "% Idle",
+            "% Overlap",
+            "% CoStop",
+            "% Max Limited",
+        )
+    ]
+    header[-9] = '"\\\\host\\Group Cpu(999999:vmx-bench)\\% Used"'
+    rows = [",".join(header)]
+    row = ",".join(f'"{idx % 100}.{idx % 10}"' for idx in range(len(header)))
+    rows.extend([row] * samples)
+    return "\n".join(rows) + "\n"
+
+
+def _execute_locally(command: str, **kwargs) -> ConnectionCompletedProcess:
+    """Execute command in local shell, as connection would do on the host."""
+    completed = subprocess.run(command, shell=True, capture_output=True, text=True, executable="/bin/sh")
+    return ConnectionCompletedProcess(
+        args=command, stdout=completed.stdout, stderr=completed.stderr, return_code=completed.returncode
+    )
+
+
+class TestParsersBenchmark:
+    @pytest.fixture
+    def connection(self, mocker):
+        connection = mocker.create_autospec(RPyCConnection)
+        yield connection
+        mocker.stopall()
+
+    def _get_host(self, connection, os_name):
+        connection.get_os_name.return_value = os_name
+        return Host(connection=connection)
+
+    def test_top_cpu(self, connection, benchmark_report):
+        stats = self._get_host(connection, OSName.LINUX).stats
+        output = _generate_top_output(LOGICAL_CPUS, TOP_PROCESSES)
+
+        elapsed, cpu_stats = _measure(stats._get_cpu_from_top_output, output, friendly_labels=False)
+
+        assert len(cpu_stats) == LOGICAL_CPUS + 1
+        budget = TOP_CPU_BUDGET_PER_CPU * LOGICAL_CPUS
+        _track(benchmark_report, "top_cpu", LOGICAL_CPUS, elapsed, budget)
+        assert elapsed < budget
+
+    def test_top_mem(self, connection, benchmark_report):
+        stats = self._get_host(connection, OSName.LINUX).stats
+        output = _generate_top_output(LOGICAL_CPUS, TOP_PROCESSES)
+        lines = output.count("\n")
+
+        elapsed, mem_stats = _measure(stats._get_mem_from_top_output, output)
+
+        assert mem_stats["Mem"] == {"total": 78924.9, "free": 60415.4, "used": 3092.8, "buff/cache": 15416.8}
+        assert mem_stats["Swap"] == {"total": 8192.0, "free": 8129.9, "used": 62.1, "avail": 74997.8}
+        budget = TOP_MEM_BUDGET_PER_LINE * lines
+        _track(benchmark_report, "top_mem", lines, elapsed, budget)
+        assert elapsed < budget
+
+    def test_top_proc(self, connection, benchmark_report):
+        stats = self._get_host(connection, OSName.LINUX).stats
+        output = _generate_top_output(LOGICAL_CPUS, TOP_PROCESSES)
+
+        elapsed, proc_stats = _measure(stats._get_proc_from_top_output, output, filter_proc=[])
+
+        assert len(proc_stats["PID"]) == TOP_PROCESSES
+        budget = TOP_PROC_BUDGET_PER_PROCESS * TOP_PROCESSES
+        _track(benchmark_report, "top_proc", TOP_PROCESSES, elapsed, budget)
+        assert elapsed < budget
+
+    def test_mpstat(self, connection, benchmark_report):
+        cpu = self._get_host(connection, OSName.LINUX).cpu
+        output = _generate_mpstat_output(LOGICAL_CPUS)
+
+        elapsed, cpu_stats = _measure(cpu._parse_cpu_stats, output)
+
+        assert len(cpu_stats) == LOGICAL_CPUS + 1
+        assert cpu_stats[str(LOGICAL_CPUS - 1)]["intr/s"] == "9.86"
+        budget = MPSTAT_BUDGET_PER_CPU * LOGICAL_CPUS
+        _track(benchmark_report, "mpstat", LOGICAL_CPUS, elapsed, budget)
+        assert elapsed < budget
+
+    def test_get_counter(self, connection, benchmark_report):
+        stats = self._get_host(connection, OSName.WINDOWS).stats
+        output = _generate_get_counter_output(COUNTER_INSTANCES, COUNTER_SAMPLES)
+        lines = output.count("\n")
+        connection.execute_powershell.return_value = ConnectionCompletedProcess(
+            args="", stdout=output, stderr="", return_code=0
+        )
+
+        elapsed, collection = _measure(
+            stats.get_performance_collection, r"\Processor(*)\DPC Rate", samples=COUNTER_SAMPLES
+        )
+
+        assert len(collection) == COUNTER_INSTANCES
+        assert len(collection["\\\\b17-27878\\processor(0,1)\\dpc rate"]) == COUNTER_SAMPLES
+        budget = GET_COUNTER_BUDGET_PER_LINE * lines
+        _track(benchmark_report, "get_counter", lines, elapsed, budget)
+        assert elapsed < budget
+
+    def test_interrupts(self, connection, benchmark_report):
+        stats = self._get_host(connection, OSName.LINUX).stats
+        output = (
+            _generate_interrupts_output(LOGICAL_CPUS, IRQ_ROWS, ACTIVE_IRQ_ROWS, uptime=1000.0)
+            + f"{INTERRUPTS_SEPARATOR}\n"
+            + _generate_interrupts_output(LOGICAL_CPUS, IRQ_ROWS, ACTIVE_IRQ_ROWS, uptime=1002.0)
+        )
+        connection.execute_command.return_value = ConnectionCompletedProcess(
+            args="", stdout=output, stderr="", return_code=0
+        )
+
+        elapsed, rates = _measure(stats.measure_interrupt_rates, 2, group_by="interface")
+
+        assert rates["ens801f0"] == dict.fromkeys(range(LOGICAL_CPUS), 1.0)
+        assert len(rates["LOC"]) == LOGICAL_CPUS
+        counters = 2 * LOGICAL_CPUS * (IRQ_ROWS + 1)
+        budget = INTERRUPTS_BUDGET_PER_COUNTER * counters
+        _track(benchmark_report, "interrupts", counters, elapsed, budget)
+        assert elapsed < budget
+
+    @pytest.mark.skipif(sys.platform == "win32" or not shutil.which("awk"), reason="esxtop parsing uses POSIX shell")
+    def test_esxtop(self, connection, tmp_path, mocker, benchmark_report):
+        cpu = self._get_host(connection, OSName.ESXI).cpu
+        log_path = tmp_path / "esxtop.csv"
+        csv = _generate_esxtop_csv(ESXTOP_COLUMNS, ESXTOP_SAMPLES)
+        connection.execute_command.side_effect = _execute_locally
+        connection.path.side_effect = Path
+
+        def _parse():
+            log_path.write_text(csv)
+            return cpu.parse_cpu_usage("vmx-bench", mocker.Mock(log_path=log_path))
+
+        elapsed, usage = _measure(_parse)
+
+        assert usage == round(float(csv.splitlines()[1].split(",")[-9].strip('"')))
+        budget = ESXTOP_BUDGET_PER_CELL * ESXTOP_COLUMNS * (ESXTOP_SAMPLES + 1)
+        _track(benchmark_report, "esxtop", ESXTOP_COLUMNS, elapsed, budget)
+        assert elapsed < budget
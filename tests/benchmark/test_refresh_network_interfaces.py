@@ -0,0 +1,72 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Benchmark of NetworkInterface objects reconciliation done by `Host.refresh_network_interfaces`."""
+
+from time import perf_counter
+
+import pytest
+from mfd_connect import RPyCConnection
+from mfd_typing import OSName, PCIAddress
+from mfd_typing.network_interface import LinuxInterfaceInfo, InterfaceType
+
+from mfd_host import Host
+
+SIZES = [10, 100, 1_000, 10_000]
+# upper limit for reconciliation of already tracked interfaces, quadratic matching exceeds it by orders of magnitude
+STEADY_STATE_BUDGET_PER_INTERFACE = 50e-6
+
+pytestmark = pytest.mark.benchmark
+
+
+def _generate_interfaces_info(size: int, offset: int = 0) -> list[LinuxInterfaceInfo]:
+    """Generate PF with VFs interface info, 128 VFs per PF."""
+    interfaces_info = []
+    for idx in range(offset, offset + size):
+        bus, function = divmod(idx, 128)
+        interfaces_info.append(
+            LinuxInterfaceInfo(
+                name=f"eth{bus}" if function == 0 else f"eth{bus}v{function}",
+                pci_address=PCIAddress(domain=0, bus=bus % 256, slot=function // 8, func=function % 8),
+                interface_type=InterfaceType.PF if function == 0 else InterfaceType.VF,
+            )
+        )
+    return interfaces_info
+
+
+class TestRefreshNetworkInterfacesBenchmark:
+    @pytest.fixture
+    def host(self, mocker):
+        connection = mocker.create_autospec(RPyCConnection)
+        connection.get_os_name.return_value = OSName.LINUX
+        yield Host(connection=connection)
+        mocker.stopall()
+
+    @pytest.mark.parametrize("size", SIZES)
+    def test_reconcile_interfaces(self, host, size, benchmark_report):
+        interfaces_info = [(info, None) for info in _generate_interfaces_info(size)]
+
+        start = perf_counter()
+        change_set = host._reconcile_interfaces(interfaces=host.network_interfaces, interfaces_info=interfaces_info)
+        initial_time = perf_counter() - start
+        assert len(change_set.added) == size
+
+        ids = [id(x) for x in host.network_interfaces]
+        fresh_info = [(info, None) for info in _generate_interfaces_info(size)]
+        start = perf_counter()
+        change_set = host._reconcile_interfaces(interfaces=host.network_interfaces, interfaces_info=fresh_info)
+        steady_time = perf_counter() - start
+        assert not change_set
+        assert [id(x) for x in host.network_interfaces] == ids
+
+        churn = max(size // 10, 1)
+        churned_info = [(info, None) for info in _generate_interfaces_info(size, offset=churn)]
+        start = perf_counter()
+        change_set = host._reconcile_interfaces(interfaces=host.network_interfaces, interfaces_info=churned_info)
+        churn_time = perf_counter() - start
+        assert len(change_set.removed) == len(change_set.added) == churn
+
+        benchmark_report(
+            f"reconcile {size:>6} interfaces: initial {initial_time * 1e3:9.3f} ms, "
+            f"steady {steady_time * 1e3:9.3f} ms, churn {churn} {churn_time * 1e3:9.3f} ms"
+        )
+        assert steady_time < max(size * STEADY_STATE_BUDGET_PER_INTERFACE, 1e-3)
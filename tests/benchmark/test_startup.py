@@ -0,0 +1,133 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Benchmark of `mfd_host` import, Host construction and first feature access."""
+
+import gc
+import json
+import subprocess
+import sys
+from textwrap import dedent
+from time import perf_counter
+
+import pytest
+from mfd_connect import RPyCConnection
+from mfd_typing import OSName
+
+from mfd_host import Host
+
+# upper limits, eager import of all OS implementations (and mfd-connect with them) exceeds import budget several times
+IMPORT_BUDGET = 0.15
+HOST_CONSTRUCTION_BUDGET = 200e-6
+FIRST_FEATURE_ACCESS_BUDGET = 1.0
+# modules not needed by Linux host
+NOT_LOADED_FOR_LINUX = [
+    "mfd_devcon",
+    "mfd_sysctl",
+    "mfd_host.windows",
+    "mfd_host.esxi",
+    "mfd_host.freebsd",
+    "mfd_host.feature.device.windows",
+    "mfd_host.feature.stats.windows",
+    "mfd_host.feature.stats.freebsd",
+    "mfd_host.feature.stats.esxi",
+    "mfd_host.feature.cpu.windows",
+    "mfd_host.feature.utils.windows",
+]
+
+pytestmark = pytest.mark.benchmark
+
+STARTUP_SCRIPT = dedent("""\
+    import json
+    import sys
+    from time import perf_counter
+    from unittest.mock import create_autospec
+
+    from mfd_connect import RPyCConnection
+    from mfd_typing import OSName
+
+    start = perf_counter()
+    from mfd_host import Host
+    import_time = perf_counter() - start
+
+    connection = create_autospec(RPyCConnection)
+    connection.get_os_name.return_value = OSName.LINUX
+    start = perf_counter()
+    host = Host(connection=connection)
+    construction_time = perf_counter() - start
+
+    start = perf_counter()
+    host.utils, host.stats, host.cpu, host.service, host.memory, host.device
+    feature_access_time = perf_counter() - start
+
+    print(
+        json.dumps(
+            {
+                "import": import_time,
+                "construction": construction_time,
+                "feature_access": feature_access_time,
+                "modules": sorted(sys.modules),
+            }
+        )
+    )
+    """)
+
+
+def _get_import_time_report(statement: str) -> dict[str, int]:
+    """Get self import time in microseconds of each module imported by statement, reported by `-X importtime`."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement], capture_output=True, text=True, check=True
+    )
+    report = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_time, _, name = line.removeprefix("import time:").split("|")
+        report[name.strip()] = int(self_time)
+    return report
+
+
+class TestStartupBenchmark:
+    @pytest.fixture(scope="class")
+    def startup(self):
+        result = subprocess.run([sys.executable, "-c", STARTUP_SCRIPT], capture_output=True, text=True, check=True)
+        return json.loads(result.stdout)
+
+    def test_import_time(self, benchmark_report):
+        interpreter_modules = _get_import_time_report("pass")
+        report = {
+            name: self_time
+            for name, self_time in _get_import_time_report("from mfd_host import Host").items()
+            if name not in interpreter_modules
+        }
+        import_time = sum(report.values()) / 1e6
+
+        benchmark_report(f"from mfd_host import Host: {import_time * 1e3:.1f} ms, {len(report)} modules")
+        assert "mfd_connect" not in report
+        assert import_time < IMPORT_BUDGET
+
+    def test_host_import_time_with_connection_imported(self, startup, benchmark_report):
+        benchmark_report(f"from mfd_host import Host after mfd_connect: {startup['import'] * 1e3:.1f} ms")
+        assert startup["import"] < IMPORT_BUDGET
+
+    def test_first_feature_access(self, startup, benchmark_report):
+        benchmark_report(
+            f"Host construction: {startup['construction'] * 1e3:.2f} ms, "
+            f"first feature access: {startup['feature_access'] * 1e3:.1f} ms"
+        )
+        assert startup["feature_access"] < FIRST_FEATURE_ACCESS_BUDGET
+        assert not set(NOT_LOADED_FOR_LINUX).intersection(startup["modules"])
+        assert "mfd_host.feature.stats.linux" in startup["modules"]
+
+    def test_host_construction(self, mocker, benchmark_report):
+        count = 1_000
+        connection = mocker.create_autospec(RPyCConnection)
+        connection.get_os_name.return_value = OSName.LINUX
+
+        gc.collect()
+        start = perf_counter()
+        for _ in range(count):
+            Host(connection=connection)
+        construction_time = (perf_counter() - start) / count
+
+        benchmark_report(f"Host construction: {construction_time * 1e6:.1f} us")
+        assert construction_time < HOST_CONSTRUCTION_BUDGET
@@ -0,0 +1,138 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Tests for `mfd_host.aio` module."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+from mfd_connect import RPyCConnection
+from mfd_connect.base import ConnectionCompletedProcess
+from mfd_typing import OSName
+from mfd_typing.network_interface import LinuxInterfaceInfo
+
+from mfd_host import Host
+from mfd_host.aio import call_async
+
+
+class TestAsyncHost:
+    @pytest.fixture
+    def create_host(self, mocker):
+        def _create_host(**kwargs):
+            connection = mocker.create_autospec(RPyCConnection)
+            connection.get_os_name.return_value = OSName.LINUX
+            return Host(connection=connection, **kwargs)
+
+        return _create_host
+
+    @pytest.fixture
+    def host(self, create_host):
+        return create_host()
+
+    def test_feature_async_variant(self, host):
+        host.connection.execute_command.return_value = ConnectionCompletedProcess(
+            args="", stdout="MemTotal:       16318668 kB\nMemFree:         1290716 kB\n", return_code=0
+        )
+
+        meminfo = asyncio.run(host.stats.aget_meminfo())
+
+        assert meminfo == {"MemTotal": "16318668", "MemFree": "1290716"}
+        host.connection.execute_command.assert_called_once_with("cat /proc/meminfo", shell=True)
+
+    def test_feature_async_variant_passes_arguments(self, host, mocker):
+        restart_service = mocker.patch.object(type(host.service), "restart_service", autospec=True)
+
+        asyncio.run(host.service.arestart_service("sshd"))
+
+        restart_service.assert_called_once_with(host.service, "sshd")
+        assert host.service.arestart_service.__name__ == "arestart_service"
+
+    def test_missing_attributes(self, host):
+        with pytest.raises(AttributeError):
+            host.stats.aget_missing
+        with pytest.raises(AttributeError):
+            host.stats.a_connection
+        with pytest.raises(AttributeError):
+            host.stats.missing
+
+    def test_event_loop_not_blocked(self, host, mocker):
+        mocker.patch.object(type(host.cpu), "get_log_cpu_no", side_effect=lambda: time.sleep(0.2) or 8)
+
+        async def _main():
+            ticks = 0
+
+            async def _tick():
+                nonlocal ticks
+                while True:
+                    ticks += 1
+                    await asyncio.sleep(0.01)
+
+            ticker = asyncio.create_task(_tick())
+            cpus = await host.cpu.aget_log_cpu_no()
+            ticker.cancel()
+            return cpus, ticks
+
+        cpus, ticks = asyncio.run(_main())
+
+        assert cpus == 8
+        assert ticks > 5
+
+    def test_calls_limited_per_host(self, create_host):
+        hosts = [create_host(async_concurrency=2) for _ in range(3)]
+        running = {host: 0 for host in hosts}
+        max_running = {host: 0 for host in hosts}
+        lock = threading.Lock()
+
+        def _call(host):
+            with lock:
+                running[host] += 1
+                max_running[host] = max(max_running[host], running[host])
+            time.sleep(0.05)
+            with lock:
+                running[host] -= 1
+
+        async def _main():
+            await asyncio.gather(*(host.arun(_call, host) for host in hosts for _ in range(6)))
+
+        start = time.monotonic()
+        asyncio.run(_main())
+
+        assert set(max_running.values()) == {2}
+        assert time.monotonic() - start < 6 * 0.05
+
+    def test_cancelled_call_holds_semaphore_until_return(self, host):
+        release = threading.Event()
+        order = []
+
+        async def _main():
+            hanging = asyncio.create_task(host.arun(lambda: release.wait(5) and order.append("hanging")))
+            await asyncio.sleep(0.05)
+            hanging.cancel()
+            waiting = asyncio.create_task(host.arun(order.append, "next"))
+            await asyncio.sleep(0.05)
+            assert not waiting.done()
+            release.set()
+            await waiting
+
+        asyncio.run(_main())
+
+        assert order == ["hanging", "next"]
+
+    def test_semaphore_per_event_loop(self, host):
+        assert asyncio.run(host.arun(lambda: 1)) == 1
+        assert asyncio.run(host.arun(lambda: 2)) == 2
+
+    def test_call_without_host(self):
+        assert asyncio.run(call_async(None, sum, [1, 2])) == 3
+
+    def test_arefresh_network_interfaces(self, host, mocker):
+        mocker.patch(
+            "mfd_network_adapter.network_adapter_owner.linux.LinuxNetworkAdapterOwner._get_all_interfaces_info",
+            return_value=[LinuxInterfaceInfo(name="eth0")],
+        )
+
+        change_set = asyncio.run(host.arefresh_network_interfaces())
+
+        assert [interface.name for interface in change_set.added] == ["eth0"]
+        assert host.network_interfaces == change_set.added
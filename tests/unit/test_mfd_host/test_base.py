@@ -15,6 +15,7 @@ from mfd_model.config import HostModel, NetworkInterfaceModelBase as NetworkInte
 
 
 from mfd_host import Host
+from mfd_host.data_structures import InterfaceEvent, InterfaceEventType
 from mfd_host.esxi import ESXiHost
 from mfd_host.exceptions import HostConnectedOSNotSupported
 from mfd_host.freebsd import FreeBSDHost
@@ -114,8 +115,12 @@ class TestHostCreation:
             "mfd_network_adapter.network_adapter_owner.linux.LinuxNetworkAdapterOwner._get_all_interfaces_info",
             return_value=interfaces_info,
         )
-        host.refresh_network_interfaces()
+        change_set = host.refresh_network_interfaces()
         assert len(host.network_interfaces) == 3
+        assert change_set.added == host.network_interfaces
+
+        change_set = host.refresh_network_interfaces()
+        assert not change_set
 
     def test_refresh_interfaces_with_topology_with_interfaces(self, host, mocker):
         interfaces_info = [
@@ -239,6 +244,119 @@ class TestHostCreation:
         assert last_interface_id == last_interface_id_after_refresh
         assert len(host.network_interfaces) == 4
 
+    def test_refresh_interfaces_partial(self, host, mocker):
+        interfaces_info = [
+            LinuxInterfaceInfo(name="eth0", pci_address=PCIAddress(data="0000:5e:00.0")),
+            LinuxInterfaceInfo(name="eth1", namespace="foo"),
+            LinuxInterfaceInfo(name="vf_1", interface_type=InterfaceType.VF),
+        ]
+        get_all_interfaces_info = mocker.patch(
+            "mfd_network_adapter.network_adapter_owner.linux.LinuxNetworkAdapterOwner._get_all_interfaces_info",
+            return_value=interfaces_info,
+        )
+        mocker.patch.object(host, "_get_scoped_interfaces_info", return_value=None)
+        host.refresh_network_interfaces()
+        eth0, eth1, vf_1 = host.network_interfaces
+
+        get_all_interfaces_info.return_value = [
+            LinuxInterfaceInfo(name="eth0", pci_address=PCIAddress(data="0000:5e:00.0"), namespace="bar"),
+            LinuxInterfaceInfo(name="eth1", namespace="bar"),
+            LinuxInterfaceInfo(name="vf_2", interface_type=InterfaceType.VF),
+            LinuxInterfaceInfo(name="vf_3", interface_type=InterfaceType.VF),
+            LinuxInterfaceInfo(name="eth2"),
+        ]
+        change_set = host.refresh_network_interfaces(interface_types=[InterfaceType.VF])
+        assert change_set.removed == [vf_1]
+        assert [x.name for x in change_set.added] == ["vf_2", "vf_3"]
+        assert not change_set.updated
+        assert [x.name for x in host.network_interfaces] == ["eth0", "eth1", "vf_2", "vf_3"]
+        assert eth1.namespace == "foo"
+
+        change_set = host.refresh_network_interfaces(
+            pci_addresses=[PCIAddress(data="0000:5e:00.0")], interface_names=["eth2"]
+        )
+        assert change_set.updated == [eth0]
+        assert [x.name for x in change_set.added] == ["eth2"]
+        assert eth0.namespace == "bar"
+        assert eth1.namespace == "foo"
+        assert host.network_interfaces[:2] == [eth0, eth1]
+
+    def test_refresh_interfaces_partial_with_topology(self, host, mocker):
+        mocker.patch(
+            "mfd_network_adapter.network_adapter_owner.linux.LinuxNetworkAdapterOwner._get_all_interfaces_info",
+            return_value=[
+                LinuxInterfaceInfo(name="eth0"),
+                LinuxInterfaceInfo(name="eth1"),
+                LinuxInterfaceInfo(name="vf_1", interface_type=InterfaceType.VF),
+            ],
+        )
+        host.topology.network_interfaces = [NetworkInterfaceModel(interface_name="eth0", instantiate=True)]
+        host.refresh_network_interfaces(extended=[InterfaceType.VF], interface_types=[InterfaceType.VF])
+        assert [x.name for x in host.network_interfaces] == ["vf_1"]
+
+        host.refresh_network_interfaces()
+        assert [x.name for x in host.network_interfaces] == ["eth0"]
+
+    def test_refresh_interfaces_events(self, host, mocker):
+        get_all_interfaces_info = mocker.patch(
+            "mfd_network_adapter.network_adapter_owner.linux.LinuxNetworkAdapterOwner._get_all_interfaces_info",
+            return_value=[LinuxInterfaceInfo(name="eth0"), LinuxInterfaceInfo(name="eth1")],
+        )
+        all_events = []
+        removed_events = []
+        host.subscribe_interface_events(all_events.append)
+        host.subscribe_interface_events(removed_events.append, event_types=[InterfaceEventType.REMOVED])
+
+        host.refresh_network_interfaces()
+        eth0, eth1 = host.network_interfaces
+        assert all_events == [
+            InterfaceEvent(InterfaceEventType.ADDED, eth0),
+            InterfaceEvent(InterfaceEventType.ADDED, eth1),
+        ]
+        assert not removed_events
+
+        all_events.clear()
+        host.refresh_network_interfaces()
+        assert not all_events
+
+        get_all_interfaces_info.return_value = [LinuxInterfaceInfo(name="eth0", namespace="foo")]
+        host.refresh_network_interfaces()
+        assert all_events == [
+            InterfaceEvent(InterfaceEventType.REMOVED, eth1),
+            InterfaceEvent(InterfaceEventType.UPDATED, eth0),
+        ]
+        assert removed_events == [InterfaceEvent(InterfaceEventType.REMOVED, eth1)]
+
+        all_events.clear()
+        host.unsubscribe_interface_events(all_events.append)
+        get_all_interfaces_info.return_value = []
+        host.refresh_network_interfaces()
+        assert not all_events
+        assert removed_events[-1] == InterfaceEvent(InterfaceEventType.REMOVED, eth0)
+
+    def test_refresh_interfaces_events_failing_subscriber(self, host, mocker):
+        mocker.patch(
+            "mfd_network_adapter.network_adapter_owner.linux.LinuxNetworkAdapterOwner._get_all_interfaces_info",
+            return_value=[LinuxInterfaceInfo(name="eth0")],
+        )
+        events = []
+        host.subscribe_interface_events(mocker.Mock(side_effect=RuntimeError))
+        host.subscribe_interface_events(events.append)
+        host.refresh_network_interfaces()
+        assert len(events) == 1
+
+    def test__get_refresh_scope(self):
+        assert Host._get_refresh_scope() is None
+        scope = Host._get_refresh_scope(
+            interface_types=[InterfaceType.VF],
+            pci_addresses=[PCIAddress(data="0000:5e:00.0")],
+            interface_names=["eth1"],
+        )
+        assert scope(LinuxInterfaceInfo(name="eth0", interface_type=InterfaceType.VF))
+        assert scope(LinuxInterfaceInfo(name="eth0", pci_address=PCIAddress(data="0000:5e:00.0")))
+        assert scope(LinuxInterfaceInfo(name="eth1"))
+        assert not scope(LinuxInterfaceInfo(name="eth0", pci_address=PCIAddress(data="0000:5e:00.1")))
+
     def test__get_filtered_interface_info_by_topology(self, host):
         model = NetworkInterfaceModel(interface_name="eth0", instantiate=True)
         host.topology.network_interfaces = [model]
@@ -253,7 +371,7 @@ class TestHostCreation:
             == filtered_info
         )
 
-    def test__update_interfaces(self, host):
+    def test__reconcile_interfaces(self, host):
         interface_info = LinuxInterfaceInfo(name="eth0", namespace="foo")
         updated_namespace = "bar"
         updated_interface_info = LinuxInterfaceInfo(name="eth0", namespace=updated_namespace)
@@ -261,14 +379,49 @@ class TestHostCreation:
         interfaces_info = [(x, None) for x in interfaces_info]
 
         interface = NetworkInterface(connection=host.connection, interface_info=interface_info, topology=None)
-        interfaces = [interface]
+        removed_interface = NetworkInterface(
+            connection=host.connection, interface_info=LinuxInterfaceInfo(name="eth3"), topology=None
+        )
+        interfaces = [interface, removed_interface]
 
-        host._update_interfaces(interfaces=interfaces, interfaces_info=interfaces_info)
+        change_set = host._reconcile_interfaces(interfaces=interfaces, interfaces_info=interfaces_info)
         assert interface.namespace == updated_namespace
-        assert interface.visited
-        assert updated_interface_info.visited
-        assert not getattr(interfaces_info[1], "visited", False)
-        assert not getattr(interfaces_info[2], "visited", False)
+        assert interfaces[0] is interface
+        assert [x.name for x in interfaces] == ["eth0", "eth1", "eth2"]
+        assert change_set.updated == [interface]
+        assert change_set.removed == [removed_interface]
+        assert change_set.added == interfaces[1:]
+        assert not hasattr(interface, "visited")
+        assert not hasattr(updated_interface_info, "visited")
+
+    def test__reconcile_interfaces_no_changes(self, host):
+        interfaces_info = [(LinuxInterfaceInfo(name="eth0"), None), (LinuxInterfaceInfo(name="eth1"), None)]
+        interfaces = []
+        host._reconcile_interfaces(interfaces=interfaces, interfaces_info=interfaces_info)
+        ids = [id(x) for x in interfaces]
+
+        change_set = host._reconcile_interfaces(
+            interfaces=interfaces, interfaces_info=[(LinuxInterfaceInfo(name="eth0"), None)] + interfaces_info
+        )
+        assert not change_set
+        assert [id(x) for x in interfaces] == ids
+
+    def test__reconcile_interfaces_key_includes_type_and_pci_address(self, host):
+        pci_address = PCIAddress(data="0000:5e:00.1")
+        interfaces = [
+            NetworkInterface(
+                connection=host.connection, interface_info=LinuxInterfaceInfo(name="eth0", pci_address=pci_address)
+            )
+        ]
+        interfaces_info = [
+            (LinuxInterfaceInfo(name="eth0", pci_address=PCIAddress(data="0000:5e:00.0")), None),
+            (LinuxInterfaceInfo(name="eth0", pci_address=pci_address, interface_type=InterfaceType.VF), None),
+        ]
+
+        change_set = host._reconcile_interfaces(interfaces=interfaces, interfaces_info=interfaces_info)
+        assert len(change_set.removed) == 1
+        assert len(change_set.added) == 2
+        assert interfaces == change_set.added
 
     def test__add_interfaces_empty_list(self, host):
         interfaces_info = [
@@ -293,34 +446,15 @@ class TestHostCreation:
         assert all(isinstance(x, NetworkInterface) for x in interfaces)  # ensure all objects are NetworkIntefaces
         assert all(x._connection == host.connection for x in interfaces)  # ensure all objects share same connection
 
-    def test__remove_unvisited_interfaces_and_cleanup(self, host):
-        nic_1 = NetworkInterface(connection=host.connection, interface_info=LinuxInterfaceInfo(name="eth0"))
-        nic_2 = NetworkInterface(connection=host.connection, interface_info=LinuxInterfaceInfo(name="eth1"))
-        nic_3 = NetworkInterface(connection=host.connection, interface_info=LinuxInterfaceInfo(name="eth2"))
-
-        nic_1.visited = True
-        nic_2.visited = False
-        nic_3.visited = False
-        interfaces = [nic_1, nic_2, nic_3]
-        host._remove_unvisited_interfaces_and_cleanup(interfaces=interfaces)
-        assert len(interfaces) == 1
-        assert not getattr(nic_1, "visited", False)
-
-    def test__add_visited_flag_to_objects(self, host):
-        class A: ...
-
-        objects = [A(), A(), A()]
-
-        host._add_visited_flag_to_objects(objects=objects)
-        assert all(not x.visited for x in objects)  # ensure 'visited' is added and set to False
-
     def test__create_virtualization_object_not_supported_os(self, host):
         host.connection.get_os_name.return_value = OSName.MELLANOX
+        host.fingerprint.invalidate()
         with pytest.raises(HostConnectedOSNotSupported):
             host._create_virtualization_object()
 
     def test__create_virtualization_object_esxi_os(self, host, mocker):
         host.connection.get_os_name.return_value = OSName.ESXI
+        host.fingerprint.invalidate()
         mocked_esxi = mocker.MagicMock()
         sys.modules["mfd_esxi.host"] = mocked_esxi
         host._create_virtualization_object()
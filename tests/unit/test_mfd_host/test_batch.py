@@ -0,0 +1,173 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Tests for `mfd_host.batch` module."""
+
+import re
+import subprocess
+import threading
+
+import pytest
+from mfd_connect import RPyCConnection
+from mfd_connect.base import ConnectionCompletedProcess
+from mfd_connect.exceptions import ConnectionCalledProcessError
+from mfd_typing import OSName
+
+from mfd_host import Host
+from mfd_host.batch import CommandBatch
+from mfd_host.exceptions import CommandBatchException, UtilsFeatureExecutionError
+
+
+def _execute_locally(command, **kwargs):
+    """Execute command in local shell, as connection would do on the host."""
+    completed = subprocess.run(command, shell=True, capture_output=True, text=True, executable="/bin/sh")
+    return ConnectionCompletedProcess(
+        args=command, stdout=completed.stdout, stderr=completed.stderr, return_code=completed.returncode
+    )
+
+
+class TestCommandBatch:
+    @pytest.fixture
+    def connection(self, mocker):
+        connection = mocker.create_autospec(RPyCConnection)
+        connection.get_os_name.return_value = OSName.LINUX
+        connection.execute_command.side_effect = _execute_locally
+        return connection
+
+    def test_results_delivered_to_commands(self, connection):
+        batch = CommandBatch(connection, OSName.LINUX)
+        lines = batch.add("echo first; echo second")
+        no_newline = batch.add("printf 'no newline'")
+        stderr = batch.add("echo error >&2; false", expected_return_codes=None)
+        empty = batch.add("true")
+
+        assert len(batch) == 4
+        batch.execute()
+
+        connection.execute_command.assert_called_once()
+        assert lines.stdout == "first\nsecond\n"
+        assert no_newline.stdout == "no newline"
+        assert (stderr.result.stdout, stderr.result.stderr, stderr.result.return_code) == ("", "error\n", 1)
+        assert (empty.result.stdout, empty.result.return_code) == ("", 0)
+        assert len(batch) == 0
+
+    def test_failed_command_raises_after_all_executed(self, connection):
+        batch = CommandBatch(connection, OSName.LINUX)
+        failed = batch.add("exit_with() { return $1; }; exit_with 3", custom_exception=UtilsFeatureExecutionError)
+        next_command = batch.add("echo executed")
+
+        with pytest.raises(UtilsFeatureExecutionError) as exception_info:
+            batch.execute()
+
+        assert exception_info.value.returncode == 3
+        assert failed.result.return_code == 3
+        assert next_command.stdout == "executed\n"
+
+    def test_failed_command_default_exception(self, connection):
+        batch = CommandBatch(connection, OSName.LINUX)
+        batch.add("false")
+        batch.add("true")
+
+        with pytest.raises(ConnectionCalledProcessError):
+            batch.execute()
+
+    def test_single_command_executed_directly(self, connection):
+        batch = CommandBatch(connection, OSName.LINUX)
+        command = batch.add("echo single")
+
+        batch.execute()
+
+        connection.execute_command.assert_called_once_with("echo single", shell=True, expected_return_codes=None)
+        assert command.stdout == "single\n"
+
+    def test_result_not_available_before_execution(self, connection):
+        command = CommandBatch(connection, OSName.LINUX).add("true")
+
+        assert not command.done
+        with pytest.raises(CommandBatchException):
+            command.stdout
+
+    def test_missing_output(self, connection):
+        connection.execute_command.side_effect = None
+        connection.execute_command.return_value = ConnectionCompletedProcess(args="", stdout="", return_code=1)
+        batch = CommandBatch(connection, OSName.LINUX)
+        batch.add("true")
+        batch.add("true")
+
+        with pytest.raises(CommandBatchException, match="Output of batched commands is missing"):
+            batch.execute()
+
+    def test_powershell_script(self, connection):
+        def _execute_powershell(script, **kwargs):
+            markers = re.findall(r"'(__mfd_host_batch_\w+:\d+):out'", script)
+            stdout = f"{markers[0]}:out\r\nvalue\r\n\r\n{markers[0]}:rc:0\r\n\r\n{markers[0]}:end\r\n".replace("\r", "")
+            stdout += f"{markers[1]}:out\n\n{markers[1]}:rc:1\nnot found\n\n{markers[1]}:end\n"
+            return ConnectionCompletedProcess(args=script, stdout=stdout, return_code=0)
+
+        connection.execute_powershell.side_effect = _execute_powershell
+        batch = CommandBatch(connection, OSName.WINDOWS)
+        value = batch.add("Get-Item value")
+        missing = batch.add("Get-Item missing", expected_return_codes=None)
+
+        batch.execute()
+
+        connection.execute_command.assert_not_called()
+        assert value.stdout == "value\n"
+        assert (missing.result.return_code, missing.result.stderr) == (1, "not found\n")
+
+
+class TestHostBatch:
+    @pytest.fixture
+    def host(self, mocker):
+        connection = mocker.create_autospec(RPyCConnection)
+        connection.get_os_name.return_value = OSName.LINUX
+        connection.execute_command.side_effect = _execute_locally
+        yield Host(connection=connection)
+        mocker.stopall()
+
+    def test_commands_of_feature_calls_executed_on_exit(self, host):
+        with host.batch() as batch:
+            queued = host.utils._execute_commands(["echo one", "echo two"])
+            date = batch.add("echo three")
+            assert not any(command.done for command in queued + [date])
+            host.connection.execute_command.assert_not_called()
+
+        host.connection.execute_command.assert_called_once()
+        assert [command.stdout for command in queued + [date]] == ["one\n", "two\n", "three\n"]
+        assert host.active_batch is None
+
+    def test_not_deferred_commands_executed_immediately(self, host):
+        with host.batch() as batch:
+            command, *_ = host.stats._execute_commands(["echo now"], defer=False)
+            assert command.stdout == "now\n"
+            assert len(batch) == 0
+
+    def test_nested_batch_shares_outer(self, host):
+        with host.batch() as outer:
+            with host.batch() as inner:
+                inner.add("echo inner")
+            host.connection.execute_command.assert_not_called()
+            outer.add("echo outer")
+
+        assert inner is outer
+        host.connection.execute_command.assert_called_once()
+
+    def test_commands_dropped_on_exception(self, host):
+        with pytest.raises(RuntimeError):
+            with host.batch() as batch:
+                command = batch.add("echo dropped")
+                raise RuntimeError
+
+        host.connection.execute_command.assert_not_called()
+        assert not command.done
+        assert host.active_batch is None
+
+    def test_batch_is_thread_local(self, host):
+        other_thread_batch = []
+
+        with host.batch():
+            thread = threading.Thread(target=lambda: other_thread_batch.append(host.active_batch))
+            thread.start()
+            thread.join()
+            assert host.active_batch is not None
+
+        assert other_thread_batch == [None]
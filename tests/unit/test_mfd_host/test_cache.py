@@ -0,0 +1,139 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Tests for `mfd_host.cache` module."""
+
+import pytest
+from mfd_connect import RPyCConnection
+from mfd_network_adapter.network_adapter_owner.linux import LinuxNetworkAdapterOwner
+from mfd_network_adapter.network_adapter_owner.feature.vlan.linux import LinuxVLAN
+from mfd_package_manager import LinuxPackageManager
+from mfd_typing import OSName, PCIAddress
+from mfd_typing.network_interface import LinuxInterfaceInfo, InterfaceType
+
+from mfd_host import Host
+from mfd_host.cache import InterfaceInfoCache
+
+
+class TestInterfaceInfoCache:
+    @pytest.fixture
+    def fetch(self, mocker):
+        return mocker.Mock(side_effect=lambda: [LinuxInterfaceInfo(name="eth0")])
+
+    def test_disabled_cache_always_fetches(self, fetch):
+        cache = InterfaceInfoCache(fetch=fetch)
+
+        assert not cache.enabled
+        cache.get()
+        cache.get()
+
+        assert fetch.call_count == 2
+        assert (cache.hits, cache.misses) == (0, 2)
+
+    def test_cache_hit_within_ttl(self, fetch):
+        cache = InterfaceInfoCache(fetch=fetch, ttl=60)
+
+        first = cache.get()
+        second = cache.get()
+
+        assert fetch.call_count == 1
+        assert first == second
+        assert first is not second
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_cache_expires_after_ttl(self, fetch, mocker):
+        monotonic = mocker.patch("mfd_host.cache.monotonic", return_value=100.0)
+        cache = InterfaceInfoCache(fetch=fetch, ttl=5)
+
+        assert not cache.valid
+        cache.get()
+        monotonic.return_value = 104.9
+        assert cache.valid
+        cache.get()
+        monotonic.return_value = 105.0
+        assert not cache.valid
+        cache.get()
+
+        assert fetch.call_count == 2
+        assert (cache.hits, cache.misses) == (1, 2)
+
+    def test_invalidate(self, fetch):
+        cache = InterfaceInfoCache(fetch=fetch, ttl=60)
+
+        cache.get()
+        cache.invalidate()
+        cache.get()
+
+        assert fetch.call_count == 2
+        cache.reset_counters()
+        assert (cache.hits, cache.misses) == (0, 0)
+
+
+class TestHostInterfaceInfoCache:
+    @pytest.fixture
+    def host(self, mocker):
+        connection = mocker.create_autospec(RPyCConnection)
+        connection.get_os_name.return_value = OSName.LINUX
+        mocker.patch(
+            "mfd_network_adapter.network_adapter_owner.linux.LinuxNetworkAdapterOwner._get_all_interfaces_info",
+            return_value=[
+                LinuxInterfaceInfo(name="eth0", pci_address=PCIAddress(0, 0, 1, 0), interface_type=InterfaceType.PF),
+                LinuxInterfaceInfo(name="eth1", pci_address=PCIAddress(0, 0, 2, 0), interface_type=InterfaceType.PF),
+            ],
+        )
+        yield Host(connection=connection, interface_info_cache_ttl=60)
+        mocker.stopall()
+
+    def test_cache_disabled_by_default(self, mocker):
+        connection = mocker.create_autospec(RPyCConnection)
+        connection.get_os_name.return_value = OSName.LINUX
+
+        assert not Host(connection=connection).interface_info_cache.enabled
+
+    def test_cache_shared_by_refresh_and_get_interface_by_ip(self, host):
+        host.refresh_network_interfaces()
+        host.refresh_network_interfaces()
+        interfaces = host._get_all_network_interfaces()
+
+        assert [interface.name for interface in interfaces] == ["eth0", "eth1"]
+        assert LinuxNetworkAdapterOwner._get_all_interfaces_info.call_count == 1
+        assert (host.interface_info_cache.hits, host.interface_info_cache.misses) == (2, 1)
+
+    def test_cache_invalidated_by_mutating_operations(self, host, mocker):
+        mocker.patch.object(LinuxNetworkAdapterOwner, "create_vfs")
+        mocker.patch.object(LinuxVLAN, "create_vlan")
+
+        host.refresh_network_interfaces()
+        host.network.create_vfs(interface_name="eth0", vfs_count=4)
+        host.refresh_network_interfaces()
+        host.network.vlan.create_vlan(vlan_id=10, interface_name="eth0")
+        host.refresh_network_interfaces()
+
+        LinuxNetworkAdapterOwner.create_vfs.assert_called_once_with(host.network, interface_name="eth0", vfs_count=4)
+        LinuxVLAN.create_vlan.assert_called_once_with(host.network.vlan, vlan_id=10, interface_name="eth0")
+        assert LinuxNetworkAdapterOwner._get_all_interfaces_info.call_count == 3
+
+    def test_cache_invalidated_by_driver_operations(self, host, mocker):
+        mocker.patch.object(LinuxPackageManager, "unload_module")
+        mocker.patch.object(LinuxPackageManager, "load_module")
+
+        host.refresh_network_interfaces()
+        host.driver.unload_module(module_name="ice")
+        host.refresh_network_interfaces()
+        host.driver.load_module(module_name="ice")
+        host.refresh_network_interfaces()
+        host.driver.is_module_loaded = mocker.Mock(return_value=True)
+        host.driver.is_module_loaded(module_name="ice")
+        host.refresh_network_interfaces()
+
+        LinuxPackageManager.load_module.assert_called_with(host.driver, module_name="ice")
+        assert LinuxNetworkAdapterOwner._get_all_interfaces_info.call_count == 3
+
+    def test_cache_invalidated_when_mutating_operation_fails(self, host, mocker):
+        mocker.patch.object(LinuxNetworkAdapterOwner, "reload_driver_module", side_effect=RuntimeError)
+
+        host.refresh_network_interfaces()
+        with pytest.raises(RuntimeError):
+            host.network.reload_driver_module(module_name="ice")
+        host.refresh_network_interfaces()
+
+        assert LinuxNetworkAdapterOwner._get_all_interfaces_info.call_count == 2
@@ -0,0 +1,257 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Tests for `mfd_host.cassette` module."""
+
+import gzip
+import json
+import time
+
+import pytest
+from mfd_connect import RPyCConnection
+from mfd_connect.base import ConnectionCompletedProcess
+from mfd_connect.exceptions import ConnectionCalledProcessError
+from mfd_connect.process import RemoteProcess
+from mfd_typing import OSBitness, OSName, OSType
+
+from mfd_host import Host
+from mfd_host.cassette import Cassette, CassetteInteraction, ReplayConnection, recording
+from mfd_host.exceptions import CassetteException, UtilsFeatureExecutionError
+from mfd_host.feature.stats.sampling import SAMPLE_MARKER
+
+MEMINFO = "MemTotal:       16318668 kB\nMemFree:         1290716 kB\n"
+
+
+def _interaction(command="nproc", stdout="8\n", return_code=0, duration=0.01, method="execute_command"):
+    return CassetteInteraction(
+        method=method, command=command, stdout=stdout, stderr="", return_code=return_code, duration=duration
+    )
+
+
+class TestRecording:
+    @pytest.fixture
+    def connection(self, mocker):
+        connection = mocker.create_autospec(RPyCConnection)
+        connection.get_os_name.return_value = OSName.LINUX
+        connection.ip = "10.10.10.10"
+        return connection
+
+    def test_record_and_replay_host_flow(self, connection, tmp_path):
+        connection.execute_command.return_value = ConnectionCompletedProcess(args="", stdout=MEMINFO, return_code=0)
+        with recording(connection) as cassette:
+            host = Host(connection=connection)
+            recorded = host.stats.get_meminfo(), host.stats.get_mem_used()
+        cassette.save(tmp_path / "meminfo.json.gz")
+
+        replay = ReplayConnection(tmp_path / "meminfo.json.gz")
+        replayed_host = Host(connection=replay)
+
+        assert (replayed_host.stats.get_meminfo(), replayed_host.stats.get_mem_used()) == recorded
+        assert type(replayed_host).__name__ == "LinuxHost"
+        assert replay.ip == "10.10.10.10"
+        assert replay.executions == 2
+
+    def test_record_existing_host(self, connection):
+        connection.execute_command.return_value = ConnectionCompletedProcess(args="", stdout=MEMINFO, return_code=0)
+        host = Host(connection=connection)
+
+        with recording(connection) as cassette:
+            host.stats.get_meminfo()
+        host.stats.get_meminfo()
+
+        assert [interaction.command for interaction in cassette.interactions] == ["cat /proc/meminfo"]
+        assert cassette.system == {"get_os_name": OSName.LINUX}
+
+    def test_methods_restored(self):
+        class _Connection(RPyCConnection):
+            def execute_command(self, command, **kwargs):
+                return ConnectionCompletedProcess(args=command, stdout="8\n", return_code=0)
+
+            def get_os_name(self):
+                return OSName.LINUX
+
+        connection = _Connection.__new__(_Connection)
+
+        with recording(connection) as cassette:
+            assert "execute_command" in vars(connection)
+            connection.execute_command("nproc")
+
+        assert not {"execute_command", "execute_powershell", "get_os_name"} & set(vars(connection))
+        assert connection.execute_command("nproc").stdout == "8\n"
+        assert len(cassette) == 1
+
+    def test_failed_command_recorded(self, connection):
+        connection.execute_command.side_effect = ConnectionCalledProcessError(
+            returncode=2, cmd="cat /proc/missing", output="", stderr="No such file"
+        )
+
+        with recording(connection) as cassette:
+            with pytest.raises(ConnectionCalledProcessError):
+                connection.execute_command("cat /proc/missing", shell=True)
+
+        assert cassette.interactions[0].return_code == 2
+        assert cassette.interactions[0].stderr == "No such file"
+
+    def test_record_and_replay_sampling(self, connection, mocker, tmp_path):
+        lines = [
+            f"{SAMPLE_MARKER}\n==> /proc/uptime <==\n100.0 1000.00\n==> /proc/meminfo <==\nMemFree: 600 kB\n",
+            f"{SAMPLE_MARKER}\n==> /proc/uptime <==\n100.1 1000.00\n==> /proc/meminfo <==\nMemFree: 500 kB\n",
+        ]
+        connection.start_process.return_value = mocker.Mock(running=False, return_code=0, log_path=None)
+        connection.start_process.return_value.get_stdout_iter.return_value = iter("".join(lines).splitlines(True))
+        with recording(connection) as cassette:
+            host = Host(connection=connection)
+            host.stats.start_sampling(metrics=["memory"], interval=0.1)
+            recorded = host.stats.stop_sampling().series("memory.MemFree")
+        cassette.save(tmp_path / "sampling.json.gz")
+
+        replayed_host = Host(connection=ReplayConnection(tmp_path / "sampling.json.gz"))
+        replayed_host.stats.start_sampling(metrics=["memory"], interval=0.1)
+
+        assert replayed_host.stats.stop_sampling().series("memory.MemFree") == recorded
+        assert recorded.values == [600.0, 500.0]
+
+    def test_process_recorded_when_recording_ends(self, connection, mocker):
+        connection.start_process.return_value = mocker.Mock(running=True, log_path="/tmp/esxtop.csv")
+        connection.start_process.return_value.get_stdout_iter.return_value = iter(["1\n", "2\n"])
+
+        with recording(connection) as cassette:
+            next(connection.start_process("esxtop -b", log_file=True, shell=True).get_stdout_iter())
+
+        assert cassette.interactions == [
+            CassetteInteraction(
+                method="start_process",
+                command="esxtop -b",
+                stdout="1\n",
+                stderr="",
+                return_code=None,
+                duration=cassette.interactions[0].duration,
+                log_path="/tmp/esxtop.csv",
+            )
+        ]
+
+    def test_not_executed_command_not_recorded(self, connection):
+        connection.execute_command.side_effect = TimeoutError
+
+        with recording(connection) as cassette:
+            with pytest.raises(TimeoutError):
+                connection.execute_command("sleep 100")
+
+        assert len(cassette) == 0
+
+
+class TestCassette:
+    def test_process_saved(self, tmp_path):
+        process = CassetteInteraction(
+            method="start_process",
+            command="esxtop -b",
+            stdout="1\n",
+            stderr="",
+            return_code=None,
+            duration=1.0,
+            log_path="/tmp/esxtop.csv",
+        )
+        cassette = Cassette([_interaction(), process], system={"get_os_name": OSName.ESXI})
+
+        cassette.save(tmp_path / "cassette.json.gz")
+
+        assert Cassette.load(tmp_path / "cassette.json.gz").interactions == cassette.interactions
+
+    def test_distinct_outputs_saved_once(self, tmp_path):
+        cassette = Cassette(
+            [_interaction(stdout=MEMINFO * 100) for _ in range(50)],
+            system={"get_os_name": OSName.LINUX, "get_os_bitness": OSBitness.OS_64BIT},
+        )
+        path = tmp_path / "cassette.json.gz"
+
+        cassette.save(path)
+
+        with gzip.open(path, "rt") as file:
+            data = json.load(file)
+        assert data["outputs"] == [MEMINFO * 100, ""]
+        assert len(data["interactions"]) == 50
+        loaded = Cassette.load(path)
+        assert loaded.interactions == cassette.interactions
+        assert loaded.system == cassette.system
+
+    def test_not_a_cassette(self, tmp_path):
+        (tmp_path / "plain.json").write_text("{}")
+        with gzip.open(tmp_path / "other.json.gz", "wt") as file:
+            json.dump({"version": 0}, file)
+
+        with pytest.raises(CassetteException):
+            Cassette.load(tmp_path / "plain.json")
+        with pytest.raises(CassetteException):
+            Cassette.load(tmp_path / "other.json.gz")
+
+
+class TestReplayConnection:
+    def test_executions_served_in_order_and_repeated(self):
+        replay = ReplayConnection(
+            Cassette([_interaction(stdout="1\n"), _interaction(stdout="2\n")], system={"get_os_name": OSName.LINUX})
+        )
+
+        assert [replay.execute_command("nproc").stdout for _ in range(3)] == ["1\n", "2\n", "1\n"]
+
+    def test_matched_by_method(self):
+        replay = ReplayConnection(
+            Cassette([_interaction(method="execute_powershell", stdout="8\n")], system={"get_os_name": OSName.WINDOWS})
+        )
+
+        assert replay.execute_powershell("nproc", expected_return_codes={0}).stdout == "8\n"
+        with pytest.raises(CassetteException, match="not recorded"):
+            replay.execute_command("nproc")
+
+    def test_return_code_checked(self):
+        replay = ReplayConnection(Cassette([_interaction(return_code=1)], system={"get_os_name": OSName.LINUX}))
+
+        assert replay.execute_command("nproc", expected_return_codes=None).return_code == 1
+        with pytest.raises(ConnectionCalledProcessError):
+            replay.execute_command("nproc")
+        with pytest.raises(UtilsFeatureExecutionError):
+            replay.execute_command("nproc", custom_exception=UtilsFeatureExecutionError)
+
+    def test_simulated_latency(self):
+        cassette = Cassette([_interaction(duration=0.05)], system={"get_os_name": OSName.LINUX})
+
+        start = time.perf_counter()
+        ReplayConnection(cassette).execute_command("nproc")
+        ReplayConnection(cassette, latency=0.02, recorded_latency=1).execute_command("nproc")
+
+        assert 0.07 <= time.perf_counter() - start < 0.5
+
+    def test_process_served_finished(self):
+        process = CassetteInteraction(
+            method="start_process",
+            command="esxtop -b",
+            stdout="1\n2\n",
+            stderr="",
+            return_code=0,
+            duration=1.0,
+            log_path="/tmp/esxtop.csv",
+        )
+        replay = ReplayConnection(Cassette([process], system={"get_os_name": OSName.ESXI}))
+
+        replayed = replay.start_process("esxtop -b", log_file=True, shell=True)
+
+        assert isinstance(replayed, RemoteProcess)
+        assert not replayed.running
+        assert list(replayed.get_stdout_iter()) == ["1\n", "2\n"]
+        assert (replayed.stdout_text, replayed.return_code, replayed.log_path) == ("1\n2\n", 0, "/tmp/esxtop.csv")
+        replayed.stop()
+        with pytest.raises(CassetteException, match="not recorded"):
+            replay.start_process("esxtop -a")
+
+    def test_os_name_required(self):
+        with pytest.raises(CassetteException):
+            ReplayConnection(Cassette([_interaction()]))
+
+    def test_system_details(self):
+        replay = ReplayConnection(Cassette(system={"get_os_name": OSName.WINDOWS}))
+
+        assert replay.get_os_type() is OSType.WINDOWS
+        with pytest.raises(CassetteException):
+            replay.get_os_bitness()
+        with pytest.raises(CassetteException):
+            replay.path
+        with pytest.raises(CassetteException):
+            replay.restart_platform()
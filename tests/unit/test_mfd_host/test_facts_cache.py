@@ -0,0 +1,209 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Tests for `mfd_host.facts_cache` module."""
+
+import json
+
+import pytest
+from mfd_connect import RPyCConnection
+from mfd_connect.base import ConnectionCompletedProcess
+from mfd_typing import OSName
+
+from mfd_host import Host
+from mfd_host.facts_cache import FACTS_CACHE_DIR_VARIABLE, HostFactsCache
+from mfd_host.fingerprint import FINGERPRINT_COMMANDS
+
+LINUX_FINGERPRINT = 'kernel=5.15.0-88-generic\nboot_id={boot_id}\ncpu_count=448\nPRETTY_NAME="Ubuntu 22.04.3 LTS"\n'
+ESXI_FINGERPRINT = "kernel=8.0.2\ncpu_count=112\npretty_name=VMware ESXi {build}\n"
+DMIDECODE_COMMAND = "dmidecode -t memory |grep 'Number Of Devices'"
+
+
+class TestHostFactsCache:
+    @pytest.fixture
+    def outputs(self):
+        return {
+            FINGERPRINT_COMMANDS[OSName.LINUX]: LINUX_FINGERPRINT.format(boot_id="boot-1"),
+            "cat /proc/sys/kernel/random/boot_id": "boot-1\n",
+            DMIDECODE_COMMAND: "Number Of Devices: 16\n",
+            "esxcli hardware memory get": "Physical Memory: 549755813888 Bytes\n",
+        }
+
+    @pytest.fixture
+    def executed(self):
+        return []
+
+    @pytest.fixture
+    def make_connection(self, mocker, outputs, executed):
+        def _make_connection(os_name=OSName.LINUX):
+            connection = mocker.create_autospec(RPyCConnection)
+            connection.get_os_name.return_value = os_name
+            connection.ip = "10.10.10.10"
+
+            def _execute_command(command, **kwargs):
+                executed.append(command)
+                return ConnectionCompletedProcess(args=command, stdout=outputs[command], return_code=0)
+
+            connection.execute_command.side_effect = _execute_command
+            return connection
+
+        return _make_connection
+
+    def test_disabled_by_default(self, make_connection, executed, monkeypatch):
+        monkeypatch.delenv(FACTS_CACHE_DIR_VARIABLE, raising=False)
+        host = Host(connection=make_connection())
+
+        assert host.facts_cache is None
+        assert host.memory.get_memory_channels() == host.memory.get_memory_channels() == 16
+        assert executed == [DMIDECODE_COMMAND, DMIDECODE_COMMAND]
+
+    def test_enabled_by_environment_variable(self, make_connection, monkeypatch, tmp_path):
+        monkeypatch.setenv(FACTS_CACHE_DIR_VARIABLE, str(tmp_path))
+
+        host = Host(connection=make_connection())
+
+        assert host.facts_cache.directory == tmp_path
+
+    def test_facts_persisted_between_sessions(self, make_connection, executed, tmp_path):
+        first_host = Host(connection=make_connection(), facts_cache_dir=tmp_path)
+        assert first_host.memory.get_memory_channels() == 16
+
+        executed.clear()
+        host = Host(connection=make_connection(), facts_cache_dir=tmp_path)
+
+        assert host.memory.get_memory_channels() == 16
+        assert executed == [FINGERPRINT_COMMANDS[OSName.LINUX]]
+        assert (host.facts_cache.hits, host.facts_cache.misses) == (1, 0)
+        data = json.loads((tmp_path / "10.10.10.10.json").read_text())
+        assert data["fingerprint"]["boot_id"] == "boot-1"
+        assert data["facts"] == {"LinuxMemory.get_memory_channels": 16}
+
+    def test_facts_dropped_after_reboot(self, make_connection, outputs, executed, tmp_path):
+        Host(connection=make_connection(), facts_cache_dir=tmp_path).memory.get_memory_channels()
+        outputs[FINGERPRINT_COMMANDS[OSName.LINUX]] = LINUX_FINGERPRINT.format(boot_id="boot-2")
+        outputs[DMIDECODE_COMMAND] = "Number Of Devices: 32\n"
+
+        executed.clear()
+        host = Host(connection=make_connection(), facts_cache_dir=tmp_path)
+
+        assert host.memory.get_memory_channels() == 32
+        assert DMIDECODE_COMMAND in executed
+        assert json.loads(host.facts_cache.path.read_text())["fingerprint"]["boot_id"] == "boot-2"
+
+    def test_facts_dropped_after_reboot_during_session(self, make_connection, outputs, executed, tmp_path):
+        host = Host(connection=make_connection(), facts_cache_dir=tmp_path)
+        host.memory.get_memory_channels()
+        outputs[FINGERPRINT_COMMANDS[OSName.LINUX]] = LINUX_FINGERPRINT.format(boot_id="boot-2")
+        outputs["cat /proc/sys/kernel/random/boot_id"] = "boot-2\n"
+
+        assert host.fingerprint.validate() is False
+        executed.clear()
+        host.memory.get_memory_channels()
+
+        assert executed == [FINGERPRINT_COMMANDS[OSName.LINUX], DMIDECODE_COMMAND]
+
+    def test_facts_dropped_after_reboot_noticed_by_validation_interval(
+        self, make_connection, outputs, executed, tmp_path, mocker
+    ):
+        monotonic = mocker.patch("mfd_host.fingerprint.monotonic", return_value=1000.0)
+        host = Host(connection=make_connection(), facts_cache_dir=tmp_path, fingerprint_validation_interval=30)
+        host.memory.get_memory_channels()
+        outputs[FINGERPRINT_COMMANDS[OSName.LINUX]] = LINUX_FINGERPRINT.format(boot_id="boot-2")
+        outputs["cat /proc/sys/kernel/random/boot_id"] = "boot-2\n"
+        outputs[DMIDECODE_COMMAND] = "Number Of Devices: 32\n"
+
+        executed.clear()
+        monotonic.return_value = 1029.0
+        assert host.memory.get_memory_channels() == 16
+        assert executed == []
+
+        monotonic.return_value = 1030.0
+        assert host.memory.get_memory_channels() == 32
+        assert executed == [
+            "cat /proc/sys/kernel/random/boot_id",
+            FINGERPRINT_COMMANDS[OSName.LINUX],
+            DMIDECODE_COMMAND,
+        ]
+        assert json.loads(host.facts_cache.path.read_text())["fingerprint"]["boot_id"] == "boot-2"
+
+    def test_esxi_facts_keyed_by_build(self, make_connection, outputs, executed, tmp_path):
+        outputs[FINGERPRINT_COMMANDS[OSName.ESXI]] = ESXI_FINGERPRINT.format(build="8.0.2 build-22380479")
+        assert Host(connection=make_connection(OSName.ESXI), facts_cache_dir=tmp_path).memory.ram == 549755813888
+
+        executed.clear()
+        assert Host(connection=make_connection(OSName.ESXI), facts_cache_dir=tmp_path).memory.ram == 549755813888
+        assert executed == [FINGERPRINT_COMMANDS[OSName.ESXI]]
+
+        outputs[FINGERPRINT_COMMANDS[OSName.ESXI]] = ESXI_FINGERPRINT.format(build="8.0.3 build-24022510")
+        executed.clear()
+        Host(connection=make_connection(OSName.ESXI), facts_cache_dir=tmp_path).memory.ram
+        assert "esxcli hardware memory get" in executed
+
+    def test_fingerprint_failed(self, make_connection, executed, tmp_path):
+        connection = make_connection()
+        execute_command = connection.execute_command.side_effect
+
+        def _execute_command(command, **kwargs):
+            if command == FINGERPRINT_COMMANDS[OSName.LINUX]:
+                raise kwargs["custom_exception"](returncode=1, cmd=command, output="", stderr="")
+            return execute_command(command, **kwargs)
+
+        connection.execute_command.side_effect = _execute_command
+        host = Host(connection=connection, facts_cache_dir=tmp_path)
+
+        assert host.memory.get_memory_channels() == host.memory.get_memory_channels() == 16
+        assert executed == [DMIDECODE_COMMAND, DMIDECODE_COMMAND]
+        assert not host.facts_cache.path.exists()
+
+    def test_invalidate(self, make_connection, executed, tmp_path):
+        host = Host(connection=make_connection(), facts_cache_dir=tmp_path)
+        host.memory.get_memory_channels()
+
+        host.facts_cache.invalidate()
+
+        assert not host.facts_cache.path.exists()
+        executed.clear()
+        host.memory.get_memory_channels()
+        assert executed == [DMIDECODE_COMMAND]
+
+    def test_facts_of_other_sessions_merged(self, make_connection, tmp_path):
+        first_cache = HostFactsCache(tmp_path, make_connection())
+        second_cache = HostFactsCache(tmp_path, make_connection())
+
+        first_cache.get("first", lambda: 1)
+        second_cache.get("second", lambda: [{"NumberOfCores": "56"}])
+        first_cache.get("third", lambda: "3")
+
+        assert json.loads(first_cache.path.read_text())["facts"] == {
+            "first": 1,
+            "second": [{"NumberOfCores": "56"}],
+            "third": "3",
+        }
+
+    def test_returned_fact_not_shared(self, make_connection, tmp_path):
+        cache = HostFactsCache(tmp_path, make_connection())
+        cache.get("core_info", lambda: [{"NumberOfCores": "56"}])
+
+        cache.get("core_info", lambda: None)[0]["NumberOfCores"] = "0"
+
+        assert cache.get("core_info", lambda: None) == [{"NumberOfCores": "56"}]
+
+    def test_corrupted_file_ignored(self, make_connection, tmp_path):
+        cache = HostFactsCache(tmp_path, make_connection())
+        cache.path.write_text("{not json")
+
+        assert cache.get("fact", lambda: 1) == 1
+        assert json.loads(cache.path.read_text())["facts"] == {"fact": 1}
+
+    def test_not_writable_directory(self, make_connection, tmp_path):
+        (tmp_path / "file").write_text("")
+        cache = HostFactsCache(tmp_path / "file" / "facts", make_connection())
+
+        assert cache.get("fact", lambda: 1) == 1
+        assert cache.get("fact", lambda: 2) == 1
+
+    def test_not_serializable_fact_served_in_session(self, make_connection, tmp_path):
+        cache = HostFactsCache(tmp_path, make_connection())
+
+        assert cache.get("fact", lambda: {1, 2}) == {1, 2}
+        assert cache.get("fact", lambda: None) == {1, 2}
+        assert not list(tmp_path.iterdir())
@@ -3,6 +3,7 @@
 
 import pytest
 from mfd_connect import SSHConnection
+from mfd_connect.base import ConnectionCompletedProcess
 from mfd_host import Host
 from mfd_sysctl import Sysctl
 from mfd_sysctl.freebsd import FreebsdSysctl
@@ -31,5 +32,23 @@ class TestFreeBSDCPU:
             "mfd_sysctl.freebsd.FreebsdSysctl.get_log_cpu_no",
             mocker.create_autospec(FreebsdSysctl.get_log_cpu_no, return_value=96),
         )
+        host.connection.execute_command.return_value = ConnectionCompletedProcess(
+            args="", stdout="kernel=14.1-RELEASE\n", return_code=0
+        )
+        assert host.cpu.get_log_cpu_no() == 96
+        sysctl = host.cpu._sysctl_freebsd
         assert host.cpu.get_log_cpu_no() == 96
         FreebsdSysctl.get_log_cpu_no.assert_called()
+        assert host.cpu._sysctl_freebsd is sysctl
+
+    def test_get_log_cpu_no_from_fingerprint(self, host, mocker):
+        mocker.patch(
+            "mfd_sysctl.freebsd.FreebsdSysctl.get_log_cpu_no",
+            mocker.create_autospec(FreebsdSysctl.get_log_cpu_no, return_value=96),
+        )
+        host.connection.execute_command.return_value = ConnectionCompletedProcess(
+            args="", stdout="kernel=14.1-RELEASE\ncpu_count=48\n", return_code=0
+        )
+        assert host.cpu.get_log_cpu_no() == 48
+        FreebsdSysctl.get_log_cpu_no.assert_not_called()
+        assert host.cpu._sysctl_freebsd is None
@@ -6,7 +6,8 @@ import pytest
 from mfd_connect import SSHConnection
 from mfd_connect.base import ConnectionCompletedProcess
 from mfd_host import Host
-from mfd_host.exceptions import CPUFeatureExecutionError, CPUFeatureException
+from mfd_host.exceptions import CPUFeatureExecutionError, CPUFeatureException, FingerprintExecutionError
+from mfd_host.fingerprint import FINGERPRINT_COMMANDS
 from mfd_typing import OSName
 
 
@@ -135,18 +136,38 @@ class TestLinuxCPU:
 
     def test_get_log_cpu_no(self, host):
         host.connection.execute_command.return_value = ConnectionCompletedProcess(
-            return_code=0, args="command", stdout="32\n", stderr=""
+            return_code=0, args="command", stdout="kernel=6.8.0\ncpu_count=32\n", stderr=""
         )
         assert host.cpu.get_log_cpu_no() == 32
-        host.connection.execute_command.assert_called_once_with("nproc", custom_exception=CPUFeatureExecutionError)
+        host.connection.execute_command.assert_called_once_with(
+            FINGERPRINT_COMMANDS[OSName.LINUX], shell=True, custom_exception=FingerprintExecutionError
+        )
+
+    def test_get_log_cpu_no_missing_in_fingerprint(self, host):
+        host.connection.execute_command.side_effect = [
+            ConnectionCompletedProcess(return_code=0, args="command", stdout="kernel=6.8.0\n", stderr=""),
+            ConnectionCompletedProcess(return_code=0, args="command", stdout="32\n", stderr=""),
+        ]
+        assert host.cpu.get_log_cpu_no() == 32
+        host.connection.execute_command.assert_called_with("nproc", custom_exception=CPUFeatureExecutionError)
+
+    def test_get_log_cpu_no_fingerprint_failed(self, host):
+        def _execute_command(command, custom_exception, **kwargs):
+            if command != "nproc":
+                raise custom_exception(returncode=1, cmd=command, output="", stderr="")
+            return ConnectionCompletedProcess(return_code=0, args=command, stdout="32\n", stderr="")
+
+        host.connection.execute_command.side_effect = _execute_command
+        assert host.cpu.get_log_cpu_no() == 32
 
     def test_get_log_cpu_no_fail(self, host):
-        host.connection.execute_command.return_value = ConnectionCompletedProcess(
-            return_code=0, args="command", stdout="output", stderr=""
-        )
+        host.connection.execute_command.side_effect = [
+            ConnectionCompletedProcess(return_code=0, args="command", stdout="kernel=6.8.0\n", stderr=""),
+            ConnectionCompletedProcess(return_code=0, args="command", stdout="output", stderr=""),
+        ]
         with pytest.raises(CPUFeatureException, match="Invalid number of logical CPU found: output"):
             assert host.cpu.get_log_cpu_no()
-        host.connection.execute_command.assert_called_once_with("nproc", custom_exception=CPUFeatureExecutionError)
+        host.connection.execute_command.assert_called_with("nproc", custom_exception=CPUFeatureExecutionError)
 
     def test_affinitize_queues_to_cpus(self, host):
         host.connection.execute_command.return_value = ConnectionCompletedProcess(
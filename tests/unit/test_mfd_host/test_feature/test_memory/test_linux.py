@@ -2,6 +2,8 @@
 # SPDX-License-Identifier: MIT
 """Module to Test Linux Memory."""
 
+import re
+
 import pytest
 
 from mfd_host import Host
@@ -15,6 +17,13 @@ from mfd_host.feature.memory.exceptions import InsufficientMemoryError, MountDis
 from mfd_typing.os_values import OSName
 
 
+def _get_batch_output(script, **kwargs):
+    """Get output of successful batch script, without outputs of commands."""
+    markers = re.findall(r"'(__mfd_host_batch_\w+:\d+):out'", script)
+    stdout = "".join(f"{marker}:out\n\n{marker}:rc:0\n\n{marker}:end\n" for marker in markers)
+    return ConnectionCompletedProcess(args=script, stdout=stdout, return_code=0)
+
+
 class TestLinuxMemory:
     @pytest.fixture
     def host(self, mocker):
@@ -71,10 +80,10 @@ class TestLinuxMemory:
 
     def test_set_huge_pages(self, host, mocker):
         command = "echo 2048 > /sys/kernel/mm/hugepages/hugepages-2048kB/nr_hugepages"
-        host.memory._connection.execute_command.return_value = None
+        host.memory._connection.execute_command.return_value = ConnectionCompletedProcess(args=command, return_code=0)
         mocker.patch.object(host.memory, "_mount", autospec=True)
         host.memory.set_huge_pages(page_size_in_memory=2048)
-        host.memory._connection.execute_command.assert_called_with(command=command, shell=True)
+        host.memory._connection.execute_command.assert_called_with(command, shell=True, expected_return_codes=None)
         host.memory._mount.is_mounted.assert_called_with(mount_point="/dev/hugepages")
 
     def test_set_huge_pages_mount_unsuccessful(self, host, mocker):
@@ -85,9 +94,13 @@ class TestLinuxMemory:
 
     def test_set_huge_pages_with_numa(self, host, mocker):
         mocker.patch.object(host.memory, "_mount", autospec=True)
-        host.memory._connection.execute_command.return_value = None
+        host.memory._connection.execute_command.side_effect = _get_batch_output
         host.memory.set_huge_pages(page_size_in_memory=2048, page_size_per_numa_node=(2048, 2))
-        assert host.memory._connection.execute_command.call_count == 3
+        host.memory._connection.execute_command.assert_called_once()
+        script = host.memory._connection.execute_command.call_args.args[0]
+        assert "echo 2048 > /sys/kernel/mm/hugepages/hugepages-2048kB/nr_hugepages" in script
+        for node in range(2):
+            assert f"echo 2048 > /sys/devices/system/node/node{node}/hugepages/hugepages-2048kB/nr_hugepages" in script
         host.memory._mount.is_mounted.assert_called_with(mount_point="/dev/hugepages")
 
     def test_get_memory_channels(self, host):
@@ -0,0 +1,65 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Tests for `mfd_host.feature.registry` module."""
+
+from importlib.metadata import EntryPoint
+
+import pytest
+from mfd_connect import RPyCConnection
+from mfd_typing import OSName
+
+from mfd_host import Host
+from mfd_host.feature import registry
+from mfd_host.feature.registry import FEATURE_REGISTRY, get_feature_class, register_feature
+from mfd_host.feature.utils.linux import LinuxUtils
+
+
+class CustomLinuxUtils(LinuxUtils):
+    pass
+
+
+class TestFeatureRegistry:
+    @pytest.fixture(autouse=True)
+    def clean_registry(self, mocker):
+        mocker.patch.object(registry, "_registry", None)
+        mocker.patch.object(registry, "_feature_classes", {})
+        mocker.patch.object(registry, "entry_points", return_value=[])
+
+    @pytest.fixture
+    def host(self, mocker):
+        connection = mocker.create_autospec(RPyCConnection)
+        connection.get_os_name.return_value = OSName.LINUX
+        yield Host(connection=connection)
+        mocker.stopall()
+
+    @pytest.mark.parametrize("key, target", FEATURE_REGISTRY.items())
+    def test_registry_targets_exist(self, key, target):
+        feature_class = get_feature_class(*key)
+
+        assert f"{feature_class.__module__}:{feature_class.__name__}" == target
+        assert feature_class._feature_name == key[0]
+
+    def test_not_registered_feature(self):
+        assert get_feature_class("device", OSName.LINUX) is None
+        assert get_feature_class("not_existing", OSName.LINUX) is None
+
+    def test_register_feature(self, host):
+        register_feature("utils", OSName.LINUX, f"{__name__}:CustomLinuxUtils")
+
+        assert type(host.utils) is CustomLinuxUtils
+
+    def test_entry_point_feature(self, host):
+        registry.entry_points.return_value = [
+            EntryPoint(name="utils.linux", value=f"{__name__}:CustomLinuxUtils", group="mfd_host.features"),
+            EntryPoint(name="utils.unknown_os", value=f"{__name__}:CustomLinuxUtils", group="mfd_host.features"),
+        ]
+
+        assert type(host.utils) is CustomLinuxUtils
+        assert get_feature_class("utils", OSName.WINDOWS).__name__ == "WindowsUtils"
+
+    def test_direct_os_class_not_replaced_by_other_os(self, host):
+        utils = LinuxUtils(connection=host.connection, host=host)
+        register_feature("utils", OSName.LINUX, "mfd_host.feature.utils.windows:WindowsUtils")
+
+        assert type(utils) is LinuxUtils
+        assert type(LinuxUtils(connection=host.connection, host=host)) is LinuxUtils
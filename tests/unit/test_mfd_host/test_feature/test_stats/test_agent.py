@@ -0,0 +1,157 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Tests for `mfd_host.feature.stats.agent` module."""
+
+import base64
+import sys
+from pathlib import PurePosixPath
+
+import pytest
+from mfd_connect import RPyCConnection
+from mfd_connect.base import ConnectionCompletedProcess
+from mfd_typing import OSName
+
+from mfd_host import Host
+from mfd_host.exceptions import StatsSamplerException
+from mfd_host.feature.stats import agent_script
+from mfd_host.feature.stats.agent import AgentStatsSampler, decode_agent_samples
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="collector agent runs only on Unix")
+
+
+@pytest.fixture
+def collect(mocker, tmp_path):
+    def _collect(samples, hex_files=()):
+        """Run collector in process, each sample is list of contents of files, hex files given by indexes."""
+        paths = [str(tmp_path / f"file{index}") for index in range(len(samples[0]))]
+        remaining = iter(samples)
+
+        def _write_next_sample(*_):
+            sample = next(remaining, None)
+            if sample is None:
+                raise SystemExit(0)
+            for path, content in zip(paths, sample):
+                with open(path, "w") as file:
+                    file.write(content)
+
+        mocker.patch.object(agent_script.signal, "signal")
+        mocker.patch.object(agent_script.time, "sleep", side_effect=_write_next_sample)
+        _write_next_sample()
+        output_path = tmp_path / "output.bin"
+        agent_script.collect(str(output_path), 1.0, paths, tuple(paths[index] for index in hex_files))
+        return output_path.read_bytes()
+
+    return _collect
+
+
+def _without_overhead(data, paths):
+    """Strip overhead record, its size depends on resources used by collector."""
+    _, overhead = decode_agent_samples(data, paths)
+    record = bytearray(agent_script.OVERHEAD_RECORD)
+    for value in (overhead.cpu_time * 1e6, overhead.wall_time * 1e6, overhead.max_rss, overhead.samples):
+        agent_script.encode_varint(round(value), record)
+    assert data.endswith(record)
+    return data[: -len(record)]
+
+
+class TestDecodeAgentSamples:
+    def test_round_trip(self, collect):
+        samples = [
+            ["100.05 2000.10\n", "cpu  1 2 3\nintr {1}\n", "0000a3f1 00000000 007\n"],
+            ["100.15 2000.40\n", "cpu  1 2 1000000\nintr {1}\n", "0000a409 00000001 007\n"],
+            ["100.25 2001.00\n", "cpu  1 2 999999 4\nintr {1}\n", "0001a400 00000001 010\n"],
+        ]
+
+        data = collect(samples, hex_files=[2])
+
+        paths = ["/proc/uptime", "/proc/stat", "/proc/net/softnet_stat"]
+        decoded, overhead = decode_agent_samples(data, paths)
+        assert decoded == [dict(zip(paths, files)) for files in samples]
+        assert overhead.samples == 3
+        assert overhead.file_size == len(data)
+        assert overhead.max_rss > 0
+
+    def test_unchanged_counters_take_single_byte(self, collect):
+        content = " ".join(str(number) for number in range(10**6, 10**6 + 100))
+        single_sample = len(_without_overhead(collect([[content]]), ["file"]))
+
+        assert len(_without_overhead(collect([[content]] * 11), ["file"])) - single_sample == 10 * (1 + 1 + 100)
+
+    def test_decimal_counters_growing_to_nine_digits_keep_layout(self, collect):
+        samples = [["cpu  99999990 12345678 87654321\n"], ["cpu  100000005 12345679 87654321\n"]]
+        single_sample = len(_without_overhead(collect(samples[:1]), ["file"]))
+
+        data = collect(samples)
+
+        assert decode_agent_samples(data, ["file"])[0] == [{"file": files[0]} for files in samples]
+        assert len(_without_overhead(data, ["file"])) - single_sample == 1 + 1 + 3
+
+    def test_truncated_record_dropped(self, collect):
+        data = collect([["1 2 3\n"], ["4 5 6\n"]])
+        truncated = _without_overhead(data, ["file"])[:-1]
+
+        decoded, overhead = decode_agent_samples(truncated, ["file"])
+
+        assert decoded == [{"file": "1 2 3\n"}]
+        assert overhead is None
+
+    def test_unexpected_format(self):
+        with pytest.raises(StatsSamplerException):
+            decode_agent_samples(b"cpu  1 2 3\n", ["/proc/stat"])
+
+
+class TestAgentStatsSampler:
+    @pytest.fixture
+    def host(self, mocker):
+        connection = mocker.create_autospec(RPyCConnection)
+        connection.get_os_name.return_value = OSName.LINUX
+        connection.start_process.return_value = mocker.Mock(running=False)
+        yield Host(connection=connection)
+        mocker.stopall()
+
+    def test_agent_sampling(self, host, collect):
+        data = collect(
+            [
+                ["100.00 1000.00\n", "MemTotal: 1000 kB\nMemFree: 600 kB\n"],
+                ["101.00 1000.00\n", "MemTotal: 1000 kB\nMemFree: 500 kB\n"],
+            ]
+        )
+        host.connection.execute_command.side_effect = [
+            ConnectionCompletedProcess(args="", stdout="/dev/shm\n", return_code=0),
+            ConnectionCompletedProcess(args="", stdout=base64.encodebytes(data).decode(), return_code=0),
+        ]
+
+        sampler = host.stats.start_sampling(metrics=["memory"], agent=True)
+        assert isinstance(sampler, AgentStatsSampler)
+        host.stats.stop_sampling()
+
+        script_path, output_path = sampler.script_path, sampler.output_path
+        assert str(script_path).startswith("/dev/shm/")
+        host.connection.start_process.assert_called_once_with(
+            f"exec python3 {script_path} {output_path} 1.0 /proc/uptime /proc/meminfo", shell=True
+        )
+        assert host.connection.execute_command.call_args.args[0] == (
+            f"base64 {output_path}; rm -f {output_path} {script_path}"
+        )
+        memory_free = sampler.series("memory.MemFree")
+        assert memory_free.timestamps == [100.0, 101.0]
+        assert memory_free.values == [600.0, 500.0]
+        assert sampler.overhead.samples == 2
+
+    def test_hex_files_in_command(self, host):
+        sampler = AgentStatsSampler(host.connection, metrics=["softnet", "cpu"], interval=1.0, capacity=10)
+        sampler._directory = PurePosixPath("/dev/shm")
+
+        assert sampler.command.endswith(" 1.0 /proc/uptime hex:/proc/net/softnet_stat /proc/stat")
+
+    def test_agent_not_deployed(self, host):
+        host.connection.execute_command.return_value = ConnectionCompletedProcess(
+            args="", stdout="", stderr="", return_code=127
+        )
+
+        with pytest.raises(StatsSamplerException):
+            host.stats.start_sampling(agent=True)
+
+        host.connection.start_process.assert_not_called()
+        with pytest.raises(StatsSamplerException):
+            host.stats.stop_sampling()
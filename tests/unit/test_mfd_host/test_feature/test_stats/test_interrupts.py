@@ -0,0 +1,59 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Tests for `mfd_host.feature.stats.interrupts` module."""
+
+import pytest
+
+from mfd_host.feature.stats.interrupts import get_group_name, get_interrupt_rates, parse_interrupt_counters
+
+
+def _counters(timestamp, cpus, rows):
+    header = "".join(f"  CPU{cpu}" for cpu in cpus)
+    lines = [f"{name}: {' '.join(map(str, counts))}  {description}" for name, counts, description in rows]
+    return parse_interrupt_counters("\n".join([header, *lines]) + "\n", timestamp=timestamp)
+
+
+class TestInterrupts:
+    @pytest.mark.parametrize(
+        "name, description, group_by, expected_group",
+        [
+            ("134", "IR-PCI-MSI 524288-edge      ens801f0-TxRx-12", "name", "ens801f0-TxRx-12"),
+            ("134", "IR-PCI-MSI 524288-edge      ens801f0-TxRx-12", "interface", "ens801f0"),
+            ("134", "IR-PCI-MSI 524288-edge      ens801f0-TxRx-12", "irq", "134"),
+            ("60", "PCI-MSI 1048577-edge      eth1-rx-0", "interface", "eth1"),
+            ("1", "IO-APIC   1-edge      i8042, serio", "name", "i8042, serio"),
+            ("1", "IO-APIC   1-edge      i8042, serio", "interface", "i8042, serio"),
+            ("75", "PCI-MSI 1572864-edge      mlx5_comp3@pci:0000:5e:00.0", "interface", "mlx5_comp3@pci:0000:5e:00.0"),
+            ("LOC", "Local timer interrupts", "name", "LOC"),
+            ("9", "", "name", "9"),
+        ],
+    )
+    def test_get_group_name(self, name, description, group_by, expected_group):
+        assert get_group_name(name, description, group_by) == expected_group
+
+    def test_rates_of_new_rows_count_from_zero(self):
+        previous = _counters(10.0, [0, 1], [("LOC", [10, 10], "Local timer interrupts")])
+        current = _counters(
+            12.0, [0, 1], [("LOC", [10, 10], "Local timer interrupts"), ("200", [0, 40], "PCI-MSI 1-edge eth0-TxRx-0")]
+        )
+
+        assert get_interrupt_rates(previous, current) == {"eth0-TxRx-0": {1: 20.0}}
+
+    def test_rates_of_cpus_in_both_readings(self):
+        previous = _counters(10.0, [0, 1, 2], [("LOC", [10, 10, 10], "Local timer interrupts")])
+        current = _counters(11.0, [0, 2, 3], [("LOC", [15, 12, 50], "Local timer interrupts")])
+
+        assert get_interrupt_rates(previous, current) == {"LOC": {0: 5.0, 2: 2.0}}
+
+    def test_counters_going_back_skipped(self):
+        previous = _counters(10.0, [0, 1], [("LOC", [10, 10], "Local timer interrupts")])
+        current = _counters(11.0, [0, 1], [("LOC", [5, 20], "Local timer interrupts")])
+
+        assert get_interrupt_rates(previous, current) == {"LOC": {1: 10.0}}
+
+    @pytest.mark.parametrize("group_by, timestamp", [("queue", 11.0), ("name", 10.0)])
+    def test_invalid_arguments(self, group_by, timestamp):
+        counters = _counters(10.0, [0], [("LOC", [10], "Local timer interrupts")])
+
+        with pytest.raises(ValueError):
+            get_interrupt_rates(counters, _counters(timestamp, [0], []), group_by=group_by)
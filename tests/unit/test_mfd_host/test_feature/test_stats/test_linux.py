@@ -9,7 +9,8 @@ from mfd_typing import OSName
 from mfd_model.config import HostModel
 
 from mfd_host import Host
-from mfd_host.feature.stats.data_structures import StatsOutput
+from mfd_host.feature.stats.data_structures import StatsOutput, mem_labels, swap_labels
+from mfd_host.feature.stats.linux import INTERRUPTS_SEPARATOR, PROC_STAT_SEPARATOR
 from mfd_host.exceptions import StatisticNotFoundException
 
 
@@ -411,6 +412,254 @@ class TestLinuxUtils:
         assert out == expected_out
         host.connection.execute_command.assert_called_once_with("sar -P ALL", shell=True)
 
+    proc_stat_start = dedent(
+        """\
+        cpu  200 0 100 1600 50 0 50 0 0 0
+        cpu0 100 0 50 800 25 0 25 0 0 0
+        cpu1 100 0 50 800 25 0 25 0 0 0
+        intr 1234567 9 0 0 0
+        ctxt 98765
+        """
+    )
+    proc_stat_end = dedent(
+        """\
+        cpu  250 0 125 1900 50 0 75 0 0 0
+        cpu0 150 0 75 900 25 0 50 0 0 0
+        cpu1 100 0 50 1000 25 0 25 0 0 0
+        intr 1234987 9 0 0 0
+        ctxt 98999
+        """
+    )
+    cpu_utilization_delta = {
+        "all": {
+            "user": 12.5,
+            "nice": 0.0,
+            "system": 6.25,
+            "idle": 75.0,
+            "iowait": 0.0,
+            "irq": 0.0,
+            "softirq": 6.25,
+            "steal": 0.0,
+        },
+        "0": {
+            "user": 25.0,
+            "nice": 0.0,
+            "system": 12.5,
+            "idle": 50.0,
+            "iowait": 0.0,
+            "irq": 0.0,
+            "softirq": 12.5,
+            "steal": 0.0,
+        },
+        "1": {
+            "user": 0.0,
+            "nice": 0.0,
+            "system": 0.0,
+            "idle": 100.0,
+            "iowait": 0.0,
+            "irq": 0.0,
+            "softirq": 0.0,
+            "steal": 0.0,
+        },
+    }
+
+    def _set_outputs(self, host, *outputs):
+        host.connection.execute_command.side_effect = [
+            ConnectionCompletedProcess(return_code=0, args="", stdout=output, stderr="") for output in outputs
+        ]
+
+    def test_get_cpu_utilization_delta(self, host):
+        self._set_outputs(host, self.proc_stat_start, self.proc_stat_end)
+
+        host.stats.start_cpu_utilization_session()
+        assert host.stats.get_cpu_utilization_delta() == self.cpu_utilization_delta
+        host.connection.execute_command.assert_called_with("cat /proc/stat", shell=True)
+
+    def test_get_cpu_utilization_delta_sessions_independent(self, host):
+        self._set_outputs(host, self.proc_stat_start, self.proc_stat_end, self.proc_stat_end, self.proc_stat_end)
+
+        host.stats.start_cpu_utilization_session("traffic")
+        host.stats.start_cpu_utilization_session("idle")
+        traffic = host.stats.get_cpu_utilization_delta("traffic")
+        idle = host.stats.get_cpu_utilization_delta("idle")
+
+        assert traffic == self.cpu_utilization_delta
+        assert idle["0"] == dict.fromkeys(idle["0"], 0.0)
+
+    def test_get_cpu_utilization_delta_since_boot(self, host):
+        self._set_outputs(host, self.proc_stat_start, self.proc_stat_end, self.proc_stat_end)
+
+        since_boot = host.stats.get_cpu_utilization_delta("run", stop=True)
+        host.stats.get_cpu_utilization_delta("run", stop=True)
+
+        assert since_boot["0"] == {
+            "user": 10.0,
+            "nice": 0.0,
+            "system": 5.0,
+            "idle": 80.0,
+            "iowait": 2.5,
+            "irq": 0.0,
+            "softirq": 2.5,
+            "steal": 0.0,
+        }
+        assert host.stats.get_cpu_utilization_delta("run")["1"]["idle"] == round(1000 / 1200 * 100, 2)
+
+    def test_get_cpu_utilization_delta_counters_going_back(self, host):
+        self._set_outputs(host, self.proc_stat_end, "cpu  250 0 125 2000 40 0 75\ncpu0 150 0 75 950 20 0 50\n")
+
+        host.stats.start_cpu_utilization_session()
+        utilization = host.stats.get_cpu_utilization_delta()
+
+        assert utilization["0"]["idle"] == 100.0
+        assert utilization["0"]["steal"] == 0.0
+        assert "1" not in utilization
+
+    def test_measure_cpu_utilization(self, host):
+        self._set_outputs(host, f"{self.proc_stat_start}{PROC_STAT_SEPARATOR}\n{self.proc_stat_end}")
+
+        assert host.stats.measure_cpu_utilization(0.5) == self.cpu_utilization_delta
+        host.connection.execute_command.assert_called_once_with(
+            f"cat /proc/stat; sleep 0.5; echo {PROC_STAT_SEPARATOR}; cat /proc/stat", shell=True
+        )
+
+    def test_get_cpu_utilization_delta_no_cpu_times(self, host):
+        self._set_outputs(host, "")
+
+        with pytest.raises(StatisticNotFoundException):
+            host.stats.get_cpu_utilization_delta()
+
+    interrupts_start = dedent(
+        """\
+        1000.00 3000.00
+                   CPU0       CPU1       CPU2
+          0:         44          0          0   IO-APIC   2-edge      timer
+        134:        100          0          0  IR-PCI-MSI 524288-edge      ens801f0-TxRx-0
+        135:          0        200          0  IR-PCI-MSI 524289-edge      ens801f0-TxRx-1
+        136:          0          0         10  IR-PCI-MSI 526336-edge      ens801f1-TxRx-0
+        LOC:       5000       5000       5000   Local timer interrupts
+        ERR:          0
+        """
+    )
+    interrupts_end = dedent(
+        """\
+        1002.00 3008.00
+                   CPU0       CPU1       CPU2
+          0:         44          0          0   IO-APIC   2-edge      timer
+        134:       2100          0          0  IR-PCI-MSI 524288-edge      ens801f0-TxRx-0
+        135:          0       4200          0  IR-PCI-MSI 524289-edge      ens801f0-TxRx-1
+        136:          0          0         10  IR-PCI-MSI 526336-edge      ens801f1-TxRx-0
+        LOC:       5500       5400       5000   Local timer interrupts
+        ERR:          0
+        """
+    )
+    softirqs_start = dedent(
+        """\
+        1000.00 3000.00
+                            CPU0       CPU1
+                  HI:          1          0
+              NET_TX:         10         10
+              NET_RX:       1000         20
+        """
+    )
+    softirqs_end = dedent(
+        """\
+        1000.50 3001.00
+                            CPU0       CPU1
+                  HI:          1          0
+              NET_TX:         10         11
+              NET_RX:       6000         20
+        """
+    )
+
+    def test_get_interrupts(self, host):
+        self._set_outputs(host, self.interrupts_start)
+
+        interrupts = host.stats.get_interrupts()
+
+        host.connection.execute_command.assert_called_once_with("cat /proc/uptime /proc/interrupts", shell=True)
+        assert interrupts.timestamp == 1000.0
+        assert interrupts.cpus == [0, 1, 2]
+        assert interrupts.names == ["0", "134", "135", "136", "LOC", "ERR"]
+        assert interrupts.descriptions[1] == "IR-PCI-MSI 524288-edge      ens801f0-TxRx-0"
+        assert interrupts.descriptions[4] == "Local timer interrupts"
+        assert interrupts.get("135") == {0: 0, 1: 200, 2: 0}
+        assert interrupts.get("ERR") == {0: 0, 1: 0, 2: 0}
+
+    def test_get_softirqs(self, host):
+        self._set_outputs(host, self.softirqs_start)
+
+        softirqs = host.stats.get_softirqs()
+
+        host.connection.execute_command.assert_called_once_with("cat /proc/uptime /proc/softirqs", shell=True)
+        assert softirqs.names == ["HI", "NET_TX", "NET_RX"]
+        assert softirqs.get("NET_RX") == {0: 1000, 1: 20}
+
+    @pytest.mark.parametrize(
+        "group_by, expected_rates",
+        [
+            ("irq", {"134": {0: 1000.0}, "135": {1: 2000.0}, "LOC": {0: 250.0, 1: 200.0}}),
+            ("name", {"ens801f0-TxRx-0": {0: 1000.0}, "ens801f0-TxRx-1": {1: 2000.0}, "LOC": {0: 250.0, 1: 200.0}}),
+            ("interface", {"ens801f0": {0: 1000.0, 1: 2000.0}, "LOC": {0: 250.0, 1: 200.0}}),
+        ],
+    )
+    def test_measure_interrupt_rates(self, host, group_by, expected_rates):
+        self._set_outputs(host, f"{self.interrupts_start}{INTERRUPTS_SEPARATOR}\n{self.interrupts_end}")
+
+        assert host.stats.measure_interrupt_rates(2, group_by=group_by) == expected_rates
+        host.connection.execute_command.assert_called_once_with(
+            f"cat /proc/uptime /proc/interrupts; sleep 2; echo {INTERRUPTS_SEPARATOR}; "
+            "cat /proc/uptime /proc/interrupts",
+            shell=True,
+        )
+
+    def test_measure_softirq_rates(self, host):
+        self._set_outputs(host, f"{self.softirqs_start}{INTERRUPTS_SEPARATOR}\n{self.softirqs_end}")
+
+        assert host.stats.measure_softirq_rates(0.5) == {"NET_TX": {1: 2.0}, "NET_RX": {0: 10000.0}}
+
+    @pytest.mark.parametrize("output", ["", "1000.00 3000.00\n", "1000.00 3000.00\n  0:  44  IO-APIC 2-edge timer\n"])
+    def test_get_interrupts_not_found(self, host, output):
+        self._set_outputs(host, output)
+
+        with pytest.raises(StatisticNotFoundException):
+            host.stats.get_interrupts()
+
+    softnet_stat_start = (
+        "1000.00 3000.00\n"
+        "00000100 00000000 00000001 00000000 00000000 00000000 00000000 00000000 00000000 00000000 00000000"
+        " 00000000 00000000\n"
+        "00000100 00000000 00000001 00000000 00000000 00000000 00000000 00000000 00000000 00000000 00000000"
+        " 00000000 00000001\n"
+    )
+    softnet_stat_end = (
+        "1010.00 3010.00\n"
+        "00000200 00000000 00000001 00000000 00000000 00000000 00000000 00000000 00000000 00000000 00000000"
+        " 00000000 00000000\n"
+        "00002810 00000014 00000065 00000000 00000000 00000000 00000000 00000000 00000000 00000000 00000000"
+        " 00000000 00000001\n"
+    )
+
+    def test_get_softnet_stat(self, host):
+        self._set_outputs(host, self.softnet_stat_start)
+
+        softnet_stat = host.stats.get_softnet_stat()
+
+        host.connection.execute_command.assert_called_once_with("cat /proc/uptime /proc/net/softnet_stat", shell=True)
+        assert softnet_stat.timestamp == 1000.0
+        assert softnet_stat.counters[1]["processed"] == 256
+        assert softnet_stat.counters[1]["time_squeeze"] == 1
+
+    def test_get_softnet_stat_bottlenecks(self, host):
+        self._set_outputs(host, self.softnet_stat_start, self.softnet_stat_end)
+
+        since = host.stats.get_softnet_stat()
+        bottlenecks = host.stats.get_softnet_stat_bottlenecks(since, time_squeeze_rate=1.0)
+
+        assert list(bottlenecks) == [1]
+        assert bottlenecks[1]["processed"] == 1000.0
+        assert bottlenecks[1]["dropped"] == 2.0
+        assert bottlenecks[1]["time_squeeze"] == 10.0
+
     def test_get_slabinfo(self, host):
         cmd_out = dedent(
             """\
@@ -662,6 +911,11 @@ class TestLinuxUtils:
     def test__get_mem_from_top_output(self, host):
         assert host.stats._get_mem_from_top_output(output=self.top_output) == self.memory_stat
 
+    def test__get_mem_from_top_output_labels_not_modified(self, host):
+        host.stats._get_mem_from_top_output(output=self.top_output)
+        assert host.stats._get_mem_from_top_output(output=self.top_output) == self.memory_stat
+        assert mem_labels == swap_labels == ["total", "free", "used"]
+
     def test__get_proc_from_top_output(self, host):
         assert host.stats._get_proc_from_top_output(output=self.top_output, filter_proc=[]) == self.process_stat
 
@@ -0,0 +1,184 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Tests for `mfd_host.feature.stats.sampling` module."""
+
+import math
+
+import pytest
+from mfd_connect import RPyCConnection
+from mfd_typing import OSName
+
+from mfd_host import Host
+from mfd_host.exceptions import StatsSamplerException
+from mfd_host.feature.stats.sampling import SAMPLE_MARKER, SampleRingBuffer
+
+SOFTIRQS = (
+    "                    CPU0       CPU1\n"
+    "          HI:          {hi}          0\n"
+    "      NET_RX:     {net_rx}     {net_rx}\n"
+)
+NET_DEV = (
+    "Inter-|   Receive                                                |  Transmit\n"
+    " face |bytes    packets errs drop fifo frame compressed multicast|bytes    packets errs drop fifo colls carrier"
+    " compressed\n"
+    "  eth0: {rx_bytes} 10    0    0    0     0          0         0 {tx_bytes} 5    0    0    0     0       0"
+    "          0\n"
+)
+
+
+def _sample(uptime, stat=None, meminfo=None, softirqs=None, net_dev=None, softnet_stat=None):
+    files = {"/proc/uptime": f"{uptime} 1000.00", "/proc/stat": stat, "/proc/meminfo": meminfo}
+    files.update({"/proc/softirqs": softirqs, "/proc/net/dev": net_dev, "/proc/net/softnet_stat": softnet_stat})
+    lines = [SAMPLE_MARKER]
+    for path, content in files.items():
+        if content is not None:
+            lines.extend([f"==> {path} <==", *content.splitlines(), ""])
+    return [f"{line}\n" for line in lines]
+
+
+class TestStatsSampler:
+    @pytest.fixture
+    def host(self, mocker):
+        connection = mocker.create_autospec(RPyCConnection)
+        connection.get_os_name.return_value = OSName.LINUX
+        yield Host(connection=connection)
+        mocker.stopall()
+
+    @pytest.fixture
+    def process(self, host, mocker):
+        process = mocker.Mock(running=False)
+        host.connection.start_process.return_value = process
+        return process
+
+    def test_sampling(self, host, process):
+        process.get_stdout_iter.return_value = iter(
+            _sample(100.0, "cpu  100 0 100 800 0 0 0 0 0 0\n", "MemTotal: 1000 kB\nMemFree: 600 kB\n")
+            + _sample(100.1, "cpu  150 0 110 830 0 0 10 0 0 0\n", "MemTotal: 1000 kB\nMemFree: 500 kB\n")
+            + _sample(100.2, "cpu  150 0 110 930 0 0 10 0 0 0\n", "MemTotal: 1000 kB\nMemFree: 400 kB\n")
+        )
+
+        host.stats.start_sampling(interval=0.1)
+        sampler = host.stats.stop_sampling()
+
+        host.connection.start_process.assert_called_once_with(
+            f"while :; do echo {SAMPLE_MARKER}; tail -v -n +1 /proc/uptime /proc/stat /proc/meminfo; sleep 0.1; done",
+            shell=True,
+        )
+        memory_free = sampler.series("memory.MemFree")
+        assert memory_free.timestamps == [100.0, 100.1, 100.2]
+        assert memory_free.values == [600.0, 500.0, 400.0]
+        cpu_user = sampler.series("cpu.user")
+        assert math.isnan(cpu_user.values[0])
+        assert cpu_user.values[1:] == [50.0, 0.0]
+        assert sampler.series("cpu.softirq").values[1:] == [10.0, 0.0]
+        assert sampler.series("cpu.idle").values[1:] == [30.0, 100.0]
+        assert sampler.errors == 0
+
+    def test_rates(self, host, process):
+        process.get_stdout_iter.return_value = iter(
+            _sample(10.0, softirqs=SOFTIRQS.format(hi=1, net_rx=100), net_dev=NET_DEV.format(rx_bytes=0, tx_bytes=0))
+            + _sample(
+                10.5, softirqs=SOFTIRQS.format(hi=1, net_rx=600), net_dev=NET_DEV.format(rx_bytes=500, tx_bytes=50)
+            )
+        )
+
+        host.stats.start_sampling(metrics=["softirqs", "net"])
+        sampler = host.stats.stop_sampling()
+
+        assert sampler.series("softirqs.NET_RX").values[1] == 2000.0
+        assert sampler.series("softirqs.HI").values[1] == 0.0
+        assert sampler.series("net.eth0.rx_bytes").values[1] == 1000.0
+        assert sampler.series("net.eth0.tx_bytes").values[1] == 100.0
+        assert "net.eth0.rx_drop" in sampler.names
+
+    def test_softnet_stat(self, host, process):
+        process.get_stdout_iter.return_value = iter(
+            _sample(1.0, softnet_stat="00000010 00000000 00000000\n00000010 00000001 00000000\n")
+            + _sample(1.5, softnet_stat="00000010 00000000 00000000\n00000110 00000003 00000002\n")
+        )
+
+        host.stats.start_sampling(metrics=["softnet"])
+        sampler = host.stats.stop_sampling()
+
+        assert sampler.series("softnet.cpu1.processed").values[1] == 512.0
+        assert sampler.series("softnet.cpu1.dropped").values[1] == 4.0
+        assert sampler.series("softnet.cpu1.time_squeeze").values[1] == 4.0
+        assert sampler.series("softnet.cpu0.dropped").values[1] == 0.0
+
+    def test_per_core(self, host, process):
+        process.get_stdout_iter.return_value = iter(
+            _sample(1.0, "cpu  2 0 0 2 0 0 0 0\ncpu0 1 0 0 1 0 0 0 0\ncpu1 1 0 0 1 0 0 0 0\n")
+            + _sample(2.0, "cpu  2 0 0 4 0 0 0 0\ncpu0 1 0 0 2 0 0 0 0\ncpu1 1 0 0 2 0 0 0 0\n")
+        )
+
+        host.stats.start_sampling(metrics=["cpu_per_core"])
+        sampler = host.stats.stop_sampling()
+
+        assert sampler.series("cpu1.idle").values[1] == 100.0
+        assert "cpu.idle" not in sampler.names
+
+    def test_not_parsed_sample_skipped(self, host, process):
+        process.get_stdout_iter.return_value = iter(
+            _sample(1.0, meminfo="MemFree: 600 kB\n") + _sample(2.0) + _sample(3.0, meminfo="MemFree: 400 kB\n")
+        )
+
+        host.stats.start_sampling(metrics=["memory"])
+        sampler = host.stats.stop_sampling()
+
+        assert sampler.series("memory.MemFree").values == [600.0, 400.0]
+        assert sampler.errors == 1
+
+    def test_running_collector_stopped(self, host, process):
+        process.get_stdout_iter.return_value = iter([])
+        process.running = True
+
+        host.stats.start_sampling()
+        host.stats.stop_sampling()
+
+        process.stop.assert_called_once()
+        process.kill.assert_called_once()
+
+    def test_single_sampling_at_a_time(self, host, process):
+        process.get_stdout_iter.return_value = iter([])
+
+        host.stats.start_sampling()
+        with pytest.raises(StatsSamplerException):
+            host.stats.start_sampling()
+        host.stats.stop_sampling()
+        with pytest.raises(StatsSamplerException):
+            host.stats.stop_sampling()
+
+    @pytest.mark.parametrize(
+        "kwargs", [{"metrics": ["cpu", "disk"]}, {"metrics": []}, {"interval": 0}, {"capacity": 0}]
+    )
+    def test_invalid_arguments(self, host, kwargs):
+        with pytest.raises(StatsSamplerException):
+            host.stats.start_sampling(**kwargs)
+
+        host.connection.start_process.assert_not_called()
+
+
+class TestSampleRingBuffer:
+    def test_oldest_samples_overwritten(self):
+        buffer = SampleRingBuffer(capacity=3)
+
+        for timestamp in range(5):
+            buffer.append(float(timestamp), {"value": timestamp * 10.0})
+
+        assert len(buffer) == 3
+        series = buffer.get("value")
+        assert series.timestamps == [2.0, 3.0, 4.0]
+        assert series.values == [20.0, 30.0, 40.0]
+
+    def test_missing_values(self):
+        buffer = SampleRingBuffer(capacity=4)
+
+        buffer.append(1.0, {"first": 1.0})
+        buffer.append(2.0, {"second": 2.0})
+        buffer.append(3.0, {"first": 3.0})
+
+        assert buffer.names == ["first", "second"]
+        first, second = buffer.get("first"), buffer.get("second")
+        assert first.values[0] == 1.0 and math.isnan(first.values[1]) and first.values[2] == 3.0
+        assert math.isnan(second.values[0]) and second.values[1] == 2.0 and math.isnan(second.values[2])
+        assert buffer.get("third").values == []
@@ -0,0 +1,80 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Tests for `mfd_host.feature.stats.softnet` module."""
+
+import pytest
+
+from mfd_host.exceptions import StatisticNotFoundException
+from mfd_host.feature.stats.data_structures import SoftnetStat
+from mfd_host.feature.stats.softnet import find_softnet_stat_bottlenecks, get_softnet_stat_deltas, parse_softnet_stat
+
+
+def _softnet_stat(timestamp, counters):
+    return SoftnetStat(
+        timestamp=timestamp,
+        counters={
+            cpu: {"processed": processed, "dropped": dropped, "time_squeeze": time_squeeze}
+            for cpu, (processed, dropped, time_squeeze) in counters.items()
+        },
+    )
+
+
+class TestSoftnet:
+    def test_parse_softnet_stat(self):
+        output = (
+            "00003dbd 00000000 00000005 00000000 00000000 00000000 00000000 00000000 00000000 00000000 00000000"
+            " 00000000 00000000 00000000 00000000\n"
+            "0001e240 0000000a 000000ff 00000000 00000000 00000000 00000000 00000000 00000000 00000002 00000001"
+            " 00000003 00000005 00000003 00000000\n"
+        )
+
+        softnet_stat = parse_softnet_stat(output, timestamp=10.0)
+
+        assert list(softnet_stat.counters) == [0, 5]
+        assert softnet_stat.counters[5] == {
+            "processed": 123456,
+            "dropped": 10,
+            "time_squeeze": 255,
+            "cpu_collision": 0,
+            "received_rps": 2,
+            "flow_limit_count": 1,
+        }
+
+    def test_parse_softnet_stat_without_cpu_column(self):
+        output = (
+            "00000010 00000000 00000001 00000000 00000000 00000000 00000000 00000000 00000000 00000000 00000000\n"
+            "00000020 00000000 00000002 00000000 00000000 00000000 00000000 00000000 00000000 00000000 00000000\n"
+        )
+
+        softnet_stat = parse_softnet_stat(output, timestamp=10.0)
+
+        assert softnet_stat.counters[1]["processed"] == 32
+
+    @pytest.mark.parametrize("output", ["", "cat: /proc/net/softnet_stat: No such file or directory\n"])
+    def test_parse_softnet_stat_not_found(self, output):
+        with pytest.raises(StatisticNotFoundException):
+            parse_softnet_stat(output, timestamp=10.0)
+
+    def test_deltas_of_wrapped_counters(self):
+        previous = _softnet_stat(10.0, {0: (2**32 - 10, 0, 5), 1: (100, 0, 0)})
+        current = _softnet_stat(20.0, {0: (90, 0, 5), 2: (100, 0, 0)})
+
+        assert get_softnet_stat_deltas(previous, current) == {0: {"processed": 100, "dropped": 0, "time_squeeze": 0}}
+
+    def test_find_softnet_stat_bottlenecks(self):
+        previous = _softnet_stat(10.0, {0: (0, 0, 0), 1: (0, 0, 0), 2: (0, 0, 0), 3: (0, 0, 0)})
+        current = _softnet_stat(12.0, {0: (1000, 0, 0), 1: (1000, 4, 0), 2: (1000, 0, 100), 3: (1000, 2, 10)})
+
+        assert find_softnet_stat_bottlenecks(previous, current) == {
+            1: {"processed": 500.0, "dropped": 2.0, "time_squeeze": 0.0},
+            2: {"processed": 500.0, "dropped": 0.0, "time_squeeze": 50.0},
+            3: {"processed": 500.0, "dropped": 1.0, "time_squeeze": 5.0},
+        }
+        bottlenecks = find_softnet_stat_bottlenecks(previous, current, dropped_rate=1.0, time_squeeze_rate=10.0)
+        assert list(bottlenecks) == [1, 2]
+
+    def test_readings_not_in_order(self):
+        softnet_stat = _softnet_stat(10.0, {0: (0, 0, 0)})
+
+        with pytest.raises(ValueError):
+            find_softnet_stat_bottlenecks(softnet_stat, softnet_stat)
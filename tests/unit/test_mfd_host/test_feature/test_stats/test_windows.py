@@ -1,5 +1,6 @@
 # Copyright (C) 2025 Intel Corporation
 # SPDX-License-Identifier: MIT
+import re
 from textwrap import dedent
 from unittest.mock import call
 
@@ -40,24 +41,24 @@ class TestLinuxUtils:
         mocker.stopall()
 
     def test_get_meminfo(self, host):
-        output = dedent(
-            """\
-            Timestamp : 11/22/2023 12:17:07 PM
-            Readings  : \\b17-27878\\memory\\pool nonpaged bytes :
-                        421310464
-            """
-        )
-        host.stats._connection.execute_powershell.return_value = ConnectionCompletedProcess(
-            return_code=0, args="", stdout=output, stderr=""
-        )
-        host.stats.get_meminfo()
-        host.stats._connection.execute_powershell.assert_has_calls(
-            [
-                call('Get-counter -Counter "\\Memory\\Available Bytes" | Format-List', expected_return_codes={0}),
-                call('Get-counter -Counter "\\Memory\\Pool Paged Bytes" | Format-List', expected_return_codes={0}),
-                call('Get-counter -Counter "\\Memory\\Pool Nonpaged Bytes" | Format-List', expected_return_codes={0}),
-            ]
-        )
+        readings = {"available bytes": 1290716, "pool paged bytes": 708444160, "pool nonpaged bytes": 421310464}
+
+        def _get_batch_output(script, **kwargs):
+            markers = re.findall(r"'(__mfd_host_batch_\w+:\d+):out'", script)
+            stdout = "".join(
+                f"{marker}:out\nTimestamp : 11/22/2023 12:17:07 PM\nReadings  : \\\\b17-27878\\memory\\{name} :\n"
+                f"            {value}\n\n{marker}:rc:0\n\n{marker}:end\n"
+                for marker, (name, value) in zip(markers, readings.items())
+            )
+            return ConnectionCompletedProcess(return_code=0, args=script, stdout=stdout, stderr="")
+
+        host.stats._connection.execute_powershell.side_effect = _get_batch_output
+
+        assert host.stats.get_meminfo() == {"Available": 1290716, "Paged": 708444160, "Nonpaged": 421310464}
+        host.stats._connection.execute_powershell.assert_called_once()
+        script = host.stats._connection.execute_powershell.call_args.args[0]
+        for counter in ("Available Bytes", "Pool Paged Bytes", "Pool Nonpaged Bytes"):
+            assert f'Get-counter -Counter "\\Memory\\{counter}" | Format-List' in script
 
     def test_get_cpu_utilization(self, host):
         output = dedent(
@@ -1,9 +1,11 @@
 # Copyright (C) 2025 Intel Corporation
 # SPDX-License-Identifier: MIT
+import json
 from ipaddress import IPv4Interface, IPv6Interface, IPv4Address, IPv6Address
 
 import pytest
 from mfd_connect import RPyCConnection
+from mfd_connect.base import ConnectionCompletedProcess
 from mfd_network_adapter.network_interface.feature.ip.data_structures import IPs
 from mfd_typing import OSName
 from mfd_network_adapter.network_interface.linux import LinuxNetworkInterface
@@ -25,13 +27,35 @@ class TestBaseUtils:
 
         mocker.stopall()
 
-    def test_get_interface_by_ip(self, host, mocker):
+    @pytest.fixture
+    def interfaces(self, host, mocker):
         interface_v4 = mocker.create_autospec(LinuxNetworkInterface)
+        interface_v4.name = "eth0"
+        interface_v4.namespace = None
         interface_v4.ip.get_ips.return_value = IPs(v4=[IPv4Interface("127.0.0.1/10")])
 
         interface_v6 = mocker.create_autospec(LinuxNetworkInterface)
+        interface_v6.name = "eth1"
+        interface_v6.namespace = None
         interface_v6.ip.get_ips.return_value = IPs(v6=[IPv6Interface("fe80::3efd:feff:fecf:8b72/64")])
 
+        host.connection.execute_command.return_value = ConnectionCompletedProcess(
+            args="ip -j addr",
+            return_code=0,
+            stdout=json.dumps(
+                [
+                    {"ifname": "eth0", "addr_info": [{"family": "inet", "local": "127.0.0.1", "prefixlen": 10}]},
+                    {
+                        "ifname": "eth1",
+                        "addr_info": [{"family": "inet6", "local": "fe80::3efd:feff:fecf:8b72", "prefixlen": 64}],
+                    },
+                ]
+            ),
+        )
+        return interface_v4, interface_v6
+
+    def test_get_interface_by_ip(self, host, interfaces, mocker):
+        interface_v4, interface_v6 = interfaces
         host.network_interfaces = [interface_v4, interface_v6]
 
         assert host.utils.get_interface_by_ip(IPv4Address("127.0.0.1")) is interface_v4
@@ -40,7 +64,7 @@ class TestBaseUtils:
         with pytest.raises(UtilsFeatureException):
             host.utils.get_interface_by_ip(IPv4Interface("1.2.3.4"))
 
-        host.network.get_interfaces = mocker.Mock(return_value=[interface_v4, interface_v6])
+        host._get_all_network_interfaces = mocker.Mock(return_value=[interface_v4, interface_v6])
 
         assert host.utils.get_interface_by_ip(IPv4Address("127.0.0.1"), check_all_interfaces=True) is interface_v4
         assert (
@@ -50,3 +74,29 @@ class TestBaseUtils:
 
         with pytest.raises(UtilsFeatureException):
             host.utils.get_interface_by_ip(IPv4Interface("1.2.3.4"), check_all_interfaces=True)
+
+        interface_v4.ip.get_ips.assert_not_called()
+        interface_v6.ip.get_ips.assert_not_called()
+
+    def test_get_interfaces_by_ips(self, host, interfaces):
+        interface_v4, interface_v6 = interfaces
+        host.network_interfaces = [interface_v4, interface_v6]
+
+        assert host.utils.get_interfaces_by_ips(
+            [IPv4Address("127.0.0.1"), IPv6Address("fe80::3efd:feff:fecf:8b72"), IPv4Address("1.2.3.4")]
+        ) == {IPv4Address("127.0.0.1"): interface_v4, IPv6Address("fe80::3efd:feff:fecf:8b72"): interface_v6}
+        host.connection.execute_command.assert_called_once()
+
+    def test_get_interfaces_by_ips_interface_in_namespace(self, host, interfaces, mocker):
+        interface_v4, _ = interfaces
+        interface_ns = mocker.create_autospec(LinuxNetworkInterface)
+        interface_ns.name = "eth2"
+        interface_ns.namespace = "ns1"
+        interface_ns.ip.get_ips.return_value = IPs(v4=[IPv4Interface("10.0.0.1/24")])
+        host.network_interfaces = [interface_v4, interface_ns]
+
+        assert host.utils.get_interfaces_by_ips([IPv4Address("127.0.0.1"), IPv4Address("10.0.0.1")]) == {
+            IPv4Address("127.0.0.1"): interface_v4,
+            IPv4Address("10.0.0.1"): interface_ns,
+        }
+        interface_v4.ip.get_ips.assert_not_called()
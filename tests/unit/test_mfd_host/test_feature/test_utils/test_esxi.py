@@ -0,0 +1,105 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+from ipaddress import IPv4Address, IPv6Address
+from textwrap import dedent
+
+import pytest
+from mfd_connect import RPyCConnection
+from mfd_connect.base import ConnectionCompletedProcess
+from mfd_typing import OSName
+from mfd_model.config import HostModel
+
+from mfd_host import Host
+
+
+class TestESXiUtils:
+    @pytest.fixture
+    def host(self, mocker):
+        connection = mocker.create_autospec(RPyCConnection)
+        connection.get_os_name.return_value = OSName.ESXI
+
+        model = HostModel(role="sut")
+
+        yield Host(connection=connection, topology=model)
+
+        mocker.stopall()
+
+    def test_get_ip_address_index(self, host):
+        ipv4_output = dedent("""\
+            Name  IPv4 Address   IPv4 Netmask   IPv4 Broadcast  Address Type  Gateway      DHCP DNS
+            ----  -------------  -------------  --------------  ------------  -----------  --------
+            vmk0  10.10.10.10    255.255.255.0  10.10.10.255    DHCP          10.10.10.1       true
+            vmk1  192.168.0.1    255.255.255.0  192.168.0.255   STATIC        0.0.0.0         false
+            """)
+        ipv6_output = dedent("""\
+            Interface  Address                    Netmask  Type                Status
+            ---------  -------------------------  -------  ------------------  ---------
+            vmk0       fe80::250:56ff:fe6b:1234        64  STATIC              PREFERRED
+            """)
+        host.connection.execute_command.side_effect = [
+            ConnectionCompletedProcess("", stdout=ipv4_output, return_code=0),
+            ConnectionCompletedProcess("", stdout=ipv6_output, return_code=0),
+        ]
+
+        assert host.utils.get_ip_address_index() == {
+            IPv4Address("10.10.10.10"): "vmk0",
+            IPv4Address("192.168.0.1"): "vmk1",
+            IPv6Address("fe80::250:56ff:fe6b:1234"): "vmk0",
+        }
+
+    def test_get_interfaces_by_ips_of_vmkernel_interfaces(self, host, mocker):
+        ipv4_output = dedent("""\
+            Name  IPv4 Address   IPv4 Netmask   IPv4 Broadcast  Address Type  Gateway      DHCP DNS
+            ----  -------------  -------------  --------------  ------------  -----------  --------
+            vmk0  10.10.10.10    255.255.255.0  10.10.10.255    DHCP          10.10.10.1       true
+            vmk1  192.168.0.1    255.255.255.0  192.168.0.255   STATIC        0.0.0.0         false
+            vmk2  192.168.1.1    255.255.255.0  192.168.1.255   STATIC        0.0.0.0         false
+            """)
+        uplinks_output = dedent("""\
+            vmk0
+               Name: vmk0
+               MAC Address: 00:50:56:6b:12:34
+               Enabled: true
+               Portset: vSwitch0
+               Portgroup: Management Network
+               VDS Name: N/A
+            vmk1
+               Name: vmk1
+               Enabled: true
+               Portset: DvsPortset-0
+               Portgroup: N/A
+               VDS Name: dvs1
+            vmk2
+               Name: vmk2
+               Portset: vSwitch1
+               VDS Name: N/A
+            vSwitch0
+               Name: vSwitch0
+               Class: cswitch
+               Uplinks: vmnic0, vmnic1
+               Portgroups: VM Network, Management Network
+
+            vSwitch1
+               Name: vSwitch1
+               Uplinks:\x20
+            dvs1
+               Name: dvs1
+               VDS ID: 50 1b 2c
+               Uplinks: vmnic3, vmnic2
+            """)
+        host.connection.execute_command.side_effect = [
+            ConnectionCompletedProcess("", stdout=ipv4_output, return_code=0),
+            ConnectionCompletedProcess("", stdout="", return_code=0),
+            ConnectionCompletedProcess("", stdout=uplinks_output, return_code=0),
+        ]
+        interfaces = []
+        for name in ("vmnic1", "vmnic2"):
+            interface = mocker.Mock(spec=["name", "ip"])
+            interface.name = name
+            interfaces.append(interface)
+        host.network_interfaces = interfaces
+
+        assert host.utils.get_interfaces_by_ips(
+            [IPv4Address("10.10.10.10"), IPv4Address("192.168.0.1"), IPv4Address("192.168.1.1")]
+        ) == {IPv4Address("10.10.10.10"): interfaces[0], IPv4Address("192.168.0.1"): interfaces[1]}
+        assert host.connection.execute_command.call_count == 3
@@ -1,8 +1,11 @@
 # Copyright (C) 2025 Intel Corporation
 # SPDX-License-Identifier: MIT
+from ipaddress import IPv4Address, IPv6Address
+from textwrap import dedent
 
 import pytest
 from mfd_connect import RPyCConnection
+from mfd_connect.base import ConnectionCompletedProcess
 from mfd_typing import OSName
 from mfd_model.config import HostModel
 
@@ -30,3 +33,23 @@ class TestFreeBSDUtils:
         host.connection.execute_command.reset_mock()
         host.utils.set_icmp_echo(ignore_broadcasts=False)
         host.connection.execute_command.assert_called_once_with(cmd_broadcasts.format(1))
+
+    def test_get_ip_address_index(self, host):
+        output = dedent("""\
+            ixl0: flags=8863<UP,BROADCAST,RUNNING,SIMPLEX,MULTICAST> metric 0 mtu 1500
+            \toptions=4e507bb<RXCSUM,TXCSUM,VLAN_MTU,VLAN_HWTAGGING,JUMBO_MTU>
+            \tether 3c:fd:fe:cf:8b:72
+            \tinet 10.10.10.10 netmask 0xffffff00 broadcast 10.10.10.255
+            \tinet6 fe80::3efd:feff:fecf:8b72%ixl0 prefixlen 64 scopeid 0x1
+            ixl1: flags=8822<BROADCAST,SIMPLEX,MULTICAST> metric 0 mtu 1500
+            \tether 3c:fd:fe:cf:8b:73
+            lo0: flags=8049<UP,LOOPBACK,RUNNING,MULTICAST> metric 0 mtu 16384
+            \tinet 127.0.0.1 netmask 0xff000000
+            """)
+        host.connection.execute_command.return_value = ConnectionCompletedProcess("", stdout=output, return_code=0)
+
+        assert host.utils.get_ip_address_index() == {
+            IPv4Address("10.10.10.10"): "ixl0",
+            IPv6Address("fe80::3efd:feff:fecf:8b72"): "ixl0",
+            IPv4Address("127.0.0.1"): "lo0",
+        }
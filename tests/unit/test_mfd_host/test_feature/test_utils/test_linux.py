@@ -1,8 +1,8 @@
 # Copyright (C) 2025 Intel Corporation
 # SPDX-License-Identifier: MIT
-from ipaddress import IPv4Address
+import re
+from ipaddress import IPv4Address, IPv6Address
 from textwrap import dedent
-from unittest.mock import call
 
 import pytest
 from mfd_common_libs import log_levels
@@ -16,6 +16,13 @@ from mfd_host import Host
 from mfd_host.exceptions import HostModuleException, UtilsFeatureExecutionError
 
 
+def _get_batch_output(script, **kwargs):
+    """Get output of successful batch script, without outputs of commands."""
+    markers = re.findall(r"'(__mfd_host_batch_\w+:\d+):out'", script)
+    stdout = "".join(f"{marker}:out\n\n{marker}:rc:0\n\n{marker}:end\n" for marker in markers)
+    return ConnectionCompletedProcess(args=script, stdout=stdout, return_code=0)
+
+
 class TestLinuxUtils:
     @pytest.fixture
     def host(self, mocker):
@@ -39,14 +46,12 @@ class TestLinuxUtils:
 
     @pytest.mark.usefixtures("get_program_cmd_patch")
     def test_start_kedr(self, host):
-        start_kedr_output = dedent(
-            """\
+        start_kedr_output = dedent("""\
         Starting KEDR...
        /sbin/insmod /lib/modules/3.10.0-514.el7.x86_64/extra/kedr.ko target_name=i40e
        /sbin/insmod /lib/modules/3.10.0-514.el7.x86_64/extra/kedr_leak_check.ko
        /sbin/insmod /lib/modules/3.10.0-514.el7.x86_64/extra/kedr_lc_common_mm.ko
-       KEDR started."""
-        )
+       KEDR started.""")
         host.connection.execute_command.return_value = ConnectionCompletedProcess(
             args="", stdout=start_kedr_output, return_code=0
         )
@@ -131,27 +136,32 @@ class TestLinuxUtils:
     def test_set_icmp_echo(self, host):
         cmd_all = "echo '{}' > /proc/sys/net/ipv4/icmp_echo_ignore_all"
         cmd_broadcasts = "echo '{}' > /proc/sys/net/ipv4/icmp_echo_ignore_broadcasts"
+        host.connection.execute_command.side_effect = _get_batch_output
 
         host.utils.set_icmp_echo(ignore_all=True, ignore_broadcasts=True)
-        host.connection.execute_command.assert_has_calls(
-            [
-                call(cmd_all.format(1), shell=True),
-                call(cmd_broadcasts.format(1), shell=True),
-            ]
-        )
+        script = host.connection.execute_command.call_args.args[0]
+        assert cmd_all.format(1) in script and cmd_broadcasts.format(1) in script
 
         host.utils.set_icmp_echo(ignore_all=False, ignore_broadcasts=False)
-        host.connection.execute_command.assert_has_calls(
-            [
-                call(cmd_all.format(0), shell=True),
-                call(cmd_broadcasts.format(0), shell=True),
-            ]
-        )
+        script = host.connection.execute_command.call_args.args[0]
+        assert cmd_all.format(0) in script and cmd_broadcasts.format(0) in script
+        assert host.connection.execute_command.call_count == 2
+
+    def test_set_icmp_echo_in_batch(self, host):
+        host.connection.execute_command.side_effect = _get_batch_output
+
+        with host.batch():
+            host.utils.set_icmp_echo(ignore_all=True)
+            host.utils.set_icmp_echo(ignore_all=False)
+            host.connection.execute_command.assert_not_called()
+
+        host.connection.execute_command.assert_called_once()
+        assert host.connection.execute_command.call_args.args[0].count("icmp_echo_ignore_all") == 2
 
     def test_get_pretty_name_found(self, host):
         output = ConnectionCompletedProcess(
             "",
-            stdout='PRETTY_NAME="SUSE Linux Enterprise Server 15 SP7"',
+            stdout='kernel=6.4.0\nPRETTY_NAME="SUSE Linux Enterprise Server 15 SP7"',
             return_code=0,
         )
         expected_output = "SUSE Linux Enterprise Server 15 SP7"
@@ -159,9 +169,78 @@ class TestLinuxUtils:
         host.connection.execute_command.return_value = output
 
         assert expected_output == host.utils.get_pretty_name()
+        host.connection.execute_command.assert_called_once()
+
+    def test_get_pretty_name_missing_in_fingerprint(self, host):
+        host.connection.execute_command.side_effect = [
+            ConnectionCompletedProcess("", stdout="kernel=6.4.0\n", return_code=0),
+            ConnectionCompletedProcess("", stdout='PRETTY_NAME="SUSE Linux Enterprise Server 15 SP7"', return_code=0),
+        ]
+
+        assert host.utils.get_pretty_name() == "SUSE Linux Enterprise Server 15 SP7"
+        host.connection.execute_command.assert_called_with(
+            "cat /etc/os-release | grep -i 'pretty_name'", custom_exception=UtilsFeatureExecutionError, shell=True
+        )
+
+    def test_get_pretty_name_fingerprint_failed(self, host):
+        def _execute_command(command, custom_exception, **kwargs):
+            if not command.startswith("cat /etc/os-release"):
+                raise custom_exception(returncode=1, cmd=command, output="", stderr="")
+            return ConnectionCompletedProcess(
+                "", stdout='PRETTY_NAME="SUSE Linux Enterprise Server 15 SP7"', return_code=0
+            )
+
+        host.connection.execute_command.side_effect = _execute_command
+
+        assert host.utils.get_pretty_name() == "SUSE Linux Enterprise Server 15 SP7"
 
     def test_get_pretty_name_not_found(self, host):
-        host.connection.execute_command.side_effect = UtilsFeatureExecutionError(returncode=1, cmd="")
+        host.connection.execute_command.side_effect = [
+            ConnectionCompletedProcess("", stdout="kernel=6.4.0\n", return_code=0),
+            UtilsFeatureExecutionError(returncode=1, cmd=""),
+        ]
 
         with pytest.raises(UtilsFeatureExecutionError):
             host.utils.get_pretty_name()
+
+    def test_get_ip_address_index(self, host):
+        output = dedent("""\
+            [{"ifindex":1,"ifname":"lo","addr_info":[{"family":"inet","local":"127.0.0.1","prefixlen":8},
+            {"family":"inet6","local":"::1","prefixlen":128}]},
+            {"ifindex":2,"ifname":"eth0","addr_info":[{"family":"inet","local":"10.10.10.10","prefixlen":24},
+            {"family":"inet6","local":"fe80::1","prefixlen":64,"tentative":true}]},
+            {"ifindex":3,"ifname":"eth0.100","addr_info":[]}]""")
+        host.connection.execute_command.return_value = ConnectionCompletedProcess("", stdout=output, return_code=0)
+
+        assert host.utils.get_ip_address_index() == {
+            IPv4Address("127.0.0.1"): "lo",
+            IPv6Address("::1"): "lo",
+            IPv4Address("10.10.10.10"): "eth0",
+        }
+        host.connection.execute_command.assert_called_once_with("ip -j addr", expected_return_codes=None)
+
+    @pytest.mark.parametrize(
+        "json_output",
+        [
+            ConnectionCompletedProcess("", stdout="", stderr='Option "-j" is unknown', return_code=255),
+            ConnectionCompletedProcess("", stdout="1: lo: <LOOPBACK,UP,LOWER_UP> mtu 65536", return_code=0),
+        ],
+    )
+    def test_get_ip_address_index_without_json_output(self, host, json_output):
+        output = dedent(r"""
+            1: lo    inet 127.0.0.1/8 scope host lo\       valid_lft forever preferred_lft forever
+            2: eth0    inet 10.10.10.10/24 brd 10.10.10.255 scope global eth0\       valid_lft forever
+            2: eth0    inet6 fe80::1/64 scope link tentative \       valid_lft forever preferred_lft forever
+            3: eth0.100    inet6 fe80::2/64 scope link \       valid_lft forever preferred_lft forever
+            """)
+        host.connection.execute_command.side_effect = [
+            json_output,
+            ConnectionCompletedProcess("", stdout=output, return_code=0),
+        ]
+
+        assert host.utils.get_ip_address_index() == {
+            IPv4Address("127.0.0.1"): "lo",
+            IPv4Address("10.10.10.10"): "eth0",
+            IPv6Address("fe80::2"): "eth0.100",
+        }
+        host.connection.execute_command.assert_called_with("ip -o addr", custom_exception=UtilsFeatureExecutionError)
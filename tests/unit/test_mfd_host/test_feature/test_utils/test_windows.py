@@ -0,0 +1,73 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+from ipaddress import IPv4Address, IPv6Address
+from textwrap import dedent
+
+import pytest
+from mfd_connect import RPyCConnection
+from mfd_connect.base import ConnectionCompletedProcess
+from mfd_typing import OSName
+from mfd_model.config import HostModel
+
+from mfd_host import Host
+
+
+class TestWindowsUtils:
+    @pytest.fixture
+    def host(self, mocker):
+        connection = mocker.create_autospec(RPyCConnection)
+        connection.get_os_name.return_value = OSName.WINDOWS
+
+        model = HostModel(role="sut")
+
+        yield Host(connection=connection, topology=model)
+
+        mocker.stopall()
+
+    def test_get_ip_address_index(self, host):
+        output = dedent("""\
+            IPAddress         : fe80::3efd:feff:fecf:8b72%12
+            InterfaceIndex    : 12
+            InterfaceAlias    : Ethernet 2
+            AddressFamily     : IPv6
+            PrefixLength      : 64
+            AddressState      : Preferred
+
+            IPAddress         : 10.10.10.10
+            InterfaceIndex    : 12
+            InterfaceAlias    : Ethernet 2
+            AddressFamily     : IPv4
+            PrefixLength      : 24
+            AddressState      : Preferred
+
+            IPAddress         : 10.10.10.11
+            InterfaceIndex    : 12
+            InterfaceAlias    : Ethernet 2
+            AddressFamily     : IPv4
+            PrefixLength      : 24
+            AddressState      : Tentative
+
+            IPAddress         : 127.0.0.1
+            InterfaceIndex    : 1
+            InterfaceAlias    : Loopback Pseudo-Interface 1
+            AddressFamily     : IPv4
+            PrefixLength      : 8
+            AddressState      : Preferred
+            """)
+        host.connection.execute_powershell.return_value = ConnectionCompletedProcess("", stdout=output, return_code=0)
+
+        assert host.utils.get_ip_address_index() == {
+            IPv6Address("fe80::3efd:feff:fecf:8b72"): "Ethernet 2",
+            IPv4Address("10.10.10.10"): "Ethernet 2",
+            IPv4Address("127.0.0.1"): "Loopback Pseudo-Interface 1",
+        }
+        host.connection.execute_powershell.assert_called_once()
+
+        host.connection.execute_powershell.return_value = ConnectionCompletedProcess(
+            "", stdout=output.replace("\n", "\r\n"), return_code=0
+        )
+        assert host.utils.get_ip_address_index() == {
+            IPv6Address("fe80::3efd:feff:fecf:8b72"): "Ethernet 2",
+            IPv4Address("10.10.10.10"): "Ethernet 2",
+            IPv4Address("127.0.0.1"): "Loopback Pseudo-Interface 1",
+        }
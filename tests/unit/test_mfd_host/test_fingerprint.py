@@ -0,0 +1,160 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Tests for `mfd_host.fingerprint` module."""
+
+from textwrap import dedent
+
+import pytest
+from mfd_connect import RPyCConnection
+from mfd_connect.base import ConnectionCompletedProcess
+from mfd_typing import OSName
+
+from mfd_host import Host
+from mfd_host.exceptions import FingerprintExecutionError
+from mfd_host.fingerprint import BOOT_ID_COMMANDS, FINGERPRINT_COMMANDS, get_host_fingerprint
+
+LINUX_OUTPUT = dedent("""\
+    kernel=6.8.0-45-generic
+    boot_id=0b1f1c4e-6a0f-4a40-9d8a-0f6b7e6c2c11
+    cpu_count=448
+    PRETTY_NAME="Ubuntu 24.04.1 LTS"
+    """)
+
+
+class TestHostFingerprint:
+    @pytest.fixture
+    def connection(self, mocker):
+        connection = mocker.create_autospec(RPyCConnection)
+        connection.get_os_name.return_value = OSName.LINUX
+        connection.execute_command.return_value = ConnectionCompletedProcess(
+            args="", stdout=LINUX_OUTPUT, return_code=0
+        )
+        return connection
+
+    def test_os_name_read_once_per_connection(self, connection):
+        host = Host(connection=connection)
+        _ = host.utils, host.memory, host.stats, host.cpu, host.service, host.device
+
+        # one call for dispatch, others by external modules: OS verification in LinuxHost constructor, mfd-mount
+        assert connection.get_os_name.call_count == 3
+        assert host.fingerprint is get_host_fingerprint(connection)
+
+    def test_details_gathered_by_single_command(self, connection):
+        fingerprint = get_host_fingerprint(connection)
+
+        assert fingerprint.os_name is OSName.LINUX
+        assert fingerprint.kernel_version == "6.8.0-45-generic"
+        assert fingerprint.boot_id == "0b1f1c4e-6a0f-4a40-9d8a-0f6b7e6c2c11"
+        assert fingerprint.cpu_count == 448
+        assert fingerprint.pretty_name == "Ubuntu 24.04.1 LTS"
+        connection.execute_command.assert_called_once_with(
+            FINGERPRINT_COMMANDS[OSName.LINUX], shell=True, custom_exception=FingerprintExecutionError
+        )
+
+    def test_host_without_pretty_name(self, connection):
+        connection.execute_command.return_value = ConnectionCompletedProcess(
+            args="", stdout=LINUX_OUTPUT.replace('PRETTY_NAME="Ubuntu 24.04.1 LTS"\n', ""), return_code=0
+        )
+        fingerprint = get_host_fingerprint(connection)
+
+        assert fingerprint.pretty_name is None
+        assert fingerprint.cpu_count == 448
+        # grep not finding PRETTY_NAME doesn't fail the whole command
+        assert FINGERPRINT_COMMANDS[OSName.LINUX].endswith("|| true")
+
+    def test_failed_command(self, connection):
+        def _execute_command(command, custom_exception, **kwargs):
+            raise custom_exception(returncode=1, cmd=command, output="", stderr="")
+
+        connection.execute_command.side_effect = _execute_command
+
+        with pytest.raises(FingerprintExecutionError):
+            get_host_fingerprint(connection).cpu_count
+
+    def test_validate_same_boot_id(self, connection):
+        fingerprint = get_host_fingerprint(connection)
+        _ = fingerprint.boot_id
+        connection.execute_command.return_value = ConnectionCompletedProcess(
+            args="", stdout="0b1f1c4e-6a0f-4a40-9d8a-0f6b7e6c2c11\n", return_code=0
+        )
+
+        assert fingerprint.validate()
+        assert fingerprint.kernel_version == "6.8.0-45-generic"
+        connection.execute_command.assert_called_with(
+            BOOT_ID_COMMANDS[OSName.LINUX], shell=True, custom_exception=FingerprintExecutionError
+        )
+
+    def test_validate_boot_id_changed(self, connection):
+        fingerprint = get_host_fingerprint(connection)
+        _ = fingerprint.boot_id
+        connection.execute_command.return_value = ConnectionCompletedProcess(
+            args="", stdout="c5b6a6f4-2f3c-4b51-8f63-6f5d1e7e9a20\n", return_code=0
+        )
+
+        assert not fingerprint.validate()
+        connection.execute_command.return_value = ConnectionCompletedProcess(
+            args="", stdout=LINUX_OUTPUT.replace("6.8.0-45", "6.8.0-47"), return_code=0
+        )
+        assert fingerprint.kernel_version == "6.8.0-47-generic"
+
+    def test_details_validated_after_interval(self, connection, mocker):
+        monotonic = mocker.patch("mfd_host.fingerprint.monotonic", return_value=1000.0)
+        fingerprint = get_host_fingerprint(connection)
+        _ = fingerprint.kernel_version
+        connection.execute_command.side_effect = [
+            ConnectionCompletedProcess(args="", stdout="c5b6a6f4-2f3c-4b51-8f63-6f5d1e7e9a20\n", return_code=0),
+            ConnectionCompletedProcess(args="", stdout=LINUX_OUTPUT.replace("6.8.0-45", "6.8.0-47"), return_code=0),
+        ]
+
+        monotonic.return_value = 1059.0
+        assert fingerprint.kernel_version == "6.8.0-45-generic"
+        monotonic.return_value = 1060.0
+        assert fingerprint.kernel_version == "6.8.0-47-generic"
+        connection.execute_command.assert_any_call(
+            BOOT_ID_COMMANDS[OSName.LINUX], shell=True, custom_exception=FingerprintExecutionError
+        )
+
+    def test_validation_disabled(self, connection, mocker):
+        monotonic = mocker.patch("mfd_host.fingerprint.monotonic", return_value=1000.0)
+        host = Host(connection=connection, fingerprint_validation_interval=0)
+        _ = host.fingerprint.kernel_version
+
+        monotonic.return_value = 5000.0
+        assert host.fingerprint.kernel_version == "6.8.0-45-generic"
+        connection.execute_command.assert_called_once()
+
+    def test_validate_without_gathered_details(self, connection):
+        assert get_host_fingerprint(connection).validate()
+        connection.execute_command.assert_not_called()
+
+    def test_windows_details(self, mocker):
+        connection = mocker.create_autospec(RPyCConnection)
+        connection.get_os_name.return_value = OSName.WINDOWS
+        connection.execute_powershell.return_value = ConnectionCompletedProcess(
+            args="",
+            stdout=dedent("""\
+                kernel=10.0.20348.0
+                boot_id=2025-01-01T10:00:00.5000000+01:00
+                cpu_count=64
+                pretty_name=Microsoft Windows Server 2022 Datacenter
+                """),
+            return_code=0,
+        )
+        fingerprint = get_host_fingerprint(connection)
+
+        assert fingerprint.kernel_version == "10.0.20348.0"
+        assert fingerprint.cpu_count == 64
+        assert fingerprint.pretty_name == "Microsoft Windows Server 2022 Datacenter"
+        connection.execute_command.assert_not_called()
+
+    def test_esxi_without_boot_id(self, mocker):
+        connection = mocker.create_autospec(RPyCConnection)
+        connection.get_os_name.return_value = OSName.ESXI
+        connection.execute_command.return_value = ConnectionCompletedProcess(
+            args="", stdout="kernel=8.0.0\ncpu_count=48\npretty_name=VMware ESXi 8.0.0 build-20513097\n", return_code=0
+        )
+        fingerprint = get_host_fingerprint(connection)
+
+        assert fingerprint.boot_id is None
+        assert fingerprint.validate()
+        connection.execute_command.assert_called_once()
@@ -0,0 +1,146 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Tests for `mfd_host.fleet` module."""
+
+import threading
+import time
+
+import pytest
+from mfd_connect import RPyCConnection
+from mfd_model.config import HostModel, TopologyModelBase
+from mfd_model.config.__version__ import VERSION
+from mfd_typing import OSName
+
+from mfd_host import Host, HostFleet
+from mfd_host.exceptions import HostFleetException
+
+HOSTS = 8
+
+
+class TestHostFleet:
+    @pytest.fixture
+    def connection_factory(self, mocker):
+        def _create_connection(*_):
+            connection = mocker.create_autospec(RPyCConnection)
+            connection.get_os_name.return_value = OSName.LINUX
+            return connection
+
+        return _create_connection
+
+    @pytest.fixture
+    def hosts(self, connection_factory):
+        return [Host(connection=connection_factory(), name=f"sut{index}") for index in range(HOSTS)]
+
+    def test_run_returns_results_in_fleet_order(self, hosts):
+        result = HostFleet(hosts).run(lambda host: host.name)
+
+        assert list(result) == hosts
+        assert list(result.returned.values()) == [f"sut{index}" for index in range(HOSTS)]
+        assert result.succeeded
+        assert all(host_result.duration >= 0 for host_result in result.values())
+
+    def test_call_feature_method(self, hosts, mocker):
+        for index, host in enumerate(hosts):
+            host.cpu.get_log_cpu_no = mocker.Mock(return_value=index * 2)
+
+        result = HostFleet(hosts).call("cpu.get_log_cpu_no")
+
+        assert result.returned == {host: index * 2 for index, host in enumerate(hosts)}
+        hosts[0].cpu.get_log_cpu_no.assert_called_once_with()
+
+    def test_call_passes_arguments(self, hosts, mocker):
+        for host in hosts:
+            host.service.restart_service = mocker.Mock()
+
+        HostFleet(hosts).call("service.restart_service", "sshd")
+
+        for host in hosts:
+            host.service.restart_service.assert_called_once_with("sshd")
+
+    def test_exceptions_do_not_fail_fast(self, hosts):
+        def _call(host):
+            if host is hosts[1]:
+                raise RuntimeError("host unreachable")
+            return host.name
+
+        result = HostFleet(hosts).run(_call)
+
+        assert not result.succeeded
+        assert list(result.failed) == [hosts[1]]
+        assert isinstance(result[hosts[1]].exception, RuntimeError)
+        assert len(result.returned) == HOSTS - 1
+        with pytest.raises(HostFleetException, match="Call failed on 1 of 8 hosts - sut1") as exception_info:
+            result.raise_on_failure()
+        assert exception_info.value.__cause__ is result[hosts[1]].exception
+
+    def test_calls_executed_concurrently(self, hosts):
+        start = time.monotonic()
+        HostFleet(hosts).run(lambda host: time.sleep(0.2))
+
+        assert time.monotonic() - start < 0.2 * HOSTS / 2
+
+    def test_workers_bounded(self, hosts):
+        running = []
+        max_running = []
+        lock = threading.Lock()
+
+        def _call(host):
+            with lock:
+                running.append(host)
+                max_running.append(len(running))
+            time.sleep(0.01)
+            with lock:
+                running.remove(host)
+
+        HostFleet(hosts, max_workers=3).run(_call)
+
+        assert max(max_running) == 3
+
+    def test_timeout_abandons_hanging_host(self, hosts):
+        release = threading.Event()
+
+        def _call(host):
+            if host is hosts[0]:
+                release.wait(5)
+            return host.name
+
+        start = time.monotonic()
+        result = HostFleet(hosts, timeout=0.2).run(_call)
+        release.set()
+
+        assert time.monotonic() - start < 1
+        assert isinstance(result[hosts[0]].exception, TimeoutError)
+        assert list(result.failed) == [hosts[0]]
+
+    def test_timeout_counted_from_call_start(self, hosts):
+        start = time.monotonic()
+        result = HostFleet(hosts[:4], max_workers=1).run(lambda host: time.sleep(0.1), timeout=0.3)
+
+        assert time.monotonic() - start > 0.3
+        assert result.succeeded
+
+    def test_invalid_max_workers(self, hosts):
+        with pytest.raises(HostFleetException):
+            HostFleet(hosts, max_workers=0)
+
+    def test_from_topology(self, connection_factory):
+        topology = TopologyModelBase(
+            metadata={"version": VERSION}, hosts=[HostModel(role="sut", name=f"sut{index}") for index in range(4)]
+        )
+
+        fleet = HostFleet.from_topology(topology, connection_factory, max_workers=2)
+
+        assert [host.name for host in fleet] == ["sut0", "sut1", "sut2", "sut3"]
+        assert all(host.topology is model for host, model in zip(fleet, topology.hosts))
+        assert fleet.max_workers == 2
+
+    def test_from_topology_failed_connection(self, connection_factory):
+        def _failing_factory(model):
+            if model.name == "sut1":
+                raise ConnectionError("refused")
+            return connection_factory()
+
+        models = [HostModel(role="sut", name=f"sut{index}") for index in range(3)]
+
+        with pytest.raises(HostFleetException, match="Failed to create 1 of 3 hosts - sut1"):
+            HostFleet.from_topology(models, _failing_factory)
@@ -0,0 +1,200 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Tests for `mfd_host.instrumentation` module."""
+
+import json
+import logging
+import time
+
+import pytest
+from mfd_connect import RPyCConnection
+from mfd_connect.base import ConnectionCompletedProcess
+from mfd_connect.exceptions import ConnectionCalledProcessError
+from mfd_typing import OSName
+
+from mfd_host import Host
+from mfd_host.feature.base import BaseFeature
+from mfd_host.fingerprint import get_host_fingerprint
+from mfd_host.instrumentation import (
+    Histogram,
+    HistogramSink,
+    InstrumentationRecord,
+    InstrumentedConnection,
+    JsonLinesSink,
+    LoggingSummarySink,
+    disable_instrumentation,
+    enable_instrumentation,
+    instrumented,
+    is_instrumentation_enabled,
+)
+
+MEMINFO = "MemTotal:       16318668 kB\nMemFree:         1290716 kB\n"
+
+
+class _Feature(BaseFeature):
+    def outer(self):
+        self.inner()
+        self._connection.execute_command("echo outer")
+        time.sleep(0.01)
+
+    def inner(self):
+        return self._connection.execute_command("echo inner").stdout
+
+    def failing(self):
+        raise ValueError
+
+
+def _record(name="cmd", duration=0.001, kind="command"):
+    return InstrumentationRecord(kind=kind, name=name, host=None, started=0.0, duration=duration)
+
+
+class TestInstrumentation:
+    @pytest.fixture
+    def host(self, mocker):
+        connection = mocker.create_autospec(RPyCConnection)
+        connection.get_os_name.return_value = OSName.LINUX
+        connection.execute_command.side_effect = lambda command, **kwargs: ConnectionCompletedProcess(
+            args=command, stdout=MEMINFO if "meminfo" in command else f"{command[5:]}\n", return_code=0
+        )
+        host = Host(connection=connection, name="sut")
+        yield host
+        disable_instrumentation()
+
+    def test_disabled_by_default(self, host):
+        assert not is_instrumentation_enabled()
+        assert host.stats._connection is host.connection
+        assert host.stats.get_meminfo() == {"MemTotal": "16318668", "MemFree": "1290716"}
+
+    def test_method_and_command_recorded(self, host):
+        with instrumented() as (sink,):
+            host.stats.get_meminfo()
+            host.stats.get_meminfo()
+
+        method = sink.get_histogram("method", "LinuxStats.get_meminfo")
+        command = sink.get_histogram("command", "cat /proc/meminfo")
+        assert (method.count, method.commands, method.stdout_bytes) == (2, 2, 2 * len(MEMINFO))
+        assert (command.count, command.stdout_bytes) == (2, 2 * len(MEMINFO))
+        assert 0 < method.parse_time <= method.total_time
+        assert not is_instrumentation_enabled()
+
+    def test_nested_methods(self, host):
+        records = []
+        sink = HistogramSink()
+        sink.record = records.append
+        feature = _Feature(connection=host.connection, host=host)
+
+        with instrumented(sink):
+            feature.outer()
+
+        assert [(record.kind, record.name) for record in records] == [
+            ("command", "echo inner"),
+            ("method", "_Feature.inner"),
+            ("command", "echo outer"),
+            ("method", "_Feature.outer"),
+        ]
+        inner_command, inner, outer_command, outer = records
+        assert inner_command.method == "_Feature.inner"
+        assert outer_command.method == "_Feature.outer"
+        assert (outer.commands, outer.stdout_bytes) == (2, len("inner\nouter\n"))
+        assert outer.parse_time >= 0.01
+        assert outer.host == inner_command.host == "sut"
+
+    def test_failures_recorded(self, host):
+        records = []
+        sink = HistogramSink()
+        sink.record = records.append
+        host.connection.execute_command.side_effect = ConnectionCalledProcessError(returncode=1, cmd="")
+        feature = _Feature(connection=host.connection, host=host)
+
+        with instrumented(sink):
+            with pytest.raises(ValueError):
+                feature.failing()
+            with pytest.raises(ConnectionCalledProcessError):
+                feature.inner()
+
+        assert [(record.name, record.failed) for record in records] == [
+            ("_Feature.failing", True),
+            ("echo inner", True),
+            ("_Feature.inner", True),
+        ]
+
+    def test_failing_sink_does_not_affect_call(self, host, mocker):
+        sink = HistogramSink()
+        mocker.patch.object(sink, "record", side_effect=RuntimeError)
+
+        with instrumented(sink):
+            assert host.stats.get_mem_used() == 16318668 - 1290716
+
+    def test_wrapped_method_keeps_metadata(self, host):
+        assert type(host.stats).get_meminfo.__name__ == "get_meminfo"
+        assert "/proc/meminfo" in type(host.stats).get_meminfo.__doc__
+
+    def test_json_lines_sink(self, host, tmp_path):
+        path = tmp_path / "records.jsonl"
+
+        with instrumented(JsonLinesSink(path)):
+            host.stats.get_meminfo()
+
+        records = [json.loads(line) for line in path.read_text().splitlines()]
+        assert [(record["kind"], record["name"]) for record in records] == [
+            ("command", "cat /proc/meminfo"),
+            ("method", "LinuxStats.get_meminfo"),
+        ]
+        assert records[1]["stdout_bytes"] == len(MEMINFO)
+
+    def test_logging_summary_sink(self, host, caplog):
+        caplog.set_level(logging.INFO, logger="mfd_host.instrumentation")
+        enable_instrumentation(LoggingSummarySink())
+        host.stats.get_meminfo()
+
+        assert not caplog.records
+        disable_instrumentation()
+
+        assert "LinuxStats.get_meminfo" in caplog.text
+        assert "cat /proc/meminfo" in caplog.text
+
+    def test_instrumented_connection_delegates(self, host):
+        host.connection.ip = "10.10.10.10"
+
+        assert InstrumentedConnection(host.connection).ip == "10.10.10.10"
+        assert isinstance(InstrumentedConnection(host.connection), RPyCConnection)
+
+    @pytest.mark.parametrize("coalesce_commands", [False, True])
+    def test_feature_results_same_with_instrumentation(self, host, coalesce_commands):
+        host.connection.modules.return_value.socket.gethostname.return_value = "sut\n"
+        host = Host(connection=host.connection, name="sut", coalesce_commands=coalesce_commands)
+        expected = (host.utils.get_hostname(), host.stats.get_meminfo(), host.stats.get_mem_used())
+
+        with instrumented():
+            assert (host.utils.get_hostname(), host.stats.get_meminfo(), host.stats.get_mem_used()) == expected
+            assert get_host_fingerprint(host.stats._connection) is host.fingerprint
+
+        assert expected[0] == "sut"
+
+
+class TestHistogram:
+    def test_statistics(self):
+        histogram = Histogram()
+        for duration in [0.00005, 0.001, 0.001, 0.002, 0.5]:
+            histogram.add(_record(duration=duration))
+
+        assert histogram.count == 5
+        assert histogram.min_time == 0.00005
+        assert histogram.max_time == 0.5
+        assert histogram.mean_time == pytest.approx(0.10081)
+        assert histogram.percentile(50) == pytest.approx(0.0016)
+        assert histogram.percentile(100) == 0.5
+
+    def test_empty(self):
+        assert Histogram().percentile(95) == 0.0
+        assert Histogram().mean_time == 0.0
+
+    def test_summary_ordered_by_total_time(self):
+        sink = HistogramSink()
+        sink.record(_record("fast", 0.001))
+        sink.record(_record("slow", 0.1))
+
+        lines = sink.summary().splitlines()
+
+        assert lines[0].startswith("command")
+        assert [line.split()[0] for line in lines[1:]] == ["slow", "fast"]
@@ -0,0 +1,126 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+import pytest
+from mfd_connect import RPyCConnection
+from mfd_network_adapter.network_adapter_owner.exceptions import NetworkAdapterIncorrectData
+from mfd_typing import OSName, PCIAddress, PCIDevice
+from mfd_typing.network_interface import InterfaceInfo, LinuxInterfaceInfo, InterfaceType
+from mfd_model.config import HostModel, NetworkInterfaceModelBase as NetworkInterfaceModel
+
+from mfd_host import Host
+from mfd_host.interface_index import InterfaceInfoIndex, get_pci_address_key
+
+
+class TestInterfaceInfoIndex:
+    @pytest.fixture
+    def host(self, mocker):
+        connection = mocker.create_autospec(RPyCConnection)
+        connection.get_os_name.return_value = OSName.LINUX
+        yield Host(connection=connection)
+        mocker.stopall()
+
+    @pytest.fixture
+    def interfaces_info(self):
+        return [
+            LinuxInterfaceInfo(
+                name="eth0", pci_address=PCIAddress(data="0000:18:00.0"), pci_device=PCIDevice(data="8086:1592")
+            ),
+            LinuxInterfaceInfo(
+                name="eth1", pci_address=PCIAddress(data="0000:18:00.1"), pci_device=PCIDevice(data="8086:1592")
+            ),
+            LinuxInterfaceInfo(
+                name="eth2",
+                pci_address=PCIAddress(data="0000:5e:00.0"),
+                pci_device=PCIDevice(data="8086:1572:8086:0001"),
+            ),
+            LinuxInterfaceInfo(
+                name="eth2v0",
+                pci_address=PCIAddress(data="0000:5e:02.0"),
+                pci_device=PCIDevice(data="8086:154c"),
+                interface_type=InterfaceType.VF,
+            ),
+            LinuxInterfaceInfo(
+                name="eth3", pci_address=PCIAddress(data="0000:af:00.0"), pci_device=PCIDevice(data="15b3:1017")
+            ),
+            LinuxInterfaceInfo(name="br0", interface_type=InterfaceType.VIRTUAL_DEVICE),
+        ]
+
+    @pytest.mark.parametrize(
+        "criteria",
+        [
+            {},
+            {"pci_address": PCIAddress(data="0000:5e:00.0")},
+            {"pci_address": PCIAddress(data="0000:00:00.0")},
+            {"pci_device": PCIDevice(data="8086:1592")},
+            {"pci_device": PCIDevice(data="8086:1572")},
+            {"pci_device": PCIDevice(data="8086:1572:8086:0002")},
+            {"pci_device": PCIDevice(data="8086:1592"), "interface_indexes": [1]},
+            {"interface_names": ["eth3", "eth0"]},
+            {"interface_names": ["foo"]},
+            {"family": "CVL"},
+            {"family": "FVL"},
+            {"speed": "@100G"},
+            {"family": "FVL", "speed": "100G"},
+            {"family": "FVL", "interface_indexes": [0, 1]},
+            {"all_interfaces": True},
+            {"random_interface": False, "all_interfaces": True},
+        ],
+    )
+    def test_filter_same_as_network_adapter_owner(self, host, interfaces_info, criteria):
+        expected = host.network._filter_interfaces_info(all_interfaces_info=interfaces_info, **criteria)
+        assert InterfaceInfoIndex(interfaces_info).filter(**criteria) == expected
+
+    def test_filter_random_interface(self, interfaces_info, mocker):
+        choice = mocker.patch("mfd_host.interface_index.random.choice", side_effect=lambda x: x[-1])
+        assert InterfaceInfoIndex(interfaces_info).filter(
+            pci_device=PCIDevice(data="8086:1592"), random_interface=True
+        ) == [interfaces_info[1]]
+        choice.assert_called_once_with(interfaces_info[:2])
+
+    def test_filter_incorrect_criteria(self, interfaces_info):
+        index = InterfaceInfoIndex(interfaces_info)
+        with pytest.raises(NetworkAdapterIncorrectData):
+            index.filter(interface_names=["eth0"], pci_device=PCIDevice(data="8086:1592"))
+        with pytest.raises(NetworkAdapterIncorrectData):
+            index.filter(interface_names=["eth0"], random_interface=True, all_interfaces=True)
+
+    def test_filter_interface_index_out_of_range(self, interfaces_info):
+        with pytest.raises(IndexError):
+            InterfaceInfoIndex(interfaces_info).filter(interface_names=["eth0"], interface_indexes=[1])
+
+    @pytest.mark.parametrize(
+        "model",
+        [
+            NetworkInterfaceModel(pci_address="0000:18:00.1", interface_name="vmnic1"),
+            NetworkInterfaceModel(pci_device="8086:1592:8086:0002"),
+            NetworkInterfaceModel(family="CVL", interface_index=1),
+            NetworkInterfaceModel(interface_name="vmnic0", random_interface=True, all_interfaces=True),
+        ],
+    )
+    def test_topology_filter_same_as_esxi_owner(self, mocker, model):
+        connection = mocker.create_autospec(RPyCConnection)
+        connection.get_os_name.return_value = OSName.ESXI
+        host = Host(connection=connection, topology=HostModel(role="sut", network_interfaces=[model]))
+        interfaces_info = [
+            InterfaceInfo(
+                name="vmnic0", pci_address=PCIAddress(data="0000:18:00.0"), pci_device=PCIDevice(data="8086:1592")
+            ),
+            InterfaceInfo(
+                name="vmnic1", pci_address=PCIAddress(data="0000:18:00.1"), pci_device=PCIDevice(data="8086:1592")
+            ),
+            InterfaceInfo(
+                name="vmnic2", pci_address=PCIAddress(data="0000:af:00.0"), pci_device=PCIDevice(data="15b3:1017")
+            ),
+        ]
+        filter_interfaces_info = mocker.spy(host.network, "_filter_interfaces_info")
+
+        filtered_info = host._get_filtered_interface_info_by_topology(
+            interfaces_info=interfaces_info, ignore_instantiate=True
+        )
+
+        assert [info for info, _ in filtered_info] == filter_interfaces_info.spy_return
+        assert filter_interfaces_info.call_args.kwargs["all_interfaces_info"] == interfaces_info
+
+    def test_get_pci_address_key(self):
+        assert get_pci_address_key(None) is None
+        assert get_pci_address_key(PCIAddress(data="0001:5e:02.3")) == (1, 0x5E, 2, 3)
@@ -0,0 +1,112 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+from textwrap import dedent
+from time import sleep
+
+import pytest
+from mfd_connect import RPyCConnection
+from mfd_connect.process import RemoteProcess
+from mfd_typing import OSName
+from mfd_typing.network_interface import LinuxInterfaceInfo, InterfaceType
+
+from mfd_host import Host
+from mfd_host.exceptions import InterfaceWatcherException
+from mfd_host.interface_watcher import InterfaceWatcher, parse_ip_monitor_line, parse_udevadm_monitor_line
+
+IP_MONITOR_OUTPUT = dedent("""\
+    7: eth0v0: <BROADCAST,MULTICAST> mtu 1500 qdisc noop state DOWN group default \\    link/ether 02:00:00:00:00:01
+    8: eth0v1: <BROADCAST,MULTICAST> mtu 1500 qdisc noop state DOWN group default \\    link/ether 02:00:00:00:00:02
+    Deleted 5: eth0.100@eth0: <BROADCAST,MULTICAST> mtu 1500 qdisc noop state DOWN \\    link/ether 02:00:00:00:00:03
+    """).splitlines()
+
+
+class TestInterfaceWatcher:
+    @pytest.fixture
+    def host(self, mocker):
+        connection = mocker.create_autospec(RPyCConnection)
+        connection.get_os_name.return_value = OSName.LINUX
+        yield Host(connection=connection)
+        mocker.stopall()
+
+    def test_parse_ip_monitor_line(self):
+        assert [parse_ip_monitor_line(line) for line in IP_MONITOR_OUTPUT] == ["eth0v0", "eth0v1", "eth0.100"]
+        assert parse_ip_monitor_line("    link/ether 02:00:00:00:00:01 brd ff:ff:ff:ff:ff:ff") is None
+
+    def test_parse_udevadm_monitor_line(self):
+        line = "KERNEL[5462.431220] add      /devices/pci0000:17/0000:17:02.0/0000:18:02.1/net/eth0v1 (net)"
+        assert parse_udevadm_monitor_line(line) == "eth0v1"
+        assert parse_udevadm_monitor_line("monitor will print the received events for:") is None
+
+    def test_watcher_refreshes_affected_interfaces(self, host, mocker):
+        refresh = mocker.patch.object(host, "refresh_network_interfaces")
+        watcher = InterfaceWatcher(host, IP_MONITOR_OUTPUT, debounce=0.5, refresh_kwargs={"extended": ["foo"]})
+        watcher.start()
+        watcher.join(timeout=5)
+
+        assert not watcher.running
+        refresh.assert_called_once_with(interface_names=["eth0.100", "eth0v0", "eth0v1"], extended=["foo"])
+        assert watcher.refresh_count == 1
+
+    def test_watcher_refresh_error_does_not_stop_watcher(self, host, mocker):
+        refresh = mocker.patch.object(host, "refresh_network_interfaces", side_effect=[ValueError, None])
+
+        def event_source():
+            yield IP_MONITOR_OUTPUT[0]
+            sleep(0.3)
+            yield IP_MONITOR_OUTPUT[1]
+
+        watcher = InterfaceWatcher(host, event_source(), debounce=0)
+        watcher.start()
+        watcher.join(timeout=5)
+
+        assert refresh.call_count == 2
+        assert watcher.refresh_count == 1
+        assert isinstance(watcher.last_error, ValueError)
+        with pytest.raises(InterfaceWatcherException):
+            watcher.start()
+
+    def test_start_interface_watcher_with_fake_event_stream(self, host, mocker):
+        get_all_interfaces_info = mocker.patch(
+            "mfd_network_adapter.network_adapter_owner.linux.LinuxNetworkAdapterOwner._get_all_interfaces_info",
+            return_value=[LinuxInterfaceInfo(name="eth0")],
+        )
+        mocker.patch.object(host, "_get_scoped_interfaces_info", return_value=None)
+        host.refresh_network_interfaces()
+        eth0 = host.network_interfaces[0]
+        get_all_interfaces_info.return_value = [
+            LinuxInterfaceInfo(name="eth0", namespace="foo"),
+            LinuxInterfaceInfo(name="eth0v0", interface_type=InterfaceType.VF),
+            LinuxInterfaceInfo(name="eth0v1", interface_type=InterfaceType.VF),
+        ]
+
+        watcher = host.start_interface_watcher(event_source=IP_MONITOR_OUTPUT, debounce=0.1)
+        watcher.join(timeout=5)
+
+        assert [x.name for x in host.network_interfaces] == ["eth0", "eth0v0", "eth0v1"]
+        assert host.network_interfaces[0] is eth0
+        assert eth0.namespace is None
+        host.stop_interface_watcher()
+        assert host.interface_watcher is None
+        host.connection.start_process.assert_not_called()
+
+    def test_start_interface_watcher_remote_process(self, host, mocker):
+        process = mocker.create_autospec(RemoteProcess)
+        process.get_stdout_iter.return_value = iter([])
+        process.running = True
+        host.connection.start_process.return_value = process
+
+        host.start_interface_watcher(source="udev")
+        host.connection.start_process.assert_called_once_with(
+            "udevadm monitor --kernel --subsystem-match=net", shell=True
+        )
+        host.stop_interface_watcher()
+        process.stop.assert_called_once()
+
+    def test_start_interface_watcher_errors(self, host, mocker):
+        with pytest.raises(InterfaceWatcherException):
+            host.start_interface_watcher(source="foo")
+
+        mocker.patch.object(InterfaceWatcher, "running", new_callable=mocker.PropertyMock, return_value=True)
+        host.start_interface_watcher(event_source=[])
+        with pytest.raises(InterfaceWatcherException):
+            host.start_interface_watcher(event_source=[])
@@ -0,0 +1,30 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Tests for `mfd_host.lazy_import` module."""
+
+import pytest
+
+import mfd_host.feature.stats as stats_package
+from mfd_host.lazy_import import lazy_getattr
+
+
+class TestLazyImport:
+    def test_attribute_imported_from_submodule(self):
+        from mfd_host.feature.stats.linux import LinuxStats
+
+        assert stats_package.LinuxStats is LinuxStats
+
+    def test_union_of_attributes(self):
+        from mfd_host.feature.stats.base import BaseFeatureStats
+        from mfd_host.feature.stats.windows import WindowsStats
+
+        feature_type = stats_package.StatsFeatureType
+
+        assert BaseFeatureStats in feature_type.__args__
+        assert WindowsStats in feature_type.__args__
+
+    def test_unknown_attribute(self):
+        __getattr__ = lazy_getattr("mfd_host.feature.stats", attributes={"LinuxStats": ".linux"})
+
+        with pytest.raises(AttributeError, match="has no attribute 'WindowsStats'"):
+            __getattr__("WindowsStats")
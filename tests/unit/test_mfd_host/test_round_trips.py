@@ -0,0 +1,499 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Round trip budgets of Host and feature methods, remote commands are counted by fake connection."""
+
+import re
+from ipaddress import IPv4Address
+from pathlib import PurePosixPath, PureWindowsPath
+from types import SimpleNamespace
+from typing import Any, Iterable, Optional, Union
+
+import pytest
+from mfd_connect import Connection
+from mfd_connect.base import ConnectionCompletedProcess
+from mfd_connect.exceptions import ConnectionCalledProcessError
+from mfd_network_adapter.data_structures import State
+from mfd_typing import OSBitness, OSName, OSType
+from mfd_typing.cpu_values import CPUArchitecture
+from mfd_typing.network_interface import InterfaceType
+
+from mfd_host import Host
+from mfd_host.exceptions import StatsSamplerException, UtilsFeatureException
+from mfd_host.feature.memory.exceptions import MountDiskDirectoryError
+from mfd_host.feature.registry import FEATURE_REGISTRY, get_feature_class
+from mfd_host.feature.stats.data_structures import SoftnetStat
+from mfd_host.feature.stats.linux import INTERRUPTS_SEPARATOR, PROC_STAT_SEPARATOR
+
+BATCH_SHELL_COMMAND_REGEX = re.compile(
+    r"^printf '%s\\n' '(?P<marker>\S+):(?P<index>\d+):out'\n\{ (?P<command>.*?)\n\}", re.M
+)
+BATCH_POWERSHELL_COMMAND_REGEX = re.compile(
+    r"Write-Output '(?P<marker>\S+):(?P<index>\d+):out'.*?try \{ & \{ (?P<command>.*?) \} \| Out-String"
+)
+
+INTERFACES = 64
+MEMINFO = "MemTotal:       16318668 kB\nMemFree:         1290716 kB\nMemAvailable:    8290716 kB\n"
+TOP = (
+    "top - 19:43:02 up 111 days, 22:16,  0 users,  load average: 0.46, 0.31, 0.22\n"
+    "%Cpu0  :  0.0 us,  6.2 sy,  0.0 ni, 93.8 id,  0.0 wa,  0.0 hi,  0.0 si,  0.0 st\n"
+    "MiB Mem :  78924.9 total,  60415.4 free,   3092.8 used,  15416.8 buff/cache\n"
+    "MiB Swap:   8192.0 total,   8129.9 free,     62.1 used.  74997.8 avail Mem\n"
+    "    PID USER      PR  NI    VIRT    RES    SHR S  %CPU  %MEM     TIME+ COMMAND\n"
+    "      1 root      20   0  169712  10520   6392 S   0.0   0.0   3:17.91 systemd\n"
+)
+MPSTAT = (
+    "Linux 5.15.0-88-generic (host) \t11/22/2023 \t_x86_64_\t(1 CPU)\n\n"
+    "12:17:07 PM  CPU    %usr   %nice    %sys   %idle\n12:17:07 PM  all    0.06    0.00    0.03   99.91\n\n"
+    "12:17:07 PM  CPU    intr/s\n12:17:07 PM  all    122.44\n"
+)
+PROC_STAT = "cpu  200 0 100 1600 50 0 50 0 0 0\ncpu0 100 0 50 800 25 0 25 0 0 0\ncpu1 100 0 50 800 25 0 25 0 0 0\n"
+INTERRUPTS = "      CPU0  CPU1\n134:  100  0  IR-PCI-MSI 524288-edge  ens801f0-TxRx-0\n"
+COUNTER = "Timestamp : 11/22/2023 12:17:07 PM\nReadings  : \\\\host\\memory\\available bytes :\n            1290716\n\n"
+
+LINUX_RESPONSES = {
+    r"^echo kernel=": (
+        "kernel=6.8.0-45-generic\nboot_id=0b1f1c4e-6a0f-4a40-9d8a-0f6b7e6c2c11\ncpu_count=448\n"
+        'PRETTY_NAME="Ubuntu 22.04.3 LTS"\n'
+    ),
+    r"^cat /proc/meminfo": MEMINFO,
+    r"^cat /proc/stat; sleep": f"{PROC_STAT}{PROC_STAT_SEPARATOR}\n{PROC_STAT}",
+    r"^cat /proc/stat": PROC_STAT,
+    r"^cat /proc/uptime /proc/\w+; sleep": f"1000.00 0\n{INTERRUPTS}{INTERRUPTS_SEPARATOR}\n1001.00 0\n{INTERRUPTS}",
+    r"^cat /proc/uptime /proc/net/softnet_stat": "1001.00 0\n00000010 00000000 00000000\n",
+    r"^cat /proc/uptime": f"1000.00 0\n{INTERRUPTS}",
+    r"^grep MemAvailable": "8290716\n",
+    r"^df /mnt/ram": ["", "tmpfs 1024 0 1024 0% /mnt/ram\n"],
+    r"^df /dev/hugepages": ["", "nodev 0 0 0 - /dev/hugepages\n"],
+    r"^dmidecode": "Number Of Devices: 16\n",
+    r"^top -b": TOP,
+    r"^mpstat -A": MPSTAT,
+    r"^nproc": "448\n",
+    r"^which kedr": "/usr/sbin/kedr\n",
+    r"^cat /etc/os-release": 'PRETTY_NAME="Ubuntu 22.04.3 LTS"\n',
+    r"^ip -j addr": "[]",
+    r"^systemctl status": "1\n",
+    r"^pidof irqbalance": [("1234\n", 0), ("", 1)],
+}
+WINDOWS_RESPONSES = {
+    r"^\$os = Get-CimInstance Win32_OperatingSystem": (
+        "kernel=10.0.20348.0\nboot_id=2023-11-22T12:17:07.5000000+01:00\ncpu_count=56\n"
+        "pretty_name=Microsoft Windows Server 2022 Datacenter\n"
+    ),
+    r"^Get-counter": COUNTER,
+    r"^Get-WmiObject -class Win32_processor": "DeviceID : CPU0\nNumberOfCores : 28\nNumberOfLogicalProcessors : 56\n",
+    r"^gwmi win32_processor": "NumberOfCores : 28\n",
+    r"^gwmi win32_computersystem": "NumberOfLogicalProcessors : 56\n",
+    r"^gwmi win32_networkadapter": "ConfigManagerErrorCode : 22\n",
+    r"Coreinfo": "NUMA Node 0\nNUMA Node 1\n",
+    r"^bcdedit": "The operation completed successfully.\n",
+    r"devcon\S* disable": "PCI\\VEN_8086&DEV_1592 : Disabled\n1 device(s) disabled.\n",
+    r"devcon\S* enable": "PCI\\VEN_8086&DEV_1592 : Enabled\n1 device(s) are enabled.\n",
+    r"devcon\S* find": "PCI\\VEN_8086&DEV_1592\\0 : Intel(R) Ethernet Controller E810-C\n1 matching device(s) found.\n",
+    r"devcon\S* resources": (
+        "PCI\\VEN_8086&DEV_1592\\0\n    Name: Intel(R) Ethernet Controller E810-C\n    Device is disabled.\n"
+        "1 matching device(s) found.\n"
+    ),
+}
+ESXI_RESPONSES = {
+    r"^esxcli hardware cpu global get": "   CPU Packages: 2\n   CPU Cores: 56\n   CPU Threads: 112\n",
+    r"^esxcli hardware memory get": "   Physical Memory: 549620260864 Bytes\n",
+    r"^vsish -e get /memory/memInfo": "System heap free (pages):1024\nSystem memory usage (pages):4096\n",
+}
+FREEBSD_RESPONSES = {
+    r"^echo kernel=": (
+        "kernel=14.1-RELEASE\nboot_id={ sec = 1700000000, usec = 0 }\ncpu_count=8\npretty_name=FreeBSD 14.1\n"
+    ),
+    r"sysctl -n kern.cp_times": "10 0 10 0 80 20 0 20 0 60\n",
+    r"sysctl -n hw.pagesize": "4096\n",
+    r"sysctl -n vm\.stats": "1024\n",
+    r"sysctl -n hw.ncpu": "8\n",
+}
+RESPONSES = {
+    OSName.LINUX: LINUX_RESPONSES,
+    OSName.WINDOWS: WINDOWS_RESPONSES,
+    OSName.ESXI: ESXI_RESPONSES,
+    OSName.FREEBSD: FREEBSD_RESPONSES,
+}
+
+
+class _FakePosixPath(PurePosixPath):
+    """Path on the fake host, file system operations do nothing."""
+
+    def exists(self) -> bool:
+        return True
+
+    def mkdir(self, *args, **kwargs) -> None:
+        pass
+
+    def unlink(self, *args, **kwargs) -> None:
+        pass
+
+    def read_text(self, *args, **kwargs) -> str:
+        return '"\\\\host\\Group Cpu(1:vmx)\\% Used"\n"12.5"\n'
+
+
+class _FakeWindowsPath(PureWindowsPath, _FakePosixPath):
+    """Windows path on the fake host, file system operations do nothing."""
+
+
+class CountingConnection(Connection):
+    """
+    Fake connection answering commands from table of responses and counting round trips to the host.
+
+    Output of command is the first response with pattern matching the command, empty output if none matches.
+    Response is output or (output, return code) tuple, list of them is served in order and the last one is repeated.
+    Batch of commands (see `mfd_host.batch`) is answered command by command, but counted as single round trip.
+    """
+
+    def __init__(self, os_name: OSName, responses: dict[str, Any], ip: str = "10.10.10.10"):
+        super().__init__(cache_system_data=False)
+        self._ip = ip
+        self._os_name = os_name
+        self._responses = {re.compile(pattern): output for pattern, output in responses.items()}
+        self._served: dict[re.Pattern, int] = {}
+        self.round_trips: list[str] = []
+
+    def reset(self) -> None:
+        """Forget counted round trips."""
+        self.round_trips.clear()
+
+    def execute_command(self, command: str, **kwargs) -> ConnectionCompletedProcess:
+        return self._execute(command, BATCH_SHELL_COMMAND_REGEX, **kwargs)
+
+    def execute_powershell(self, command: str, **kwargs) -> ConnectionCompletedProcess:
+        return self._execute(command, BATCH_POWERSHELL_COMMAND_REGEX, **kwargs)
+
+    def start_process(self, command: str, **kwargs) -> Any:
+        self.round_trips.append(command)
+        return SimpleNamespace(running=False, log_path="/tmp/esxtop.csv", get_stdout_iter=lambda: iter(()))
+
+    def get_os_name(self) -> OSName:
+        return self._os_name
+
+    def get_os_type(self) -> OSType:
+        return OSType.WINDOWS if self._os_name is OSName.WINDOWS else OSType.POSIX
+
+    def get_os_bitness(self) -> OSBitness:
+        return OSBitness.OS_64BIT
+
+    def get_cpu_architecture(self) -> CPUArchitecture:
+        return CPUArchitecture.X86_64
+
+    def path(self, *args, **kwargs) -> Union[_FakePosixPath, _FakeWindowsPath]:
+        return _FakeWindowsPath(*args) if self._os_name is OSName.WINDOWS else _FakePosixPath(*args)
+
+    def disconnect(self) -> None:
+        pass
+
+    def wait_for_host(self, timeout: int = 60) -> None:
+        pass
+
+    def restart_platform(self) -> None:
+        pass
+
+    def shutdown_platform(self) -> None:
+        pass
+
+    def _get_output(self, command: str) -> tuple[str, int]:
+        """Get output and return code of single command."""
+        for pattern, output in self._responses.items():
+            if pattern.search(command):
+                if isinstance(output, list):
+                    position = self._served.get(pattern, 0)
+                    self._served[pattern] = position + 1
+                    output = output[min(position, len(output) - 1)]
+                return (output, 0) if isinstance(output, str) else output
+        return "", 0
+
+    def _execute(
+        self,
+        command: str,
+        batch_regex: re.Pattern,
+        *,
+        expected_return_codes: Optional[Iterable[int]] = frozenset({0}),
+        custom_exception: Optional[type] = None,
+        **kwargs,
+    ) -> ConnectionCompletedProcess:
+        """Answer command or batch of commands."""
+        self.round_trips.append(command)
+        batched = list(batch_regex.finditer(command))
+        if not batched:
+            stdout, return_code = self._get_output(command)
+        else:
+            outputs = [(match, *self._get_output(match["command"])) for match in batched]
+            stdout = "".join(
+                f"{match['marker']}:{match['index']}:out\n{output}\n"
+                f"{match['marker']}:{match['index']}:rc:{return_code}\n\n{match['marker']}:{match['index']}:end\n"
+                for match, output, return_code in outputs
+            )
+            return_code = 0
+        if expected_return_codes and return_code not in expected_return_codes:
+            raise (custom_exception or ConnectionCalledProcessError)(returncode=return_code, cmd=command, output=stdout)
+        return ConnectionCompletedProcess(args=command, stdout=stdout, stderr="", return_code=return_code)
+
+
+def _budget(
+    os_name: OSName, feature: str, method: str, round_trips: int, *args, raises: Optional[type] = None, **kwargs
+) -> Any:
+    """Get test case of round trip budget of feature method."""
+    return pytest.param(
+        os_name, feature, method, args, kwargs, raises, round_trips, id=f"{os_name.name}-{feature}.{method}"
+    )
+
+
+DEVICES = [SimpleNamespace(index=idx, pnp_device_id=f"PCI\\VEN_8086&DEV_1592\\{idx}") for idx in range(16)]
+IP = IPv4Address("10.10.10.11")
+
+FEATURE_BUDGETS = [
+    _budget(OSName.LINUX, "cpu", "affinitize_queues_to_cpus", 1, "eth0", "/root/scripts"),
+    _budget(OSName.LINUX, "cpu", "display_cpu_stats_only", 1),
+    _budget(OSName.LINUX, "cpu", "get_cpu_stats", 1),
+    _budget(OSName.LINUX, "cpu", "get_log_cpu_no", 1),
+    _budget(OSName.LINUX, "memory", "create_ram_disk", 4, "/mnt/ram", 1024),
+    # umount of installed mfd-mount doesn't report success
+    _budget(OSName.LINUX, "memory", "delete_ram_disk", 1, "/mnt/ram", raises=MountDiskDirectoryError),
+    _budget(OSName.LINUX, "memory", "get_memory_channels", 1),
+    _budget(OSName.LINUX, "memory", "set_huge_pages", 4, 2048, (1024, 8)),
+    _budget(OSName.LINUX, "service", "is_network_manager_running", 1),
+    _budget(OSName.LINUX, "service", "is_service_running", 1, "sshd"),
+    _budget(OSName.LINUX, "service", "restart_libvirtd", 1),
+    _budget(OSName.LINUX, "service", "restart_service", 1, "sshd"),
+    _budget(OSName.LINUX, "service", "set_network_manager", 3, enable=True),
+    _budget(OSName.LINUX, "service", "start_irqbalance", 1),
+    _budget(OSName.LINUX, "service", "stop_irqbalance", 3),
+    _budget(OSName.LINUX, "stats", "get_cpu_utilization", 1),
+    _budget(OSName.LINUX, "stats", "get_cpu_utilization_delta", 1),
+    _budget(OSName.LINUX, "stats", "get_interrupts", 1),
+    _budget(OSName.LINUX, "stats", "get_mem_used", 1),
+    _budget(OSName.LINUX, "stats", "get_meminfo", 1),
+    _budget(OSName.LINUX, "stats", "get_slabinfo", 1),
+    _budget(OSName.LINUX, "stats", "get_softnet_stat", 1),
+    _budget(OSName.LINUX, "stats", "get_softnet_stat_bottlenecks", 1, SoftnetStat(timestamp=1000.0)),
+    _budget(OSName.LINUX, "stats", "get_softirqs", 1),
+    _budget(OSName.LINUX, "stats", "get_top_stats", 1),
+    _budget(OSName.LINUX, "stats", "measure_cpu_utilization", 1, 0.5),
+    _budget(OSName.LINUX, "stats", "measure_interrupt_rates", 1, 0.5),
+    _budget(OSName.LINUX, "stats", "measure_softirq_rates", 1, 0.5),
+    _budget(OSName.LINUX, "stats", "start_cpu_utilization_session", 1),
+    # collector is started once, samples are streamed back without further round trips
+    _budget(OSName.LINUX, "stats", "start_sampling", 1),
+    _budget(OSName.LINUX, "stats", "stop_sampling", 0, raises=StatsSamplerException),
+    _budget(OSName.LINUX, "utils", "create_unprivileged_user", 1, "user", "password"),
+    _budget(OSName.LINUX, "utils", "delete_unprivileged_user", 1, "user"),
+    _budget(OSName.LINUX, "utils", "get_hostname", 0),
+    _budget(OSName.LINUX, "utils", "get_interface_by_ip", 1, IP, raises=UtilsFeatureException),
+    _budget(OSName.LINUX, "utils", "get_interfaces_by_ips", 1, [IP, IPv4Address("10.10.10.12")]),
+    _budget(OSName.LINUX, "utils", "get_ip_address_index", 1),
+    _budget(OSName.LINUX, "utils", "get_pretty_name", 1),
+    _budget(OSName.LINUX, "utils", "remove_ssh_known_host", 1, IP, "/root/.ssh"),
+    _budget(OSName.LINUX, "utils", "set_icmp_echo", 1),
+    _budget(OSName.LINUX, "utils", "start_kedr", 2, "ice"),
+    _budget(OSName.LINUX, "utils", "stop_kedr", 2),
+    _budget(OSName.WINDOWS, "cpu", "get_core_info", 1),
+    _budget(OSName.WINDOWS, "cpu", "get_hyperthreading_state", 1),
+    _budget(OSName.WINDOWS, "cpu", "get_log_cpu_no", 1),
+    _budget(OSName.WINDOWS, "cpu", "get_numa_node_count", 3),
+    _budget(OSName.WINDOWS, "cpu", "get_phy_cpu_no", 1),
+    _budget(OSName.WINDOWS, "cpu", "set_groupsize", 2, 8),
+    _budget(OSName.WINDOWS, "device", "disable_devices", 1, DEVICES[0].pnp_device_id),
+    _budget(OSName.WINDOWS, "device", "enable_devices", 1, DEVICES[0].pnp_device_id),
+    _budget(OSName.WINDOWS, "device", "find_devices", 1, pattern="*"),
+    _budget(OSName.WINDOWS, "device", "get_description_for_code", 0, 22),
+    _budget(OSName.WINDOWS, "device", "get_device_status", 1, 0),
+    _budget(OSName.WINDOWS, "device", "get_resources", 1, DEVICES[0].pnp_device_id),
+    _budget(OSName.WINDOWS, "device", "restart_devices", 1, DEVICES[0].pnp_device_id),
+    _budget(OSName.WINDOWS, "device", "set_state_for_multiple_devices", 3 * len(DEVICES), DEVICES, State.DISABLED),
+    _budget(OSName.WINDOWS, "device", "uninstall_devices", 1, DEVICES[0].pnp_device_id),
+    _budget(OSName.WINDOWS, "device", "verify_device_state", 2, DEVICES[0], State.DISABLED),
+    _budget(OSName.WINDOWS, "stats", "get_cpu_utilization", 1),
+    _budget(OSName.WINDOWS, "stats", "get_dpc_rate", 1),
+    _budget(OSName.WINDOWS, "stats", "get_meminfo", 1),
+    _budget(OSName.WINDOWS, "stats", "get_performance_collection", 1, r"\Processor(*)\DPC Rate", samples=5),
+    _budget(OSName.WINDOWS, "stats", "get_performance_counter", 1, r"\Memory\Available Bytes"),
+    _budget(OSName.WINDOWS, "stats", "parse_performance_collection", 0, {}),
+    _budget(OSName.WINDOWS, "utils", "get_hostname", 0),
+    _budget(OSName.WINDOWS, "utils", "get_interface_by_ip", 1, IP, raises=UtilsFeatureException),
+    _budget(OSName.WINDOWS, "utils", "get_interfaces_by_ips", 1, [IP]),
+    _budget(OSName.WINDOWS, "utils", "get_ip_address_index", 1),
+    _budget(OSName.WINDOWS, "utils", "set_icmp_echo", 0, raises=NotImplementedError),
+    _budget(OSName.ESXI, "cpu", "cores", 1),
+    _budget(OSName.ESXI, "cpu", "packages", 1),
+    _budget(OSName.ESXI, "cpu", "parse_cpu_usage", 1, "vmx", SimpleNamespace(log_path="/tmp/esxtop.csv")),
+    _budget(OSName.ESXI, "cpu", "set_numa_affinity", 1, State.ENABLED),
+    _budget(OSName.ESXI, "cpu", "start_cpu_measurement", 1),
+    _budget(OSName.ESXI, "cpu", "stop_cpu_measurement", 1, SimpleNamespace(running=False, log_path="/tmp/x"), "vmx"),
+    _budget(OSName.ESXI, "cpu", "threads", 1),
+    _budget(OSName.ESXI, "service", "restart_service", 1, "hostd"),
+    _budget(OSName.ESXI, "stats", "get_meminfo", 1),
+    _budget(OSName.ESXI, "utils", "get_hostname", 0),
+    _budget(OSName.ESXI, "utils", "get_interface_by_ip", 2, IP, raises=UtilsFeatureException),
+    _budget(OSName.ESXI, "utils", "get_interfaces_by_ips", 2, [IP]),
+    _budget(OSName.ESXI, "utils", "get_ip_address_index", 2),
+    _budget(OSName.ESXI, "utils", "set_icmp_echo", 0, raises=NotImplementedError),
+    _budget(OSName.FREEBSD, "cpu", "get_log_cpu_no", 1),
+    _budget(OSName.FREEBSD, "stats", "get_cpu_utilization", 1),
+    _budget(OSName.FREEBSD, "stats", "get_free_memory", 2),
+    _budget(OSName.FREEBSD, "stats", "get_wired_memory", 2),
+    _budget(OSName.FREEBSD, "utils", "get_hostname", 0),
+    _budget(OSName.FREEBSD, "utils", "get_interface_by_ip", 1, IP, raises=UtilsFeatureException),
+    _budget(OSName.FREEBSD, "utils", "get_interfaces_by_ips", 1, [IP]),
+    _budget(OSName.FREEBSD, "utils", "get_ip_address_index", 1),
+    _budget(OSName.FREEBSD, "utils", "set_icmp_echo", 1),
+]
+
+
+def _generate_interfaces_responses(size: int) -> dict[str, str]:
+    """Generate outputs of commands listing PF interfaces, the first one is management interface."""
+    lspci = []
+    sys_class_net = []
+    ip_a = []
+    for idx in range(size):
+        pci_address = f"0000:{idx + 1:02x}:00.0"
+        lspci.append(
+            f"Slot:\t{pci_address}\nClass:\tEthernet controller [0200]\n"
+            f"Vendor:\tIntel Corporation [8086]\nDevice:\tEthernet Controller E810-C for QSFP [1592]\n"
+        )
+        sys_class_net.append(
+            f"lrwxrwxrwx 1 root root 0 Nov 22 12:17 eth{idx} -> "
+            f"../../devices/pci0000:00/0000:00:03.0/{pci_address}/net/eth{idx}"
+        )
+        ip_a.append(
+            f"{idx + 2}: eth{idx}: <BROADCAST,MULTICAST,UP,LOWER_UP> mtu 1500 state UP\n"
+            f"    link/ether 00:00:00:00:{idx // 256:02x}:{idx % 256:02x} brd ff:ff:ff:ff:ff:ff"
+        )
+    return {
+        r"^lspci": "\n".join(lspci),
+        r"^\\ls -l /sys/class/net": "\n".join(sys_class_net),
+        r"^ip a$": "\n".join(ip_a),
+        r"^ip addr show \| grep 'inet '": "    inet 10.10.10.10/24 brd 10.10.10.255 scope global eth0\n",
+    }
+
+
+class TestRoundTrips:
+    def _get_host(self, os_name: OSName, responses: Optional[dict] = None, **kwargs) -> Host:
+        connection = CountingConnection(os_name, {**RESPONSES[os_name], **(responses or {})})
+        return Host(connection=connection, **kwargs)
+
+    @pytest.mark.parametrize("os_name, feature, method, args, kwargs, raises, round_trips", FEATURE_BUDGETS)
+    def test_feature_method(self, os_name, feature, method, args, kwargs, raises, round_trips):
+        host = self._get_host(os_name)
+        feature_object = getattr(host, feature)
+        host.connection.reset()
+
+        if raises is None:
+            getattr(feature_object, method)(*args, **kwargs)
+        else:
+            with pytest.raises(raises):
+                getattr(feature_object, method)(*args, **kwargs)
+
+        assert len(host.connection.round_trips) == round_trips, host.connection.round_trips
+
+    def test_budgets_cover_public_feature_methods(self):
+        budgets = {(param.values[0], param.values[1], param.values[2]) for param in FEATURE_BUDGETS}
+        missing = []
+        for feature, os_name in FEATURE_REGISTRY:
+            feature_class = get_feature_class(feature, os_name)
+            for name in dir(feature_class):
+                if not name.startswith("_") and callable(getattr(feature_class, name)):
+                    if (os_name, feature, name) not in budgets:
+                        missing.append(f"{feature_class.__name__}.{name}")
+
+        assert not missing, f"Round trip budget is missing for: {missing}"
+
+    @pytest.mark.parametrize("os_name", [OSName.LINUX, OSName.WINDOWS, OSName.ESXI, OSName.FREEBSD])
+    def test_host_creation(self, os_name):
+        host = self._get_host(os_name)
+
+        assert host.connection.round_trips == []
+
+    def test_feature_creation(self):
+        host = self._get_host(OSName.WINDOWS)
+
+        host.device
+        host.device
+
+        # availability of devcon is checked once
+        assert len(host.connection.round_trips) == 1
+
+    def test_freebsd_log_cpu_no_missing_in_fingerprint(self):
+        host = self._get_host(OSName.FREEBSD, {r"^echo kernel=": "kernel=14.1-RELEASE\n"})
+        host.cpu
+
+        # sysctl is not checked on creation of feature
+        assert host.connection.round_trips == []
+        host.cpu.get_log_cpu_no()
+        host.connection.reset()
+        host.cpu.get_log_cpu_no()
+
+        # availability of sysctl is checked by the first call only
+        assert host.connection.round_trips == ["sysctl -n hw.ncpu"]
+
+    def test_refresh_network_interfaces(self):
+        host = self._get_host(OSName.LINUX, _generate_interfaces_responses(INTERFACES))
+
+        host.network
+        host.connection.reset()
+        change_set = host.refresh_network_interfaces()
+
+        assert len(change_set.added) == INTERFACES
+        assert host.network_interfaces[0].interface_type is InterfaceType.MANAGEMENT
+        # namespaces, lspci, /sys/class/net, VLANs, VFs, tunnels, MACs, bonding, management IP, independent of size
+        assert len(host.connection.round_trips) == 9
+
+        host.connection.reset()
+        host.refresh_network_interfaces()
+
+        assert len(host.connection.round_trips) == 9
+
+    def test_refresh_network_interfaces_partial(self):
+        sysfs_interfaces = [
+            "pci 0000:01:00.0 0x020000 0x8086 0x1592 0x0000 0x0000 0",
+            "net eth0 0000:01:00.0 0 1 00:00:00:00:00:00",
+            "pci 0000:02:00.0 0x020000 0x8086 0x1592 0x0000 0x0000 0",
+            "net eth1 0000:02:00.0 0 1 00:00:00:00:00:01",
+            r"2: eth0    inet 10.10.10.10/24 brd 10.10.10.255 scope global eth0\       valid_lft forever",
+        ]
+        responses = {**_generate_interfaces_responses(INTERFACES), r"^net\(\)": "\n".join(sysfs_interfaces)}
+        host = self._get_host(OSName.LINUX, responses)
+        host.refresh_network_interfaces()
+        host.connection.reset()
+
+        change_set = host.refresh_network_interfaces(interface_names=["eth0", "eth1"])
+
+        # info gathered from sysfs is the same as the one from full enumeration
+        assert not (change_set.added or change_set.removed or change_set.updated)
+        assert len(host.connection.round_trips) == 1
+
+    def test_refresh_network_interfaces_cached(self):
+        host = self._get_host(OSName.LINUX, _generate_interfaces_responses(INTERFACES), interface_info_cache_ttl=60)
+        host.network
+        host.refresh_network_interfaces()
+        host.connection.reset()
+
+        host.refresh_network_interfaces()
+        host.utils.get_interfaces_by_ips([IP], check_all_interfaces=True)
+
+        assert len(host.connection.round_trips) == 1
+
+    def test_facts_cached(self, tmp_path):
+        facts = ["get_numa_node_count", "get_core_info", "get_phy_cpu_no", "get_log_cpu_no"]
+        warm_host = self._get_host(OSName.WINDOWS, facts_cache_dir=tmp_path)
+        expected = [getattr(warm_host.cpu, fact)() for fact in facts]
+
+        host = self._get_host(OSName.WINDOWS, facts_cache_dir=tmp_path)
+
+        assert [getattr(host.cpu, fact)() for fact in facts] == expected
+        # fingerprint of the host, checking that it was not rebooted since facts were gathered
+        assert len(host.connection.round_trips) == 1
+
+    def test_batch(self):
+        host = self._get_host(OSName.LINUX)
+        host.memory
+        host.connection.reset()
+
+        with host.batch():
+            host.utils.set_icmp_echo(ignore_all=True)
+            host.memory.set_huge_pages(2048, (1024, 8))
+
+        # mount of hugetlbfs is not deferred
+        assert len(host.connection.round_trips) == 4
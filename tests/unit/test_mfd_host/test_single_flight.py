@@ -0,0 +1,185 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Tests for `mfd_host.single_flight` module."""
+
+import threading
+import time
+
+import pytest
+from mfd_connect import RPyCConnection
+from mfd_connect.base import ConnectionCompletedProcess
+from mfd_typing import OSName
+
+from mfd_host import Host
+from mfd_host.fingerprint import get_host_fingerprint
+from mfd_host.single_flight import CoalescingConnection, SingleFlight
+
+CALLERS = 8
+
+
+def _call_concurrently(function, callers=CALLERS):
+    """Call function with index of thread from many threads, return results or exceptions in order of threads."""
+    results = [None] * callers
+
+    def _call(index):
+        try:
+            results[index] = function(index)
+        except Exception as e:
+            results[index] = e
+
+    threads = [threading.Thread(target=_call, args=(index,)) for index in range(callers)]
+    for thread in threads:
+        thread.start()
+    return threads, results
+
+
+def _wait_for(condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "Condition not met in time"
+        time.sleep(0.001)
+
+
+class TestSingleFlight:
+    def test_concurrent_calls_share_execution(self):
+        single_flight = SingleFlight()
+        release = threading.Event()
+        executions = []
+
+        def _execute():
+            executions.append(1)
+            release.wait(5)
+            return "value"
+
+        threads, results = _call_concurrently(lambda _: single_flight.do("key", _execute))
+        _wait_for(lambda: single_flight.saved == CALLERS - 1)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        assert results == ["value"] * CALLERS
+        assert len(executions) == 1
+        assert (single_flight.executions, single_flight.saved) == (1, CALLERS - 1)
+
+    def test_exception_shared(self):
+        single_flight = SingleFlight()
+        release = threading.Event()
+
+        def _execute():
+            release.wait(5)
+            raise ValueError("failed")
+
+        threads, results = _call_concurrently(lambda _: single_flight.do("key", _execute))
+        _wait_for(lambda: single_flight.saved == CALLERS - 1)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        assert all(isinstance(result, ValueError) for result in results)
+        assert single_flight.executions == 1
+
+    def test_results_not_kept_after_call(self):
+        single_flight = SingleFlight()
+
+        assert single_flight.do("key", lambda: 1) == 1
+        assert single_flight.do("key", lambda: 2) == 2
+        assert (single_flight.executions, single_flight.saved) == (2, 0)
+
+        single_flight.reset_counters()
+        assert (single_flight.executions, single_flight.saved) == (0, 0)
+
+    def test_different_keys_not_coalesced(self):
+        single_flight = SingleFlight()
+        barrier = threading.Barrier(2, timeout=5)
+
+        def _execute(value):
+            barrier.wait()
+            return value
+
+        threads = [threading.Thread(target=single_flight.do, args=(key, _execute, key)) for key in ("a", "b")]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert (single_flight.executions, single_flight.saved) == (2, 0)
+
+
+class TestCoalescingConnection:
+    @pytest.fixture
+    def connection(self, mocker):
+        connection = mocker.create_autospec(RPyCConnection)
+        connection.get_os_name.return_value = OSName.LINUX
+        connection.ip = "10.10.10.10"
+        return connection
+
+    def test_key_includes_arguments(self):
+        key = CoalescingConnection._get_key("execute_command", "nproc", (), {"expected_return_codes": {0}})
+
+        assert key == CoalescingConnection._get_key(
+            "execute_command", "nproc", (), {"expected_return_codes": frozenset({0})}
+        )
+        assert key != CoalescingConnection._get_key("execute_command", "nproc", (), {"expected_return_codes": None})
+        assert key != CoalescingConnection._get_key("execute_powershell", "nproc", (), {"expected_return_codes": {0}})
+        assert CoalescingConnection._get_key("execute_command", "env", (), {"env": {"A": "1"}}) is not None
+        assert CoalescingConnection._get_key("execute_command", "nproc", (), {"input_data": bytearray(b"4")}) is None
+
+    def test_not_hashable_arguments_executed_directly(self, connection):
+        single_flight = SingleFlight()
+
+        single_flight.wrap(connection).execute_command("nproc", input_data=bytearray(b"4"))
+
+        connection.execute_command.assert_called_once_with("nproc", input_data=bytearray(b"4"))
+        assert single_flight.executions == 0
+
+    def test_attributes_of_wrapped_connection(self, connection):
+        wrapped = SingleFlight().wrap(connection)
+
+        assert wrapped.ip == "10.10.10.10"
+        assert get_host_fingerprint(wrapped) is get_host_fingerprint(connection)
+        assert isinstance(wrapped, RPyCConnection)
+        assert type(wrapped) is CoalescingConnection
+
+
+class TestHostCoalescing:
+    @pytest.fixture
+    def connection(self, mocker):
+        connection = mocker.create_autospec(RPyCConnection)
+        connection.get_os_name.return_value = OSName.LINUX
+        return connection
+
+    def test_disabled_by_default(self, connection):
+        host = Host(connection=connection)
+
+        assert host.single_flight is None
+        assert host.stats._connection is connection
+
+    def test_identical_commands_of_features_coalesced(self, connection):
+        release = threading.Event()
+
+        def _execute_command(command, **kwargs):
+            release.wait(5)
+            return ConnectionCompletedProcess(
+                args=command, stdout="MemTotal:       16318668 kB\nMemFree:         1290716 kB\n", return_code=0
+            )
+
+        connection.execute_command.side_effect = _execute_command
+        host = Host(connection=connection, coalesce_commands=True)
+
+        threads, results = _call_concurrently(
+            lambda index: host.stats.get_meminfo() if index % 2 else host.stats.get_mem_used()
+        )
+        _wait_for(lambda: host.single_flight.saved == CALLERS - 1)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        connection.execute_command.assert_called_once_with("cat /proc/meminfo", shell=True)
+        assert not any(isinstance(result, Exception) for result in results)
+        assert host.single_flight.executions == 1
+
+    def test_hostname_of_wrapped_connection(self, connection):
+        connection.modules.return_value.socket.gethostname.return_value = "host\n"
+        host = Host(connection=connection, coalesce_commands=True)
+
+        assert host.utils.get_hostname() == "host"
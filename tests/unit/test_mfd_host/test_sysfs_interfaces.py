@@ -0,0 +1,87 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Tests for `mfd_host.sysfs_interfaces` module."""
+
+from ipaddress import IPv4Interface
+
+import pytest
+from mfd_typing import MACAddress, PCIAddress, PCIDevice
+from mfd_typing.network_interface import InterfaceType, LinuxInterfaceInfo
+
+from mfd_host.sysfs_interfaces import get_sysfs_interfaces_command, parse_sysfs_interfaces
+
+PF = "pci 0000:18:00.0 0x020000 0x8086 0x1592 0x8086 0x0002 0"
+VF = "pci 0000:18:01.0 0x020000 0x8086 0x1889 0x0000 0x0000 1"
+
+
+def _is_management_interface(ip: IPv4Interface) -> bool:
+    return ip.ip == IPv4Interface("10.10.10.10").ip
+
+
+class TestSysfsInterfaces:
+    def test_get_sysfs_interfaces_command(self):
+        command = get_sysfs_interfaces_command(
+            interface_names=["eth0"], pci_addresses=[PCIAddress(data="0000:18:00.1")], virtual_functions=True
+        )
+
+        assert "readlink -f /sys/class/net/eth0/device" in command
+        assert "pci /sys/bus/pci/devices/0000:18:00.1" in command
+        assert "/sys/bus/pci/devices/*/physfn" in command
+        assert "/sys/bus/pci/devices/*/physfn" not in get_sysfs_interfaces_command(["eth0"], [], False)
+
+    def test_parse_sysfs_interfaces(self):
+        output = "\n".join(
+            [
+                PF,
+                "net eth0 0000:18:00.0 0 1 00:00:00:00:00:01",
+                VF,
+                "pci 0000:18:01.1 0x020000 0x8086 0x1889 0x0000 0x0000 1",
+                "net eth0v1 0000:18:01.1 0 1 00:00:00:00:00:02",
+                r"2: eth0    inet 10.10.10.10/24 brd 10.10.10.255 scope global eth0\       valid_lft forever",
+                r"5: eth0v1    inet 10.10.10.10/8 scope host eth0v1\       valid_lft forever",
+            ]
+        )
+
+        assert parse_sysfs_interfaces(output, _is_management_interface) == [
+            LinuxInterfaceInfo(
+                name="eth0",
+                pci_address=PCIAddress(data="0000:18:00.0"),
+                pci_device=PCIDevice(data="8086:1592:8086:0002"),
+                interface_type=InterfaceType.MANAGEMENT,
+                mac_address=MACAddress("00:00:00:00:00:01"),
+                installed=True,
+            ),
+            LinuxInterfaceInfo(
+                name="eth0v1",
+                pci_address=PCIAddress(data="0000:18:01.1"),
+                pci_device=PCIDevice(data="8086:1889"),
+                interface_type=InterfaceType.VF,
+                mac_address=MACAddress("00:00:00:00:00:02"),
+                installed=True,
+            ),
+            LinuxInterfaceInfo(
+                pci_address=PCIAddress(data="0000:18:01.0"),
+                pci_device=PCIDevice(data="8086:1889"),
+                interface_type=InterfaceType.VF,
+                installed=False,
+            ),
+        ]
+
+    def test_parse_sysfs_interfaces_missing_interface(self):
+        assert parse_sysfs_interfaces("", _is_management_interface) == []
+
+    @pytest.mark.parametrize(
+        "lines",
+        [
+            ["netns", PF, "net eth0 0000:18:00.0 0 1 00:00:00:00:00:01"],
+            ["net br0 - 0 1 00:00:00:00:00:01"],
+            [PF, "net eth0 0000:18:00.0 1 1 00:00:00:00:00:01"],
+            [PF, "net nac_0 0000:18:00.0 0 1 00:00:00:00:00:01"],
+            [PF, "net eth0 0000:18:00.0 0 1 00:00:00:00:00:01", "net eth1 0000:18:00.0 0 1 00:00:00:00:00:02"],
+            ["pci 0000:18:00.0 0x028000 0x8086 0x1592 0x8086 0x0002 0", "net ib0 0000:18:00.0 0 32 00:01"],
+            ["pci virtio3 0x1af4 0x0001 0", "net eth0 virtio3 0 1 00:00:00:00:00:01"],
+        ],
+        ids=["namespace", "virtual", "bonding_slave", "bts", "vport", "not_ethernet", "not_pci"],
+    )
+    def test_parse_sysfs_interfaces_full_enumeration_required(self, lines):
+        assert parse_sysfs_interfaces("\n".join(lines), _is_management_interface) is None
@@ -0,0 +1,170 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Stress tests of concurrent use of Host object from many threads."""
+
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import count
+
+import pytest
+from mfd_connect import RPyCConnection
+from mfd_typing import OSName, OSBitness, PCIAddress
+from mfd_typing.network_interface import LinuxInterfaceInfo, InterfaceType
+
+from mfd_host import Host
+from mfd_host.cache import InterfaceInfoCache
+from mfd_host.feature.base.base import BaseFeature
+from mfd_host.fingerprint import get_host_fingerprint
+
+THREADS = 16
+
+
+def _run_concurrently(function, threads: int = THREADS) -> list:
+    """Call function from many threads released at the same moment, return results."""
+    barrier = threading.Barrier(threads)
+
+    def _call():
+        barrier.wait()
+        return function()
+
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        futures = [executor.submit(_call) for _ in range(threads)]
+        return [future.result(timeout=30) for future in futures]
+
+
+@pytest.fixture(autouse=True)
+def frequent_thread_switches():
+    """Switch threads as often as possible to expose races."""
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(interval)
+
+
+class TestHostThreadSafety:
+    @pytest.fixture
+    def host(self, mocker):
+        connection = mocker.create_autospec(RPyCConnection)
+        connection.get_os_name.return_value = OSName.LINUX
+        yield Host(connection=connection)
+        mocker.stopall()
+
+    def test_features_initialized_once(self, host, mocker):
+        original_init = BaseFeature.__init__
+        initialized = []
+
+        def slow_init(feature, *args, **kwargs):
+            time.sleep(0.01)
+            initialized.append(type(feature).__name__)
+            original_init(feature, *args, **kwargs)
+
+        mocker.patch.object(BaseFeature, "__init__", slow_init)
+        owner = mocker.patch(
+            "mfd_network_adapter.NetworkAdapterOwner", side_effect=lambda **_: time.sleep(0.01) or object()
+        )
+
+        results = _run_concurrently(
+            lambda: (host.utils, host.stats, host.cpu, host.memory, host.service, host.device, host.network)
+        )
+
+        assert all(result == results[0] for result in results)
+        assert all(len({id(result[i]) for result in results}) == 1 for i in range(len(results[0])))
+        assert initialized
+        assert len(initialized) == len(set(initialized))
+        owner.assert_called_once()
+
+    def test_concurrent_refresh_and_readers(self, host, mocker):
+        variants = [
+            [
+                LinuxInterfaceInfo(name="eth0", pci_address=PCIAddress(0, 0, 1, 0), interface_type=InterfaceType.PF),
+                LinuxInterfaceInfo(name="eth1", pci_address=PCIAddress(0, 0, 2, 0), interface_type=InterfaceType.PF),
+            ],
+            [
+                LinuxInterfaceInfo(name="eth0", pci_address=PCIAddress(0, 0, 1, 0), interface_type=InterfaceType.PF),
+                LinuxInterfaceInfo(name="eth2", pci_address=PCIAddress(0, 0, 3, 0), interface_type=InterfaceType.PF),
+            ],
+        ]
+        calls = count()
+        mocker.patch(
+            "mfd_network_adapter.network_adapter_owner.linux.LinuxNetworkAdapterOwner._get_all_interfaces_info",
+            side_effect=lambda: list(variants[next(calls) % 2]),
+        )
+        host.refresh_network_interfaces()
+        eth0 = host.network_interfaces[0]
+        snapshots = []
+        roles = count()
+
+        def refresh_or_read():
+            refreshing = next(roles) % 2
+            for _ in range(20):
+                if refreshing:
+                    host.refresh_network_interfaces()
+                else:
+                    snapshots.append([interface.name for interface in list(host.network_interfaces)])
+
+        _run_concurrently(refresh_or_read)
+
+        assert all(snapshot in (["eth0", "eth1"], ["eth0", "eth2"]) for snapshot in snapshots)
+        assert [interface.name for interface in host.network_interfaces] in (["eth0", "eth1"], ["eth0", "eth2"])
+        assert host.network_interfaces[0] is eth0
+
+    def test_concurrent_subscriptions(self, host):
+        callbacks = [lambda event: None for _ in range(THREADS)]
+        index = count()
+
+        _run_concurrently(lambda: host.subscribe_interface_events(callbacks[next(index)]))
+
+        assert {id(callback) for callback, _ in host._interface_subscribers} == {id(c) for c in callbacks}
+
+
+class TestInterfaceInfoCacheThreadSafety:
+    def test_concurrent_misses_fetch_once(self, mocker):
+        fetch = mocker.Mock(side_effect=lambda: time.sleep(0.05) or [LinuxInterfaceInfo(name="eth0")])
+        cache = InterfaceInfoCache(fetch=fetch, ttl=60)
+
+        results = _run_concurrently(cache.get)
+
+        fetch.assert_called_once()
+        assert all(result == results[0] for result in results)
+        assert (cache.hits, cache.misses) == (THREADS - 1, 1)
+
+
+class TestHostFingerprintThreadSafety:
+    def test_concurrent_access_gathers_once(self, mocker):
+        connection = mocker.create_autospec(RPyCConnection)
+        connection.get_os_name.side_effect = lambda: time.sleep(0.01) or OSName.LINUX
+
+        fingerprints = _run_concurrently(lambda: get_host_fingerprint(connection))
+        os_names = _run_concurrently(lambda: fingerprints[0].os_name)
+
+        assert all(fingerprint is fingerprints[0] for fingerprint in fingerprints)
+        assert set(os_names) == {OSName.LINUX}
+        connection.get_os_name.assert_called_once()
+
+
+class TestFreeBSDStatsThreadSafety:
+    def test_concurrent_cpu_utilization(self, mocker):
+        connection = mocker.create_autospec(RPyCConnection)
+        connection.get_os_name.return_value = OSName.FREEBSD
+        connection.get_os_bitness.return_value = OSBitness.OS_64BIT
+        stats = Host(connection=connection).stats
+        reads = count(1)
+
+        def read_cp_times(_):
+            # between reads each of 2 cores spends 1 tick in user and 1 in idle state, since boot 100 ticks in idle
+            ticks = next(reads)
+            time.sleep(0.001)
+            return f"{ticks} 0 0 0 {100 + ticks} {ticks} 0 0 0 {100 + ticks}"
+
+        mocker.patch.object(stats._sysctl, "get_sysctl_value", side_effect=read_cp_times)
+
+        results = _run_concurrently(stats.get_cpu_utilization)
+
+        since_boot = [result for result in results if result["0"]["user"] != 50.0]
+        assert len(since_boot) == 1
+        assert since_boot[0]["0"] == {"user": 0.98, "nice": 0.0, "system": 0.0, "interrupt": 0.0, "idle": 99.02}
+        assert all(
+            result["all"]["user"] == result["all"]["idle"] == 50.0 for result in results if result["0"]["user"] == 50.0
+        )